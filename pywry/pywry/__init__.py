@@ -4,6 +4,10 @@ This package provides a simple API for displaying HTML content in native
 windows with support for Plotly.js, AG Grid, and custom event handling.
 """
 
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
 # Frozen-executable subprocess interception — runs before any other
 # pywry import.  In a frozen distributable (PyInstaller / Nuitka / cx_Freeze),
 # when the parent process spawns itself as the Tauri subprocess, this call
@@ -16,182 +20,367 @@ from ._freeze import freeze_support, setup_pytauri_runtime
 freeze_support()
 setup_pytauri_runtime()
 
-# Inline notebook module - import functions directly
-from . import inline
-from .app import PyWry
-from .asset_loader import AssetLoader, get_asset_loader
-from .callbacks import CallbackFunc, WidgetType, get_registry
-from .chat import (
-    AppArtifact,
-    ChatProvider,
-    CodeArtifact,
-    HtmlArtifact,
-    ImageArtifact,
-    JsonArtifact,
-    MarkdownArtifact,
-    PlotlyArtifact,
-    TableArtifact,
-    TradingViewArtifact,
-    TradingViewSeries,
-    build_chat_html,
-    get_provider,
-)
-from .chat.manager import (
-    ChatContext,
-    ChatManager,
-    SettingsItem,
-)
-from .chat.models import (
-    ACPCommand,
-    ACPToolCall,
-    ChatConfig,
-    ChatMessage,
-    ChatThread,
-    ContentBlock,
-)
-from .chat.session import (
-    PlanEntry,
-    SessionConfigOption,
-    SessionMode,
-)
-from .chat.updates import (
-    AgentMessageUpdate,
-    ArtifactUpdate,
-    CitationUpdate,
-    CommandsUpdate,
-    ConfigOptionUpdate,
-    ModeUpdate,
-    PlanUpdate,
-    StatusUpdate,
-    ThinkingUpdate,
-    ToolCallUpdate,
-)
-from .config import (
-    AssetSettings,
-    HotReloadSettings,
-    LogSettings,
-    PyWrySettings,
-    SecuritySettings,
-    ThemeSettings,
-    TimeoutSettings,
-    WindowSettings,
-)
-from .grid import (
-    ColDef,
-    ColGroupDef,
-    DefaultColDef,
-    GridOptions,
-    RowSelection,
-    build_grid_config,
-    to_js_grid_config,
-)
-from .hot_reload import HotReloadManager
-from .inline import block, show_dataframe, show_plotly, show_tvchart
-from .menu_proxy import MenuProxy
-from .modal import Modal
-from .models import (
-    HtmlContent,
-    ThemeMode,
-    WindowConfig,
-    WindowMode,
-)
-from .notebook import (
-    NotebookEnvironment,
-    detect_notebook_environment,
-    is_anywidget_available,
-    should_use_inline_rendering,
-)
-from .plotly_config import (
-    ModeBarButton,
-    ModeBarConfig,
-    PlotlyConfig,
-    PlotlyIconName,
-    StandardButton,
-    SvgIcon,
-)
-from .state_mixins import (
-    GridStateMixin,
-    PlotlyStateMixin,
-    ToolbarStateMixin,
-)
-from .toolbar import (
-    Button,
-    Checkbox,
-    DateInput,
-    Div,
-    Marquee,
-    MultiSelect,
-    NumberInput,
-    Option,
-    RadioGroup,
-    RangeInput,
-    SearchInput,
-    SecretInput,
-    Select,
-    SliderInput,
-    TabGroup,
-    TextArea,
-    TextInput,
-    TickerItem,
-    Toggle,
-    Toolbar,
-    ToolbarItem,
-)
-from .tray_proxy import TrayProxy
-from .tvchart import (
-    DatafeedProvider,
-    QuoteData,
-    TVChartBar,
-    TVChartConfig,
-    TVChartData,
-    TVChartDatafeedBarUpdate,
-    TVChartDatafeedConfigRequest,
-    TVChartDatafeedConfigResponse,
-    TVChartDatafeedConfiguration,
-    TVChartDatafeedHistoryRequest,
-    TVChartDatafeedHistoryResponse,
-    TVChartDatafeedMarksRequest,
-    TVChartDatafeedMarksResponse,
-    TVChartDatafeedResolveRequest,
-    TVChartDatafeedResolveResponse,
-    TVChartDatafeedSearchRequest,
-    TVChartDatafeedSearchResponse,
-    TVChartDatafeedServerTimeRequest,
-    TVChartDatafeedServerTimeResponse,
-    TVChartDatafeedSubscribeRequest,
-    TVChartDatafeedSymbolType,
-    TVChartDatafeedTimescaleMarksRequest,
-    TVChartDatafeedTimescaleMarksResponse,
-    TVChartDatafeedUnsubscribeRequest,
-    TVChartExchange,
-    TVChartLibrarySubsessionInfo,
-    TVChartMark,
-    TVChartSearchSymbolResultItem,
-    TVChartStateMixin,
-    TVChartSymbolInfo,
-    TVChartSymbolInfoPriceSource,
-    TVChartTimescaleMark,
-    UDFAdapter,
-    build_tvchart_toolbars,
-)
-from .types import (
-    CheckMenuItemConfig,
-    IconMenuItemConfig,
-    MenuConfig,
-    MenuItemConfig,
-    MouseButton,
-    MouseButtonState,
-    PredefinedMenuItemConfig,
-    PredefinedMenuItemKind,
-    SubmenuConfig,
-    TrayIconConfig,
-)
-from .widget import PyWryAgGridWidget, PyWryPlotlyWidget, PyWryTVChartWidget, PyWryWidget
-from .window_manager import BrowserMode, get_lifecycle
+# Public names are resolved lazily (PEP 562): ``import pywry`` only loads
+# this module, and each submodule is imported the first time one of its
+# names is accessed.  This keeps FastAPI/uvicorn (``inline``), watchdog
+# (``hot_reload``), IPython and the chat/tvchart models out of processes
+# that never use them, such as the Tauri subprocess.
+if TYPE_CHECKING:
+    from . import inline
+    from .app import PyWry
+    from .asset_loader import AssetLoader, get_asset_loader
+    from .callbacks import CallbackFunc, WidgetType, get_registry
+    from .chat import (
+        AppArtifact,
+        ChatProvider,
+        CodeArtifact,
+        HtmlArtifact,
+        ImageArtifact,
+        JsonArtifact,
+        MarkdownArtifact,
+        PlotlyArtifact,
+        TableArtifact,
+        TradingViewArtifact,
+        TradingViewSeries,
+        build_chat_html,
+        get_provider,
+    )
+    from .chat.manager import (
+        ChatContext,
+        ChatManager,
+        SettingsItem,
+    )
+    from .chat.models import (
+        ACPCommand,
+        ACPToolCall,
+        ChatConfig,
+        ChatMessage,
+        ChatThread,
+        ContentBlock,
+    )
+    from .chat.session import (
+        PlanEntry,
+        SessionConfigOption,
+        SessionMode,
+    )
+    from .chat.updates import (
+        AgentMessageUpdate,
+        ArtifactUpdate,
+        CitationUpdate,
+        CommandsUpdate,
+        ConfigOptionUpdate,
+        ModeUpdate,
+        PlanUpdate,
+        StatusUpdate,
+        ThinkingUpdate,
+        ToolCallUpdate,
+    )
+    from .config import (
+        AssetSettings,
+        HotReloadSettings,
+        LogSettings,
+        PyWrySettings,
+        SecuritySettings,
+        ThemeSettings,
+        TimeoutSettings,
+        WindowSettings,
+    )
+    from .dashboard import Dashboard
+    from .grid import (
+        ColDef,
+        ColGroupDef,
+        DefaultColDef,
+        GridOptions,
+        RowSelection,
+        build_grid_config,
+        to_js_grid_config,
+    )
+    from .hot_reload import HotReloadManager
+    from .inline import block, show_dataframe, show_plotly, show_tvchart
+    from .menu_proxy import MenuProxy
+    from .modal import Modal
+    from .models import (
+        HtmlContent,
+        ThemeMode,
+        WindowConfig,
+        WindowMode,
+    )
+    from .notebook import (
+        NotebookEnvironment,
+        detect_notebook_environment,
+        is_anywidget_available,
+        should_use_inline_rendering,
+    )
+    from .plotly_config import (
+        ModeBarButton,
+        ModeBarConfig,
+        PlotlyConfig,
+        PlotlyIconName,
+        StandardButton,
+        SvgIcon,
+    )
+    from .state_mixins import (
+        GridStateMixin,
+        PlotlyStateMixin,
+        ToolbarStateMixin,
+    )
+    from .ticker_board import TickerBoard
+    from .toolbar import (
+        Button,
+        Checkbox,
+        DateInput,
+        Div,
+        Marquee,
+        MultiSelect,
+        NumberInput,
+        Option,
+        OptionIndex,
+        RadioGroup,
+        RangeInput,
+        SearchInput,
+        SecretInput,
+        Select,
+        SliderInput,
+        TabGroup,
+        TextArea,
+        TextInput,
+        TickerItem,
+        Toggle,
+        Toolbar,
+        ToolbarItem,
+    )
+    from .tray_proxy import TrayProxy
+    from .tvchart import (
+        DatafeedProvider,
+        QuoteData,
+        TVChartBar,
+        TVChartConfig,
+        TVChartData,
+        TVChartDatafeedBarUpdate,
+        TVChartDatafeedConfigRequest,
+        TVChartDatafeedConfigResponse,
+        TVChartDatafeedConfiguration,
+        TVChartDatafeedHistoryRequest,
+        TVChartDatafeedHistoryResponse,
+        TVChartDatafeedMarksRequest,
+        TVChartDatafeedMarksResponse,
+        TVChartDatafeedResolveRequest,
+        TVChartDatafeedResolveResponse,
+        TVChartDatafeedSearchRequest,
+        TVChartDatafeedSearchResponse,
+        TVChartDatafeedServerTimeRequest,
+        TVChartDatafeedServerTimeResponse,
+        TVChartDatafeedSubscribeRequest,
+        TVChartDatafeedSymbolType,
+        TVChartDatafeedTimescaleMarksRequest,
+        TVChartDatafeedTimescaleMarksResponse,
+        TVChartDatafeedUnsubscribeRequest,
+        TVChartExchange,
+        TVChartLibrarySubsessionInfo,
+        TVChartMark,
+        TVChartSearchSymbolResultItem,
+        TVChartStateMixin,
+        TVChartSymbolInfo,
+        TVChartSymbolInfoPriceSource,
+        TVChartTimescaleMark,
+        UDFAdapter,
+        build_tvchart_toolbars,
+    )
+    from .types import (
+        CheckMenuItemConfig,
+        IconMenuItemConfig,
+        MenuConfig,
+        MenuItemConfig,
+        MouseButton,
+        MouseButtonState,
+        PredefinedMenuItemConfig,
+        PredefinedMenuItemKind,
+        SubmenuConfig,
+        TrayIconConfig,
+    )
+    from .widget import PyWryAgGridWidget, PyWryPlotlyWidget, PyWryTVChartWidget, PyWryWidget
+    from .window_manager import BrowserMode, get_lifecycle
 
 
 __version__ = "2.0.0"
 
+# Public name -> submodule that defines it.  A name mapping to itself is
+# the submodule.
+_LAZY_IMPORTS: dict[str, str] = {
+    "inline": ".inline",
+    "PyWry": ".app",
+    "AssetLoader": ".asset_loader",
+    "get_asset_loader": ".asset_loader",
+    "CallbackFunc": ".callbacks",
+    "WidgetType": ".callbacks",
+    "get_registry": ".callbacks",
+    "AppArtifact": ".chat",
+    "ChatProvider": ".chat",
+    "CodeArtifact": ".chat",
+    "HtmlArtifact": ".chat",
+    "ImageArtifact": ".chat",
+    "JsonArtifact": ".chat",
+    "MarkdownArtifact": ".chat",
+    "PlotlyArtifact": ".chat",
+    "TableArtifact": ".chat",
+    "TradingViewArtifact": ".chat",
+    "TradingViewSeries": ".chat",
+    "build_chat_html": ".chat",
+    "get_provider": ".chat",
+    "ChatContext": ".chat.manager",
+    "ChatManager": ".chat.manager",
+    "SettingsItem": ".chat.manager",
+    "ACPCommand": ".chat.models",
+    "ACPToolCall": ".chat.models",
+    "ChatConfig": ".chat.models",
+    "ChatMessage": ".chat.models",
+    "ChatThread": ".chat.models",
+    "ContentBlock": ".chat.models",
+    "PlanEntry": ".chat.session",
+    "SessionConfigOption": ".chat.session",
+    "SessionMode": ".chat.session",
+    "AgentMessageUpdate": ".chat.updates",
+    "ArtifactUpdate": ".chat.updates",
+    "CitationUpdate": ".chat.updates",
+    "CommandsUpdate": ".chat.updates",
+    "ConfigOptionUpdate": ".chat.updates",
+    "ModeUpdate": ".chat.updates",
+    "PlanUpdate": ".chat.updates",
+    "StatusUpdate": ".chat.updates",
+    "ThinkingUpdate": ".chat.updates",
+    "ToolCallUpdate": ".chat.updates",
+    "AssetSettings": ".config",
+    "HotReloadSettings": ".config",
+    "LogSettings": ".config",
+    "PyWrySettings": ".config",
+    "SecuritySettings": ".config",
+    "ThemeSettings": ".config",
+    "TimeoutSettings": ".config",
+    "WindowSettings": ".config",
+    "Dashboard": ".dashboard",
+    "ColDef": ".grid",
+    "ColGroupDef": ".grid",
+    "DefaultColDef": ".grid",
+    "GridOptions": ".grid",
+    "RowSelection": ".grid",
+    "build_grid_config": ".grid",
+    "to_js_grid_config": ".grid",
+    "HotReloadManager": ".hot_reload",
+    "block": ".inline",
+    "show_dataframe": ".inline",
+    "show_plotly": ".inline",
+    "show_tvchart": ".inline",
+    "MenuProxy": ".menu_proxy",
+    "Modal": ".modal",
+    "HtmlContent": ".models",
+    "ThemeMode": ".models",
+    "WindowConfig": ".models",
+    "WindowMode": ".models",
+    "NotebookEnvironment": ".notebook",
+    "detect_notebook_environment": ".notebook",
+    "is_anywidget_available": ".notebook",
+    "should_use_inline_rendering": ".notebook",
+    "ModeBarButton": ".plotly_config",
+    "ModeBarConfig": ".plotly_config",
+    "PlotlyConfig": ".plotly_config",
+    "PlotlyIconName": ".plotly_config",
+    "StandardButton": ".plotly_config",
+    "SvgIcon": ".plotly_config",
+    "GridStateMixin": ".state_mixins",
+    "PlotlyStateMixin": ".state_mixins",
+    "ToolbarStateMixin": ".state_mixins",
+    "Button": ".toolbar",
+    "Checkbox": ".toolbar",
+    "DateInput": ".toolbar",
+    "Div": ".toolbar",
+    "Marquee": ".toolbar",
+    "MultiSelect": ".toolbar",
+    "NumberInput": ".toolbar",
+    "Option": ".toolbar",
+    "OptionIndex": ".toolbar",
+    "RadioGroup": ".toolbar",
+    "RangeInput": ".toolbar",
+    "SearchInput": ".toolbar",
+    "SecretInput": ".toolbar",
+    "Select": ".toolbar",
+    "SliderInput": ".toolbar",
+    "TabGroup": ".toolbar",
+    "TextArea": ".toolbar",
+    "TextInput": ".toolbar",
+    "TickerItem": ".toolbar",
+    "Toggle": ".toolbar",
+    "Toolbar": ".toolbar",
+    "ToolbarItem": ".toolbar",
+    "TickerBoard": ".ticker_board",
+    "TrayProxy": ".tray_proxy",
+    "DatafeedProvider": ".tvchart",
+    "QuoteData": ".tvchart",
+    "TVChartBar": ".tvchart",
+    "TVChartConfig": ".tvchart",
+    "TVChartData": ".tvchart",
+    "TVChartDatafeedBarUpdate": ".tvchart",
+    "TVChartDatafeedConfigRequest": ".tvchart",
+    "TVChartDatafeedConfigResponse": ".tvchart",
+    "TVChartDatafeedConfiguration": ".tvchart",
+    "TVChartDatafeedHistoryRequest": ".tvchart",
+    "TVChartDatafeedHistoryResponse": ".tvchart",
+    "TVChartDatafeedMarksRequest": ".tvchart",
+    "TVChartDatafeedMarksResponse": ".tvchart",
+    "TVChartDatafeedResolveRequest": ".tvchart",
+    "TVChartDatafeedResolveResponse": ".tvchart",
+    "TVChartDatafeedSearchRequest": ".tvchart",
+    "TVChartDatafeedSearchResponse": ".tvchart",
+    "TVChartDatafeedServerTimeRequest": ".tvchart",
+    "TVChartDatafeedServerTimeResponse": ".tvchart",
+    "TVChartDatafeedSubscribeRequest": ".tvchart",
+    "TVChartDatafeedSymbolType": ".tvchart",
+    "TVChartDatafeedTimescaleMarksRequest": ".tvchart",
+    "TVChartDatafeedTimescaleMarksResponse": ".tvchart",
+    "TVChartDatafeedUnsubscribeRequest": ".tvchart",
+    "TVChartExchange": ".tvchart",
+    "TVChartLibrarySubsessionInfo": ".tvchart",
+    "TVChartMark": ".tvchart",
+    "TVChartSearchSymbolResultItem": ".tvchart",
+    "TVChartStateMixin": ".tvchart",
+    "TVChartSymbolInfo": ".tvchart",
+    "TVChartSymbolInfoPriceSource": ".tvchart",
+    "TVChartTimescaleMark": ".tvchart",
+    "UDFAdapter": ".tvchart",
+    "build_tvchart_toolbars": ".tvchart",
+    "CheckMenuItemConfig": ".types",
+    "IconMenuItemConfig": ".types",
+    "MenuConfig": ".types",
+    "MenuItemConfig": ".types",
+    "MouseButton": ".types",
+    "MouseButtonState": ".types",
+    "PredefinedMenuItemConfig": ".types",
+    "PredefinedMenuItemKind": ".types",
+    "SubmenuConfig": ".types",
+    "TrayIconConfig": ".types",
+    "PyWryAgGridWidget": ".widget",
+    "PyWryPlotlyWidget": ".widget",
+    "PyWryTVChartWidget": ".widget",
+    "PyWryWidget": ".widget",
+    "BrowserMode": ".window_manager",
+    "get_lifecycle": ".window_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = module if module_name == f".{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
 __all__ = [
     "ACPCommand",
     "ACPToolCall",
@@ -218,6 +407,7 @@ __all__ = [
     "CommandsUpdate",
     "ConfigOptionUpdate",
     "ContentBlock",
+    "Dashboard",
     "DatafeedProvider",
     "DateInput",
     "DefaultColDef",
@@ -247,6 +437,7 @@ __all__ = [
     "NotebookEnvironment",
     "NumberInput",
     "Option",
+    "OptionIndex",
     "PlanEntry",
     "PlanUpdate",
     "PlotlyArtifact",
@@ -314,6 +505,7 @@ __all__ = [
     "ThemeMode",
     "ThemeSettings",
     "ThinkingUpdate",
+    "TickerBoard",
     "TickerItem",
     "TimeoutSettings",
     "Toggle",
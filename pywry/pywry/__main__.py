@@ -338,6 +338,9 @@ class JsonIPC:
         self.trays: dict[str, Any] = {}  # tray_id -> TrayIcon object
         self.tray_menu_items: set[str] = set()  # item IDs owned by trays
         self._destroyed_windows: set[str] = set()  # labels of destroyed windows
+        self.watched_windows: set[str] = set()  # labels whose state is pushed
+        self._state_timers: dict[str, threading.Timer] = {}  # label -> debounced push
+        self._state_timers_lock = threading.Lock()
         self.app_handle: Any = None
         self.running = True
 
@@ -365,26 +368,46 @@ class JsonIPC:
         """Signal that the app is ready."""
         self.send({"type": "ready"})
 
-    def send_error(self, error: str) -> None:
-        """Send an error message."""
+    def send_error(self, error: str, request_id: str | None = None) -> None:
+        """Send an error message, correlated with ``request_id`` if given."""
         log_error(error)
-        self.send({"type": "error", "error": error})
-
-    def _window_not_found(self, label: str, context: str = "") -> None:
+        msg: dict[str, Any] = {"type": "error", "error": error}
+        if request_id:
+            msg["request_id"] = request_id
+        self.send(msg)
+
+    def _window_not_found(
+        self, label: str, context: str = "", request_id: str | None = None
+    ) -> None:
         """Log a 'window not found' message at the appropriate level.
 
         If the window was already destroyed (user closed it), this is
         expected and logged at debug level.  Otherwise it's a real error.
+        A correlated request always gets a failed result so its caller
+        does not wait for the timeout.
         """
         prefix = f"{context}: " if context else ""
-        if label in self._destroyed_windows:
-            log(f"{prefix}Window already closed: {label}")
-        else:
-            self.send_error(f"{prefix}Window not found: {label}")
+        if label not in self._destroyed_windows:
+            self.send_error(f"{prefix}Window not found: {label}", request_id)
+            return
+        log(f"{prefix}Window already closed: {label}")
+        if request_id:
+            self.send(
+                {
+                    "type": "result",
+                    "label": label,
+                    "success": False,
+                    "error": f"{prefix}Window already closed: {label}",
+                    "request_id": request_id,
+                }
+            )
 
-    def send_result(self, label: str, success: bool) -> None:
-        """Send a command result."""
-        self.send({"type": "result", "label": label, "success": success})
+    def send_result(self, label: str, success: bool, request_id: str | None = None) -> None:
+        """Send a command result, correlated with ``request_id`` if given."""
+        msg: dict[str, Any] = {"type": "result", "label": label, "success": success}
+        if request_id:
+            msg["request_id"] = request_id
+        self.send(msg)
 
     def send_request_and_wait(
         self,
@@ -470,6 +493,10 @@ class JsonIPC:
             self.check_window_open(cmd)
         elif action == "window_get":
             self.window_get_property(cmd)
+        elif action == "window_get_many":
+            self.window_get_properties(cmd)
+        elif action == "window_watch":
+            self.window_watch(cmd)
         elif action == "window_call":
             self.window_call_method(cmd)
         elif action == "menu_create":
@@ -488,6 +515,8 @@ class JsonIPC:
             self.tray_update(cmd)
         elif action == "tray_remove":
             self.tray_remove(cmd)
+        elif action == "frame_release":
+            self.release_frame(cmd)
         elif action == "quit":
             self.quit()
         else:
@@ -791,14 +820,24 @@ class JsonIPC:
         """Emit an event to a window.
 
         Uses Tauri's event system to send the event to the webview,
-        which dispatches it to JavaScript handlers.
+        which dispatches it to JavaScript handlers.  ``label`` may be
+        ``"*"`` for every window, or the command may carry a ``labels``
+        list to reach several specific windows at once.
         """
         label = cmd.get("label", "main")
         event = cmd.get("event", "")
         payload = cmd.get("payload", {})
+        request_id = cmd.get("request_id")
 
         if not event:
-            self.send_error("emit: missing 'event' field")
+            self.send_error("emit: missing 'event' field", request_id)
+            return
+
+        # Fan out to an explicit set of windows in one command
+        labels = cmd.get("labels")
+        if labels:
+            self._emit_to_labels(labels, event, payload)
+            self.send_result(label, True, request_id)
             return
 
         # Handle wildcard - emit to all windows
@@ -809,7 +848,7 @@ class JsonIPC:
                     log(f"Emitted '{event}' to window '{window_label}'")
                 except Exception as e:
                     log(f"Failed to emit to '{window_label}': {e}")
-            self.send_result("*", True)
+            self.send_result("*", True, request_id)
             return
 
         # Get specific window
@@ -820,15 +859,28 @@ class JsonIPC:
                 self.windows[label] = window
 
         if window is None:
-            self._window_not_found(label, "emit")
+            self._window_not_found(label, "emit", request_id)
             return
 
         try:
             self._emit_to_window(window, event, payload)
             log(f"Emitted '{event}' to window '{label}'")
-            self.send_result(label, True)
+            self.send_result(label, True, request_id)
         except Exception as e:
-            self.send_error(f"emit: Failed to emit event: {e}")
+            self.send_error(f"emit: Failed to emit event: {e}", request_id)
+
+    def _emit_to_labels(self, labels: list[str], event: str, payload: dict[str, Any]) -> None:
+        """Emit one event to each window in *labels*, skipping missing ones."""
+        for window_label in labels:
+            window = self._get_window(window_label)
+            if window is None:
+                log(f"emit: window '{window_label}' not found")
+                continue
+            try:
+                self._emit_to_window(window, event, payload)
+            except Exception as e:
+                log(f"Failed to emit to '{window_label}': {e}")
+        log(f"Emitted '{event}' to {len(labels)} window(s)")
 
     def _emit_to_window(self, window: Any, event: str, payload: dict[str, Any]) -> None:
         """Emit event to a window using JavaScript eval."""
@@ -848,9 +900,10 @@ class JsonIPC:
         """Evaluate arbitrary JavaScript in a window without replacing content."""
         label = cmd.get("label", "main")
         script = cmd.get("script", "")
+        request_id = cmd.get("request_id")
 
         if not script:
-            self.send_error("eval: missing 'script' field")
+            self.send_error("eval: missing 'script' field", request_id)
             return
 
         window = self.windows.get(label)
@@ -860,15 +913,26 @@ class JsonIPC:
                 self.windows[label] = window
 
         if window is None:
-            self._window_not_found(label, "eval")
+            self._window_not_found(label, "eval", request_id)
             return
 
         try:
             window.eval(script)
             log(f"Evaluated JS in window '{label}'")
-            self.send_result(label, True)
+            self.send_result(label, True, request_id)
         except Exception as e:
-            self.send_error(f"eval: Failed to evaluate JS: {e}")
+            self.send_error(f"eval: Failed to evaluate JS: {e}", request_id)
+
+    def release_frame(self, cmd: dict[str, Any]) -> None:
+        """Unmap a shared-memory grid frame once the parent has released it.
+
+        Fire-and-forget: no result is sent back.
+        """
+        from .shared_frame import detach
+
+        name = cmd.get("name", "")
+        if detach(name):
+            log(f"Released shared frame '{name}'")
 
     def check_window_open(self, cmd: dict[str, Any]) -> None:
         """Check if a window is open."""
@@ -991,6 +1055,143 @@ class JsonIPC:
                 }
             )
 
+    def window_get_properties(self, cmd: dict[str, Any]) -> None:
+        """Get several window properties in one blocking round trip.
+
+        Expected cmd format:
+        {
+            "action": "window_get_many",
+            "label": "main",
+            "properties": ["inner_size", "is_focused"],
+            "request_id": "uuid-xxx"
+        }
+
+        Response format:
+        {
+            "type": "response",
+            "request_id": "uuid-xxx",
+            "success": true,
+            "values": {"inner_size": {...}, "is_focused": true},
+            "errors": {}
+        }
+        """
+        label = cmd.get("label", "main")
+        request_id = cmd.get("request_id", "")
+
+        window = self._get_window(label)
+        if window is None:
+            self.send(
+                {
+                    "type": "response",
+                    "request_id": request_id,
+                    "success": False,
+                    "error": f"Window not found: {label}",
+                }
+            )
+            return
+
+        from .window_dispatch import get_window_properties
+
+        values, errors = get_window_properties(window, cmd.get("properties", []))
+        self.send(
+            {
+                "type": "response",
+                "request_id": request_id,
+                "success": True,
+                "values": values,
+                "errors": errors,
+            }
+        )
+
+    def window_watch(self, cmd: dict[str, Any]) -> None:
+        """Start or stop pushing a window's state changes to the parent.
+
+        While watched, resize/move/focus/scale/theme events send a
+        ``{"type": "window_state", "label": ..., "state": {...}}`` message
+        with the affected properties.  Enabling responds with the current
+        value of every watched property.
+
+        Expected cmd format:
+        {
+            "action": "window_watch",
+            "label": "main",
+            "enabled": true,
+            "request_id": "uuid-xxx"
+        }
+        """
+        from .window_dispatch import WATCHED_PROPERTIES, get_window_properties
+
+        label = cmd.get("label", "main")
+        request_id = cmd.get("request_id", "")
+
+        if not cmd.get("enabled", True):
+            self.watched_windows.discard(label)
+            if request_id:
+                self.send({"type": "response", "request_id": request_id, "success": True})
+            return
+
+        window = self._get_window(label)
+        if window is None:
+            self.send(
+                {
+                    "type": "response",
+                    "request_id": request_id,
+                    "success": False,
+                    "error": f"Window not found: {label}",
+                }
+            )
+            return
+
+        self.watched_windows.add(label)
+        values, _errors = get_window_properties(window, WATCHED_PROPERTIES)
+        self.send({"type": "response", "request_id": request_id, "success": True, "values": values})
+
+    def push_window_state(self, label: str, window_event: Any) -> None:
+        """Send the properties changed by *window_event* for a watched window."""
+        if label not in self.watched_windows:
+            return
+
+        from .window_dispatch import (
+            DEBOUNCED_EVENT_PROPERTIES,
+            STATE_DEBOUNCE_SECONDS,
+            STATE_EVENT_PROPERTIES,
+        )
+
+        event_name = type(window_event).__name__
+        props = STATE_EVENT_PROPERTIES.get(event_name)
+        if props:
+            self._send_window_state(label, props)
+        deferred = DEBOUNCED_EVENT_PROPERTIES.get(event_name)
+        if deferred:
+            # Restart the timer so a burst of events triggers a single read
+            timer = threading.Timer(
+                STATE_DEBOUNCE_SECONDS, self._push_debounced_state, (label, deferred)
+            )
+            timer.daemon = True
+            with self._state_timers_lock:
+                previous = self._state_timers.get(label)
+                self._state_timers[label] = timer
+            if previous is not None:
+                previous.cancel()
+            timer.start()
+
+    def _push_debounced_state(self, label: str, props: tuple[str, ...]) -> None:
+        """Timer callback: send the debounced properties once events settle."""
+        with self._state_timers_lock:
+            self._state_timers.pop(label, None)
+        if label in self.watched_windows:
+            self._send_window_state(label, props)
+
+    def _send_window_state(self, label: str, props: tuple[str, ...]) -> None:
+        from .window_dispatch import get_window_properties
+
+        window = self._get_window(label)
+        if window is None:
+            return
+        values, _errors = get_window_properties(window, props)
+        if values:
+            self.send({"type": "window_state", "label": label, "state": values})
+
     def window_call_method(self, cmd: dict[str, Any]) -> None:
         """Call a window method - fire-and-forget or blocking.
 
@@ -1786,8 +1987,11 @@ def main() -> int:  # noqa: C901
                         _handle_close_requested(ipc, app_handle, label, window_event)
                     elif isinstance(window_event, WindowEvent.Destroyed):
                         ipc.windows.pop(label, None)
+                        ipc.watched_windows.discard(label)
                         ipc._destroyed_windows.add(label)
                         log(f"Window '{label}' destroyed, removed from cache")
+                    else:
+                        ipc.push_window_state(label, window_event)
                 elif isinstance(run_event, RunEvent.MenuEvent):
                     # Menu item clicked — forward as menu:click event.
                     # Tray menu items are already handled by per-tray
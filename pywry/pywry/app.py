@@ -19,7 +19,6 @@ from .assets import (
 )
 from .callbacks import CallbackFunc, get_registry
 from .config import PyWrySettings
-from .hot_reload import HotReloadManager
 from .log import debug, info, warn
 from .models import (
     AlertPayload,
@@ -47,7 +46,9 @@ from .window_manager import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from .hot_reload import HotReloadManager
     from .modal import Modal
+    from .shared_frame import SharedFrame
     from .toolbar import Toolbar
     from .types import MenuConfig
     from .widget_protocol import BaseWidget
@@ -145,17 +146,23 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
             self._mode_enum = WindowMode.BROWSER
             self._mode = BrowserMode()
 
+        # Launch the native subprocess now so the first show() does not
+        # pay the interpreter + pytauri startup.
+        if (
+            self._settings.window.warm_standby
+            and self._mode_enum
+            in (WindowMode.NEW_WINDOW, WindowMode.SINGLE_WINDOW, WindowMode.MULTI_WINDOW)
+            and not should_use_inline_rendering()
+        ):
+            runtime.enable_warm_standby()
+
         # Asset loader for CSS/JS files
         self._asset_loader = AssetLoader()
 
         # Hot reload manager (only if enabled)
         self._hot_reload_manager: HotReloadManager | None = None
         if hot_reload or self._settings.hot_reload.enabled:
-            self._hot_reload_manager = HotReloadManager(
-                settings=self._settings.hot_reload,
-                asset_loader=self._asset_loader,
-            )
-            self._hot_reload_manager.start()
+            self._hot_reload_manager = self._create_hot_reload_manager()
             info("Hot reload enabled")
 
         # Registry of inline (anywidget/IFrame) widgets for notebook mode
@@ -980,6 +987,20 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
 
                 callbacks["menu:click"] = _menu_dispatcher
 
+        # ── Toolbar dropdowns with a server-side option_source ────────
+        if toolbars:
+            from .toolbar import Toolbar as _Toolbar, register_option_source_handlers_for_toolbar
+
+            callbacks = dict(callbacks or {})
+            for toolbar_cfg in toolbars:
+                if isinstance(toolbar_cfg, _Toolbar):
+                    # setdefault keeps any handler the caller registered itself
+                    register_option_source_handlers_for_toolbar(
+                        toolbar_cfg,
+                        callbacks.setdefault,
+                        lambda event, data: self.emit(event, data, target_label),
+                    )
+
         label_result = self._mode.show(config, html, callbacks, target_label)
 
         # Create the native menu AFTER the window exists (Tauri needs a
@@ -1282,6 +1303,7 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
         # Generate unique grid ID for this instance
         grid_id = f"app-grid-{uuid.uuid4().hex[:8]}"
         row_count = len(row_data)
+        shared_frame = None
 
         if server_side:
             # Server-side mode: data stays in Python, JS gets it via IPC
@@ -1339,6 +1361,15 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
             # Client-side mode: send all data to frontend
             # AG Grid's DOM virtualization handles large datasets efficiently
             # JS-side truncates if > 100K rows to protect browser memory
+            # Large frames go through shared memory instead of the page
+            shared_frame = self._create_shared_frame(row_data)
+            if shared_frame is not None:
+                row_data_json = "[]"
+                shared_frame_json = json.dumps(shared_frame.descriptor())
+            else:
+                row_data_json = json.dumps(row_data)
+                shared_frame_json = "null"
+            column_defs_json = json.dumps(column_defs or [])
             grid_html = f"""
         <div id="myGrid" class="pywry-grid {theme_class}"></div>
         <script>
@@ -1349,17 +1380,20 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
                         return;
                     }}
 
+                    var columnDefs = {column_defs_json};
+                    var rowData = {row_data_json};
                     var gridConfig = {{
-                        columnDefs: {json.dumps(column_defs or [])},
-                        rowData: {json.dumps(row_data)},
+                        columnDefs: columnDefs,
+                        rowData: rowData,
+                        sharedFrame: {shared_frame_json},
                         domLayout: 'normal'
                     }};
 
                     var userOptions = {user_options_json};
                     if (userOptions) {{
                         Object.assign(gridConfig, userOptions);
-                        if (!userOptions.columnDefs) gridConfig.columnDefs = {json.dumps(column_defs or [])};
-                        if (!userOptions.rowData) gridConfig.rowData = {json.dumps(row_data)};
+                        if (!userOptions.columnDefs) gridConfig.columnDefs = columnDefs;
+                        if (!userOptions.rowData) gridConfig.rowData = rowData;
                     }}
 
                     const gridDiv = document.querySelector('#myGrid');
@@ -1385,7 +1419,7 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
         # Wrap in HtmlContent if inline_css provided
         content = HtmlContent(html=grid_html, inline_css=inline_css) if inline_css else grid_html
 
-        return self.show(
+        handle = self.show(
             content=content,
             title=title or "Data Table",
             width=width,
@@ -1397,6 +1431,9 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
             toolbars=toolbars,
             modals=modals,
         )
+        if shared_frame is not None:
+            self._track_shared_frame(handle.label, shared_frame)
+        return handle
 
     def _build_tvchart_series_payload(
         self,
@@ -1428,12 +1465,17 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
             ]
         from .tvchart import normalize_ohlcv
 
-        chart_data = normalize_ohlcv(data, symbol_col=symbol_col, max_bars=max_bars)
+        chart_data = normalize_ohlcv(
+            data,
+            symbol_col=symbol_col,
+            max_bars=max_bars,
+            typed_arrays=self._settings.tvchart.typed_arrays,
+        )
         return [
             {
                 "seriesId": s.series_id,
-                "bars": s.bars,
-                "volume": s.volume,
+                "bars": s.bars_payload(),
+                "volume": s.volume_payload(),
                 "seriesType": s.series_type.value.capitalize(),
                 "seriesOptions": series_options or {},
             }
@@ -2429,13 +2471,24 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
     def enable_hot_reload(self) -> None:
         """Enable hot reload if not already enabled."""
         if self._hot_reload_manager is None:
-            self._hot_reload_manager = HotReloadManager(
-                settings=self._settings.hot_reload,
-                asset_loader=self._asset_loader,
-            )
-            self._hot_reload_manager.start()
+            self._hot_reload_manager = self._create_hot_reload_manager()
             info("Hot reload enabled")
 
+    def _create_hot_reload_manager(self) -> HotReloadManager:
+        """Create and start a hot reload manager wired to the window runtime."""
+        from . import runtime
+        from .hot_reload import HotReloadManager  # watchdog, only when enabled
+
+        manager = HotReloadManager(
+            settings=self._settings.hot_reload,
+            asset_loader=self._asset_loader,
+        )
+        manager.set_inject_css_callback(runtime.inject_css)
+        manager.set_broadcast_css_callback(runtime.broadcast_css)
+        manager.set_refresh_callback(runtime_refresh_window)
+        manager.start()
+        return manager
+
     def disable_hot_reload(self) -> None:
         """Disable hot reload and stop file watching."""
         if self._hot_reload_manager:
@@ -2443,6 +2496,67 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
             self._hot_reload_manager = None
             info("Hot reload disabled")
 
+    # Shared-memory grid frames by window label
+    _shared_frames: dict[str, tuple[SharedFrame, CallbackFunc]]
+
+    def _create_shared_frame(self, row_data: list[dict[str, Any]]) -> SharedFrame | None:
+        """Write large row data into shared memory for the native window.
+
+        Parameters
+        ----------
+        row_data : list[dict[str, Any]]
+            Normalized grid rows.
+
+        Returns
+        -------
+        SharedFrame or None
+            The frame, or None when the handoff is disabled, the data is
+            below ``settings.window.shared_frame_rows``, or the segment
+            could not be created (the rows are then embedded as usual).
+        """
+        threshold = self._settings.window.shared_frame_rows
+        if not threshold or len(row_data) < threshold:
+            return None
+        from .shared_frame import SharedFrame
+
+        try:
+            return SharedFrame(row_data)
+        except OSError as e:
+            warn(f"Shared-memory grid handoff unavailable, embedding rows: {e}")
+            return None
+
+    def _track_shared_frame(self, label: str, frame: SharedFrame) -> None:
+        """Keep ``frame`` alive until its window closes or is re-rendered.
+
+        Parameters
+        ----------
+        label : str
+            Window label showing the frame.
+        frame : SharedFrame
+            Frame to release with the window.
+        """
+        if not hasattr(self, "_shared_frames"):
+            self._shared_frames = {}
+        self._release_shared_frame(label)
+
+        def on_closed(_data: dict[str, Any], _event_type: str, closed_label: str) -> None:
+            self._release_shared_frame(closed_label)
+
+        get_registry().register(label, "window:closed", on_closed)
+        self._shared_frames[label] = (frame, on_closed)
+
+    def _release_shared_frame(self, label: str) -> None:
+        """Unmap and unlink the shared frame shown in ``label``, if any."""
+        entry = getattr(self, "_shared_frames", {}).pop(label, None)
+        if entry is None:
+            return
+        frame, on_closed = entry
+        from . import runtime
+
+        get_registry().unregister(label, "window:closed", on_closed)
+        runtime.release_frame(frame.name)
+        frame.close()
+
     # Storage for server-side grid data
     _grid_data: dict[str, list[dict[str, Any]]]
 
@@ -2738,6 +2852,9 @@ class PyWry(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarStateMix
             self._hot_reload_manager.stop()
             self._hot_reload_manager = None
 
+        for label in list(getattr(self, "_shared_frames", {})):
+            self._release_shared_frame(label)
+
         self._mode.close_all()
         get_lifecycle().destroy_all()
         self._plotly_js = None
@@ -6,12 +6,9 @@ endpoints that integrate with the existing session store and auth middleware.
 
 from __future__ import annotations
 
-import asyncio
-import collections
 import contextlib
 import logging
 import secrets
-import threading
 import time
 
 from typing import TYPE_CHECKING, Any
@@ -19,14 +16,16 @@ from typing import TYPE_CHECKING, Any
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import JSONResponse, RedirectResponse
 
+from ..state._factory import get_auth_state_store, get_login_rate_limiter
 from ..state.auth import AuthConfig, generate_session_token
+from ..state.memory import MemoryAuthStateStore
 from ..state.types import UserSession
 from .pkce import PKCEChallenge
 
 
 if TYPE_CHECKING:
     from ..config import DeploySettings
-    from ..state.base import SessionStore
+    from ..state.base import AuthStateStore, RateLimiter, SessionStore
     from .providers import OAuthProvider
     from .token_store import TokenStore
 
@@ -80,134 +79,6 @@ def _verify_csrf_origin(request: Request, *, trusted_origins: list[str] | None =
     return source_origin == request_origin
 
 
-# ── Login Rate Limiter ───────────────────────────────────────────────
-
-
-class LoginRateLimiter:
-    """Simple in-process sliding-window rate limiter for login requests.
-
-    Limits by client IP address with a configurable window and max requests.
-
-    Parameters
-    ----------
-    max_requests : int
-        Maximum number of requests allowed per window.
-    window_seconds : float
-        Time window in seconds.
-    """
-
-    def __init__(self, max_requests: int = 10, window_seconds: float = 60.0) -> None:
-        self._max_requests = max_requests
-        self._window = window_seconds
-        self._requests: dict[str, collections.deque[float]] = {}
-        self._lock = threading.Lock()
-
-    def is_allowed(self, client_ip: str) -> bool:
-        """Check if a request from *client_ip* is allowed."""
-        now = time.monotonic()
-        with self._lock:
-            if client_ip not in self._requests:
-                self._requests[client_ip] = collections.deque()
-
-            dq = self._requests[client_ip]
-            # Evict old entries outside the window
-            while dq and dq[0] < now - self._window:
-                dq.popleft()
-
-            if len(dq) >= self._max_requests:
-                return False
-
-            dq.append(now)
-            return True
-
-    def reset(self) -> None:
-        """Clear all rate limit state (for testing)."""
-        with self._lock:
-            self._requests.clear()
-
-
-_login_rate_limiter = LoginRateLimiter()
-
-
-# ── Bounded Auth State Store ─────────────────────────────────────────
-
-
-class AuthStateStore:
-    """Bounded, TTL-enforced store for pending OAuth2 CSRF state.
-
-    Thread-safe via ``asyncio.Lock``. Evicts expired entries on every
-    write and enforces a hard capacity limit to prevent memory exhaustion.
-
-    Parameters
-    ----------
-    max_pending : int
-        Maximum number of concurrent pending auth states.
-    max_age : float
-        Maximum age of a pending state in seconds before auto-eviction.
-    """
-
-    def __init__(self, max_pending: int = 1000, max_age: float = 600.0) -> None:
-        self._store: dict[str, dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
-        self._max_pending = max_pending
-        self._max_age = max_age
-
-    async def put(self, state: str, data: dict[str, Any]) -> None:
-        """Store a pending auth state."""
-        async with self._lock:
-            self._evict_expired()
-            if len(self._store) >= self._max_pending:
-                # Evict oldest entry when at capacity
-                oldest_key = min(self._store, key=lambda k: self._store[k].get("created_at", 0))
-                del self._store[oldest_key]
-            self._store[state] = data
-
-    async def pop(self, state: str) -> dict[str, Any] | None:
-        """Retrieve and remove a pending auth state (single-use)."""
-        async with self._lock:
-            self._evict_expired()
-            return self._store.pop(state, None)
-
-    async def contains(self, state: str) -> bool:
-        """Check if a state exists."""
-        async with self._lock:
-            self._evict_expired()
-            return state in self._store
-
-    def _evict_expired(self) -> None:
-        """Remove all expired entries (caller must hold lock)."""
-        now = time.time()
-        expired = [
-            k for k, v in self._store.items() if now - v.get("created_at", 0) > self._max_age
-        ]
-        for k in expired:
-            del self._store[k]
-
-    async def cleanup(self) -> int:
-        """Explicitly clean up expired states. Returns count removed."""
-        async with self._lock:
-            before = len(self._store)
-            self._evict_expired()
-            return before - len(self._store)
-
-    async def size(self) -> int:
-        """Return current number of pending states."""
-        async with self._lock:
-            return len(self._store)
-
-    def _get_store_for_testing(self) -> dict[str, dict[str, Any]]:
-        """Expose internal store for testing only."""
-        return self._store
-
-
-# Global instance — shared across routes in this process.
-# For multi-worker deploy, this should be replaced with a Redis-backed store.
-_auth_state_store = AuthStateStore()
-
-# Alias used by tests
-_pending_auth_states = _auth_state_store._get_store_for_testing()
-
-
 def create_auth_router(  # noqa: C901, PLR0915
     provider: OAuthProvider,
     session_store: SessionStore,
@@ -215,6 +86,8 @@ def create_auth_router(  # noqa: C901, PLR0915
     deploy_settings: DeploySettings,
     auth_config: AuthConfig,
     use_pkce: bool = True,
+    rate_limiter: RateLimiter | None = None,
+    state_store: AuthStateStore | None = None,
 ) -> APIRouter:
     """Create a FastAPI router with OAuth2 authentication routes.
 
@@ -232,6 +105,13 @@ def create_auth_router(  # noqa: C901, PLR0915
         Auth configuration (secret, session TTL, etc.).
     use_pkce : bool
         Whether to use PKCE (default True).
+    rate_limiter : RateLimiter or None
+        Per-client limiter for ``/auth/login``. Defaults to
+        :func:`~pywry.state.get_login_rate_limiter`, which is shared across
+        workers on the Redis backend.
+    state_store : AuthStateStore or None
+        Store for pending OAuth2 state between login and callback. Defaults
+        to :func:`~pywry.state.get_auth_state_store`.
 
     Returns
     -------
@@ -239,6 +119,8 @@ def create_auth_router(  # noqa: C901, PLR0915
         Router with ``/auth/*`` routes.
     """
     router = APIRouter(prefix="/auth", tags=["authentication"])
+    login_rate_limiter = rate_limiter or get_login_rate_limiter()
+    auth_state_store = state_store or get_auth_state_store()
 
     @router.get("/login")
     async def auth_login(request: Request) -> Response:
@@ -251,7 +133,7 @@ def create_auth_router(  # noqa: C901, PLR0915
         """
         # Rate limit login attempts by client IP
         client_ip = request.client.host if request.client else "unknown"
-        if not _login_rate_limiter.is_allowed(client_ip):
+        if not await login_rate_limiter.is_allowed(client_ip):
             return JSONResponse(
                 status_code=429,
                 content={
@@ -279,7 +161,7 @@ def create_auth_router(  # noqa: C901, PLR0915
                 redirect_uri = "https://" + redirect_uri[len("http://") :]
 
         # Store state for CSRF validation
-        await _auth_state_store.put(
+        await auth_state_store.put(
             state,
             {
                 "pkce_verifier": pkce.verifier if pkce else None,
@@ -320,7 +202,7 @@ def create_auth_router(  # noqa: C901, PLR0915
                 },
             )
 
-        if not state or not await _auth_state_store.contains(state):
+        if not state or not await auth_state_store.contains(state):
             return JSONResponse(
                 status_code=400,
                 content={
@@ -339,7 +221,7 @@ def create_auth_router(  # noqa: C901, PLR0915
             )
 
         # Retrieve and remove pending state (single-use)
-        auth_state = await _auth_state_store.pop(state)
+        auth_state = await auth_state_store.pop(state)
         if auth_state is None:
             return JSONResponse(
                 status_code=400,
@@ -567,22 +449,25 @@ def create_auth_router(  # noqa: C901, PLR0915
     return router
 
 
-def cleanup_expired_states(max_age: float = 600.0) -> int:
+def cleanup_expired_states(max_age: float = 600.0, store: AuthStateStore | None = None) -> int:
     """Remove expired pending auth states (synchronous wrapper).
 
+    Only in-process stores need pruning; Redis-backed states expire via
+    their TTL and report zero.
+
     Parameters
     ----------
     max_age : float
         Maximum age in seconds before a state is considered expired.
+    store : AuthStateStore or None
+        Store to prune. Defaults to :func:`~pywry.state.get_auth_state_store`.
 
     Returns
     -------
     int
         Number of expired states removed.
     """
-    now = time.time()
-    store = _auth_state_store._get_store_for_testing()
-    expired = [k for k, v in store.items() if now - v.get("created_at", 0) > max_age]
-    for k in expired:
-        del store[k]
-    return len(expired)
+    store = store or get_auth_state_store()
+    if not isinstance(store, MemoryAuthStateStore):
+        return 0
+    return store._evict_expired(max_age)
@@ -0,0 +1,375 @@
+"""Write-behind persistence of ChatManager history into a ``ChatStore``.
+
+``ChatManager`` keeps its threads as plain message dicts so the hot paths
+(streaming, edit/resend, state replay) never touch the store.  The
+``ChatJournal`` records every mutation in an in-process queue and applies
+them to the configured ``ChatStore`` in batches on the state event loop,
+so a slow backend never blocks a generation.
+
+Reads (restore on startup, scroll-back paging) go straight to the store
+after the pending queue has been drained, so they always observe every
+write the manager has already made.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+
+if TYPE_CHECKING:
+    from ..state.base import ChatStore
+    from .models import ChatMessage
+
+
+log = logging.getLogger(__name__)
+
+MessageDict = dict[str, Any]
+
+_OpKind = Literal["save", "append", "truncate", "clear", "delete"]
+
+
+@dataclass
+class _JournalOp:
+    """A single pending store mutation."""
+
+    kind: _OpKind
+    thread_id: str
+    title: str = ""
+    message: MessageDict = field(default_factory=dict)
+    from_id: str = ""
+
+
+def message_to_store(message: MessageDict) -> ChatMessage:
+    """Convert a ChatManager message dict into a ``ChatMessage``.
+
+    Parameters
+    ----------
+    message : dict[str, Any]
+        Message dict with ``id``, ``role``, ``text`` and optional extras.
+
+    Returns
+    -------
+    ChatMessage
+        Store representation. Keys other than ``id``, ``role``, ``text``
+        and ``stopped`` are kept in ``metadata``.
+    """
+    from .models import ChatMessage
+
+    metadata = {k: v for k, v in message.items() if k not in ("id", "role", "text", "stopped")}
+    kwargs: dict[str, Any] = {
+        "role": message.get("role", "assistant"),
+        "content": message.get("text", ""),
+        "stopped": bool(message.get("stopped", False)),
+        "metadata": metadata,
+    }
+    if message.get("id"):
+        kwargs["message_id"] = message["id"]
+    return ChatMessage(**kwargs)
+
+
+def message_from_store(message: ChatMessage) -> MessageDict:
+    """Convert a stored ``ChatMessage`` back into a ChatManager message dict.
+
+    Parameters
+    ----------
+    message : ChatMessage
+        Stored message.
+
+    Returns
+    -------
+    dict[str, Any]
+        Message dict in the shape ``ChatManager`` keeps in memory.
+    """
+    from .models import TextPart
+
+    content = message.content
+    if not isinstance(content, str):
+        content = "".join(p.text for p in content if isinstance(p, TextPart))
+    result: MessageDict = {**message.metadata}
+    result.update({"id": message.message_id, "role": message.role, "text": content})
+    if message.stopped:
+        result["stopped"] = True
+    return result
+
+
+class ChatJournal:
+    """Batching write-behind journal from ``ChatManager`` to a ``ChatStore``.
+
+    Mutations are queued synchronously and applied on the state event
+    loop (the inline server loop when running, otherwise the shared
+    fallback loop) ``flush_delay`` seconds after the first queued write,
+    so a burst of messages costs one wake-up.  A later ``truncate``,
+    ``clear`` or ``delete`` on a thread drops the earlier pending writes
+    it supersedes.
+
+    Parameters
+    ----------
+    store : ChatStore
+        Backend that receives the writes.
+    scope : str
+        Widget ID under which threads are stored.
+    flush_delay : float
+        Seconds to wait after the first pending write before draining.
+    max_batch : int
+        Maximum number of operations applied per drain iteration.
+    """
+
+    def __init__(
+        self,
+        store: ChatStore,
+        scope: str,
+        *,
+        flush_delay: float = 0.05,
+        max_batch: int = 500,
+    ) -> None:
+        self._store = store
+        self._scope = scope
+        self._flush_delay = flush_delay
+        self._max_batch = max_batch
+        self._ops: deque[_JournalOp] = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._known_threads: set[str] = set()
+        self._drain_lock: asyncio.Lock | None = None
+        self._titles: dict[str, str] = {}
+
+    @property
+    def store(self) -> ChatStore:
+        """The backing chat store."""
+        return self._store
+
+    @property
+    def scope(self) -> str:
+        """Widget ID used to scope the stored threads."""
+        return self._scope
+
+    @property
+    def pending(self) -> int:
+        """Number of queued operations not yet applied."""
+        with self._lock:
+            return len(self._ops)
+
+    # -- Writes (sync, non-blocking) ------------------------------------------
+
+    def save_thread(self, thread_id: str, title: str) -> None:
+        """Create or rename a thread.
+
+        Parameters
+        ----------
+        thread_id : str
+            Thread identifier.
+        title : str
+            Thread title.
+        """
+        self._known_threads.add(thread_id)
+        self._titles[thread_id] = title
+        self._enqueue(_JournalOp("save", thread_id, title=title))
+
+    def append(self, thread_id: str, message: MessageDict) -> None:
+        """Append a message to a thread.
+
+        Parameters
+        ----------
+        thread_id : str
+            Thread identifier. Saved first if the journal has not seen it.
+        message : dict[str, Any]
+            ChatManager message dict.
+        """
+        if thread_id not in self._known_threads:
+            self.save_thread(thread_id, self._titles.get(thread_id, "New Chat"))
+        self._enqueue(_JournalOp("append", thread_id, message=dict(message)))
+
+    def truncate(self, thread_id: str, from_id: str) -> None:
+        """Remove message ``from_id`` and every message after it.
+
+        Parameters
+        ----------
+        thread_id : str
+            Thread identifier.
+        from_id : str
+            First message ID to remove.
+        """
+        self._enqueue(_JournalOp("truncate", thread_id, from_id=from_id))
+
+    def clear(self, thread_id: str) -> None:
+        """Remove every message from a thread.
+
+        Parameters
+        ----------
+        thread_id : str
+            Thread identifier.
+        """
+        self._enqueue(_JournalOp("clear", thread_id))
+
+    def delete(self, thread_id: str) -> None:
+        """Delete a thread and its messages.
+
+        Parameters
+        ----------
+        thread_id : str
+            Thread identifier.
+        """
+        self._known_threads.discard(thread_id)
+        self._titles.pop(thread_id, None)
+        self._enqueue(_JournalOp("delete", thread_id))
+
+    def flush(self, timeout: float | None = 10.0) -> None:
+        """Block until every queued operation has been applied.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum seconds to wait.
+        """
+        from ..state.sync_helpers import run_async
+
+        run_async(self._drain(), timeout=timeout)
+
+    # -- Reads (sync, drain first) --------------------------------------------
+
+    def load_threads(self) -> list[tuple[str, str]]:
+        """Return ``(thread_id, title)`` for every stored thread, oldest first.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            Stored threads ordered by creation time.
+        """
+        from ..state.sync_helpers import run_async
+
+        async def _load() -> list[tuple[str, str]]:
+            await self._drain()
+            threads = await self._store.list_threads(self._scope)
+            threads.sort(key=lambda t: t.created_at)
+            return [(t.thread_id, t.title) for t in threads]
+
+        result = run_async(_load(), timeout=10.0)
+        for thread_id, title in result:
+            self._known_threads.add(thread_id)
+            self._titles[thread_id] = title
+        return result
+
+    def load_messages(
+        self,
+        thread_id: str,
+        limit: int,
+        before_id: str | None = None,
+    ) -> list[MessageDict]:
+        """Read a page of messages from the store.
+
+        Parameters
+        ----------
+        thread_id : str
+            Thread identifier.
+        limit : int
+            Maximum number of messages.
+        before_id : str | None
+            Only return messages older than this ID.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Messages in chronological order.
+        """
+        from ..state.sync_helpers import run_async
+
+        async def _load() -> list[ChatMessage]:
+            await self._drain()
+            return await self._store.get_messages(
+                self._scope, thread_id, limit=limit, before_id=before_id
+            )
+
+        return [message_from_store(m) for m in run_async(_load(), timeout=10.0)]
+
+    # -- Internals ------------------------------------------------------------
+
+    def _enqueue(self, op: _JournalOp) -> None:
+        with self._lock:
+            self._ops.append(op)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        from ..state.sync_helpers import run_async_fire_and_forget
+
+        run_async_fire_and_forget(self._drain_later())
+
+    async def _drain_later(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        await self._drain()
+
+    async def _drain(self) -> None:
+        if self._drain_lock is None:
+            self._drain_lock = asyncio.Lock()
+        async with self._drain_lock:
+            while True:
+                with self._lock:
+                    if not self._ops:
+                        self._scheduled = False
+                        return
+                    count = min(len(self._ops), self._max_batch)
+                    batch = [self._ops.popleft() for _ in range(count)]
+                for op in self._coalesce(batch):
+                    try:
+                        await self._apply(op)
+                    except Exception:
+                        log.warning(
+                            "Chat journal %s on thread %s failed",
+                            op.kind,
+                            op.thread_id,
+                            exc_info=True,
+                        )
+
+    @staticmethod
+    def _coalesce(batch: list[_JournalOp]) -> list[_JournalOp]:
+        """Drop writes that a later op in the same batch makes redundant.
+
+        Message writes before a ``clear``/``delete`` of the same thread are
+        skipped, as is a ``save`` immediately followed by another ``save``.
+        """
+        kept: list[_JournalOp] = []
+        reset: set[str] = set()
+        next_kind: dict[str, str] = {}
+        for op in reversed(batch):
+            superseded = (op.kind in ("append", "truncate", "clear") and op.thread_id in reset) or (
+                op.kind == "save" and next_kind.get(op.thread_id) == "save"
+            )
+            if op.kind in ("clear", "delete"):
+                reset.add(op.thread_id)
+            next_kind[op.thread_id] = op.kind
+            if not superseded:
+                kept.append(op)
+        kept.reverse()
+        return kept
+
+    async def _apply(self, op: _JournalOp) -> None:
+        store, scope = self._store, self._scope
+        if op.kind == "save":
+            existing = await store.get_thread(scope, op.thread_id)
+            if existing is not None:
+                existing.title = op.title
+                existing.updated_at = time.time()
+                await store.save_thread(scope, existing)
+            else:
+                from .models import ChatThread
+
+                await store.save_thread(scope, ChatThread(thread_id=op.thread_id, title=op.title))
+        elif op.kind == "append":
+            await store.append_message(scope, op.thread_id, message_to_store(op.message))
+        elif op.kind == "clear":
+            await store.clear_messages(scope, op.thread_id)
+        elif op.kind == "truncate":
+            if not await store.truncate_messages(scope, op.thread_id, op.from_id):
+                log.warning(
+                    "Chat journal truncate on thread %s skipped: message %s is not stored",
+                    op.thread_id,
+                    op.from_id,
+                )
+        elif op.kind == "delete":
+            await store.delete_thread(scope, op.thread_id)
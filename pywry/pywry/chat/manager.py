@@ -35,7 +35,7 @@ import uuid
 
 from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from pydantic import BaseModel
 
@@ -50,6 +50,7 @@ from .artifacts import (
     TradingViewArtifact,
     _ArtifactBase,
 )
+from .journal import ChatJournal
 from .updates import (
     AgentMessageUpdate,
     ArtifactUpdate,
@@ -65,6 +66,12 @@ from .updates import (
 )
 
 
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    from ..state.base import ChatStore
+
+
 log = logging.getLogger(__name__)
 
 
@@ -270,16 +277,158 @@ HandlerFunc = Callable[..., Any]
 
 
 class _StreamState:
-    """Mutable state container for stream text buffering."""
+    """Mutable state container for stream text buffering.
+
+    Text is accumulated as a list of chunks and only joined when read, so
+    long answers cost linear rather than quadratic copying.  ``sent`` is
+    the offset of the next chunk sent to the frontend, counted in UTF-16
+    code units to match JavaScript string lengths.
+    """
 
-    __slots__ = ("buffer", "full_text", "last_flush", "message_id")
+    __slots__ = ("_parts", "_pending", "_pending_len", "last_flush", "message_id", "sent")
 
     def __init__(self, message_id: str) -> None:
         self.message_id = message_id
-        self.full_text = ""
-        self.buffer = ""
+        self._parts: list[str] = []
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self.sent = 0
         self.last_flush = time.monotonic()
 
+    def append(self, text: str) -> None:
+        """Add streamed text to both the pending buffer and the full text."""
+        self._parts.append(text)
+        self._pending.append(text)
+        self._pending_len += len(text)
+
+    @property
+    def buffer(self) -> str:
+        """Text buffered since the last flush."""
+        return "".join(self._pending)
+
+    @property
+    def buffer_len(self) -> int:
+        """Length of the buffered text, without joining it."""
+        return self._pending_len
+
+    def take_buffer(self) -> str:
+        """Return and clear the buffered text, advancing ``sent``."""
+        chunk = "".join(self._pending)
+        self._pending.clear()
+        self._pending_len = 0
+        self.sent += len(chunk.encode("utf-16-le")) // 2
+        return chunk
+
+    @property
+    def full_text(self) -> str:
+        """Everything streamed so far."""
+        if len(self._parts) > 1:
+            self._parts[:] = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+
+class _ProviderRuntime:
+    """Long-lived event loop that runs provider generations as tasks.
+
+    Async SDK clients (``AsyncOpenAI``, ``AsyncAnthropic``, ...) bind their
+    HTTP connection pools to the loop that first used them.  Running every
+    turn on one persistent loop keeps those pools alive across turns, lets
+    generations for different threads run concurrently, and gives each
+    generation a real ``asyncio.Task`` that can be cancelled.
+
+    The loop thread is started lazily on the first submission.
+    """
+
+    def __init__(self, name: str = "pywry-chat-provider") -> None:
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop, started on first access."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                ready = threading.Event()
+                loop = asyncio.new_event_loop()
+
+                def _run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name=self._name, daemon=True)
+                self._thread.start()
+                ready.wait(timeout=5.0)
+                self._loop = loop
+            return self._loop
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._loop is not None and self._loop.is_running()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is executing on the runtime's loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Any) -> concurrent.futures.Future[Any]:
+        """Schedule a coroutine on the runtime loop.
+
+        Parameters
+        ----------
+        coro : Coroutine
+            Coroutine to run.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future for the result. Cancelling it cancels the underlying task.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Any) -> Any:
+        """Run a coroutine on the runtime loop and block for its result.
+
+        Parameters
+        ----------
+        coro : Coroutine
+            Coroutine to run.
+
+        Returns
+        -------
+        Any
+            The coroutine's result.
+
+        Raises
+        ------
+        RuntimeError
+            If called from the runtime's own loop thread (would deadlock).
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                "_ProviderRuntime.run() cannot be called from the provider loop. "
+                "Use 'await' directly instead."
+            )
+        return self.submit(coro).result()
+
+    def close(self) -> None:
+        """Stop the loop thread and close the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+        if loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout=5.0)
+        if not loop.is_running():
+            loop.close()
+
 
 def _tool_result_text(content: Any) -> str:
     """Flatten a ToolCallUpdate.content value into a plain string for the UI."""
@@ -348,6 +497,20 @@ class ChatManager:
         Allowed file extensions (required when ``enable_file_attach=True``).
     context_allowed_roots : list[str] | None
         Restrict file attachments to these directories.
+    store : ChatStore | None
+        Chat store that receives thread history through a write-behind
+        journal. Enables restoring history on restart and evicting old
+        messages from memory.
+    persist : bool
+        Persist history into the configured ``get_chat_store()`` backend
+        when no ``store`` is given.
+    chat_id : str
+        Key that scopes persisted threads in the store. Use a stable
+        value (per app or per user) to restore history after a restart.
+    history_window : int
+        Messages kept in memory per thread when persistence is enabled.
+        Older messages are reloaded from the store on scroll-back or
+        when an evicted message is edited or resent.
     """
 
     CONTEXT_TOOL: ClassVar[dict[str, Any]] = {
@@ -398,6 +561,10 @@ class ChatManager:
         enable_file_attach: bool = False,
         file_accept_types: list[str] | None = None,
         context_allowed_roots: list[str] | None = None,
+        store: ChatStore | None = None,
+        persist: bool = False,
+        chat_id: str = "chat",
+        history_window: int = 200,
     ) -> None:
         if provider is None and handler is None:
             raise ValueError("Either 'provider' or 'handler' must be supplied")
@@ -443,6 +610,9 @@ class ChatManager:
         self._thread_titles: dict[str, str] = {}
         self._active_thread: str = ""
         self._cancel_events: dict[str, threading.Event] = {}
+        self._generations: dict[str, concurrent.futures.Future[Any]] = {}
+        self._runtime = _ProviderRuntime()
+        self._emit_latency: float = 0.0
         self._settings_values: dict[str, Any] = {
             s.id: s.value for s in self._settings_items if s.type != "separator"
         }
@@ -455,11 +625,95 @@ class ChatManager:
         # ACP session state
         self._session_id: str = ""
 
+        # Persistence: write-behind journal + in-memory history window
+        self._history_window = max(1, history_window)
+        self._older_available: set[str] = set()
+        self._journal: ChatJournal | None = None
+        self._init_threads(store, persist, chat_id)
+
+    def _init_threads(self, store: ChatStore | None, persist: bool, chat_id: str) -> None:
+        """Attach the write-behind journal, restore threads, or create the default one."""
+        if store is None and persist:
+            from ..state import get_chat_store
+
+            store = get_chat_store()
+        if store is not None:
+            self._journal = ChatJournal(store, chat_id)
+            self._restore_threads()
+
+        if self._threads:
+            self._active_thread = next(reversed(self._threads))
+            return
         # Create default thread
         default_id = f"thread_{uuid.uuid4().hex[:8]}"
         self._threads[default_id] = []
         self._thread_titles[default_id] = "Chat 1"
         self._active_thread = default_id
+        if self._journal is not None:
+            self._journal.save_thread(default_id, "Chat 1")
+
+    def _restore_threads(self) -> None:
+        """Load persisted threads and their latest messages from the store."""
+        journal = self._journal
+        if journal is None:
+            return
+        try:
+            for thread_id, title in journal.load_threads():
+                messages = journal.load_messages(thread_id, self._history_window)
+                self._threads[thread_id] = messages
+                self._thread_titles[thread_id] = title
+                if len(messages) >= self._history_window:
+                    self._older_available.add(thread_id)
+        except Exception:
+            log.warning("Failed to restore chat threads from the store", exc_info=True)
+
+    def _append_message(self, thread_id: str, message: MessageDict) -> None:
+        """Append to a thread's history, journal it, and evict past the window."""
+        thread = self._threads.setdefault(thread_id, [])
+        if self._journal is None:
+            thread.append(message)
+            return
+        message.setdefault("id", f"msg_{uuid.uuid4().hex[:8]}")
+        thread.append(message)
+        self._journal.append(thread_id, message)
+        overflow = len(thread) - self._history_window
+        if overflow > 0:
+            del thread[:overflow]
+            self._older_available.add(thread_id)
+
+    def _reset_thread(self, thread_id: str) -> None:
+        """Drop every message from a thread, including persisted history."""
+        self._threads[thread_id] = []
+        self._older_available.discard(thread_id)
+        if self._journal is not None:
+            self._journal.clear(thread_id)
+
+    def _load_older(self, thread_id: str, limit: int) -> int:
+        """Prepend up to ``limit`` evicted messages back into memory.
+
+        Returns
+        -------
+        int
+            Number of messages loaded.
+        """
+        if self._journal is None or thread_id not in self._older_available:
+            return 0
+        thread = self._threads.setdefault(thread_id, [])
+        before_id = thread[0].get("id") if thread else None
+        older = self._journal.load_messages(thread_id, limit, before_id=before_id)
+        if len(older) < limit:
+            self._older_available.discard(thread_id)
+        self._threads[thread_id] = older + thread
+        return len(older)
+
+    def _find_message(self, thread_id: str, message_id: str, role: str | None = None) -> int | None:
+        """Index of a message in memory, reloading evicted history if needed."""
+        while True:
+            for idx, msg in enumerate(self._threads.get(thread_id, [])):
+                if msg.get("id") == message_id and (role is None or msg.get("role") == role):
+                    return idx
+            if not self._load_older(thread_id, self._history_window):
+                return None
 
     def register_context_source(self, component_id: str, name: str) -> None:
         """Register a live component as an @-mentionable context source.
@@ -547,6 +801,7 @@ class ChatManager:
             "chat:input-response": self._on_input_response,
             "chat:edit-message": self._on_edit_message,
             "chat:resend-from": self._on_resend_from,
+            "chat:request-history": self._on_request_history,
         }
 
     @property
@@ -561,7 +816,11 @@ class ChatManager:
 
     @property
     def threads(self) -> dict[str, list[MessageDict]]:
-        """Thread history (read-only view)."""
+        """Thread history (read-only view).
+
+        With persistence enabled only the in-memory window of each thread
+        is included.
+        """
         return dict(self._threads)
 
     def send_message(self, text: str, thread_id: str | None = None) -> None:
@@ -580,8 +839,7 @@ class ChatManager:
             "chat:assistant-message",
             {"messageId": msg_id, "text": text, "threadId": tid},
         )
-        self._threads.setdefault(tid, [])
-        self._threads[tid].append({"id": msg_id, "role": "assistant", "text": text})
+        self._append_message(tid, {"id": msg_id, "role": "assistant", "text": text})
 
     def _emit(self, event: str, data: dict[str, Any]) -> None:
         """Emit an event via the bound widget."""
@@ -1056,30 +1314,58 @@ class ChatManager:
             self._dispatch_session_update(item, state, thread_id, ctx)
 
     _STREAM_FLUSH_INTERVAL: float = 0.030
+    _STREAM_MAX_FLUSH_INTERVAL: float = 0.250
     _STREAM_MAX_BUFFER: int = 300
+    _STREAM_LATENCY_FACTOR: float = 4.0
+    _STREAM_QUEUE_SOFT_LIMIT: int = 8
+
+    def _stream_flush_interval(self) -> float:
+        """Current flush interval, stretched by transport latency and backlog.
+
+        The base interval grows to ``_STREAM_LATENCY_FACTOR`` times the
+        smoothed cost of one emit, and again with the number of events the
+        widget reports as still queued for delivery, capped at
+        ``_STREAM_MAX_FLUSH_INTERVAL``.
+        """
+        base = self._STREAM_FLUSH_INTERVAL
+        if base <= 0:
+            return 0.0
+        interval = max(base, self._STREAM_LATENCY_FACTOR * self._emit_latency)
+        backlog = getattr(self._widget, "pending_events", 0)
+        if isinstance(backlog, int) and backlog > 0:
+            interval *= 1 + backlog / self._STREAM_QUEUE_SOFT_LIMIT
+        return min(interval, self._STREAM_MAX_FLUSH_INTERVAL)
 
     def _flush_buffer(self, state: _StreamState) -> None:
         """Flush buffered text to the frontend."""
-        if state.buffer:
+        if state.buffer_len:
+            offset = state.sent
+            chunk = state.take_buffer()
+            started = time.monotonic()
             self._emit_fire(
                 "chat:stream-chunk",
                 {
                     "messageId": state.message_id,
-                    "chunk": state.buffer,
+                    "chunk": chunk,
+                    "offset": offset,
                     "done": False,
                 },
             )
-            state.buffer = ""
             state.last_flush = time.monotonic()
+            cost = state.last_flush - started
+            self._emit_latency += 0.2 * (cost - self._emit_latency)
 
     def _buffer_text(self, state: _StreamState, text: str) -> None:
-        """Add text to buffer, auto-flush on threshold."""
-        state.buffer += text
-        state.full_text += text
-        if state.buffer and (
-            time.monotonic() - state.last_flush >= self._STREAM_FLUSH_INTERVAL
-            or len(state.buffer) >= self._STREAM_MAX_BUFFER
-        ):
+        """Add text to buffer, auto-flush on an adaptive threshold."""
+        state.append(text)
+        if not state.buffer_len:
+            return
+        interval = self._stream_flush_interval()
+        base = self._STREAM_FLUSH_INTERVAL
+        max_buffer = self._STREAM_MAX_BUFFER
+        if base > 0:
+            max_buffer = int(max_buffer * interval / base)
+        if time.monotonic() - state.last_flush >= interval or state.buffer_len >= max_buffer:
             self._flush_buffer(state)
 
     def _finalize_stream(self, state: _StreamState, thread_id: str) -> None:
@@ -1099,9 +1385,8 @@ class ChatManager:
             {"messageId": state.message_id, "chunk": "", "done": True},
         )
         if state.full_text:
-            self._threads.setdefault(thread_id, [])
-            self._threads[thread_id].append(
-                {"id": state.message_id, "role": "assistant", "text": state.full_text}
+            self._append_message(
+                thread_id, {"id": state.message_id, "role": "assistant", "text": state.full_text}
             )
 
     def _handle_cancel(self, state: _StreamState, thread_id: str) -> None:
@@ -1117,14 +1402,14 @@ class ChatManager:
             },
         )
         if state.full_text:
-            self._threads.setdefault(thread_id, [])
-            self._threads[thread_id].append(
+            self._append_message(
+                thread_id,
                 {
                     "id": state.message_id,
                     "role": "assistant",
                     "text": state.full_text,
                     "stopped": True,
-                }
+                },
             )
 
     def _handle_stream(
@@ -1253,11 +1538,13 @@ class ChatManager:
             )
             self._handle_stream(result, message_id, thread_id, cancel, ctx=ctx)
         elif inspect.isasyncgen(result):
-            asyncio.run(self._handle_async_stream(result, message_id, thread_id, cancel, ctx=ctx))
+            self._runtime.run(
+                self._handle_async_stream(result, message_id, thread_id, cancel, ctx=ctx)
+            )
         elif inspect.iscoroutine(result):
-            resolved = asyncio.run(result)
+            resolved = self._runtime.run(result)
             if inspect.isasyncgen(resolved):
-                asyncio.run(
+                self._runtime.run(
                     self._handle_async_stream(resolved, message_id, thread_id, cancel, ctx=ctx)
                 )
             elif isinstance(resolved, str):
@@ -1297,8 +1584,7 @@ class ChatManager:
             "chat:assistant-message",
             {"messageId": message_id, "text": text, "threadId": thread_id},
         )
-        self._threads.setdefault(thread_id, [])
-        self._threads[thread_id].append({"id": message_id, "role": "assistant", "text": text})
+        self._append_message(thread_id, {"id": message_id, "role": "assistant", "text": text})
 
     def _run_handler(
         self,
@@ -1323,12 +1609,12 @@ class ChatManager:
                 "chat:assistant-message",
                 {"messageId": message_id, "text": error_text, "threadId": thread_id},
             )
-            self._threads.setdefault(thread_id, [])
-            self._threads[thread_id].append(
-                {"id": message_id, "role": "assistant", "text": error_text}
+            self._append_message(
+                thread_id, {"id": message_id, "role": "assistant", "text": error_text}
             )
         finally:
-            self._cancel_events.pop(thread_id, None)
+            if self._cancel_events.get(thread_id) is cancel:
+                self._cancel_events.pop(thread_id, None)
 
     def _on_user_message(self, data: Any, _event_type: str, _label: str) -> None:
         """Handle incoming user message."""
@@ -1342,8 +1628,7 @@ class ChatManager:
         user_message_id = data.get("messageId") or f"msg_{uuid.uuid4().hex[:8]}"
 
         self._active_thread = thread_id
-        self._threads.setdefault(thread_id, [])
-        self._threads[thread_id].append({"id": user_message_id, "role": "user", "text": text})
+        self._append_message(thread_id, {"id": user_message_id, "role": "user", "text": text})
 
         message_id = f"msg_{uuid.uuid4().hex[:8]}"
         cancel = threading.Event()
@@ -1385,12 +1670,28 @@ class ChatManager:
             )
             t.start()
         elif self._provider is not None:
-            t = threading.Thread(
-                target=self._run_provider,
-                args=(messages, ctx, message_id, thread_id, cancel),
-                daemon=True,
-            )
-            t.start()
+            self._start_provider(messages, ctx, message_id, thread_id, cancel)
+
+    def _start_provider(
+        self,
+        messages: list[MessageDict],
+        ctx: ChatContext,
+        message_id: str,
+        thread_id: str,
+        cancel: threading.Event,
+    ) -> concurrent.futures.Future[Any]:
+        """Submit a provider generation to the persistent provider loop."""
+        future = self._runtime.submit(
+            self._run_provider_async(messages, ctx, message_id, thread_id, cancel)
+        )
+        self._generations[thread_id] = future
+
+        def _forget(done: concurrent.futures.Future[Any]) -> None:
+            if self._generations.get(thread_id) is done:
+                self._generations.pop(thread_id, None)
+
+        future.add_done_callback(_forget)
+        return future
 
     def _run_provider(
         self,
@@ -1400,9 +1701,27 @@ class ChatManager:
         thread_id: str,
         cancel: threading.Event,
     ) -> None:
-        """Execute the ACP provider prompt in a background thread."""
+        """Execute the ACP provider prompt and block until it finishes."""
+        self._runtime.run(self._run_provider_async(messages, ctx, message_id, thread_id, cancel))
+
+    async def _run_provider_async(
+        self,
+        messages: list[MessageDict],
+        ctx: ChatContext,
+        message_id: str,
+        thread_id: str,
+        cancel: threading.Event,
+    ) -> None:
+        """Run one ACP provider prompt turn as a task on the provider loop."""
         from .models import TextPart
 
+        state = _StreamState(message_id)
+        cancel_event = asyncio.Event()
+        # Use the UI thread_id as the provider session_id so each chat
+        # thread has its own LangGraph checkpointer thread and the agent
+        # sees prior turns in the same conversation.
+        session_id = thread_id or self._session_id
+        stream: Any = None
         try:
             messages = self._inject_context(messages, ctx, message_id, thread_id)
 
@@ -1412,35 +1731,37 @@ class ChatManager:
                 last = messages[-1]
                 content_blocks.append(TextPart(text=last.get("text", "")))
 
-            cancel_event = asyncio.Event()
-            # Use the UI thread_id as the provider session_id so each chat
-            # thread has its own LangGraph checkpointer thread and the agent
-            # sees prior turns in the same conversation.
-            session_id = thread_id or self._session_id
-
-            async def _run() -> None:
-                state = _StreamState(message_id)
-                typing_hidden = False
-                async for update in self._provider.prompt(session_id, content_blocks, cancel_event):
-                    if not typing_hidden:
-                        typing_hidden = True
-                        self._emit(
-                            "chat:typing-indicator",
-                            {"typing": False, "threadId": thread_id},
-                        )
-                    if cancel.is_set():
-                        cancel_event.set()
-                        self._handle_cancel(state, thread_id)
-                        return
-                    self._dispatch_session_update(update, state, thread_id, ctx)
+            typing_hidden = False
+            stream = self._provider.prompt(session_id, content_blocks, cancel_event)
+            async for update in stream:
                 if not typing_hidden:
+                    typing_hidden = True
                     self._emit(
                         "chat:typing-indicator",
                         {"typing": False, "threadId": thread_id},
                     )
-                self._finalize_stream(state, thread_id)
-
-            asyncio.run(_run())
+                if cancel.is_set():
+                    cancel_event.set()
+                    self._handle_cancel(state, thread_id)
+                    return
+                self._dispatch_session_update(update, state, thread_id, ctx)
+            if not typing_hidden:
+                self._emit(
+                    "chat:typing-indicator",
+                    {"typing": False, "threadId": thread_id},
+                )
+            self._finalize_stream(state, thread_id)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            try:
+                await self._provider.cancel(session_id)
+            except Exception:
+                log.debug("provider.cancel failed", exc_info=True)
+            self._emit(
+                "chat:typing-indicator",
+                {"typing": False, "threadId": thread_id},
+            )
+            self._handle_cancel(state, thread_id)
         except Exception as exc:
             self._emit(
                 "chat:typing-indicator",
@@ -1451,19 +1772,43 @@ class ChatManager:
                 "chat:assistant-message",
                 {"messageId": message_id, "text": error_text, "threadId": thread_id},
             )
-            self._threads.setdefault(thread_id, [])
-            self._threads[thread_id].append(
-                {"id": message_id, "role": "assistant", "text": error_text}
+            self._append_message(
+                thread_id, {"id": message_id, "role": "assistant", "text": error_text}
             )
         finally:
-            self._cancel_events.pop(thread_id, None)
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception:
+                    log.debug("provider stream aclose failed", exc_info=True)
+            if self._cancel_events.get(thread_id) is cancel:
+                self._cancel_events.pop(thread_id, None)
+
+    def _cancel_generation(self, thread_id: str) -> None:
+        """Signal and cancel the active generation for a thread, if any."""
+        cancel = self._cancel_events.get(thread_id)
+        if cancel:
+            cancel.set()
+        future = self._generations.get(thread_id)
+        if future is not None:
+            future.cancel()
 
     def _on_stop_generation(self, data: Any, _event_type: str, _label: str) -> None:
         """Cancel active generation."""
         thread_id = data.get("threadId", self._active_thread)
-        cancel = self._cancel_events.get(thread_id)
-        if cancel:
-            cancel.set()
+        self._cancel_generation(thread_id)
+
+    def close(self) -> None:
+        """Cancel running generations, stop the provider loop, flush history.
+
+        The loop is restarted transparently if the manager is used again.
+        """
+        for thread_id in list(self._generations):
+            self._cancel_generation(thread_id)
+        self._runtime.close()
+        if self._journal is not None:
+            self._journal.flush()
 
     def _truncate_thread_at(
         self,
@@ -1479,18 +1824,16 @@ class ChatManager:
         messages after it are removed; when False the target message and
         everything after it are removed.
         """
-        messages = self._threads.get(thread_id, [])
-        cut_index: int | None = None
-        for idx, msg in enumerate(messages):
-            if msg.get("id") == message_id:
-                cut_index = idx
-                break
+        cut_index = self._find_message(thread_id, message_id)
         if cut_index is None:
             return [], []
+        messages = self._threads.get(thread_id, [])
         keep_until = cut_index + 1 if keep_target else cut_index
         removed = messages[keep_until:]
         removed_ids = [m.get("id", "") for m in removed if m.get("id")]
         self._threads[thread_id] = messages[:keep_until]
+        if self._journal is not None and removed_ids:
+            self._journal.truncate(thread_id, removed_ids[0])
         return removed, removed_ids
 
     def _truncate_provider_state(self, thread_id: str, kept_messages: list[MessageDict]) -> None:
@@ -1519,19 +1862,13 @@ class ChatManager:
         if not message_id or not new_text:
             return
 
-        messages = self._threads.get(thread_id, [])
-        target_idx: int | None = None
-        for idx, msg in enumerate(messages):
-            if msg.get("id") == message_id and msg.get("role") == "user":
-                target_idx = idx
-                break
+        target_idx = self._find_message(thread_id, message_id, role="user")
         if target_idx is None:
             return
+        messages = self._threads.get(thread_id, [])
 
         # Cancel any active generation in this thread before mutating history
-        active_cancel = self._cancel_events.get(thread_id)
-        if active_cancel:
-            active_cancel.set()
+        self._cancel_generation(thread_id)
 
         # Replace the user message text and drop everything after it
         messages[target_idx] = {**messages[target_idx], "text": new_text}
@@ -1562,6 +1899,8 @@ class ChatManager:
         # Pop the just-edited user message so _on_user_message re-appends it
         # with the same id.
         self._threads[thread_id] = messages[:target_idx]
+        if self._journal is not None:
+            self._journal.truncate(thread_id, message_id)
         self._on_user_message(synthetic, "chat:user-message", "")
 
     def _on_resend_from(self, data: Any, _event_type: str, _label: str) -> None:
@@ -1577,24 +1916,20 @@ class ChatManager:
         if not message_id:
             return
 
-        messages = self._threads.get(thread_id, [])
-        target_idx: int | None = None
-        for idx, msg in enumerate(messages):
-            if msg.get("id") == message_id and msg.get("role") == "user":
-                target_idx = idx
-                break
+        target_idx = self._find_message(thread_id, message_id, role="user")
         if target_idx is None:
             return
+        messages = self._threads.get(thread_id, [])
 
-        active_cancel = self._cancel_events.get(thread_id)
-        if active_cancel:
-            active_cancel.set()
+        self._cancel_generation(thread_id)
 
         target = messages[target_idx]
         # Keep the target user message; drop everything after it.
         removed = messages[target_idx + 1 :]
         removed_ids = [m.get("id", "") for m in removed if m.get("id")]
         self._threads[thread_id] = messages[: target_idx + 1]
+        if self._journal is not None and removed_ids:
+            self._journal.truncate(thread_id, removed_ids[0])
 
         # Frontend drops the obsolete bubbles.  We deliberately DO NOT
         # pass ``editedMessageId`` / ``editedText`` — the target bubble
@@ -1643,11 +1978,7 @@ class ChatManager:
                 daemon=True,
             ).start()
         elif self._provider is not None:
-            threading.Thread(
-                target=self._run_provider,
-                args=(messages_for_run, ctx, new_assistant_id, thread_id, cancel),
-                daemon=True,
-            ).start()
+            self._start_provider(messages_for_run, ctx, new_assistant_id, thread_id, cancel)
 
     def _on_todo_clear(self, _data: Any, _event_type: str, _label: str) -> None:
         """Handle user clearing the plan/todo list."""
@@ -1661,8 +1992,7 @@ class ChatManager:
         pending = self._pending_inputs.pop(request_id, None)
         if pending is None:
             return
-        self._threads.setdefault(thread_id, [])
-        self._threads[thread_id].append({"role": "user", "text": text})
+        self._append_message(thread_id, {"role": "user", "text": text})
         ctx = pending.get("ctx")
         if ctx is not None:
             ctx._input_response = text
@@ -1675,7 +2005,7 @@ class ChatManager:
         thread_id = data.get("threadId", self._active_thread) or self._active_thread
         if command == "/clear":
             self._emit("chat:clear", {"threadId": thread_id})
-            self._threads[thread_id] = []
+            self._reset_thread(thread_id)
             return
         if self._on_slash_command:
             self._on_slash_command(command, args, thread_id)
@@ -1687,6 +2017,8 @@ class ChatManager:
         self._threads[thread_id] = []
         self._thread_titles[thread_id] = title
         self._active_thread = thread_id
+        if self._journal is not None:
+            self._journal.save_thread(thread_id, title)
         self._emit(
             "chat:update-thread-list",
             {"threads": self._build_thread_list()},
@@ -1703,7 +2035,7 @@ class ChatManager:
         self._emit("chat:switch-thread", {"threadId": thread_id})
         self._emit("chat:clear", {})
         for msg in self._threads.get(thread_id, []):
-            msg_id = f"msg_{uuid.uuid4().hex[:8]}"
+            msg_id = msg.get("id") or f"msg_{uuid.uuid4().hex[:8]}"
             role = msg.get("role", "assistant")
             payload: dict[str, Any] = {
                 "messageId": msg_id,
@@ -1719,6 +2051,10 @@ class ChatManager:
         thread_id = data.get("threadId", "")
         self._threads.pop(thread_id, None)
         self._thread_titles.pop(thread_id, None)
+        self._older_available.discard(thread_id)
+        if self._journal is not None:
+            self._journal.delete(thread_id)
+        self._cancel_generation(thread_id)
         self._cancel_events.pop(thread_id, None)
         if self._active_thread == thread_id:
             self._active_thread = next(iter(self._threads), "")
@@ -1735,6 +2071,8 @@ class ChatManager:
         new_title = data.get("title", "")
         if thread_id in self._thread_titles and new_title:
             self._thread_titles[thread_id] = new_title
+            if self._journal is not None:
+                self._journal.save_thread(thread_id, new_title)
         self._emit(
             "chat:update-thread-list",
             {"threads": self._build_thread_list()},
@@ -1746,7 +2084,7 @@ class ChatManager:
         value = data.get("value")
         self._settings_values[key] = value
         if key == "clear-history":
-            self._threads[self._active_thread] = []
+            self._reset_thread(self._active_thread)
             self._emit("chat:clear", {})
             return
         if self._on_settings_change:
@@ -1756,9 +2094,9 @@ class ChatManager:
         """Respond to initialization request from frontend JS."""
         if self._welcome_message and not self._threads.get(self._active_thread):
             welcome_id = f"msg_{uuid.uuid4().hex[:8]}"
-            self._threads.setdefault(self._active_thread, [])
-            self._threads[self._active_thread].append(
-                {"id": welcome_id, "role": "assistant", "text": self._welcome_message}
+            self._append_message(
+                self._active_thread,
+                {"id": welcome_id, "role": "assistant", "text": self._welcome_message},
             )
         self._emit(
             "chat:state-response",
@@ -1773,6 +2111,7 @@ class ChatManager:
                     }
                     for m in self._threads.get(self._active_thread, [])
                 ],
+                "hasOlder": self._active_thread in self._older_available,
             },
         )
         for cmd in self._slash_commands:
@@ -1793,6 +2132,45 @@ class ChatManager:
             if sources:
                 self._emit("chat:context-sources", {"sources": sources})
 
+    def _on_request_history(self, data: Any, _event_type: str, _label: str) -> None:
+        """Serve a page of older messages when the user scrolls back.
+
+        Requests without ``beforeId`` are ignored: the initial page of a
+        thread is replayed by ``chat:switch-thread``.
+        """
+        thread_id = data.get("threadId") or self._active_thread
+        before_id = data.get("beforeId")
+        if not before_id:
+            return
+        limit = max(1, int(data.get("limit") or self._history_window))
+        thread = self._threads.get(thread_id, [])
+        ids = [m.get("id") for m in thread]
+        page: list[MessageDict] = []
+        if before_id in ids:
+            idx = ids.index(before_id)
+            page = thread[max(0, idx - limit) : idx]
+            if len(page) < limit and thread_id in self._older_available and self._journal:
+                first_id = thread[0].get("id")
+                page = self._journal.load_messages(thread_id, limit - len(page), first_id) + page
+        elif self._journal is not None:
+            page = self._journal.load_messages(thread_id, limit, before_id=before_id)
+        self._emit(
+            "chat:history-page",
+            {
+                "threadId": thread_id,
+                "messages": [
+                    {
+                        "id": m.get("id", ""),
+                        "role": m.get("role", "assistant"),
+                        "content": m.get("text", ""),
+                        "stopped": bool(m.get("stopped", False)),
+                    }
+                    for m in page
+                ],
+                "hasMore": len(page) >= limit,
+            },
+        )
+
     def _build_thread_list(self) -> list[dict[str, str]]:
         """Build thread list dicts for the frontend."""
         return [
@@ -62,6 +62,13 @@ class OpenPayload(BaseModel):
     target: str
 
 
+class FrameChunkPayload(BaseModel):
+    """Payload for shared-frame chunk requests."""
+
+    name: str
+    index: int
+
+
 def register_commands(commands: Commands) -> None:
     """Register IPC commands with pytauri.
 
@@ -106,6 +113,13 @@ def register_commands(commands: Commands) -> None:
         """Open a URL in the default browser."""
         return handle_open_url(body.target)
 
+    @commands.command()
+    async def pywry_frame_chunk(body: FrameChunkPayload) -> bytes:
+        """Return one chunk of a shared-memory grid frame as raw JSON bytes."""
+        from ..shared_frame import read_chunk
+
+        return read_chunk(body.name, body.index)
+
     debug("Registered pytauri commands")
 
 
@@ -403,6 +403,13 @@ class WindowSettings(BaseSettings):
         Whether rendered content may make network requests.
     on_window_close : Literal["hide", "close"]
         Default behavior when the user closes a window.
+    warm_standby : bool
+        Launch the native subprocess in the background when ``PyWry`` is
+        constructed and keep a ready spare for restarts.
+    shared_frame_rows : int
+        Row count from which native ``show_dataframe`` hands the rows to the
+        window through shared memory instead of embedding them in the page.
+        ``0`` disables the handoff.
     enable_plotly : bool
         Whether Plotly assets are enabled by default.
     enable_aggrid : bool
@@ -440,6 +447,18 @@ class WindowSettings(BaseSettings):
         default="hide",
         description="What happens when user clicks X: 'hide' keeps window alive, 'close' destroys it",
     )
+    warm_standby: bool = Field(
+        default=False,
+        description="Pre-launch the native subprocess and keep a ready spare for restarts",
+    )
+    shared_frame_rows: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Row count from which native show_dataframe sends rows through shared "
+            "memory instead of the page HTML (0 disables)"
+        ),
+    )
 
     # Library integration
     enable_plotly: bool = Field(default=False, description="Include Plotly.js in window")
@@ -472,6 +491,13 @@ class TVChartSettings(BaseSettings):
     max_bars: int = Field(default=10_000, ge=100)
     stream_buffer_size: int = Field(default=50, ge=1)
     indicator_cache_enabled: bool = True
+    typed_arrays: bool = Field(
+        default=False,
+        description=(
+            "Send initial bar and volume data to the frontend as columnar base64 "
+            "typed arrays instead of lists of objects (requires numpy)."
+        ),
+    )
     storage_backend: Literal[
         "file", "localStorage", "memory", "config", "path", "adapter", "server"
     ] = Field(
@@ -666,6 +692,14 @@ class DeploySettings(BaseSettings):
         ge=60,
         description="User session TTL in seconds",
     )
+    permission_cache_ttl: float = Field(
+        default=1.0,
+        ge=0,
+        description=(
+            "Seconds role permissions and sessions are cached for permission checks "
+            "and by the auth middleware (0 re-reads the store on every check)"
+        ),
+    )
 
     # Worker identification
     worker_id: str | None = Field(
@@ -877,6 +911,35 @@ class ServerSettings(BaseSettings):
     access_log: bool = Field(default=True, description="Enable access logging")
     reload: bool = Field(default=False, description="Enable auto-reload (dev mode)")
 
+    # Event loop and protocol implementations ("auto" picks uvloop, httptools
+    # and websockets when they are installed)
+    loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        default="auto", description="Event loop ('auto' uses uvloop when installed)"
+    )
+    http: Literal["auto", "h11", "httptools"] = Field(
+        default="auto", description="HTTP parser ('auto' uses httptools when installed)"
+    )
+    ws: Literal["auto", "websockets", "websockets-sansio", "wsproto"] = Field(
+        default="auto", description="WebSocket implementation ('auto' prefers websockets)"
+    )
+
+    # WebSocket tuning
+    ws_max_size: int = Field(
+        default=16 * 1024 * 1024, ge=1, description="Max incoming WebSocket message size in bytes"
+    )
+    ws_max_queue: int = Field(
+        default=32, ge=1, description="Max incoming WebSocket messages buffered per connection"
+    )
+    ws_ping_interval: float | None = Field(
+        default=20.0, gt=0, description="Seconds between WebSocket pings (None disables pings)"
+    )
+    ws_ping_timeout: float | None = Field(
+        default=20.0, gt=0, description="Seconds to wait for a pong before closing the connection"
+    )
+    ws_per_message_deflate: bool = Field(
+        default=True, description="Negotiate permessage-deflate WebSocket compression"
+    )
+
     # Timeouts
     timeout_keep_alive: int = Field(default=5, ge=0, description="Keep-alive timeout in seconds")
     timeout_graceful_shutdown: int | None = Field(
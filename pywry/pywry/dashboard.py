@@ -0,0 +1,259 @@
+"""Multi-widget dashboards with payloads serialized on a process pool.
+
+Showing a dashboard of many Plotly figures, grids and charts one
+``show_*`` call at a time runs every figure normalization,
+``build_grid_config`` and ``normalize_ohlcv`` back to back on the calling
+thread.  That work is pure Python and holds the GIL, so threads do not
+help.  A :class:`Dashboard` collects the widgets first and then:
+
+1. converts every payload concurrently in worker processes;
+2. creates every widget on the calling thread, in the order they were
+   added, from the prepared payloads;
+3. registers them with the server in one ``register_widgets`` batch;
+4. displays them.
+
+The pool uses the ``spawn`` start method so that forking never copies
+the server or window threads; scripts must therefore call
+:meth:`Dashboard.show` under ``if __name__ == "__main__":``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+
+    from .grid import GridConfig
+    from .tvchart.models import TVChartData
+    from .widget_protocol import BaseWidget
+
+
+# show_dataframe arguments consumed by build_grid_config
+_GRID_ARGS = (
+    "column_defs",
+    "grid_options",
+    "aggrid_theme",
+    "row_selection",
+    "enable_cell_span",
+    "pagination",
+    "pagination_page_size",
+)
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS: int | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _prepare_figure(figure: Any) -> dict[str, Any]:
+    """Worker job: convert a figure or figure dict into JSON-native values."""
+    from .state_mixins import _normalize_figure, _to_jsonable
+
+    if isinstance(figure, dict):
+        return _to_jsonable(figure)
+    return _normalize_figure(figure)
+
+
+def _prepare_grid(data: Any, options: dict[str, Any]) -> GridConfig:
+    """Worker job: build the grid configuration, row data included."""
+    from .grid import build_grid_config
+
+    return build_grid_config(data, **options)
+
+
+def _prepare_ohlcv(data: Any, options: dict[str, Any]) -> TVChartData:
+    """Worker job: normalize OHLCV data into chart series."""
+    from .tvchart import normalize_ohlcv
+
+    return normalize_ohlcv(data, **options)
+
+
+def _get_pool(max_workers: int | None) -> ProcessPoolExecutor:
+    """Return the shared worker pool, recreating it for a new size."""
+    global _POOL, _POOL_WORKERS  # noqa: PLW0603
+    with _POOL_LOCK:
+        if _POOL is None or max_workers != _POOL_WORKERS:
+            if _POOL is None:
+                atexit.register(_shutdown_pool)
+            else:
+                _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _POOL_WORKERS = max_workers
+        return _POOL
+
+
+def _shutdown_pool() -> None:
+    """Stop the shared worker pool, if one was started."""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        pool, _POOL, _POOL_WORKERS = _POOL, None, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class _Item:
+    """One widget queued on a dashboard."""
+
+    kind: str
+    data: Any
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    display: bool = True
+
+
+class Dashboard:
+    """Builder that shows many widgets with parallel payload preparation.
+
+    Parameters
+    ----------
+    max_workers : int or None
+        Size of the shared process pool (default: CPU count).  With ``0``
+        or ``1`` worker every job runs on the calling thread, skipping the
+        pickling round trip.
+    executor : Executor or None
+        Run jobs on this executor instead of the shared pool.  Jobs and
+        their data must be picklable for process-based executors.
+
+    Examples
+    --------
+    >>> dashboard = Dashboard()
+    >>> dashboard.add_plotly(fig, title="Revenue").add_dataframe(df, height=400)
+    >>> dashboard.add_tvchart(ohlcv, symbol_col="symbol")
+    >>> widgets = dashboard.show()
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        if max_workers is not None and max_workers < 0:
+            raise ValueError("max_workers must be non-negative")
+        self.max_workers = max_workers
+        self.executor = executor
+        self._items: list[_Item] = []
+
+    def __len__(self) -> int:
+        """Return the number of queued widgets."""
+        return len(self._items)
+
+    def add_plotly(self, figure: Any, **kwargs: Any) -> Dashboard:
+        """Queue a Plotly figure; ``kwargs`` are passed to ``show_plotly``."""
+        return self._add("plotly", figure, kwargs)
+
+    def add_dataframe(self, df: Any, **kwargs: Any) -> Dashboard:
+        """Queue a grid; ``kwargs`` are passed to ``show_dataframe``."""
+        return self._add("dataframe", df, kwargs)
+
+    def add_tvchart(self, data: Any = None, **kwargs: Any) -> Dashboard:
+        """Queue a TradingView chart; ``kwargs`` are passed to ``show_tvchart``."""
+        return self._add("tvchart", data, kwargs)
+
+    def _add(self, kind: str, data: Any, kwargs: dict[str, Any]) -> Dashboard:
+        display = kwargs.pop("display", True)
+        self._items.append(_Item(kind, data, kwargs, display))
+        return self
+
+    def prepare(self) -> list[Any]:
+        """Serialize every queued payload, concurrently where possible.
+
+        Returns
+        -------
+        list[Any]
+            One entry per queued widget, in order: a JSON-native figure
+            dict, a ``GridConfig`` or a ``TVChartData`` (``None`` for
+            datafeed charts).  Each is accepted as-is by the matching
+            ``show_*`` function, ``build_plotly_init_script`` or
+            ``build_grid_html``.
+        """
+        jobs = [self._job(item) for item in self._items]
+        pending = [job for job in jobs if job is not None]
+        executor = self.executor
+        workers = (os.cpu_count() or 1) if self.max_workers is None else self.max_workers
+        if executor is None and workers > 1 and len(pending) > 1:
+            executor = _get_pool(self.max_workers)
+        if executor is None:
+            return [None if job is None else job[0](*job[1]) for job in jobs]
+
+        futures = [None if job is None else executor.submit(job[0], *job[1]) for job in jobs]
+        try:
+            return [None if future is None else future.result() for future in futures]
+        except BrokenProcessPool:
+            if executor is _POOL:
+                _shutdown_pool()  # Start a fresh pool on the next call
+            raise
+
+    def show(self) -> list[BaseWidget]:
+        """Create, register and display every queued widget.
+
+        Returns
+        -------
+        list[BaseWidget]
+            The widgets, in the order they were added.
+        """
+        from .inline import (
+            _defer_registration,
+            _display_widget,
+            _state,
+            show_dataframe,
+            show_plotly,
+            show_tvchart,
+        )
+
+        show_fns: dict[str, Callable[..., Any]] = {
+            "plotly": show_plotly,
+            "dataframe": show_dataframe,
+            "tvchart": show_tvchart,
+        }
+        payloads = self.prepare()
+        with _defer_registration() as pending:
+            widgets = [
+                show_fns[item.kind](
+                    item.data if payload is None else payload, display=False, **item.kwargs
+                )
+                for item, payload in zip(self._items, payloads, strict=True)
+            ]
+        if pending:
+            _state.register_widgets(list(pending.values()))
+        for item, widget in zip(self._items, widgets, strict=True):
+            if item.display:
+                _display_widget(widget, item.kwargs.get("open_browser", False))
+        return widgets
+
+    def _job(self, item: _Item) -> tuple[Callable[..., Any], tuple[Any, ...]] | None:
+        """Return the worker function and arguments for ``item``, if any."""
+        if item.kind == "plotly":
+            return _prepare_figure, (item.data,)
+
+        if item.kind == "dataframe":
+            from .inline import _get_default_theme
+
+            theme = item.kwargs.get("theme") or _get_default_theme()
+            options = {key: item.kwargs[key] for key in _GRID_ARGS if key in item.kwargs}
+            options["theme"] = "dark" if theme in ("dark", "system") else "light"
+            options["grid_id"] = item.kwargs.get("widget_id")
+            return _prepare_grid, (item.data, options)
+
+        if item.kwargs.get("use_datafeed"):
+            return None
+        from .config import get_settings
+
+        options = {
+            "symbol_col": item.kwargs.get("symbol_col"),
+            "max_bars": item.kwargs.get("max_bars", 10_000),
+            "typed_arrays": get_settings().tvchart.typed_arrays,
+        }
+        return _prepare_ohlcv, (item.data, options)
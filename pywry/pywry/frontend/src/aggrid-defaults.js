@@ -265,6 +265,13 @@ window.PYWRY_AGGRID_BUILD_OPTIONS = function(config, gridId) {
     // Browser memory limit - AG Grid renders fine but data must fit in memory
     var MAX_SAFE_ROWS = 100000;  // 100k rows
 
+    // Shared-memory frame: rows are streamed in after the grid is created,
+    // so size decisions use the frame's row count
+    var sharedFrame = config.sharedFrame;
+    if (sharedFrame && typeof sharedFrame === 'object') {
+        rowCount = sharedFrame.rows || 0;
+    }
+
     // Handle large datasets - truncate to protect browser memory
     var rowData = config.rowData;
     var truncatedRows = 0;
@@ -279,7 +286,71 @@ window.PYWRY_AGGRID_BUILD_OPTIONS = function(config, gridId) {
     }
 
     // Standard client-side row model with pagination
-    return window.PYWRY_AGGRID_BUILD_CLIENT_OPTIONS(config, id, rowData, rowCount, truncatedRows);
+    var options = window.PYWRY_AGGRID_BUILD_CLIENT_OPTIONS(config, id, rowData, rowCount, truncatedRows);
+
+    if (sharedFrame && typeof sharedFrame === 'object') {
+        var onGridReady = options.onGridReady;
+        var maxRows = rowCount;
+        options.onGridReady = function(event) {
+            onGridReady(event);
+            window.PYWRY_AGGRID_LOAD_SHARED_FRAME(event.api, sharedFrame, maxRows, id);
+        };
+    }
+
+    return options;
+};
+
+/**
+ * Stream the rows of a shared-memory frame into a grid.
+ *
+ * Chunks are fetched one at a time through the ``pywry_frame_chunk``
+ * command, which returns the raw JSON of each chunk, and appended with
+ * row transactions until ``maxRows`` rows are loaded.
+ *
+ * @param {Object} api - AG Grid API
+ * @param {Object} frame - Frame descriptor ({name, chunks, rows})
+ * @param {number} maxRows - Maximum number of rows to load
+ * @param {string} id - Grid identifier for log messages
+ * @returns {Promise<number>} Number of rows loaded
+ */
+window.PYWRY_AGGRID_LOAD_SHARED_FRAME = function(api, frame, maxRows, id) {
+    var pytauri = window.__TAURI__ && window.__TAURI__.pytauri;
+    if (!pytauri || !pytauri.pyInvoke) {
+        console.error('[PyWry AG Grid ' + id + '] Shared frame requires a native window');
+        return Promise.resolve(0);
+    }
+    var loaded = 0;
+
+    function decode(chunk) {
+        if (chunk instanceof ArrayBuffer || ArrayBuffer.isView(chunk)) {
+            return JSON.parse(new TextDecoder().decode(chunk));
+        }
+        return chunk;
+    }
+
+    function next(index) {
+        if (index >= frame.chunks || loaded >= maxRows) {
+            return Promise.resolve(loaded);
+        }
+        return pytauri.pyInvoke('pywry_frame_chunk', { name: frame.name, index: index })
+            .then(function(chunk) {
+                var rows = decode(chunk);
+                if (loaded + rows.length > maxRows) {
+                    rows = rows.slice(0, maxRows - loaded);
+                }
+                api.applyTransaction({ add: rows });
+                if (loaded === 0) {
+                    api.autoSizeAllColumns();
+                }
+                loaded += rows.length;
+                return next(index + 1);
+            });
+    }
+
+    return next(0).catch(function(e) {
+        console.error('[PyWry AG Grid ' + id + '] Failed to load shared frame:', e);
+        return loaded;
+    });
 };
 
 /**
@@ -407,9 +478,65 @@ window.PYWRY_AGGRID_BUILD_CLIENT_OPTIONS = function(config, id, rowData, rowCoun
         }
     };
 
+    // Stable row IDs let transactions match updates/removals to existing rows
+    if (config.rowIdField) {
+        var rowIdField = config.rowIdField;
+        options.getRowId = function(params) {
+            return String(params.data[rowIdField]);
+        };
+    }
+
     return options;
 };
 
+/**
+ * Apply a grid:apply-transaction payload ({add, addIndex, update, remove, async}).
+ *
+ * Entries in `remove` may be row IDs or row objects. Transactions are queued
+ * with applyTransactionAsync unless `async` is false, so a burst of ticks is
+ * applied in a single render.
+ *
+ * @param {Object} gridApi - AG Grid API
+ * @param {Object} data - Transaction payload from Python
+ */
+window.PYWRY_AGGRID_APPLY_TRANSACTION = function(gridApi, data) {
+    var tx = {};
+    if (data.add && data.add.length) {
+        tx.add = data.add;
+        if (data.addIndex != null) tx.addIndex = data.addIndex;
+    }
+    if (data.update && data.update.length) tx.update = data.update;
+    if (data.remove && data.remove.length) {
+        tx.remove = [];
+        data.remove.forEach(function(entry) {
+            if (entry !== null && typeof entry === 'object') {
+                tx.remove.push(entry);
+            } else {
+                var node = gridApi.getRowNode(String(entry));
+                if (node && node.data) tx.remove.push(node.data);
+            }
+        });
+    }
+    if (data.async === false) {
+        gridApi.applyTransaction(tx);
+    } else {
+        gridApi.applyTransactionAsync(tx);
+    }
+};
+
+/**
+ * Apply queued async transactions now, so a full data replacement or
+ * cell edit is not overwritten by an older pending transaction.
+ *
+ * @param {Object} gridApi - AG Grid API
+ */
+window.PYWRY_AGGRID_FLUSH_TRANSACTIONS = function(gridApi) {
+    if (gridApi && typeof gridApi.flushAsyncTransactions === 'function' &&
+            gridApi.getGridOption('rowModelType') !== 'infinite') {
+        gridApi.flushAsyncTransactions();
+    }
+};
+
 /**
  * Build options for Server-Side IPC Row Model.
  * Data stays in Python, JS only has metadata. Python handles sort/filter.
@@ -732,6 +859,7 @@ window.PYWRY_AGGRID_REGISTER_LISTENERS = function(gridApi, gridDiv, gridId) {
 
     window.pywry.on('grid:update-cell', function(data) {
         if (data && (!data.gridId || data.gridId === id)) {
+            window.PYWRY_AGGRID_FLUSH_TRANSACTIONS(gridApi);
             var rowId = data.rowId; // Can be ID or Index
             var colId = data.colId;
             var value = data.value;
@@ -758,6 +886,7 @@ window.PYWRY_AGGRID_REGISTER_LISTENERS = function(gridApi, gridDiv, gridId) {
 
     window.pywry.on('grid:update-data', function(data) {
         if (data && data.data && (!data.gridId || data.gridId === id)) {
+            window.PYWRY_AGGRID_FLUSH_TRANSACTIONS(gridApi);
             if (data.strategy === 'append') {
                 gridApi.applyTransaction({ add: data.data });
             } else if (data.strategy === 'update') {
@@ -769,6 +898,12 @@ window.PYWRY_AGGRID_REGISTER_LISTENERS = function(gridApi, gridDiv, gridId) {
         }
     });
 
+    window.pywry.on('grid:apply-transaction', function(data) {
+        if (data && (!data.gridId || data.gridId === id)) {
+            window.PYWRY_AGGRID_APPLY_TRANSACTION(gridApi, data);
+        }
+    });
+
     window.pywry.on('grid:update-columns', function(data) {
         if (data && data.columnDefs && (!data.gridId || data.gridId === id)) {
             var savedState = saveColumnState();
@@ -794,6 +929,7 @@ window.PYWRY_AGGRID_REGISTER_LISTENERS = function(gridApi, gridDiv, gridId) {
 
             // Update row data
             if (rowData) {
+                window.PYWRY_AGGRID_FLUSH_TRANSACTIONS(gridApi);
                 gridApi.setGridOption('rowData', rowData);
             }
 
@@ -93,6 +93,8 @@ function initChatHandlers(container, pywry) {
     settingsItems: [],
     inputRequiredRequestId: null,
     userScrolledUp: false,
+    historyHasMore: false, // older messages can be paged in from the backend
+    historyLoading: false,
     attachments: [],       // {type, name, content, mimeType, path, widgetId}
     contextSources: [],    // available @mention targets from backend
   };
@@ -623,15 +625,55 @@ function initChatHandlers(container, pywry) {
   // =========================================================================
   var streamBuffer = '';
   var streamRafId = null;
+  // UTF-16 code units received for the streaming message (including the
+  // buffer), used to drop duplicate chunks by their ``offset``.
+  var streamReceived = 0;
+  // Prefix of the streaming message already rendered into the stable
+  // container.  Only the tail after it is re-rendered on each frame.
+  var streamStableLen = 0;
+
+  // Find the last paragraph break in ``text`` after ``from`` that is not
+  // inside a fenced code block.  ``from`` is always outside a fence.
+  function findStableBoundary(text, from) {
+    var boundary = from;
+    var inFence = false;
+    var pos = from;
+    while (pos < text.length) {
+      var nl = text.indexOf('\n', pos);
+      if (nl === -1) break;
+      var line = text.substring(pos, nl);
+      if (/^\s*```/.test(line)) inFence = !inFence;
+      if (!inFence && text.charAt(nl + 1) === '\n') boundary = nl + 2;
+      pos = nl + 1;
+    }
+    return boundary;
+  }
+
+  function getStreamContainers(contentEl) {
+    var stableEl = contentEl.querySelector(':scope > .pywry-chat-stream-stable');
+    var tailEl = contentEl.querySelector(':scope > .pywry-chat-stream-tail');
+    if (!stableEl || !tailEl) {
+      contentEl.innerHTML = '';
+      stableEl = document.createElement('div');
+      stableEl.className = 'pywry-chat-stream-stable';
+      tailEl = document.createElement('div');
+      tailEl.className = 'pywry-chat-stream-tail';
+      contentEl.appendChild(stableEl);
+      contentEl.appendChild(tailEl);
+      streamStableLen = 0;
+    }
+    return { stable: stableEl, tail: tailEl };
+  }
+
+  function getStreamingContentEl() {
+    if (!state.streamingMsgId || !chatArea) return null;
+    var msgEl = chatArea.querySelector('[data-msg-id="' + state.streamingMsgId + '"]');
+    return msgEl ? msgEl.querySelector('.pywry-chat-msg-content') : null;
+  }
 
   function flushStreamBuffer() {
     streamRafId = null;
-    if (!state.streamingMsgId || !chatArea) return;
-
-    var msgEl = chatArea.querySelector('[data-msg-id="' + state.streamingMsgId + '"]');
-    if (!msgEl) return;
-
-    var contentEl = msgEl.querySelector('.pywry-chat-msg-content');
+    var contentEl = getStreamingContentEl();
     if (!contentEl) return;
 
     var msg = state.messages.find(function (m) { return m.id === state.streamingMsgId; });
@@ -641,12 +683,28 @@ function initChatHandlers(container, pywry) {
     streamBuffer = '';
 
     if (msg) {
-      contentEl.innerHTML = renderMarkdown(msg.text);
+      // Completed paragraphs are rendered once and appended; only the
+      // in-progress tail is re-parsed per frame.
+      var parts = getStreamContainers(contentEl);
+      var boundary = findStableBoundary(msg.text, streamStableLen);
+      if (boundary > streamStableLen) {
+        parts.stable.insertAdjacentHTML(
+          'beforeend',
+          renderMarkdown(msg.text.substring(streamStableLen, boundary))
+        );
+        streamStableLen = boundary;
+      }
+      parts.tail.innerHTML = renderMarkdown(msg.text.substring(streamStableLen));
     }
     maybeAutoScroll();
   }
 
-  function appendStreamChunk(chunk) {
+  function appendStreamChunk(chunk, offset) {
+    if (typeof offset === 'number') {
+      if (offset + chunk.length <= streamReceived) return;
+      if (offset < streamReceived) chunk = chunk.substring(streamReceived - offset);
+    }
+    streamReceived += chunk.length;
     streamBuffer += chunk;
     if (!streamRafId) {
       streamRafId = requestAnimationFrame(flushStreamBuffer);
@@ -656,6 +714,8 @@ function initChatHandlers(container, pywry) {
   function startStreaming(messageId, threadId) {
     state.isStreaming = true;
     state.streamingMsgId = messageId;
+    streamReceived = 0;
+    streamStableLen = 0;
 
     var msg = {
       id: messageId,
@@ -677,6 +737,16 @@ function initChatHandlers(container, pywry) {
     streamRafId = null;
     streamBuffer = '';
 
+    // One full render so block constructs split across paragraph
+    // boundaries (lists, tables) end up exactly as a non-streamed reply.
+    var finalEl = getStreamingContentEl();
+    var finalMsg = state.messages.find(function (m) { return m.id === state.streamingMsgId; });
+    if (finalEl && finalMsg && finalMsg.text) {
+      finalEl.innerHTML = renderMarkdown(finalMsg.text);
+    }
+    streamReceived = 0;
+    streamStableLen = 0;
+
     if (stopped) {
       var msg = state.messages.find(function (m) { return m.id === state.streamingMsgId; });
       if (msg) {
@@ -1234,7 +1304,7 @@ function initChatHandlers(container, pywry) {
       startStreaming(data.messageId, data.threadId);
     }
     if (data.chunk) {
-      appendStreamChunk(data.chunk);
+      appendStreamChunk(data.chunk, data.offset);
     }
     if (data.done) {
       stopStreaming(data.stopped || false);
@@ -1252,6 +1322,8 @@ function initChatHandlers(container, pywry) {
   pywry.on('chat:switch-thread', function (data) {
     state.activeThreadId = data.threadId;
     state.messages = [];
+    state.historyHasMore = true;
+    state.historyLoading = false;
     // Clear any pending input-required state
     if (state.inputRequiredRequestId) {
       state.inputRequiredRequestId = null;
@@ -1340,6 +1412,9 @@ function initChatHandlers(container, pywry) {
 
   // History/state response
   pywry.on('chat:state-response', function (data) {
+    if (data.hasOlder !== undefined) {
+      state.historyHasMore = !!data.hasOlder;
+    }
     if (data.messages) {
       state.messages = data.messages.map(function (m) {
         return {
@@ -1366,6 +1441,42 @@ function initChatHandlers(container, pywry) {
     }
   });
 
+  // Older messages paged in on scroll-back — prepend without moving the view
+  pywry.on('chat:history-page', function (data) {
+    state.historyLoading = false;
+    if (data.threadId && data.threadId !== state.activeThreadId) return;
+    state.historyHasMore = !!data.hasMore;
+    var older = (data.messages || []).map(function (m) {
+      return {
+        id: m.id,
+        role: m.role,
+        text: typeof m.content === 'string' ? m.content : '',
+        threadId: data.threadId || state.activeThreadId,
+        stopped: m.stopped || false
+      };
+    });
+    if (!older.length || !chatArea) return;
+    state.messages = older.concat(state.messages);
+    var prevHeight = chatArea.scrollHeight;
+    var firstEl = chatArea.firstChild;
+    older.forEach(function (m) {
+      chatArea.insertBefore(createMessageEl(m), firstEl);
+    });
+    chatArea.scrollTop = chatArea.scrollHeight - prevHeight;
+  });
+
+  function requestOlderHistory() {
+    if (!state.historyHasMore || state.historyLoading || !state.messages.length) return;
+    var firstId = state.messages[0].id;
+    if (!firstId) return;
+    state.historyLoading = true;
+    pywry.emit('chat:request-history', {
+      threadId: state.activeThreadId,
+      beforeId: firstId,
+      limit: __PYWRY_CHAT_MAX_RENDERED
+    });
+  }
+
   // Generation stopped confirmation
   pywry.on('chat:generation-stopped', function (data) {
     var msg = state.messages.find(function (m) { return m.id === data.messageId; });
@@ -2567,6 +2678,7 @@ function initChatHandlers(container, pywry) {
   if (chatArea) {
     var __scrollTimer = null;
     chatArea.addEventListener('scroll', function () {
+      if (chatArea.scrollTop === 0) requestOlderHistory();
       var nearBottom = (chatArea.scrollHeight - chatArea.scrollTop - chatArea.clientHeight) < __PYWRY_CHAT_SCROLL_THRESHOLD;
       if (nearBottom) {
         state.userScrolledUp = false;
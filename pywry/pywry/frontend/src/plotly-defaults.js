@@ -379,6 +379,53 @@ window.registerPyWryChart = registerPyWryChart;
             }
         });
 
+        // plotly:patch-figure - Apply only the traces/layout keys that changed
+        window.pywry.on('plotly:patch-figure', function(data) {
+            var plotDiv = findPlotDiv(data && data.chartId);
+            if (!plotDiv || !window.Plotly || !data) {
+                console.warn('[PyWry Plotly] plotly:patch-figure - no plotDiv or Plotly found');
+                return;
+            }
+            var figData = (plotDiv.data || []).slice(0, data.numTraces);
+            (data.traceIndices || []).forEach(function(traceIndex, i) {
+                figData[traceIndex] = data.traces[i];
+            });
+            var layoutPatch = data.layout || {};
+            var figLayout = Object.assign({}, plotDiv.layout);
+            Object.keys(layoutPatch).forEach(function(key) {
+                if (layoutPatch[key] === null) {
+                    delete figLayout[key];
+                } else {
+                    figLayout[key] = layoutPatch[key];
+                }
+            });
+            if (layoutPatch.template && typeof layoutPatch.template === 'object') {
+                var themeName = plotDiv.__pywry_theme_template__ || 'plotly_dark';
+                figLayout.template = window.__pywryMergeThemeTemplate(plotDiv, themeName, layoutPatch.template);
+            }
+            var config = data.config ? Object.assign({displaylogo: false}, processPlotlyConfig(data.config)) : undefined;
+            window.Plotly.react(plotDiv, figData, figLayout, config);
+        });
+
+        // plotly:extend-traces / plotly:prepend-traces - Stream points into traces
+        window.pywry.on('plotly:extend-traces', function(data) {
+            var plotDiv = findPlotDiv(data && data.chartId);
+            if (plotDiv && window.Plotly && data && data.update) {
+                window.Plotly.extendTraces(plotDiv, data.update, data.indices, data.maxPoints);
+            } else {
+                console.warn('[PyWry Plotly] plotly:extend-traces - no plotDiv, Plotly, or update data');
+            }
+        });
+
+        window.pywry.on('plotly:prepend-traces', function(data) {
+            var plotDiv = findPlotDiv(data && data.chartId);
+            if (plotDiv && window.Plotly && data && data.update) {
+                window.Plotly.prependTraces(plotDiv, data.update, data.indices, data.maxPoints);
+            } else {
+                console.warn('[PyWry Plotly] plotly:prepend-traces - no plotDiv, Plotly, or update data');
+            }
+        });
+
         // plotly:reset-zoom - Reset chart zoom to autorange
         window.pywry.on('plotly:reset-zoom', function(data) {
             var plotDiv = findPlotDiv(data && data.chartId);
@@ -578,6 +578,42 @@ function render({ model, el }) {
         }
     });
 
+    pywry.on('plotly:patch-figure', (data) => {
+        const plotDiv = container.querySelector('.js-plotly-plot');
+        if (plotDiv && window.Plotly) {
+            const figData = (plotDiv.data || []).slice(0, data.numTraces);
+            (data.traceIndices || []).forEach((traceIndex, i) => {
+                figData[traceIndex] = data.traces[i];
+            });
+            const figLayout = Object.assign({}, plotDiv.layout);
+            Object.entries(data.layout || {}).forEach(([key, value]) => {
+                if (value === null) {
+                    delete figLayout[key];
+                } else {
+                    figLayout[key] = value;
+                }
+            });
+            const config = data.config
+                ? Object.assign({displaylogo: false}, processPlotlyConfig(data.config))
+                : undefined;
+            window.Plotly.react(plotDiv, figData, figLayout, config);
+        }
+    });
+
+    pywry.on('plotly:extend-traces', (data) => {
+        const plotDiv = container.querySelector('.js-plotly-plot');
+        if (plotDiv && window.Plotly && data.update) {
+            window.Plotly.extendTraces(plotDiv, data.update, data.indices, data.maxPoints);
+        }
+    });
+
+    pywry.on('plotly:prepend-traces', (data) => {
+        const plotDiv = container.querySelector('.js-plotly-plot');
+        if (plotDiv && window.Plotly && data.update) {
+            window.Plotly.prependTraces(plotDiv, data.update, data.indices, data.maxPoints);
+        }
+    });
+
     pywry.on('plotly:reset-zoom', () => {
         const plotDiv = container.querySelector('.js-plotly-plot');
         if (plotDiv && window.Plotly) {
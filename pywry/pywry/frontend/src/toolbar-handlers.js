@@ -141,6 +141,210 @@ function initTooltipManager(container) {
     }, true);
 }
 
+/**
+ * Server-side option source for Select/MultiSelect (data-option-source="server").
+ *
+ * Only the rows in view are rendered. Pages of ranked matches are requested
+ * from Python with '{event}:options' {componentId, query, offset, limit} and
+ * arrive as '{event}:options-response' {componentId, query, offset, total, options}.
+ * Typing restarts the search after data-debounce milliseconds.
+ */
+var OPTION_ROW_HEIGHT = 28;
+
+function escapeOptionHtml(text) {
+    return String(text).replace(/[&<>"']/g, function(ch) {
+        return { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[ch];
+    });
+}
+
+function initOptionSource(dropdown, menu, textEl, pywry) {
+    var eventName = dropdown.getAttribute('data-event');
+    var pageSize = parseInt(dropdown.getAttribute('data-page-size'), 10) || 50;
+    var debounceMs = parseInt(dropdown.getAttribute('data-debounce'), 10);
+    var isMulti = dropdown.classList.contains('pywry-multiselect');
+    var viewport = dropdown.querySelector('.pywry-option-viewport');
+    var spacer = viewport && viewport.querySelector('.pywry-option-spacer');
+    var rowsEl = viewport && viewport.querySelector('.pywry-option-rows');
+    var searchInput = dropdown.querySelector('.pywry-search-input');
+    if (!viewport || !spacer || !rowsEl || !eventName || !pywry) return;
+    if (isNaN(debounceMs)) debounceMs = 150;
+
+    var query = '';
+    var total = 0;
+    var pages = {};
+    var pending = {};
+    var loaded = false;
+    var debounceTimer = null;
+    // value -> label; insertion order is the selection order
+    var selected = {};
+    try {
+        JSON.parse(dropdown.getAttribute('data-selected') || '[]').forEach(function(opt) {
+            selected[opt.value] = opt.label;
+        });
+    } catch (err) {}
+
+    function requestPage(page) {
+        if (pages[page] || pending[page]) return;
+        pending[page] = true;
+        pywry.emit(eventName + ':options', {
+            componentId: dropdown.id,
+            query: query,
+            offset: page * pageSize,
+            limit: pageSize
+        });
+    }
+
+    function reset() {
+        pages = {};
+        pending = {};
+        total = 0;
+        viewport.scrollTop = 0;
+        requestPage(0);
+    }
+
+    function updateMultiText() {
+        var labels = Object.keys(selected).map(function(value) { return selected[value]; });
+        if (labels.length === 0) {
+            textEl.textContent = 'Select...';
+        } else if (labels.length <= 2) {
+            textEl.textContent = labels.join(', ');
+        } else {
+            textEl.textContent = labels.length + ' selected';
+        }
+    }
+
+    function renderRow(opt) {
+        var value = escapeOptionHtml(opt.value);
+        var label = escapeOptionHtml(opt.label);
+        var isSelected = Object.prototype.hasOwnProperty.call(selected, opt.value);
+        var title = opt.description ? ' data-tooltip="' + escapeOptionHtml(opt.description) + '"' : '';
+        if (isMulti) {
+            return '<label class="pywry-multiselect-option' + (isSelected ? ' pywry-selected' : '') +
+                '" data-value="' + value + '"' + title + '>' +
+                '<input type="checkbox" class="pywry-multiselect-checkbox" value="' + value + '"' +
+                (isSelected ? ' checked' : '') + '>' +
+                '<span class="pywry-multiselect-label">' + label + '</span></label>';
+        }
+        return '<div class="pywry-dropdown-option' + (isSelected ? ' pywry-selected' : '') +
+            '" data-value="' + value + '"' + title + '>' + label + '</div>';
+    }
+
+    function render() {
+        spacer.style.height = (total * OPTION_ROW_HEIGHT) + 'px';
+        var first = Math.floor(viewport.scrollTop / OPTION_ROW_HEIGHT);
+        var count = Math.ceil((viewport.clientHeight || 200) / OPTION_ROW_HEIGHT) + 1;
+        var last = Math.min(total, first + count);
+        var html = [];
+        for (var i = first; i < last; i++) {
+            var page = Math.floor(i / pageSize);
+            var rows = pages[page];
+            if (!rows) {
+                requestPage(page);
+                html.push('<div class="pywry-option-loading"></div>');
+            } else if (rows[i - page * pageSize]) {
+                html.push(renderRow(rows[i - page * pageSize]));
+            }
+        }
+        rowsEl.style.transform = 'translateY(' + (first * OPTION_ROW_HEIGHT) + 'px)';
+        rowsEl.innerHTML = html.join('');
+    }
+
+    pywry.on(eventName + ':options-response', function(data) {
+        if (!data || data.componentId !== dropdown.id || data.query !== query) return;
+        var page = Math.floor((data.offset || 0) / pageSize);
+        delete pending[page];
+        pages[page] = data.options || [];
+        total = data.total || 0;
+        render();
+    });
+
+    dropdown.querySelector('.pywry-dropdown-selected').addEventListener('click', function() {
+        if (!dropdown.classList.contains('pywry-open')) return;
+        if (!loaded) {
+            loaded = true;
+            requestPage(0);
+        } else {
+            render();
+        }
+    });
+    viewport.addEventListener('scroll', render);
+
+    if (searchInput) {
+        searchInput.addEventListener('input', function(e) {
+            clearTimeout(debounceTimer);
+            var value = e.target.value;
+            debounceTimer = setTimeout(function() {
+                query = value;
+                loaded = true;
+                reset();
+            }, debounceMs);
+        });
+        searchInput.addEventListener('click', function(e) {
+            e.stopPropagation();
+        });
+    }
+
+    rowsEl.addEventListener('click', function(e) {
+        var row = e.target.closest('[data-value]');
+        if (!row) return;
+        e.stopPropagation();
+        e.preventDefault();
+        var value = row.getAttribute('data-value');
+        var label = row.textContent;
+        if (isMulti) {
+            if (Object.prototype.hasOwnProperty.call(selected, value)) {
+                delete selected[value];
+            } else {
+                selected[value] = label;
+            }
+            updateMultiText();
+            render();
+            pywry.emit(eventName, { values: Object.keys(selected), componentId: dropdown.id });
+            return;
+        }
+        selected = {};
+        selected[value] = label;
+        textEl.textContent = label;
+        dropdown.classList.remove('pywry-open');
+        menu.style.cssText = '';
+        pywry.emit(eventName, { value: value, componentId: dropdown.id });
+    });
+
+    dropdown.querySelectorAll('.pywry-multiselect-action[data-action="none"]').forEach(function(btn) {
+        btn.addEventListener('click', function(e) {
+            e.stopPropagation();
+            selected = {};
+            updateMultiText();
+            render();
+            pywry.emit(eventName, { values: [], componentId: dropdown.id });
+        });
+    });
+}
+
+/**
+ * Apply one marquee ticker update (text/html, styles, classes) to an element.
+ */
+function applyTickerUpdate(el, data) {
+    if (data.html !== undefined) {
+        el.innerHTML = data.html;
+    } else if (data.text !== undefined) {
+        el.textContent = data.text;
+    }
+    if (data.styles) {
+        Object.keys(data.styles).forEach(function(prop) {
+            el.style[prop] = data.styles[prop];
+        });
+    }
+    if (data.class_add) {
+        var adds = Array.isArray(data.class_add) ? data.class_add : [data.class_add];
+        adds.forEach(function(c) { el.classList.add(c); });
+    }
+    if (data.class_remove) {
+        var removes = Array.isArray(data.class_remove) ? data.class_remove : [data.class_remove];
+        removes.forEach(function(c) { el.classList.remove(c); });
+    }
+}
+
 function initToolbarHandlers(container, pywry) {
     initTooltipManager(container);
     container.querySelectorAll('.pywry-dropdown').forEach(function(dropdown) {
@@ -185,6 +389,10 @@ function initToolbarHandlers(container, pywry) {
                 menu.style.cssText = '';
             }
         });
+        if (dropdown.getAttribute('data-option-source') === 'server') {
+            initOptionSource(dropdown, menu, textEl, pywry);
+            return;
+        }
         if (!dropdown.classList.contains('pywry-multiselect')) {
             var selectSearchInput = dropdown.querySelector('.pywry-search-input');
             if (selectSearchInput) {
@@ -598,28 +806,35 @@ function initToolbarHandlers(container, pywry) {
                 return;
             }
             elements.forEach(function(el) {
-                // Update content
-                if (data.html !== undefined) {
-                    el.innerHTML = data.html;
-                } else if (data.text !== undefined) {
-                    el.textContent = data.text;
-                }
-                // Apply styles
-                if (data.styles) {
-                    Object.keys(data.styles).forEach(function(prop) {
-                        el.style[prop] = data.styles[prop];
-                    });
-                }
-                // Add/remove classes
-                if (data.class_add) {
-                    var adds = Array.isArray(data.class_add) ? data.class_add : [data.class_add];
-                    adds.forEach(function(c) { el.classList.add(c); });
-                }
-                if (data.class_remove) {
-                    var removes = Array.isArray(data.class_remove) ? data.class_remove : [data.class_remove];
-                    removes.forEach(function(c) { el.classList.remove(c); });
-                }
+                applyTickerUpdate(el, data);
+            });
+        });
+
+        // Batched ticker updates (TickerBoard): the latest update per ticker is
+        // kept until the next animation frame, then all are applied in one pass
+        var pendingTickers = {};
+        var tickerFrame = null;
+        function applyPendingTickers() {
+            tickerFrame = null;
+            var updates = pendingTickers;
+            pendingTickers = {};
+            container.querySelectorAll('[data-ticker]').forEach(function(el) {
+                var update = updates[el.getAttribute('data-ticker')];
+                if (update) applyTickerUpdate(el, update);
+            });
+        }
+        pywry.on('toolbar:marquee-set-items', function(data) {
+            (data.items || []).forEach(function(item) {
+                if (!item.ticker) return;
+                var merged = Object.assign({}, pendingTickers[item.ticker], item);
+                if (item.text !== undefined && item.html === undefined) delete merged.html;
+                pendingTickers[item.ticker] = merged;
             });
+            if (tickerFrame === null) {
+                tickerFrame = window.requestAnimationFrame
+                    ? window.requestAnimationFrame(applyPendingTickers)
+                    : setTimeout(applyPendingTickers, 16);
+            }
         });
 
         // Generic setComponentValue function for toolbar:set-value
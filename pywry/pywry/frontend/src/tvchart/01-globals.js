@@ -106,3 +106,49 @@ function _tvContainerSize(container) {
     if (container === document.body) return { width: window.innerWidth, height: window.innerHeight };
     return { width: container.clientWidth, height: container.clientHeight };
 }
+
+// ---------------------------------------------------------------------------
+// Typed-array bar decoding — Python may send bars/volume as a columnar block
+// { length, columns: { time: {dtype, bdata}, open: {...}, ... } } where each
+// column is the base64 of a little-endian typed array (Plotly's bdata spec).
+// Decoding goes straight into typed arrays; no JSON number parsing.
+// ---------------------------------------------------------------------------
+var _TV_TYPED_ARRAY_CTORS = {
+    i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array,
+    i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array,
+};
+
+function _tvDecodeTypedArray(spec) {
+    var Ctor = _TV_TYPED_ARRAY_CTORS[spec.dtype] || Float64Array;
+    var raw = atob(spec.bdata);
+    var bytes = new Uint8Array(raw.length);
+    for (var i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+    return new Ctor(bytes.buffer);
+}
+
+function _tvDecodeColumnar(block) {
+    if (!block || Array.isArray(block) || !block.columns) return block;
+    var names = Object.keys(block.columns);
+    var cols = names.map(function(name) { return _tvDecodeTypedArray(block.columns[name]); });
+    var rows = new Array(block.length);
+    for (var i = 0; i < block.length; i++) {
+        var row = {};
+        for (var c = 0; c < names.length; c++) row[names[c]] = cols[c][i];
+        rows[i] = row;
+    }
+    return rows;
+}
+
+// Expand columnar bars/volume in a create/update payload in place.
+function _tvDecodePayloadBars(payload) {
+    if (!payload) return payload;
+    if (payload.bars) payload.bars = _tvDecodeColumnar(payload.bars);
+    if (payload.volume) payload.volume = _tvDecodeColumnar(payload.volume);
+    if (Array.isArray(payload.series)) {
+        payload.series.forEach(function(s) {
+            if (s && s.bars) s.bars = _tvDecodeColumnar(s.bars);
+            if (s && s.volume) s.volume = _tvDecodeColumnar(s.volume);
+        });
+    }
+    return payload;
+}
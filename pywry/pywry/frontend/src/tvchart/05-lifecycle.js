@@ -125,6 +125,7 @@ function _tvEnforceMainScaleDividerClearance(entry, preferredTop, preferredBotto
  */
 window.PYWRY_TVCHART_CREATE = function(chartId, container, payload) {
     try {
+    _tvDecodePayloadBars(payload);
     // Destroy previous chart if exists
     if (window.__PYWRY_TVCHARTS__[chartId] && window.__PYWRY_TVCHARTS__[chartId].chart) {
         window.__PYWRY_TVCHARTS__[chartId].chart.remove();
@@ -622,6 +623,7 @@ function _tvExtractVolumeFromBars(bars, theme, entry) {
  * @param {Object} payload - { seriesId, bars, volume } or { bars, volume } for main series
  */
 window.PYWRY_TVCHART_UPDATE = function(chartId, payload) {
+    _tvDecodePayloadBars(payload);
     var resolved = _tvResolveChartEntry(chartId);
     var entry = resolved ? resolved.entry : null;
     if (!entry) {
@@ -999,7 +1001,7 @@ function _tvSetupEventBridge(chartId, chart) {
 // State export
 // ---------------------------------------------------------------------------
 
-function _tvExportState(chartId) {
+function _tvExportState(chartId, compact) {
     var entry = window.__PYWRY_TVCHARTS__[chartId];
     if (!entry) return null;
 
@@ -1016,8 +1018,9 @@ function _tvExportState(chartId) {
     try { logicalRange = entry.chart.timeScale().getVisibleLogicalRange(); } catch (e) { logicalRange = null; }
     try { timeRange = entry.chart.timeScale().getVisibleRange(); } catch (e) { timeRange = null; }
 
-    // Collect raw bar data if stored
-    var rawData = entry._rawData ? entry._rawData.slice() : null;
+    // Collect raw bar data if stored.  ``compact`` exports (mutation
+    // acks) skip bars and drawings, which are the bulk of the payload.
+    var rawData = (!compact && entry._rawData) ? entry._rawData.slice() : null;
 
     // Main symbol and interval (from the stored payload)
     var mainSymbol = '';
@@ -1051,8 +1054,8 @@ function _tvExportState(chartId) {
     }
 
     // Collect drawings
-    var ds = window.__PYWRY_DRAWINGS__[chartId];
-    var drawings = [];
+    var ds = compact ? null : window.__PYWRY_DRAWINGS__[chartId];
+    var drawings = compact ? null : [];
     if (ds && ds.drawings) {
         for (var d = 0; d < ds.drawings.length; d++) {
             drawings.push(Object.assign({}, ds.drawings[d]));
@@ -49,6 +49,101 @@
             return null;
         }
 
+        // Mutation acknowledgements.  Python tags a mutation with an
+        // ``ackId``; once the mutation has been applied the frontend
+        // replies with exactly one ``tvchart:ack`` carrying the compact
+        // post-mutation state and the state keys the mutation changed.
+        // Handlers whose work continues asynchronously (symbol, interval
+        // and compare data round-trips) return a matcher instead; the ack
+        // is deferred until a ``tvchart:data-response`` for that chart
+        // settles with a ``{seriesId, symbol, interval}`` the matcher
+        // accepts, so an unrelated round-trip cannot release it early.
+        var _pendingAcks = {};  // ackId -> ack
+
+        function _ackChanged(pre, post) {
+            if (!post) return [];
+            var keys = Object.keys(post);
+            var changed = [];
+            for (var i = 0; i < keys.length; i++) {
+                var k = keys[i];
+                if (!pre || JSON.stringify(pre[k]) !== JSON.stringify(post[k])) {
+                    changed.push(k);
+                }
+            }
+            return changed;
+        }
+
+        function _sendAck(ack, error) {
+            var post = ack.chartId ? _tvExportState(ack.chartId, true) : null;
+            var msg = {
+                ackId: ack.ackId,
+                event: ack.event,
+                chartId: ack.chartId,
+                ok: !error && !!post,
+                changed: _ackChanged(ack.pre, post),
+                state: post,
+            };
+            if (error || !post) msg.error = error || 'not found';
+            bridge.emit('tvchart:ack', msg);
+        }
+
+        function _settleAcks(chartId, response) {
+            var ids = Object.keys(_pendingAcks);
+            for (var i = 0; i < ids.length; i++) {
+                var ack = _pendingAcks[ids[i]];
+                if (ack.chartId !== chartId || !ack.settledBy(response)) continue;
+                delete _pendingAcks[ids[i]];
+                _sendAck(ack);
+            }
+        }
+
+        // Emit ``tvchart:data-settled``.  ``response`` describes the
+        // data-response that settled (omitted for zoom-only settles) and
+        // releases the deferred acks whose mutation it completes.
+        function _emitSettled(chartId, state, response) {
+            bridge.emit('tvchart:data-settled', state || {
+                chartId: chartId, error: 'not found',
+            });
+            if (response) _settleAcks(chartId, response);
+        }
+
+        // Upper-cased symbol of a chart's main series ('' if unknown).
+        function _mainSymbol(entry) {
+            var series = entry && entry.payload && entry.payload.series;
+            return series && series[0] && series[0].symbol
+                ? String(series[0].symbol).toUpperCase() : '';
+        }
+
+        // Wrap a Python → JS mutation handler so ``ackId``-tagged
+        // payloads are acknowledged once the mutation has landed.
+        function _withAck(eventName, handler) {
+            return function(data) {
+                var ackId = data && data.ackId;
+                if (!ackId) return handler(data);
+                var resolved = _tvResolveChartEntry(_resolveCid(data));
+                var ack = {
+                    ackId: ackId,
+                    event: eventName,
+                    chartId: resolved ? resolved.chartId : null,
+                };
+                ack.pre = ack.chartId ? _tvExportState(ack.chartId, true) : null;
+                var outcome;
+                try {
+                    outcome = handler(data);
+                } catch (e) {
+                    console.error('[pywry:tvchart] ' + eventName + ' failed:', e);
+                    _sendAck(ack, String((e && e.message) || e));
+                    return;
+                }
+                if (typeof outcome === 'function' && ack.chartId) {
+                    ack.settledBy = outcome;
+                    _pendingAcks[ackId] = ack;
+                    return;
+                }
+                _sendAck(ack);
+            };
+        }
+
         // Python → JS: create chart
         bridge.on('tvchart:create', function(data) {
             var container = data.containerId
@@ -67,11 +162,17 @@
 
         // Python → JS: update data
         bridge.on('tvchart:data-response', function(data) {
+            _tvDecodePayloadBars(data);
             var chartId = data.chartId || _cid;
             var resolved = _tvResolveChartEntry(chartId);
             var entry = resolved ? resolved.entry : null;
             if (!entry || !entry.chart) return;
             var seriesId = data.seriesId || 'main';
+            var settledResponse = {
+                seriesId: seriesId,
+                symbol: data.symbol ? String(data.symbol).toUpperCase() : '',
+                interval: data.interval || '',
+            };
 
             // When the main series receives new bars with a different
             // interval OR a different symbol, destroy and fully recreate
@@ -258,10 +359,7 @@
                     var _fireSettled = function() {
                         if (_pending > 0 || _settledFired) return;
                         _settledFired = true;
-                        var finalState = _tvExportState(cid);
-                        bridge.emit('tvchart:data-settled', finalState || {
-                            chartId: cid, error: 'not found',
-                        });
+                        _emitSettled(cid, _tvExportState(cid), settledResponse);
                     };
                     var _track = function() {
                         _pending++;
@@ -630,22 +728,19 @@
             // Python mutation handler waiting on this round-trip can
             // return deterministic confirmed state instead of polling.
             var _settledCid = resolved ? resolved.chartId : chartId;
-            var _settledState = _tvExportState(_settledCid);
-            bridge.emit('tvchart:data-settled', _settledState || {
-                chartId: _settledCid, error: 'not found',
-            });
+            _emitSettled(_settledCid, _tvExportState(_settledCid), settledResponse);
         });
 
-        bridge.on('tvchart:update', function(data) {
+        bridge.on('tvchart:update', _withAck('tvchart:update', function(data) {
             var chartId = data.chartId || _cid;
             window.PYWRY_TVCHART_UPDATE(chartId, data);
-        });
+        }));
 
         // Python → JS: stream single bar
-        bridge.on('tvchart:stream', function(data) {
+        bridge.on('tvchart:stream', _withAck('tvchart:stream', function(data) {
             var chartId = data.chartId || _cid;
             window.PYWRY_TVCHART_STREAM(chartId, data);
-        });
+        }));
 
         // Python → JS: destroy chart
         bridge.on('tvchart:destroy', function(data) {
@@ -654,7 +749,7 @@
         });
 
         // Python → JS: apply chart options
-        bridge.on('tvchart:apply-options', function(data) {
+        bridge.on('tvchart:apply-options', _withAck('tvchart:apply-options', function(data) {
             var resolved = _tvResolveChartEntry(data.chartId || _cid);
             var entry = resolved ? resolved.entry : null;
             if (!entry || !entry.chart) return;
@@ -665,10 +760,10 @@
                 var s = entry.seriesMap[data.seriesId || 'main'];
                 if (s) s.applyOptions(data.seriesOptions);
             }
-        });
+        }));
 
         // Python → JS: add an overlay/indicator series
-        bridge.on('tvchart:add-series', function(data) {
+        bridge.on('tvchart:add-series', _withAck('tvchart:add-series', function(data) {
             var resolved = _tvResolveChartEntry(data.chartId || _cid);
             var entry = resolved ? resolved.entry : null;
             if (!entry || !entry.chart) return;
@@ -736,10 +831,10 @@
             _tvRefreshLegendTitle(resolved ? resolved.chartId : (data.chartId || _cid));
             _tvEmitLegendRefresh(resolved ? resolved.chartId : (data.chartId || _cid));
             _tvRenderHoverLegend(resolved ? resolved.chartId : (data.chartId || _cid), null);
-        });
+        }));
 
         // Python → JS: remove a series
-        bridge.on('tvchart:remove-series', function(data) {
+        bridge.on('tvchart:remove-series', _withAck('tvchart:remove-series', function(data) {
             var entry = window.__PYWRY_TVCHARTS__[data.chartId || _cid];
             if (!entry || !entry.chart) return;
             var seriesId = data.seriesId;
@@ -795,10 +890,10 @@
             _tvRefreshLegendTitle(data.chartId || _cid);
             _tvEmitLegendRefresh(data.chartId || _cid);
             _tvRenderHoverLegend(data.chartId || _cid, null);
-        });
+        }));
 
         // Python → JS: add markers to a series
-        bridge.on('tvchart:add-markers', function(data) {
+        bridge.on('tvchart:add-markers', _withAck('tvchart:add-markers', function(data) {
             var entry = window.__PYWRY_TVCHARTS__[data.chartId || _cid];
             if (!entry) return;
             var seriesId = data.seriesId || 'main';
@@ -808,10 +903,10 @@
                 var sorted = data.markers.slice().sort(function(a, b) { return a.time - b.time; });
                 series.setMarkers(sorted);
             }
-        });
+        }));
 
         // Python → JS: add a horizontal price line
-        bridge.on('tvchart:add-price-line', function(data) {
+        bridge.on('tvchart:add-price-line', _withAck('tvchart:add-price-line', function(data) {
             var entry = window.__PYWRY_TVCHARTS__[data.chartId || _cid];
             if (!entry) return;
             var seriesId = data.seriesId || 'main';
@@ -826,10 +921,10 @@
                     title: data.title || '',
                 });
             }
-        });
+        }));
 
         // Python → JS: fit content / scroll to position
-        bridge.on('tvchart:time-scale', function(data) {
+        bridge.on('tvchart:time-scale', _withAck('tvchart:time-scale', function(data) {
             var chartId = data.chartId || _cid;
             var entry = window.__PYWRY_TVCHARTS__[chartId];
             if (!entry || !entry.chart) return;
@@ -847,11 +942,8 @@
             // confirmed post-mutation state instead of blocking on a
             // timeout.  Same event name as data-response's settled
             // signal — the payload is the live chart state.
-            var settledState = _tvExportState(chartId);
-            bridge.emit('tvchart:data-settled', settledState || {
-                chartId: chartId, error: 'not found',
-            });
-        });
+            _emitSettled(chartId, _tvExportState(chartId));
+        }));
 
         // Python → JS: request state export
         bridge.on('tvchart:request-state', function(data) {
@@ -889,7 +981,7 @@
         // -----------------------------------------------------------------
 
         // Chart type change (Select dropdown)
-        bridge.on('tvchart:chart-type-change', function(data) {
+        bridge.on('tvchart:chart-type-change', _withAck('tvchart:chart-type-change', function(data) {
             var displayName = data.value || data.selected || 'Candles';
             var styleCfg = _tvResolveChartStyle(displayName);
             var baseType = styleCfg.seriesType;
@@ -1100,10 +1192,10 @@
                 entry.chart.timeScale().fitContent();
             }
             _tvRenderHoverLegend(resolved.chartId, null);
-        });
+        }));
 
         // Dark mode toggle — updates THIS widget's UI only.
-        bridge.on('tvchart:toggle-dark-mode', function(data) {
+        bridge.on('tvchart:toggle-dark-mode', _withAck('tvchart:toggle-dark-mode', function(data) {
             var isDark = data.value === true || data.checked === true;
             var newTheme = isDark ? 'dark' : 'light';
 
@@ -1142,7 +1234,7 @@
             if (bridge && bridge.sendEvent) {
                 bridge.sendEvent('pywry:update-theme', { theme: newTheme });
             }
-        });
+        }));
 
         // Settings button
         bridge.on('tvchart:show-settings', function(data) {
@@ -1161,7 +1253,7 @@
             _tvShowIndicatorsPanel(chartId);
         });
 
-        bridge.on('tvchart:add-indicator', function(data) {
+        bridge.on('tvchart:add-indicator', _withAck('tvchart:add-indicator', function(data) {
             var chartId = data.chartId || _cid;
             var def = {
                 name: data.name || '',
@@ -1202,12 +1294,12 @@
                 _annualization: data.annualization,
             };
             _tvAddIndicator(def, chartId);
-        });
+        }));
 
-        bridge.on('tvchart:remove-indicator', function(data) {
+        bridge.on('tvchart:remove-indicator', _withAck('tvchart:remove-indicator', function(data) {
             var seriesId = data.seriesId;
             if (seriesId) _tvRemoveIndicator(seriesId);
-        });
+        }));
 
         bridge.on('tvchart:list-indicators', function(data) {
             var chartId = data.chartId || _cid;
@@ -1248,19 +1340,19 @@
         });
 
         // Log scale toggle (legacy event fallback)
-        bridge.on('tvchart:log-scale', function(data) {
+        bridge.on('tvchart:log-scale', _withAck('tvchart:log-scale', function(data) {
             var isLog = data.value === true || data.checked === true;
             _tvApplyLogScale(isLog, data.chartId || _cid);
-        });
+        }));
 
         // Auto scale toggle (legacy event fallback)
-        bridge.on('tvchart:auto-scale', function(data) {
+        bridge.on('tvchart:auto-scale', _withAck('tvchart:auto-scale', function(data) {
             var isAuto = data.value === true || data.checked === true;
             _tvApplyAutoScale(isAuto, data.chartId || _cid);
-        });
+        }));
 
         // Data interval/frequency change (top bar) — emits to Python for data re-fetch
-        bridge.on('tvchart:interval-change', function(data) {
+        bridge.on('tvchart:interval-change', _withAck('tvchart:interval-change', function(data) {
             var interval = data.value || '1d';
             // Deselect all time-range tabs — interval change always shows ALL data
             var tabs = document.querySelectorAll('.pywry-tab[data-target-interval]');
@@ -1276,6 +1368,12 @@
             // getBars is bypassed entirely.
             var resolved = _tvResolveChartEntry(chartId);
             var entry = resolved ? resolved.entry : null;
+            // Settled by the main series' new bars (not a symbol swap)
+            var symbolBefore = _mainSymbol(entry);
+            var settledBy = function(response) {
+                return response.seriesId === 'main' && (!response.symbol || !symbolBefore
+                    || response.symbol === symbolBefore);
+            };
             if (entry && entry.payload && entry.payload.useDatafeed) {
                 var currentInterval = (entry.payload && entry.payload.interval) || '';
                 if (interval === currentInterval) return; // no-op if same interval
@@ -1324,15 +1422,16 @@
                         });
                     }
                 }
-                return;
+                return settledBy;
             }
 
             // Non-datafeed mode: notify Python so it can supply new data
             _tvEmitIntervalDataRequests(chartId, interval);
-        });
+            return settledBy;
+        }));
 
         // Time range preset (TabGroup) — zoom only, never changes interval.
-        bridge.on('tvchart:time-range', function(data) {
+        bridge.on('tvchart:time-range', _withAck('tvchart:time-range', function(data) {
             var range = data.value || data.selected || '1y';
             var chartId = data.chartId || _cid;
             var resolved = _tvResolveChartEntry(chartId);
@@ -1340,15 +1439,11 @@
             if (entry && entry.chart) {
                 _tvApplyTimeRangeSelection(entry, range);
             }
-            // Signal mutation completion for Python-side
-            // ``_wait_for_data_settled`` so the tool returns confirmed
-            // state instead of blocking on the timeout.
+            // Signal mutation completion to ``tvchart:data-settled``
+            // listeners; the MCP tool itself is answered by the ack.
             var settledCid = resolved ? resolved.chartId : chartId;
-            var settledState = _tvExportState(settledCid);
-            bridge.emit('tvchart:data-settled', settledState || {
-                chartId: settledCid, error: 'not found',
-            });
-        });
+            _emitSettled(settledCid, _tvExportState(settledCid));
+        }));
 
         bridge.on('tvchart:time-range-picker', function(data) {
             var chartId = (data && data.chartId) || _cid;
@@ -1379,44 +1474,67 @@
         });
 
         // Undo — revert last chart action (drawing, indicator, etc.)
-        bridge.on('tvchart:undo', function() {
+        bridge.on('tvchart:undo', _withAck('tvchart:undo', function() {
             _tvPerformUndo();
-        });
+        }));
 
         // Redo — re-apply last undone action
-        bridge.on('tvchart:redo', function() {
+        bridge.on('tvchart:redo', _withAck('tvchart:redo', function() {
             _tvPerformRedo();
-        });
+        }));
 
         // Compare — open symbol entry panel.  Optional ``query`` drives
         // the panel programmatically: search + auto-add the matching
         // ticker as a compare series, so MCP callers can confirm the
         // compare actually appeared in state.compareSymbols.
-        bridge.on('tvchart:compare', function(data) {
+        bridge.on('tvchart:compare', _withAck('tvchart:compare', function(data) {
             var chartId = _tvResolveChartId((data && data.chartId) || _cid);
             if (!chartId) return;
+            var resolved = _tvResolveChartEntry(chartId);
+            var compared = (resolved && resolved.entry && resolved.entry._compareSymbols) || {};
+            var compareIds = Object.keys(compared);
+            var query = String((data && data.query) || '').toUpperCase();
             _tvShowComparePanel(chartId, {
                 query: data && data.query,
                 autoAdd: data && data.autoAdd !== false,
                 symbolType: data && data.symbolType,
                 exchange: data && data.exchange,
             });
-        });
+            // An auto-added compare lands via a data round-trip for a
+            // new compare series (or the queried one, if already shown).
+            if (query && data.autoAdd !== false) {
+                return function(response) {
+                    return response.seriesId !== 'main' && !_activeIndicators[response.seriesId]
+                        && (compareIds.indexOf(response.seriesId) === -1
+                            || response.symbol.indexOf(query) !== -1);
+                };
+            }
+        }));
 
         // Symbol search — open the symbol search dialog. Optional
         // `query` pre-fills the input; `autoSelect` (default true when
         // `query` is provided) picks the matching/first result.
         // `symbolType` / `exchange` narrow the datafeed search.
-        bridge.on('tvchart:symbol-search', function(data) {
+        bridge.on('tvchart:symbol-search', _withAck('tvchart:symbol-search', function(data) {
             var chartId = _tvResolveChartId((data && data.chartId) || _cid);
             if (!chartId) return;
+            var resolved = _tvResolveChartEntry(chartId);
+            var symbolBefore = _mainSymbol(resolved ? resolved.entry : null);
             _tvShowSymbolSearchDialog(chartId, {
                 query: data && data.query,
                 autoSelect: data && data.autoSelect,
                 symbolType: data && data.symbolType,
                 exchange: data && data.exchange,
             });
-        });
+            // An auto-selected symbol lands via a main-series data
+            // round-trip for a different symbol.
+            if (data && data.query && data.autoSelect !== false) {
+                return function(response) {
+                    return response.seriesId === 'main' && (!response.symbol
+                        || response.symbol !== symbolBefore);
+                };
+            }
+        }));
 
         bridge.on('tvchart:datafeed-search-response', function(data) {
             data = data || {};
@@ -554,6 +554,44 @@
         }
     });
 
+    // Plotly partial figure update handler (only changed traces/layout keys)
+    window.pywry.on('plotly:patch-figure', function(data) {
+        const chartEl = document.getElementById('chart');
+        if (chartEl && (typeof Plotly !== 'undefined' || typeof window.Plotly !== 'undefined')) {
+            const PlotlyLib = typeof Plotly !== 'undefined' ? Plotly : window.Plotly;
+            const traceData = (chartEl.data || []).slice(0, data.numTraces);
+            (data.traceIndices || []).forEach(function(traceIndex, i) {
+                traceData[traceIndex] = data.traces[i];
+            });
+            const layout = Object.assign({}, chartEl.layout);
+            Object.keys(data.layout || {}).forEach(function(key) {
+                if (data.layout[key] === null) {
+                    delete layout[key];
+                } else {
+                    layout[key] = data.layout[key];
+                }
+            });
+            PlotlyLib.react(chartEl, traceData, layout, data.config || undefined);
+        }
+    });
+
+    // Plotly streaming handlers (extendTraces / prependTraces)
+    window.pywry.on('plotly:extend-traces', function(data) {
+        const chartEl = document.getElementById('chart');
+        if (chartEl && data.update && (typeof Plotly !== 'undefined' || typeof window.Plotly !== 'undefined')) {
+            const PlotlyLib = typeof Plotly !== 'undefined' ? Plotly : window.Plotly;
+            PlotlyLib.extendTraces(chartEl, data.update, data.indices, data.maxPoints);
+        }
+    });
+
+    window.pywry.on('plotly:prepend-traces', function(data) {
+        const chartEl = document.getElementById('chart');
+        if (chartEl && data.update && (typeof Plotly !== 'undefined' || typeof window.Plotly !== 'undefined')) {
+            const PlotlyLib = typeof Plotly !== 'undefined' ? Plotly : window.Plotly;
+            PlotlyLib.prependTraces(chartEl, data.update, data.indices, data.maxPoints);
+        }
+    });
+
     // Theme triggers: translate viewer-side theme signals into the
     // internal pywry:update-theme event that the handler above listens
     // for. Covers three cases:
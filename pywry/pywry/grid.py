@@ -428,6 +428,10 @@ class GridOptions(AGGridModel):
         Client-side row data when using the client-side row model.
     row_model_type : RowModelType
         AG Grid row model used to render and fetch data.
+    row_id_field : str | None
+        Column whose value identifies each row (PyWry option; becomes AG
+        Grid's ``getRowId``). Required for ``apply_transaction`` updates
+        and removals and for ``diff_update``.
     row_selection : dict[str, Any] | bool | None
         Row selection configuration passed directly to AG Grid.
     cell_selection : bool | None
@@ -473,6 +477,7 @@ class GridOptions(AGGridModel):
     # === Row Data ===
     row_data: list[dict[str, Any]] | None = Field(default=None, alias="rowData")
     row_model_type: RowModelType = Field(default="clientSide", alias="rowModelType")
+    row_id_field: str | None = Field(default=None, alias="rowIdField")
 
     # === Selection (enabled by default) ===
     row_selection: dict[str, Any] | bool | None = Field(default=None, alias="rowSelection")
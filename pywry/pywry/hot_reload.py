@@ -6,6 +6,8 @@ live development workflow.
 
 from __future__ import annotations
 
+import hashlib
+
 from typing import TYPE_CHECKING, Any
 
 from .asset_loader import AssetLoader, get_asset_loader
@@ -26,6 +28,14 @@ class HotReloadManager:
 
     - CSS changes: Inject updated styles without page reload
     - JS changes: Trigger full page refresh (with scroll position preservation)
+
+    Changes arrive from the file watcher in debounced batches.  Each changed
+    file is read once per batch and ignored when its content hash matches
+    the last version delivered, so saves that do not alter a file cost no
+    IPC.  A hash is only recorded once every window received the change,
+    so a failed delivery is retried on the next save.  A stylesheet shared
+    by several windows is pushed to all of them in one broadcast, and each
+    window refreshes at most once per batch.
     """
 
     def __init__(
@@ -60,8 +70,12 @@ class HotReloadManager:
         # Track asset IDs for CSS injection: label -> {path -> asset_id}
         self._asset_ids: dict[str, dict[Path, str]] = {}
 
+        # Content hash of the last delivered version of each file
+        self._content_hashes: dict[Path, str] = {}
+
         # Callback for IPC commands (set by PyWry)
         self._inject_css_callback: Callable[..., Any] | None = None
+        self._broadcast_css_callback: Callable[..., Any] | None = None
         self._refresh_callback: Callable[..., Any] | None = None
 
         self._running = False
@@ -89,6 +103,21 @@ class HotReloadManager:
         """
         self._inject_css_callback = callback
 
+    def set_broadcast_css_callback(
+        self,
+        callback: Callable[..., Any],
+    ) -> None:
+        """Set the callback for injecting CSS into several windows at once.
+
+        Parameters
+        ----------
+        callback : Callable[..., Any]
+            Function(labels, css, asset_id) to inject CSS into every window
+            in ``labels`` with a single IPC message.  Without it, shared
+            stylesheets fall back to one inject callback per window.
+        """
+        self._broadcast_css_callback = callback
+
     def set_refresh_callback(
         self,
         callback: Callable[..., Any],
@@ -120,6 +149,7 @@ class HotReloadManager:
         self._running = False
         self._window_files.clear()
         self._asset_ids.clear()
+        self._content_hashes.clear()
         info("Hot reload manager stopped")
 
     def enable_for_window(
@@ -151,8 +181,9 @@ class HotReloadManager:
                 self._asset_ids[label][resolved] = asset_id
                 self._file_watcher.watch(
                     resolved,
-                    self._on_file_change,
+                    self._on_changes,
                     label,
+                    batched=True,
                 )
                 debug(f"Watching CSS: {resolved} for window {label}")
 
@@ -163,8 +194,9 @@ class HotReloadManager:
                 self._window_files[label][resolved] = "script"
                 self._file_watcher.watch(
                     resolved,
-                    self._on_file_change,
+                    self._on_changes,
                     label,
+                    batched=True,
                 )
                 debug(f"Watching script: {resolved} for window {label}")
 
@@ -202,7 +234,7 @@ class HotReloadManager:
         if label not in self._window_files:
             return False
 
-        if not self._inject_css_callback:
+        if not self._inject_css_callback and not self._broadcast_css_callback:
             warn("No CSS injection callback configured")
             return False
 
@@ -218,19 +250,73 @@ class HotReloadManager:
 
         success = False
         for css_path in css_files:
-            # Invalidate cache and reload
-            self._asset_loader.invalidate(css_path)
-            css_content = self._asset_loader.load_css(css_path, use_cache=False)
-
-            if css_content:
-                asset_id = self._asset_ids.get(label, {}).get(css_path)
-                if asset_id:
-                    try:
-                        self._inject_css_callback(label, css_content, asset_id)
-                        debug(f"Injected CSS: {css_path} into window {label}")
-                        success = True
-                    except Exception as e:
-                        warn(f"Failed to inject CSS: {e}")
+            css_content, _digest = self._read_asset(css_path, "css")
+            if css_content and self._push_css([label], css_path, css_content):
+                success = True
+
+        return success
+
+    def _read_asset(self, path: Path, file_type: str) -> tuple[str, str]:
+        """Re-read a changed file once and return its content and content hash.
+
+        The fresh content replaces the asset loader's cached copy, so pages
+        rebuilt after the change do not read the file again.
+        """
+        self._asset_loader.invalidate(path)
+        if file_type == "css":
+            content = self._asset_loader.load_css(path)
+        else:
+            content = self._asset_loader.load_script(path)
+        return content, hashlib.sha256(content.encode()).hexdigest()
+
+    def _read_if_changed(self, path: Path, file_type: str) -> tuple[str, str] | None:
+        """Return the file's new content and hash, or None if it matches the last delivery."""
+        content, digest = self._read_asset(path, file_type)
+        if self._content_hashes.get(path) == digest:
+            debug(f"Content unchanged, skipping: {path}")
+            return None
+        return content, digest
+
+    def _push_css(self, labels: list[str], path: Path, css: str) -> bool:
+        """Inject one stylesheet into several windows.
+
+        Windows sharing an asset ID receive a single broadcast when a
+        broadcast callback is configured, otherwise one injection each.
+        Returns True only if every window received the stylesheet.
+        """
+        targets: dict[str, list[str]] = {}
+        for label in labels:
+            asset_id = self._asset_ids.get(label, {}).get(path)
+            if asset_id:
+                targets.setdefault(asset_id, []).append(label)
+
+        success = bool(targets)
+        for asset_id, target_labels in targets.items():
+            try:
+                if self._broadcast_css_callback and (
+                    len(target_labels) > 1 or not self._inject_css_callback
+                ):
+                    delivered = (
+                        self._broadcast_css_callback(target_labels, css, asset_id) is not False
+                    )
+                elif self._inject_css_callback:
+                    # Inject into every window even after one fails
+                    results = [
+                        self._inject_css_callback(label, css, asset_id) for label in target_labels
+                    ]
+                    delivered = False not in results
+                else:
+                    success = False
+                    continue
+            except Exception as e:
+                warn(f"Failed to inject CSS: {e}")
+                success = False
+                continue
+            if delivered:
+                debug(f"Injected CSS: {path} into {len(target_labels)} window(s)")
+            else:
+                warn(f"Failed to inject CSS: {path}")
+                success = False
 
         return success
 
@@ -252,7 +338,9 @@ class HotReloadManager:
             return False
 
         try:
-            self._refresh_callback(label)
+            if self._refresh_callback(label) is False:
+                warn(f"Failed to refresh window {label}")
+                return False
             debug(f"Refreshed window {label}")
             return True
         except Exception as e:
@@ -260,7 +348,7 @@ class HotReloadManager:
             return False
 
     def _on_file_change(self, path: Path, label: str) -> None:
-        """Handle file change event.
+        """Handle a change to a single file for a single window.
 
         Parameters
         ----------
@@ -269,23 +357,51 @@ class HotReloadManager:
         label : str
             Window label.
         """
-        if label not in self._window_files:
-            return
+        self._on_changes({path: [label]})
 
-        file_type = self._window_files[label].get(path)
-        if not file_type:
-            return
+    def _on_changes(self, changes: dict[Path, list[str]]) -> None:
+        """Handle one debounced batch of file changes.
 
-        debug(f"File changed: {path} ({file_type}) for window {label}")
-
-        if file_type == "css":
-            if self._settings.css_reload == "inject":
-                self.reload_css(label, path)
-            else:
-                self.refresh_window(label)
-        elif file_type == "script":
+        Parameters
+        ----------
+        changes : dict[Path, list[str]]
+            Changed file -> labels of the windows watching it.
+        """
+        refresh_labels: dict[str, None] = {}
+        # Hashes recorded once their file reached every window: path -> (hash, refreshes)
+        delivered: dict[Path, tuple[str, list[str]]] = {}
+        inject = self._settings.css_reload == "inject"
+
+        for path, labels in changes.items():
+            by_type: dict[str, list[str]] = {}
+            for label in labels:
+                file_type = self._window_files.get(label, {}).get(path)
+                if file_type:
+                    by_type.setdefault(file_type, []).append(label)
+            if not by_type:
+                continue
+
+            changed = self._read_if_changed(path, "css" if "css" in by_type else "script")
+            if changed is None:
+                continue
+            content, digest = changed
+
+            debug(f"File changed: {path} for window(s) {', '.join(labels)}")
+            css_labels = by_type.get("css", [])
             # Scripts always trigger full refresh
-            self.refresh_window(label)
+            refreshes = list(by_type.get("script", []))
+            if css_labels and inject:
+                if content and not self._push_css(css_labels, path, content):
+                    continue
+            else:
+                refreshes.extend(css_labels)
+            refresh_labels.update(dict.fromkeys(refreshes))
+            delivered[path] = (digest, refreshes)
+
+        refreshed = {label: self.refresh_window(label) for label in refresh_labels}
+        for path, (digest, refreshes) in delivered.items():
+            if all(refreshed[label] for label in refreshes):
+                self._content_hashes[path] = digest
 
     def get_watched_files(self, label: str | None = None) -> dict[str, list[Path]]:
         """Get list of watched files.
@@ -15,7 +15,7 @@ import threading
 import time
 import uuid
 
-from contextlib import asynccontextmanager, suppress
+from contextlib import asynccontextmanager, contextmanager, suppress
 from typing import TYPE_CHECKING, Any, Literal
 
 from .assets import (
@@ -49,8 +49,9 @@ __all__ = ["BaseWidget", "InlineWidget"]
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+    from collections.abc import AsyncIterator, Callable, Iterator
 
+    from .config import ServerSettings
     from .grid import GridConfig
     from .modal import Modal
     from .plotly_config import PlotlyConfig
@@ -132,17 +133,24 @@ class _ServerState:
         # their last known state.
         self.widget_revisions: dict[str, int] = {}
 
+        # Deploy mode: worker that created each widget (and holds its
+        # callbacks), cached from the widget store for message forwarding
+        self.widget_owners: dict[str, str] = {}
+
         # === Pluggable backends (lazily initialized) ===
         self._widget_store: Any | None = None
         self._callback_registry: Any | None = None
         self._connection_router: Any | None = None
+        self._event_bus: Any | None = None
         self._worker_id: str | None = None
 
     @property
     def worker_id(self) -> str:
         """Get unique worker identifier."""
         if self._worker_id is None:
-            self._worker_id = f"worker-{uuid.uuid4().hex[:8]}"
+            from .state import get_worker_id
+
+            self._worker_id = get_worker_id()
         return self._worker_id
 
     def get_widget_store(self) -> Any:
@@ -169,6 +177,14 @@ class _ServerState:
             self._connection_router = _get_router()
         return self._connection_router
 
+    def get_event_bus(self) -> Any:
+        """Get the configured event bus (lazy initialization)."""
+        if self._event_bus is None:
+            from .state import get_event_bus as _get_bus
+
+            self._event_bus = _get_bus()
+        return self._event_bus
+
     # === Unified Widget Access (works in both modes) ===
 
     def register_widget(
@@ -184,34 +200,111 @@ class _ServerState:
         In deploy mode, HTML/token are stored externally; callbacks stay local.
         In normal mode, everything is stored in self.widgets dict.
         """
+        self.register_widgets(
+            [
+                {
+                    "widget_id": widget_id,
+                    "html": html,
+                    "callbacks": callbacks,
+                    "output": output,
+                    "token": token,
+                }
+            ]
+        )
+
+    def register_widgets(self, widgets: list[dict[str, Any]]) -> None:
+        """Register several widgets at once (e.g. every panel of a dashboard).
+
+        Each entry holds ``register_widget``'s arguments as keys. In deploy
+        mode the whole batch costs one blocking hop to the event loop, one
+        store write and one callback registry update.
+        """
         from .state import is_deploy_mode
 
-        # Always store local-only data (callbacks, output widget)
-        self.local_widgets[widget_id] = {
-            "callbacks": callbacks or {},
-            "output": output,
-        }
+        if not is_deploy_mode():
+            self._register_widgets_local(widgets)
+            return
 
-        if is_deploy_mode():
-            # Store HTML externally via async store
-            from .state import run_async
+        from .state import run_async
 
-            store = self.get_widget_store()
-            run_async(store.register(widget_id, html, token=token))
+        self._keep_local_only(widgets)
+        run_async(self._register_widgets_external(widgets))
 
-            # Register callbacks in local registry
-            registry = self.get_callback_registry()
-            for event_type, callback in (callbacks or {}).items():
-                run_async(registry.register(widget_id, event_type, callback))
-        else:
-            # Local mode: store everything in widgets dict
+    async def register_widget_async(
+        self,
+        widget_id: str,
+        html: str,
+        callbacks: dict[str, Any] | None = None,
+        output: Any = None,
+        token: str | None = None,
+    ) -> None:
+        """Register a widget (async version).
+
+        Use this from code already running on an event loop, where the sync
+        version would block on (or deadlock) a cross-thread future.
+        """
+        await self.register_widgets_async(
+            [
+                {
+                    "widget_id": widget_id,
+                    "html": html,
+                    "callbacks": callbacks,
+                    "output": output,
+                    "token": token,
+                }
+            ]
+        )
+
+    async def register_widgets_async(self, widgets: list[dict[str, Any]]) -> None:
+        """Register several widgets at once (async version)."""
+        from .state import is_deploy_mode
+
+        if not is_deploy_mode():
+            self._register_widgets_local(widgets)
+            return
+
+        self._keep_local_only(widgets)
+        await self._register_widgets_external(widgets)
+
+    def _register_widgets_local(self, widgets: list[dict[str, Any]]) -> None:
+        """Store widgets entirely in-process (local mode)."""
+        self._keep_local_only(widgets)
+        for widget in widgets:
+            widget_id = widget["widget_id"]
             self.widgets[widget_id] = {
-                "html": html,
-                "callbacks": callbacks or {},
-                "output": output,
+                "html": widget["html"],
+                "callbacks": widget.get("callbacks") or {},
+                "output": widget.get("output"),
             }
-            if token:
-                self.widget_tokens[widget_id] = token
+            if widget.get("token"):
+                self.widget_tokens[widget_id] = widget["token"]
+
+    def _keep_local_only(self, widgets: list[dict[str, Any]]) -> None:
+        """Store the data that cannot leave this process (callbacks, output widget)."""
+        for widget in widgets:
+            self.local_widgets[widget["widget_id"]] = {
+                "callbacks": widget.get("callbacks") or {},
+                "output": widget.get("output"),
+            }
+
+    async def _register_widgets_external(self, widgets: list[dict[str, Any]]) -> None:
+        """Write HTML/tokens to the widget store and callbacks to the registry in bulk."""
+        from .state import WidgetData
+
+        await self.get_widget_store().register_many(
+            [
+                WidgetData(
+                    widget_id=widget["widget_id"],
+                    html=widget["html"],
+                    token=widget.get("token"),
+                    owner_worker_id=self.worker_id,
+                )
+                for widget in widgets
+            ]
+        )
+        await self.get_callback_registry().register_many(
+            {widget["widget_id"]: widget.get("callbacks") or {} for widget in widgets}
+        )
 
     def get_widget_html(self, widget_id: str) -> str | None:
         """Get widget HTML content."""
@@ -328,6 +421,7 @@ class _ServerState:
         # Always clean up these
         self.widget_tokens.pop(widget_id, None)
         self.event_queues.pop(widget_id, None)
+        self.widget_owners.pop(widget_id, None)
 
     def get_active_widget_ids(self) -> list[str]:
         """Get list of active widget IDs."""
@@ -407,6 +501,31 @@ class _ServerState:
 
 _state = _ServerState()
 
+# Registrations deferred by _defer_registration, per thread
+_deferred = threading.local()
+
+
+@contextmanager
+def _defer_registration() -> Iterator[dict[str, dict[str, Any]]]:
+    """Collect the registrations of InlineWidgets created in this block.
+
+    Yields the pending ``register_widgets`` entries keyed by widget ID;
+    the caller registers them in one batch after the block, before any of
+    the widgets is displayed.
+    """
+    pending: dict[str, dict[str, Any]] = {}
+    _deferred.pending = pending
+    try:
+        yield pending
+    finally:
+        _deferred.pending = None
+
+
+def _registration_deferred(widget_id: str) -> bool:
+    """Return whether ``widget_id``'s registration is waiting in a batch."""
+    pending = getattr(_deferred, "pending", None)
+    return pending is not None and widget_id in pending
+
 
 def _generate_widget_token(widget_id: str) -> str | None:
     """Generate or retrieve a widget authentication token.
@@ -486,10 +605,17 @@ def _get_pywry_bridge_js(widget_id: str, widget_token: str | None = None) -> str
 async def _lifespan(
     app: FastAPI,
 ) -> AsyncIterator[None]:
+    from .state import is_deploy_mode
+
     # Capture the running event loop for emit() to use
     _state.server_loop = asyncio.get_running_loop()
     _state.shutdown_event = asyncio.Event()
+    relay = asyncio.create_task(_relay_worker_events()) if is_deploy_mode() else None
     yield
+    if relay is not None:
+        relay.cancel()
+        with suppress(asyncio.CancelledError):
+            await relay
 
 
 async def _ws_sender_loop(
@@ -510,8 +636,144 @@ async def _ws_sender_loop(
             log_debug(f"[SERVER] Sender error for {widget_id}: {e}")
 
 
-def _route_ws_message(widget_id: str, msg: dict[str, Any]) -> None:
-    """Route incoming websocket message to callback queue if handler exists."""
+# ═══════════════════════════════════════════════════════════
+# CROSS-WORKER DELIVERY (deploy mode)
+# ═══════════════════════════════════════════════════════════
+#
+# Each worker subscribes to its own ``worker:{id}`` event bus channel.
+# A browser may connect to any worker: that worker registers itself as the
+# connection owner in the ConnectionRouter, while callbacks stay on the
+# worker that created the widget (``owner_worker_id`` in the widget store).
+# Python->browser pushes are published to the connection owner; browser
+# messages without a local callback are published to the widget owner.
+
+_RELAY_PUSH = "pywry:relay-push"
+_RELAY_MESSAGE = "pywry:relay-message"
+
+
+async def _publish_to_worker(
+    worker_id: str, kind: str, widget_id: str, payload: dict[str, Any]
+) -> None:
+    """Publish a relayed event on another worker's channel."""
+    from .state import EventMessage
+
+    await _state.get_event_bus().publish(
+        f"worker:{worker_id}",
+        EventMessage(
+            event_type=kind,
+            widget_id=widget_id,
+            data=payload,
+            source_worker_id=_state.worker_id,
+            target_worker_id=worker_id,
+            timestamp=time.time(),
+            message_id=uuid.uuid4().hex,
+        ),
+    )
+
+
+async def _forward_push(widget_id: str, event: dict[str, Any]) -> bool:
+    """Forward a Python->browser event to the worker holding the widget's socket.
+
+    Returns True if another worker owns the connection and the event was
+    published to it; False means the event should be queued locally.
+    """
+    from .state import is_deploy_mode
+
+    if not is_deploy_mode() or widget_id in _state.connections:
+        return False
+    try:
+        owner = await _state.get_connection_router().get_owner(widget_id)
+        if not owner or owner == _state.worker_id:
+            return False
+        await _publish_to_worker(owner, _RELAY_PUSH, widget_id, event)
+    except Exception as e:
+        warn(f"[SERVER] Could not forward event to owner of {widget_id}: {e}")
+        return False
+    return True
+
+
+async def _forward_ws_message(widget_id: str, msg: dict[str, Any]) -> bool:
+    """Forward a browser message to the worker that created the widget.
+
+    Returns True if the message was published to another worker.
+    """
+    try:
+        owner = _state.widget_owners.get(widget_id)
+        if owner is None:
+            widget = await _state.get_widget_store().get(widget_id)
+            if widget is None or not widget.owner_worker_id:
+                return False
+            owner = _state.widget_owners[widget_id] = widget.owner_worker_id
+        if owner == _state.worker_id:
+            return False
+        await _publish_to_worker(owner, _RELAY_MESSAGE, widget_id, msg)
+    except Exception as e:
+        warn(f"[SERVER] Could not forward message for {widget_id}: {e}")
+        return False
+    return True
+
+
+async def _relay_worker_events() -> None:
+    """Deliver events published to this worker's channel until cancelled."""
+    bus = _state.get_event_bus()
+    channel = f"worker:{_state.worker_id}"
+    while True:
+        try:
+            async for message in bus.subscribe(channel):
+                if message.event_type == _RELAY_PUSH:
+                    event_queue = _state.event_queues.get(message.widget_id)
+                    if event_queue is not None:
+                        await event_queue.put(message.data)
+                elif message.event_type == _RELAY_MESSAGE:
+                    _route_ws_message(message.widget_id, message.data)
+        except Exception as e:
+            warn(f"[SERVER] Worker event relay failed, resubscribing: {e}")
+        await asyncio.sleep(1.0)
+
+
+async def _claim_connection(widget_id: str) -> asyncio.Task[None] | None:
+    """Register this worker as the widget's connection owner and keep it alive.
+
+    Returns the heartbeat task, or None if the router is unavailable.
+    """
+    router = _state.get_connection_router()
+    try:
+        await router.register_connection(widget_id, _state.worker_id)
+    except Exception as e:
+        warn(f"[SERVER] Could not register connection for {widget_id}: {e}")
+        return None
+    interval = max(1.0, get_settings().deploy.connection_ttl / 3)
+    return asyncio.create_task(_ws_heartbeat_loop(widget_id, interval))
+
+
+async def _ws_heartbeat_loop(widget_id: str, interval: float) -> None:
+    """Refresh the connection's router entry so it does not expire."""
+    router = _state.get_connection_router()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await router.refresh_heartbeat(widget_id):
+                # Entry expired (e.g. the backend was unreachable): re-claim
+                await router.register_connection(widget_id, _state.worker_id)
+        except Exception as e:
+            warn(f"[SERVER] Heartbeat failed for {widget_id}: {e}")
+
+
+async def _release_connection(widget_id: str) -> None:
+    """Remove the router entry if this worker still owns the connection."""
+    router = _state.get_connection_router()
+    try:
+        if await router.get_owner(widget_id) == _state.worker_id:
+            await router.unregister_connection(widget_id)
+    except Exception as e:
+        warn(f"[SERVER] Could not unregister connection for {widget_id}: {e}")
+
+
+def _route_ws_message(widget_id: str, msg: dict[str, Any]) -> bool:
+    """Route incoming websocket message to callback queue if handler exists.
+
+    Returns True if a local callback was queued for the message.
+    """
     from .state import is_deploy_mode
 
     event_type = msg.get("type", "")
@@ -522,7 +784,7 @@ def _route_ws_message(widget_id: str, msg: dict[str, Any]) -> None:
     if event_type == "pywry:disconnect":
         reason = msg.get("data", {}).get("reason", "client")
         _handle_widget_disconnect(widget_id, reason)
-        return
+        return False
 
     # Get callbacks based on mode
     if is_deploy_mode():
@@ -536,15 +798,15 @@ def _route_ws_message(widget_id: str, msg: dict[str, Any]) -> None:
         if widget_id not in _state.widgets:
             if PYWRY_DEBUG:
                 log_debug(f"[SERVER] Widget {widget_id} not in _state.widgets!")
-            return
+            return False
         callbacks = _state.widgets[widget_id].get("callbacks", {})
 
-    if event_type in callbacks:
-        if PYWRY_DEBUG:
-            log_debug(f"[SERVER] Found callback for {event_type}, queueing...")
-        _state.callback_queue.put(
-            (callbacks[event_type], msg.get("data", {}), event_type, widget_id)
-        )
+    if event_type not in callbacks:
+        return False
+    if PYWRY_DEBUG:
+        log_debug(f"[SERVER] Found callback for {event_type}, queueing...")
+    _state.callback_queue.put((callbacks[event_type], msg.get("data", {}), event_type, widget_id))
+    return True
 
 
 def _handle_widget_disconnect(widget_id: str, reason: str = "unknown") -> None:
@@ -618,6 +880,7 @@ def _handle_widget_disconnect(widget_id: str, reason: str = "unknown") -> None:
                 del _state.widgets[widget_id]
         if widget_id in _state.event_queues:
             del _state.event_queues[widget_id]
+        _state.widget_owners.pop(widget_id, None)
         # Clean up per-widget token
         if widget_id in _state.widget_tokens:
             del _state.widget_tokens[widget_id]
@@ -750,6 +1013,7 @@ def _get_app() -> FastAPI:  # noqa: C901, PLR0915
                 session_cookie=deploy_settings.auth_session_cookie,
                 auth_header=deploy_settings.auth_header,
                 session_ttl=deploy_settings.session_ttl,
+                session_cache_ttl=deploy_settings.permission_cache_ttl,
             )
 
             # Token store
@@ -868,6 +1132,8 @@ def _get_app() -> FastAPI:  # noqa: C901, PLR0915
 
         Note: Token is sent via Sec-WebSocket-Protocol header to avoid exposure in logs/URLs
         """
+        from .state import is_deploy_mode
+
         if PYWRY_DEBUG:
             log_debug(f"[SERVER] WebSocket connection request for {widget_id}")
 
@@ -965,21 +1231,36 @@ def _get_app() -> FastAPI:  # noqa: C901, PLR0915
         event_queue = _state.event_queues[widget_id]
         sender = asyncio.create_task(_ws_sender_loop(event_queue, websocket, widget_id))
 
+        # Deploy mode: claim the connection so other workers route here
+        deploy_mode = is_deploy_mode()
+        heartbeat = await _claim_connection(widget_id) if deploy_mode else None
+
         try:
             while True:
                 data = await websocket.receive_text()
                 msg = json.loads(data)
                 if PYWRY_DEBUG:
                     log_debug(f"[SERVER] Received from {widget_id}: {msg}")
-                _route_ws_message(widget_id, msg)
+                if not _route_ws_message(widget_id, msg) and deploy_mode:
+                    await _forward_ws_message(widget_id, msg)
         except WebSocketDisconnect:
             if PYWRY_DEBUG:
                 log_debug(f"[SERVER] WebSocket disconnected for {widget_id}")
             # Only handle disconnect if this is still the active connection
             if widget_id in _state.connections and _state.connections[widget_id] == websocket:
                 _handle_widget_disconnect(widget_id, "websocket_close")
+                if deploy_mode:
+                    await _forward_ws_message(
+                        widget_id,
+                        {"type": "pywry:disconnect", "data": {"reason": "websocket_close"}},
+                    )
         finally:
             sender.cancel()
+            if heartbeat is not None:
+                heartbeat.cancel()
+            # A newer socket for the same widget on this worker keeps the claim
+            if deploy_mode and _state.connections.get(widget_id) in (None, websocket):
+                await _release_connection(widget_id)
 
     @app.get("/health", include_in_schema=False)
     async def health(request: Request) -> Response:
@@ -1174,6 +1455,31 @@ def _make_server_request(
     )
 
 
+def _uvicorn_protocol_kwargs(settings: ServerSettings) -> dict[str, Any]:
+    """Return the event loop, protocol and WebSocket options for ``uvicorn.Config``.
+
+    Parameters
+    ----------
+    settings : ServerSettings
+        Server settings.
+
+    Returns
+    -------
+    dict[str, Any]
+        Keyword arguments shared by the inline server and :func:`deploy`.
+    """
+    return {
+        "loop": settings.loop,
+        "http": settings.http,
+        "ws": settings.ws,
+        "ws_max_size": settings.ws_max_size,
+        "ws_max_queue": settings.ws_max_queue,
+        "ws_ping_interval": settings.ws_ping_interval,
+        "ws_ping_timeout": settings.ws_ping_timeout,
+        "ws_per_message_deflate": settings.ws_per_message_deflate,
+    }
+
+
 def _start_server(port: int | None = None, host: str | None = None) -> None:  # noqa: C901, PLR0915
     """Start the FastAPI server in a background thread.
 
@@ -1203,6 +1509,7 @@ def _start_server(port: int | None = None, host: str | None = None) -> None:  #
         "access_log": settings.access_log,
         "timeout_keep_alive": settings.timeout_keep_alive,
         "backlog": settings.backlog,
+        **_uvicorn_protocol_kwargs(settings),
     }
 
     # Optional settings (only add if set)
@@ -1228,9 +1535,11 @@ def _start_server(port: int | None = None, host: str | None = None) -> None:  #
 
     # Store the loop so we can shut it down properly
     _state.server_loop = None
+    # Resolved here so a missing uvloop raises in the caller, not the thread
+    loop_factory = config.get_loop_factory()
 
     def run() -> None:
-        loop = asyncio.new_event_loop()
+        loop = loop_factory() if loop_factory is not None else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         _state.server_loop = loop
         try:
@@ -1414,6 +1723,11 @@ def deploy() -> None:
     - PYWRY_SERVER__RELOAD: Enable auto-reload (default: false)
     - PYWRY_SERVER__SSL_KEYFILE: Path to SSL key file
     - PYWRY_SERVER__SSL_CERTFILE: Path to SSL certificate file
+    - PYWRY_SERVER__LOOP / __HTTP / __WS: Event loop, HTTP parser and
+      WebSocket implementation (default: "auto", i.e. uvloop, httptools
+      and websockets when installed: ``pip install uvloop httptools``)
+    - PYWRY_SERVER__WS_PING_INTERVAL, __WS_MAX_SIZE, __WS_PER_MESSAGE_DEFLATE:
+      WebSocket keepalive, message size limit and compression
 
     Examples
     --------
@@ -1474,6 +1788,7 @@ def deploy() -> None:
         "access_log": server.access_log,
         "timeout_keep_alive": server.timeout_keep_alive,
         "backlog": server.backlog,
+        **_uvicorn_protocol_kwargs(server),
     }
 
     # Optional settings
@@ -1709,13 +2024,18 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
         self._output = Output() if HAS_IPYTHON else None
 
         # Register widget with proper state management (handles both memory and Redis backends)
-        _state.register_widget(
-            widget_id=self._widget_id,
-            html=html,
-            callbacks=self._callbacks,
-            output=self._output,
-            token=self._token,
-        )
+        registration = {
+            "widget_id": self._widget_id,
+            "html": html,
+            "callbacks": self._callbacks,
+            "output": self._output,
+            "token": self._token,
+        }
+        pending = getattr(_deferred, "pending", None)
+        if pending is None:
+            _state.register_widget(**registration)
+        else:
+            pending[self._widget_id] = registration
 
         # Check if server is already running (e.g., after kernel restart)
         server_already_running = False
@@ -1796,6 +2116,12 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
             f"{self._protocol}://{self._host}:{self._port}{_state.widget_prefix}/{self._widget_id}"
         )
 
+    @property
+    def pending_events(self) -> int:
+        """Number of emitted events still queued for the browser."""
+        queue = _state.event_queues.get(self._widget_id)
+        return queue.qsize() if queue is not None else 0
+
     def open_in_browser(self) -> None:
         """Open the chart in a new browser tab."""
         import webbrowser
@@ -1842,6 +2168,9 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
 
         self._callbacks[event_type] = callback
 
+        if _registration_deferred(self._widget_id):
+            # The pending registration holds self._callbacks
+            return self
         if is_deploy_mode():
             from .state import run_async
 
@@ -1871,6 +2200,8 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
         if _state.server_loop and _state.server_loop.is_running():
 
             async def _send() -> None:
+                if await _forward_push(self._widget_id, event):
+                    return
                 if self._widget_id not in _state.event_queues:
                     _state.event_queues[self._widget_id] = asyncio.Queue()
                 await _state.event_queues[self._widget_id].put(event)
@@ -1993,6 +2324,8 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
         chart_id: str | None = None,
         animate: bool = False,
         config: dict[str, Any] | None = None,
+        diff: bool = False,
+        typed_arrays: bool = False,
     ) -> None:
         """Update the Plotly figure without manual HTML generation.
 
@@ -2006,13 +2339,18 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
             Whether to animate the update.
         config : dict, optional
             Configuration dictionary.
+        diff : bool, optional
+            Send only the traces and top-level layout keys that changed
+            since the last figure sent to this chart.
+        typed_arrays : bool, optional
+            Send numeric numpy arrays as typed-array specs (``bdata``).
 
         Examples
         --------
         >>> widget.update_figure(new_fig)  # Clean API!
         """
         # Convert figure to dict
-        fig_dict = _normalize_figure(figure)
+        fig_dict = _normalize_figure(figure, typed_arrays)
         stored_config = getattr(self, "_plotly_config", None)
 
         # Resolve config - could be Pydantic model, dict, or None
@@ -2028,12 +2366,21 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
             else:
                 final_config = {}
 
+        if diff and self._emit_figure_patch(
+            fig_dict, chart_id, animate, final_config if config else None
+        ):
+            return
+
         # Send an update event for the partial plot update.
         # This keeps the rest of the page (including toolbar) intact.
         # If we wanted to replace the toolbar, we'd need to reload the whole HTML.
         # For full replacement, see update_html.
 
         # Send update via Plotly.react (no page reload needed)
+        self._sent_figures()[chart_id or ""] = {
+            "data": fig_dict.get("data", []),
+            "layout": fig_dict.get("layout", {}),
+        }
         self.emit(
             "plotly:update-figure",
             {
@@ -2052,6 +2399,7 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
         grid_id: str | None = None,
     ) -> None:
         """Update a single cell value."""
+        self._forget_rows(grid_id)
         self.emit(
             "grid:update-cell",
             {"rowId": row_id, "colId": col_id, "value": value, "gridId": grid_id},
@@ -2064,6 +2412,7 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
         strategy: str = "set",
     ) -> None:
         """Update grid data rows."""
+        self._forget_rows(grid_id)
         self.emit(
             "grid:update-data",
             {"data": data, "gridId": grid_id, "strategy": strategy},
@@ -2098,6 +2447,7 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
         """Update grid with new data, columns, and/or restore saved state."""
         payload: dict[str, Any] = {}
         if data is not None:
+            self._forget_rows(grid_id)
             to_dict = getattr(data, "to_dict", None)
             if callable(to_dict) and hasattr(data, "columns"):
                 payload["data"] = to_dict(orient="records")
@@ -2310,6 +2660,22 @@ class InlineWidget(GridStateMixin, PlotlyStateMixin, TVChartStateMixin, ToolbarS
         return []
 
 
+def _display_widget(widget: BaseWidget, open_browser: bool = False) -> None:
+    """Open ``widget`` in the browser or show its IFrame in the notebook.
+
+    Display is skipped entirely in headless mode (``PYWRY_HEADLESS=1``)
+    for server deployments, where the widget only needs to be registered.
+    """
+    if is_headless():
+        return
+    if open_browser:
+        open_fn = getattr(widget, "open_in_browser", None)
+        if callable(open_fn):
+            open_fn()
+    else:
+        widget.display()  # Jupyter notebook mode: show IFrame
+
+
 def show(
     content: str,
     title: str = "PyWry",
@@ -2510,9 +2876,13 @@ def show(
     )
 
     # Register secret handlers for all SecretInputs in toolbars
-    # This enables reveal/copy functionality
+    # This enables reveal/copy functionality, plus option pages for
+    # dropdowns with a server-side option_source
     if toolbars:
-        from .toolbar import register_secret_handlers_for_toolbar
+        from .toolbar import (
+            register_option_source_handlers_for_toolbar,
+            register_secret_handlers_for_toolbar,
+        )
 
         for toolbar_cfg in toolbars:
             if isinstance(toolbar_cfg, Toolbar):
@@ -2521,15 +2891,13 @@ def show(
                     widget.on,
                     widget.emit,
                 )
+                register_option_source_handlers_for_toolbar(
+                    toolbar_cfg,
+                    widget.on,
+                    widget.emit,
+                )
 
-    # Display - either open in browser or show IFrame
-    # Skip display entirely in headless mode (PYWRY_HEADLESS=1) for server deployments
-    if is_headless():
-        pass  # Server mode: widget is registered, no display needed
-    elif open_browser:
-        widget.open_in_browser()
-    else:
-        widget.display()  # Jupyter notebook mode: show IFrame
+    _display_widget(widget, open_browser)
     return widget
 
 
@@ -3062,6 +3430,7 @@ def show_plotly(
     toolbars: list[dict[str, Any] | Toolbar] | None = None,
     modals: list[dict[str, Any] | Modal] | None = None,
     open_browser: bool = False,
+    display: bool = True,
 ) -> BaseWidget:
     """Show a Plotly figure inline in a notebook with automatic event handling.
 
@@ -3097,6 +3466,9 @@ def show_plotly(
     open_browser : bool, optional
         If True, open in system browser instead of displaying IFrame in notebook.
         Used by BROWSER mode. Default: False.
+    display : bool, optional
+        If False, create and register the widget without showing it; call
+        ``widget.display()`` later. Default: True.
 
     Returns
     -------
@@ -3124,8 +3496,8 @@ def show_plotly(
 
     widget_id = uuid.uuid4().hex
 
-    # Convert figure to dict and merge config
-    fig_dict = json.loads(figure.to_json())
+    # Convert figure to dict in a single pass and merge config
+    fig_dict = dict(_normalize_figure(figure))
 
     # Apply default PlotlyConfig if none provided (hides logo, etc.)
     final_config: dict[str, Any] | PlotlyConfig = config if config is not None else PlotlyConfig()
@@ -3162,19 +3534,20 @@ def show_plotly(
     widget._plotly_config = config
     widget._toolbars = toolbars
 
+    # Seed the diff baseline so the first update_figure(diff=True) is a patch
+    if isinstance(widget, PlotlyStateMixin):
+        widget._sent_figures()[""] = {
+            "data": fig_dict.get("data", []),
+            "layout": fig_dict.get("layout", {}),
+        }
+
     # Auto-register callbacks
     if callbacks:
         for event_type, callback in callbacks.items():
             widget.on(event_type, callback)
 
-    # Display - either open in browser or show IFrame
-    # Skip display entirely in headless mode (PYWRY_HEADLESS=1) for server deployments
-    if is_headless():
-        pass  # Server mode: widget is registered, no display needed
-    elif open_browser:
-        widget.open_in_browser()
-    else:
-        widget.display()  # Jupyter notebook mode: show IFrame
+    if display:
+        _display_widget(widget, open_browser)
     return widget
 
 
@@ -3628,6 +4001,7 @@ def show_dataframe(
     pagination: bool | None = None,
     pagination_page_size: int = 100,
     open_browser: bool = False,
+    display: bool = True,
 ) -> BaseWidget:
     """Show a DataFrame (or dict/list) inline in a notebook with automatic event handling.
 
@@ -3636,8 +4010,10 @@ def show_dataframe(
 
     Parameters
     ----------
-    df : DataFrame | list[dict] | dict[str, list]
-        Data to display. Can be pandas DataFrame, list of row dicts, or dict of columns.
+    df : DataFrame | list[dict] | dict[str, list] | GridConfig
+        Data to display. Can be pandas DataFrame, list of row dicts, dict of columns,
+        or a ``GridConfig`` from ``build_grid_config``, which is used as-is (the
+        column, selection and pagination arguments then have no effect).
     callbacks : dict[str, Callable], optional
         Event callbacks.
     title : str
@@ -3677,6 +4053,9 @@ def show_dataframe(
     open_browser : bool, optional
         If True, open in system browser instead of displaying IFrame in notebook.
         Used by BROWSER mode. Default: False.
+    display : bool, optional
+        If False, create and register the widget without showing it; call
+        ``widget.display()`` later. Default: True.
 
     Returns
     -------
@@ -3687,25 +4066,28 @@ def show_dataframe(
     if theme is None:
         theme = _get_default_theme()
 
-    from .grid import build_grid_config
+    from .grid import GridConfig, build_grid_config
     from .notebook import create_dataframe_widget
 
     # Convert "system" to "dark" for grid config (grid doesn't support system theme)
     grid_theme: Literal["dark", "light"] = "dark" if theme in ("dark", "system") else "light"
 
-    # Use unified grid config builder
-    config = build_grid_config(
-        data=df,
-        column_defs=column_defs,
-        grid_options=grid_options,
-        theme=grid_theme,
-        aggrid_theme=aggrid_theme,
-        grid_id=widget_id,
-        row_selection=row_selection,
-        enable_cell_span=enable_cell_span,
-        pagination=pagination,
-        pagination_page_size=pagination_page_size,
-    )
+    # Use unified grid config builder unless the config was prepared upfront
+    if isinstance(df, GridConfig):
+        config = df
+    else:
+        config = build_grid_config(
+            data=df,
+            column_defs=column_defs,
+            grid_options=grid_options,
+            theme=grid_theme,
+            aggrid_theme=aggrid_theme,
+            grid_id=widget_id,
+            row_selection=row_selection,
+            enable_cell_span=enable_cell_span,
+            pagination=pagination,
+            pagination_page_size=pagination_page_size,
+        )
 
     # Use provided widget_id or the one from config
     wid = widget_id or config.context.grid_id
@@ -3732,14 +4114,8 @@ def show_dataframe(
         for event_type, callback in callbacks.items():
             widget.on(event_type, callback)
 
-    # Display - either open in browser or show IFrame
-    # Skip display entirely in headless mode (PYWRY_HEADLESS=1) for server deployments
-    if is_headless():
-        pass  # Server mode: widget is registered, no display needed
-    elif open_browser:
-        widget.open_in_browser()
-    else:
-        widget.display()  # Jupyter notebook mode: show IFrame
+    if display:
+        _display_widget(widget, open_browser)
     return widget
 
 
@@ -3973,13 +4349,15 @@ def show_tvchart(
     resolution: str = "1D",
     provider: Any = None,
     chart_kind: str = "default",
+    display: bool = True,
 ) -> Any:
     """Show a TradingView Lightweight Chart inline in a notebook.
 
     Parameters
     ----------
     data : Any, optional
-        OHLCV data as a DataFrame, list of dicts, or dict of lists.
+        OHLCV data as a DataFrame, list of dicts, dict of lists, or an
+        already normalized ``TVChartData``.
         Required in static mode; omit in datafeed mode.
     callbacks : dict, optional
         Event callbacks keyed by event name.
@@ -4017,6 +4395,9 @@ def show_tvchart(
         Initial symbol to resolve in datafeed mode.
     resolution : str
         Initial resolution/interval for datafeed mode (e.g. "1", "5", "1D").
+    display : bool, optional
+        If False, create and register the widget without showing it; call
+        ``widget.display()`` later. Default: True.
 
     Returns
     -------
@@ -4046,16 +4427,22 @@ def show_tvchart(
             }
         ]
     else:
+        from .config import get_settings
         from .tvchart import normalize_ohlcv
 
-        chart_data = normalize_ohlcv(data, symbol_col=symbol_col, max_bars=max_bars)
+        chart_data = normalize_ohlcv(
+            data,
+            symbol_col=symbol_col,
+            max_bars=max_bars,
+            typed_arrays=get_settings().tvchart.typed_arrays,
+        )
 
         for s in chart_data.series:
             series_payload.append(
                 {
                     "seriesId": s.series_id,
-                    "bars": s.bars,
-                    "volume": s.volume,
+                    "bars": s.bars_payload(),
+                    "volume": s.volume_payload(),
                     "seriesType": s.series_type.value.capitalize(),
                     "seriesOptions": series_options or {},
                 }
@@ -4139,7 +4526,7 @@ def show_tvchart(
             wire_datafeed(provider)
 
     # Display
-    if is_headless():
+    if not display or is_headless():
         pass
     elif open_browser:
         open_fn = getattr(widget, "open_in_browser", None)
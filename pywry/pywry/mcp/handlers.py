@@ -5,6 +5,7 @@ This module handles all tool call implementations using a dispatch pattern.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -24,14 +25,18 @@ from .resources import (
 )
 from .skills import get_skill, list_skills
 from .state import (
+    EventBuffer,
     capture_widget_events,
+    expect_ack,
     get_app,
+    get_event_buffer,
     get_widget,
     list_widget_ids,
     register_widget,
     remove_widget,
     request_response,
     store_widget_config,
+    wait_for_ack,
 )
 
 
@@ -53,7 +58,7 @@ _TVCHART_CAPTURE_EVENTS = [
 
 
 # Type aliases
-EventsDict = dict[str, list[dict[str, Any]]]
+EventsDict = dict[str, EventBuffer]
 MakeCallback = Callable[[str], Callable[[Any, str, str], None]]
 HandlerResult = dict[str, Any]
 
@@ -241,7 +246,7 @@ def _handle_create_widget(ctx: HandlerContext) -> HandlerResult:
     widget_holder["widget"] = widget
     widget_id = getattr(widget, "widget_id", None) or uuid.uuid4().hex
     callback = ctx.make_callback(widget_id)
-    ctx.events[widget_id] = []
+    ctx.events[widget_id] = EventBuffer()
 
     _register_widget_events(widget, toolbars, callback)
     register_widget(widget_id, widget)
@@ -471,119 +476,65 @@ def _get_widget_or_error(widget_id: str | None) -> tuple[Any | None, HandlerResu
 # =============================================================================
 
 
-def _fetch_tvchart_state(widget: Any, timeout: float = 1.5) -> dict[str, Any] | None:
-    """Round-trip ``tvchart:request-state`` and strip the correlation token.
+# JS→Python event carrying a mutation acknowledgement.  The frontend
+# sends exactly one per ``ackId``-tagged mutation, after the mutation
+# (including any data round-trip it triggers) has landed on the chart.
+_TVCHART_ACK_EVENT = "tvchart:ack"
 
-    The frontend answers with ``{chartId, error: "not found"}`` when
-    the chart entry is mid-rebuild (destroy → recreate on a symbol or
-    interval mutation).  Treat that as "state unavailable right now"
-    and return ``None``.
-    """
-    response = request_response(
-        widget,
-        "tvchart:request-state",
-        "tvchart:state-response",
-        {},
-        timeout=timeout,
-    )
-    if response is None:
-        return None
-    response.pop("context", None)
-    if response.get("error"):
-        return None
-    return response
+# Seconds to wait for the ack of a mutation applied synchronously by the
+# frontend.  Mutations that round-trip through the datafeed pass longer
+# timeouts explicitly.
+_TVCHART_ACK_TIMEOUT = 4.0
 
 
-def _wait_for_data_settled(
-    widget: Any,
-    matcher: Callable[[dict[str, Any]], bool],
-    *,
-    timeout: float = 8.0,
-) -> dict[str, Any] | None:
-    """Block until the frontend signals a data-response has fully settled.
-
-    The ``tvchart:data-settled`` event is emitted by the data-response
-    handler after the destroy-recreate (symbol / interval change) or
-    the in-place update (compare / overlay add) completes — including
-    the 150ms tail for indicator re-add.  Waiting on it is strictly
-    better than polling ``tvchart:request-state``: there's no race
-    with the rebuild window and the payload is the exact post-mutation
-    state snapshot.
-
-    The matcher lets the caller ignore an unrelated concurrent
-    mutation's settled event (e.g. compare-add firing while we're
-    waiting for a symbol-change to settle).  Returns the first
-    matching payload, or ``None`` on timeout.
-    """
-    import threading as _threading
-
-    result: dict[str, dict[str, Any] | None] = {"payload": None}
-    done = _threading.Event()
-
-    def _listener(data: Any, _event_type: str = "", _label: str = "") -> None:
-        if done.is_set() or not isinstance(data, dict):
-            return
-        if data.get("error"):
-            return
-        if matcher(data):
-            result["payload"] = data
-            done.set()
-
-    # Register an event listener, wait for a matching payload, tear it
-    # down.  ``widget.on`` returns an unsubscribe callable on most
-    # PyWry backends; fall back to a best-effort untracked listener
-    # otherwise.
-    unsubscribe = None
-    try:
-        unsubscribe = widget.on("tvchart:data-settled", _listener)
-    except Exception:
-        logger.debug("widget.on('tvchart:data-settled') failed", exc_info=True)
-    try:
-        done.wait(timeout=timeout)
-    finally:
-        if callable(unsubscribe):
-            try:
-                unsubscribe()
-            except Exception:
-                logger.debug("unsubscribe failed", exc_info=True)
-    return result["payload"]
-
-
-def _poll_tvchart_state(
+def _wait_for_ack(ack_id: str, timeout: float) -> dict[str, Any] | None:
+    """Block until the frontend acknowledges ``ack_id`` (``None`` on timeout)."""
+    return wait_for_ack(ack_id, timeout)
+
+
+def _emit_with_ack(
     widget: Any,
+    event_type: str,
+    payload: dict[str, Any],
     *,
-    matcher: Callable[[dict[str, Any]], bool],
-    total_timeout: float = 6.0,
-    poll_interval: float = 0.2,
-    settle_delay: float = 0.4,
-) -> dict[str, Any] | None:
-    """Poll ``tvchart:request-state`` until the chart reflects a mutation.
-
-    Many chart mutations kick off multi-hop async chains in the frontend
-    (symbol-search -> datafeed-resolve -> data-request -> data-response -> destroy-recreate).
-    The chart entry is genuinely unavailable during the destroy-recreate
-    window and the frontend answers with ``{error: "not found"}`` that
-    ``_fetch_tvchart_state`` already turns into ``None``.
-
-    ``settle_delay`` is a short initial wait BEFORE the first poll so
-    we don't race into the rebuild window before it's even started —
-    otherwise the first fetch can return the still-alive pre-mutation
-    state, matcher fails against an unchanged symbol, and we burn the
-    poll budget waiting for a rebuild that already finished.
+    timeout: float = _TVCHART_ACK_TIMEOUT,
+) -> tuple[dict[str, Any] | None, float]:
+    """Emit a tvchart mutation tagged with an ``ackId`` and await its ack.
+
+    The waiter is registered before the emit, so there is no window in
+    which a fast reply can be missed, and nothing is polled: the call
+    returns as soon as the single ack arrives.
+
+    Returns
+    -------
+    tuple[dict or None, float]
+        The ack payload (``{ackId, event, chartId, ok, changed, state,
+        error?}``) or ``None`` on timeout, and the round-trip latency in
+        milliseconds.
     """
-    if settle_delay > 0:
-        time.sleep(settle_delay)
-    deadline = time.monotonic() + total_timeout
-    latest: dict[str, Any] | None = None
-    while True:
-        state = _fetch_tvchart_state(widget, timeout=max(0.5, poll_interval * 4))
-        if state is not None:
-            latest = state
-            if matcher(state):
-                return state
-        if time.monotonic() >= deadline:
-            return latest
-        time.sleep(poll_interval)
+    ack_id = expect_ack(widget, _TVCHART_ACK_EVENT)
+    started = time.monotonic()
+    widget.emit(event_type, {**payload, "ackId": ack_id})
+    ack = _wait_for_ack(ack_id, timeout)
+    latency_ms = (time.monotonic() - started) * 1000.0
+    logger.debug(
+        "%s ack %s after %.1f ms", event_type, "received" if ack else "timed out", latency_ms
+    )
+    return ack, latency_ms
+
+
+def _ack_state(ack: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Post-mutation state from a successful ack, else ``None``."""
+    if not isinstance(ack, dict) or not ack.get("ok"):
+        return None
+    state = ack.get("state")
+    return state if isinstance(state, dict) else None
+
+
+def _ack_changed(ack: dict[str, Any] | None) -> set[str]:
+    """State keys the acknowledged mutation changed."""
+    changed = ack.get("changed") if isinstance(ack, dict) else None
+    return {str(k) for k in changed} if isinstance(changed, list) else set()
 
 
 def _minimal_confirm_state(state: dict[str, Any] | None) -> dict[str, Any]:
@@ -630,8 +581,14 @@ def _emit_tvchart(
     payload: dict[str, Any],
     *,
     extras: dict[str, Any] | None = None,
+    confirm: bool = False,
 ) -> HandlerResult:
-    """Shared helper: resolve widget, emit event, return a uniform result."""
+    """Shared helper: resolve widget, emit event, return a uniform result.
+
+    With ``confirm=True`` the event is sent with an ``ackId`` and the
+    result reports whether the frontend acknowledged it, the identity
+    fields of the post-mutation state, and the round-trip latency.
+    """
     widget_id = ctx.args.get("widget_id")
     resolved_id, error = _resolve_widget_id(widget_id)
     if error is not None or resolved_id is None:
@@ -653,12 +610,26 @@ def _emit_tvchart(
     merged = {k: v for k, v in (payload or {}).items() if v is not None}
     if chart_id is not None:
         merged["chartId"] = chart_id
-    widget.emit(event_type, merged)
     result: HandlerResult = {
         "widget_id": resolved_id,
         "event_sent": True,
         "event_type": event_type,
     }
+    if confirm:
+        ack, latency_ms = _emit_with_ack(widget, event_type, merged)
+        result["latency_ms"] = round(latency_ms, 1)
+        state = _ack_state(ack)
+        result["confirmed"] = state is not None
+        if state is not None:
+            result.update(_minimal_confirm_state(state))
+        else:
+            result["reason"] = (
+                f"Chart reported an error applying {event_type}: {ack['error']}"
+                if isinstance(ack, dict) and ack.get("error")
+                else f"Chart did not acknowledge {event_type} within the timeout."
+            )
+    else:
+        widget.emit(event_type, merged)
     if extras:
         result.update(extras)
     return result
@@ -674,6 +645,7 @@ def _handle_tvchart_update_series(ctx: HandlerContext) -> HandlerResult:
             "seriesId": ctx.args.get("series_id"),
             "fitContent": ctx.args.get("fit_content", True),
         },
+        confirm=True,
     )
 
 
@@ -685,6 +657,7 @@ def _handle_tvchart_update_bar(ctx: HandlerContext) -> HandlerResult:
             "bar": ctx.args.get("bar"),
             "seriesId": ctx.args.get("series_id"),
         },
+        confirm=True,
     )
 
 
@@ -700,6 +673,7 @@ def _handle_tvchart_add_series(ctx: HandlerContext) -> HandlerResult:
             "seriesOptions": ctx.args.get("series_options") or {},
         },
         extras={"series_id": series_id},
+        confirm=True,
     )
 
 
@@ -710,6 +684,7 @@ def _handle_tvchart_remove_series(ctx: HandlerContext) -> HandlerResult:
         "tvchart:remove-series",
         {"seriesId": series_id},
         extras={"series_id": series_id},
+        confirm=True,
     )
 
 
@@ -721,6 +696,7 @@ def _handle_tvchart_add_markers(ctx: HandlerContext) -> HandlerResult:
             "markers": ctx.args.get("markers"),
             "seriesId": ctx.args.get("series_id"),
         },
+        confirm=True,
     )
 
 
@@ -735,6 +711,7 @@ def _handle_tvchart_add_price_line(ctx: HandlerContext) -> HandlerResult:
             "title": ctx.args.get("title", ""),
             "seriesId": ctx.args.get("series_id"),
         },
+        confirm=True,
     )
 
 
@@ -747,6 +724,7 @@ def _handle_tvchart_apply_options(ctx: HandlerContext) -> HandlerResult:
             "seriesOptions": ctx.args.get("series_options"),
             "seriesId": ctx.args.get("series_id"),
         },
+        confirm=True,
     )
 
 
@@ -764,6 +742,7 @@ def _handle_tvchart_add_indicator(ctx: HandlerContext) -> HandlerResult:
             "maType": ctx.args.get("ma_type"),
             "offset": ctx.args.get("offset"),
         },
+        confirm=True,
     )
 
 
@@ -774,6 +753,7 @@ def _handle_tvchart_remove_indicator(ctx: HandlerContext) -> HandlerResult:
         "tvchart:remove-indicator",
         {"seriesId": series_id},
         extras={"series_id": series_id},
+        confirm=True,
     )
 
 
@@ -827,49 +807,36 @@ def _handle_tvchart_symbol_search(ctx: HandlerContext) -> HandlerResult:
     exchange = ctx.args.get("exchange")
     if exchange:
         payload["exchange"] = exchange
-    # Capture the pre-emit symbol so we can tell whether the chart
-    # changed at all — even a fuzzy search ("microsoft" -> "MSFT") is a
-    # successful change, not a failure, and the note below must reflect
-    # that rather than complaining the literal query wasn't found.  Only
-    # worth fetching when we're actually going to auto-commit a query.
-    will_confirm = bool(query) and bool(auto_select)
-    pre_symbol = ""
-    if will_confirm:
-        pre_state = _fetch_tvchart_state(widget, timeout=0.6) or {}
-        pre_symbol = str(pre_state.get("symbol") or "").upper()
     payload = {k: v for k, v in payload.items() if v is not None}
-    widget.emit("tvchart:symbol-search", payload)
 
     result: HandlerResult = {
         "widget_id": resolved_id,
         "event_sent": True,
         "event_type": "tvchart:symbol-search",
     }
-    if not will_confirm:
+    if not (query and auto_select):
         # Just opened the dialog for the user — no mutation to confirm.
+        widget.emit("tvchart:symbol-search", payload)
         return result
 
+    # The frontend acks once the destroy-recreate and all post-mutation
+    # work (legend refresh, indicator re-add) has completed.
+    ack, latency_ms = _emit_with_ack(widget, "tvchart:symbol-search", payload, timeout=8.0)
+    result["latency_ms"] = round(latency_ms, 1)
+    state = _ack_state(ack)
+
     target = str(query).upper()
     target_bare = target.rsplit(":", maxsplit=1)[-1].strip() if ":" in target else target
-
-    def _matches(state: dict[str, Any]) -> bool:
-        current = str(state.get("symbol") or "").upper()
-        if not current:
-            return False
-        # Exact / bare-ticker match — or any change away from the
-        # pre-emit symbol.  The latter covers fuzzy searches like
-        # "microsoft" -> "MSFT" where the query is a company name
-        # rather than a ticker; the chart still genuinely committed
-        # the user's intent and the tool result should reflect that.
-        if current in (target, target_bare):
-            return True
-        return bool(pre_symbol) and current != pre_symbol
-
-    # Block until the frontend emits tvchart:data-settled for the main
-    # series — that fires AFTER the destroy-recreate and all post-
-    # mutation work (legend refresh, indicator re-add) has completed.
-    state = _wait_for_data_settled(widget, _matches)
-    if state is not None:
+    current = str((state or {}).get("symbol") or "").upper()
+    # Exact / bare-ticker match — or any change of symbol.  The latter
+    # covers fuzzy searches like "microsoft" -> "MSFT" where the query
+    # is a company name rather than a ticker; the chart still genuinely
+    # committed the user's intent and the tool result should say so.
+    if (
+        state is not None
+        and current
+        and (current in (target, target_bare) or "symbol" in _ack_changed(ack))
+    ):
         result["confirmed"] = True
         # Identity fields only — no bars/raw data (the agent would
         # paraphrase them into fabricated "last close: $..." text).
@@ -902,15 +869,6 @@ def _build_compare_payload(ctx: HandlerContext) -> dict[str, Any]:
     return payload
 
 
-def _snapshot_compare_set(widget: Any) -> set[str]:
-    """Return the upper-cased tickers currently in ``state.compareSymbols``."""
-    state = _fetch_tvchart_state(widget, timeout=0.6) or {}
-    compares = state.get("compareSymbols") or {}
-    if not isinstance(compares, dict):
-        return set()
-    return {str(s).upper() for s in compares.values()}
-
-
 def _handle_tvchart_compare(ctx: HandlerContext) -> HandlerResult:
     widget_id = ctx.args.get("widget_id")
     resolved_id, error = _resolve_widget_id(widget_id)
@@ -924,49 +882,35 @@ def _handle_tvchart_compare(ctx: HandlerContext) -> HandlerResult:
     query = ctx.args.get("query")
     auto_add = ctx.args.get("auto_add", True)
 
-    # Snapshot existing compares so fuzzy adds ("microsoft" → "MSFT")
-    # register as success.  Only needed when we're actually going to
-    # confirm a mutation.
-    will_confirm = bool(query) and bool(auto_add)
-    pre_compare_set = _snapshot_compare_set(widget) if will_confirm else set()
-
-    widget.emit("tvchart:compare", payload)
-
     result: HandlerResult = {
         "widget_id": resolved_id,
         "event_sent": True,
         "event_type": "tvchart:compare",
     }
-    if not will_confirm:
+    if not (query and auto_add):
         # Just opened the dialog for the user — no mutation to confirm.
+        widget.emit("tvchart:compare", payload)
         return result
 
+    # Compare chains search → resolve → data-request → response →
+    # series add before the frontend acks, so give it a generous window.
+    ack, latency_ms = _emit_with_ack(widget, "tvchart:compare", payload, timeout=12.0)
+    result["latency_ms"] = round(latency_ms, 1)
+    state = _ack_state(ack)
+
     target = str(query).upper()
     target_bare = target.rsplit(":", maxsplit=1)[-1].strip() if ":" in target else target
-
-    accepted_tickers = {target, target_bare}
-
-    def _matches(state: dict[str, Any]) -> bool:
-        compares = state.get("compareSymbols") or {}
-        if not isinstance(compares, dict):
-            return False
-        current_set = {str(s).upper() for s in compares.values()}
-        # Exact or bare-ticker match on the newly-added compare.
-        if any(sym in accepted_tickers for sym in current_set):
-            return True
-        # Fuzzy match: any new compare that wasn't there before counts
-        # — "microsoft" committing as "MSFT" is still success.
-        return bool(current_set - pre_compare_set)
-
-    # Block until the frontend emits tvchart:data-settled with the new
-    # compare in state — that fires AFTER the compare series is added
-    # and all post-mutation work has completed.  Compare chains search
-    # → resolve → data-request → response → series add, so give it a
-    # generous window.
-    state = _wait_for_data_settled(widget, _matches, timeout=12.0)
-    if state is not None:
+    compares = (state or {}).get("compareSymbols") or {}
+    current_set = (
+        {str(s).upper() for s in compares.values()} if isinstance(compares, dict) else set()
+    )
+    # Exact or bare-ticker match on the new compare — or, for fuzzy adds
+    # ("microsoft" → "MSFT"), any change to the compare set.
+    if current_set and (
+        bool(current_set & {target, target_bare}) or "compareSymbols" in _ack_changed(ack)
+    ):
         result["confirmed"] = True
-        result.update(_minimal_confirm_state(state))
+        result.update(_minimal_confirm_state(state or {}))
     else:
         result["confirmed"] = False
         result["reason"] = (
@@ -976,6 +920,12 @@ def _handle_tvchart_compare(ctx: HandlerContext) -> HandlerResult:
     return result
 
 
+def _normalize_interval(value: str) -> str:
+    """Canonical interval for comparison (``"1D"`` and ``"D"`` are equal)."""
+    value = value.strip().upper()
+    return value[1:] if value.startswith("1") and len(value) > 1 else value
+
+
 def _handle_tvchart_change_interval(ctx: HandlerContext) -> HandlerResult:
     widget_id = ctx.args.get("widget_id")
     resolved_id, error = _resolve_widget_id(widget_id)
@@ -991,7 +941,6 @@ def _handle_tvchart_change_interval(ctx: HandlerContext) -> HandlerResult:
     if chart_id is not None:
         payload["chartId"] = chart_id
     payload = {k: v for k, v in payload.items() if v is not None}
-    widget.emit("tvchart:interval-change", payload)
 
     result: HandlerResult = {
         "widget_id": resolved_id,
@@ -999,28 +948,21 @@ def _handle_tvchart_change_interval(ctx: HandlerContext) -> HandlerResult:
         "event_type": "tvchart:interval-change",
     }
     if not value:
+        widget.emit("tvchart:interval-change", payload)
         return result
 
+    # The frontend acks after the destroy-recreate and the datafeed
+    # round-trip for the new interval have completed.
+    ack, latency_ms = _emit_with_ack(widget, "tvchart:interval-change", payload, timeout=8.0)
+    result["latency_ms"] = round(latency_ms, 1)
+    state = _ack_state(ack)
     target = str(value).strip()
-
-    def _matches(state: dict[str, Any]) -> bool:
-        current = str(state.get("interval") or "").strip()
-        if not current:
-            return False
-
-        # Frontend may report "1D" where caller asked "D"; normalise both
-        # to a canonical comparison (strip leading "1" for a lone digit).
-        def _norm(s: str) -> str:
-            s = s.upper()
-            return s[1:] if s.startswith("1") and len(s) > 1 else s
-
-        return _norm(current) == _norm(target)
-
-    # Block until the frontend emits tvchart:data-settled reflecting
-    # the new interval — that fires AFTER the destroy-recreate and all
-    # post-mutation work has completed.
-    state = _wait_for_data_settled(widget, _matches)
-    if state is not None:
+    current = str((state or {}).get("interval") or "").strip()
+    if (
+        state is not None
+        and current
+        and _normalize_interval(current) == _normalize_interval(target)
+    ):
         result["confirmed"] = True
         result.update(_minimal_confirm_state(state))
     else:
@@ -1059,18 +1001,12 @@ def _emit_zoom_and_confirm(
     event_type: str,
     payload: dict[str, Any],
 ) -> HandlerResult:
-    """Emit a zoom/range mutation and wait for the frontend's confirmation.
-
-    The frontend emits ``tvchart:data-settled`` synchronously after
-    applying the timeScale/range call — that's the
-    confirm-operation-complete signal.
-
-    No state polling: register the listener, emit the event, block on
-    ``threading.Event`` until the settled event fires (or timeout),
-    return the payload the frontend sent.  If the event never fires
-    (frontend dropped it because the value was invalid, the chart was
-    mid-rebuild, etc.), we report ``confirmed: false`` rather than
-    silently claiming success.
+    """Emit a zoom/range mutation and wait for the frontend's ack.
+
+    The frontend acks synchronously after applying the timeScale/range
+    call.  If no ack arrives (the frontend dropped the event because the
+    value was invalid, the chart was mid-rebuild, etc.), we report
+    ``confirmed: false`` rather than silently claiming success.
     """
     widget_id = ctx.args.get("widget_id")
     resolved_id, error = _resolve_widget_id(widget_id)
@@ -1084,16 +1020,13 @@ def _emit_zoom_and_confirm(
     chart_id = ctx.args.get("chart_id")
     if chart_id is not None:
         merged["chartId"] = chart_id
-    widget.emit(event_type, merged)
-
-    # Accept any settled event — the frontend emits one
-    # synchronously right after applying the zoom/range, so the
-    # first event on the bus IS the confirmation for this mutation.
-    state = _wait_for_data_settled(widget, lambda _s: True, timeout=4.0)
+    ack, latency_ms = _emit_with_ack(widget, event_type, merged)
+    state = _ack_state(ack)
     result: HandlerResult = {
         "widget_id": resolved_id,
         "event_sent": True,
         "event_type": event_type,
+        "latency_ms": round(latency_ms, 1),
     }
     if state is not None:
         result["confirmed"] = True
@@ -1120,6 +1053,7 @@ def _handle_tvchart_log_scale(ctx: HandlerContext) -> HandlerResult:
         ctx,
         "tvchart:log-scale",
         {"value": bool(ctx.args.get("value"))},
+        confirm=True,
     )
 
 
@@ -1128,6 +1062,7 @@ def _handle_tvchart_auto_scale(ctx: HandlerContext) -> HandlerResult:
         ctx,
         "tvchart:auto-scale",
         {"value": bool(ctx.args.get("value"))},
+        confirm=True,
     )
 
 
@@ -1139,6 +1074,7 @@ def _handle_tvchart_chart_type(ctx: HandlerContext) -> HandlerResult:
             "value": ctx.args.get("value"),
             "seriesId": ctx.args.get("series_id"),
         },
+        confirm=True,
     )
 
 
@@ -1159,11 +1095,11 @@ def _handle_tvchart_drawing_tool(ctx: HandlerContext) -> HandlerResult:
 
 
 def _handle_tvchart_undo(ctx: HandlerContext) -> HandlerResult:
-    return _emit_tvchart(ctx, "tvchart:undo", {})
+    return _emit_tvchart(ctx, "tvchart:undo", {}, confirm=True)
 
 
 def _handle_tvchart_redo(ctx: HandlerContext) -> HandlerResult:
-    return _emit_tvchart(ctx, "tvchart:redo", {})
+    return _emit_tvchart(ctx, "tvchart:redo", {}, confirm=True)
 
 
 def _handle_tvchart_show_settings(ctx: HandlerContext) -> HandlerResult:
@@ -1175,6 +1111,7 @@ def _handle_tvchart_toggle_dark_mode(ctx: HandlerContext) -> HandlerResult:
         ctx,
         "tvchart:toggle-dark-mode",
         {"value": bool(ctx.args.get("value"))},
+        confirm=True,
     )
 
 
@@ -1445,20 +1382,52 @@ def _handle_list_widgets(ctx: HandlerContext) -> HandlerResult:
     if ctx.headless:
         from ..inline import _state as inline_state
 
-        widgets = [{"widget_id": wid, "path": f"/widget/{wid}"} for wid in inline_state.widgets]
+        widget_ids = list(inline_state.widgets)
     else:
-        widgets = [{"widget_id": wid, "path": f"/widget/{wid}"} for wid in list_widget_ids()]
+        widget_ids = list_widget_ids()
+    widgets = []
+    for wid in widget_ids:
+        entry: dict[str, Any] = {"widget_id": wid, "path": f"/widget/{wid}"}
+        buffer = ctx.events.get(wid)
+        if buffer is not None:
+            entry["events"] = buffer.stats()
+        widgets.append(entry)
     return {"widgets": widgets, "count": len(widgets)}
 
 
-def _handle_get_events(ctx: HandlerContext) -> HandlerResult:
+# Upper bound for a single ``wait_for_events`` long-poll, in seconds.
+_MAX_EVENT_WAIT = 60.0
+
+
+def _read_events(ctx: HandlerContext, wait: float) -> HandlerResult:
+    """Shared body of ``get_events`` and ``wait_for_events``."""
     resolved_id, error = _resolve_widget_id(ctx.args.get("widget_id"))
     if error is not None or resolved_id is None:
         return error or {"error": "widget_id could not be resolved."}
-    widget_events = ctx.events.get(resolved_id, [])
+    buffer = get_event_buffer(ctx.events, resolved_id)
+    if "event_types" in ctx.args:
+        buffer.set_event_types(ctx.args["event_types"])
+    since = int(ctx.args.get("since") or 0)
+    widget_events = buffer.wait(since, wait) if wait > 0 else buffer.read(since)
+    cursor = widget_events[-1]["seq"] if widget_events else max(since, buffer.last_seq)
     if ctx.args.get("clear", False):
-        ctx.events[resolved_id] = []
-    return {"widget_id": resolved_id, "events": widget_events}
+        buffer.clear(cursor)
+    return {
+        "widget_id": resolved_id,
+        "events": widget_events,
+        "cursor": cursor,
+        "missed": buffer.missed(since) if since else 0,
+        "dropped": buffer.dropped,
+    }
+
+
+def _handle_get_events(ctx: HandlerContext) -> HandlerResult:
+    return _read_events(ctx, 0.0)
+
+
+def _handle_wait_for_events(ctx: HandlerContext) -> HandlerResult:
+    timeout = float(ctx.args.get("timeout", 10.0))
+    return _read_events(ctx, min(max(timeout, 0.0), _MAX_EVENT_WAIT))
 
 
 def _handle_destroy_widget(ctx: HandlerContext) -> HandlerResult:
@@ -1604,7 +1573,7 @@ def _handle_create_chat_widget(ctx: HandlerContext) -> HandlerResult:
 
     widget_id = getattr(widget, "widget_id", None) or uuid.uuid4().hex
     callback = ctx.make_callback(widget_id)
-    ctx.events[widget_id] = []
+    ctx.events[widget_id] = EventBuffer()
 
     register_widget(widget_id, widget)
     _chat_configs[widget_id] = widget_config
@@ -2012,6 +1981,7 @@ _HANDLERS: dict[str, Callable[[HandlerContext], HandlerResult]] = {
     # Widget Management
     "list_widgets": _handle_list_widgets,
     "get_events": _handle_get_events,
+    "wait_for_events": _handle_wait_for_events,
     "destroy_widget": _handle_destroy_widget,
     # Resources / Export
     "get_component_docs": _handle_get_component_docs,
@@ -2030,6 +2000,35 @@ _HANDLERS: dict[str, Callable[[HandlerContext], HandlerResult]] = {
     "chat_set_typing": _handle_chat_set_typing,
 }
 
+# Handlers that may block waiting on the widget (long-polls and tvchart
+# mutations that wait for the frontend's ack); run off the event loop.
+_BLOCKING_HANDLERS = frozenset(
+    {
+        "wait_for_events",
+        "tvchart_update_series",
+        "tvchart_update_bar",
+        "tvchart_add_series",
+        "tvchart_remove_series",
+        "tvchart_add_markers",
+        "tvchart_add_price_line",
+        "tvchart_apply_options",
+        "tvchart_add_indicator",
+        "tvchart_remove_indicator",
+        "tvchart_symbol_search",
+        "tvchart_compare",
+        "tvchart_change_interval",
+        "tvchart_set_visible_range",
+        "tvchart_fit_content",
+        "tvchart_time_range",
+        "tvchart_log_scale",
+        "tvchart_auto_scale",
+        "tvchart_chart_type",
+        "tvchart_undo",
+        "tvchart_redo",
+        "tvchart_toggle_dark_mode",
+    }
+)
+
 
 # =============================================================================
 # Main Entry Point
@@ -2097,7 +2096,9 @@ async def handle_tool(
         return {"error": error_msg}
 
     handler = _HANDLERS.get(name)
-    if handler:
-        return handler(ctx)
-
-    return {"error": f"Unknown tool: {name}"}
+    if handler is None:
+        return {"error": f"Unknown tool: {name}"}
+    if name in _BLOCKING_HANDLERS:
+        # Long-polls and ack waits park a worker thread, not the server's event loop.
+        return await asyncio.to_thread(handler, ctx)
+    return handler(ctx)
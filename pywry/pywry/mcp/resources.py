@@ -511,6 +511,7 @@ html = status_div.build_html()
 
 ### Event Handling
 - `get_events`: Get pending events
+- `wait_for_events`: Long-poll for events newer than a cursor
 - `send_event`: Send custom event
 
 ### Widget Management
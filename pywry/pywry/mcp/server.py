@@ -24,6 +24,8 @@ import os
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from .state import EventBuffer, get_event_buffer, set_event_buffer_size
+
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
@@ -41,7 +43,7 @@ except ImportError:
     HAS_MCP = False
 
 # Type aliases
-EventsDict = dict[str, list[dict[str, Any]]]
+EventsDict = dict[str, EventBuffer]
 EventCallback = Callable[[Any, str, str], None]
 EventCallbackFactory = Callable[[str], EventCallback]
 
@@ -65,14 +67,13 @@ def _make_event_callback(widget_id: str) -> EventCallback:
     """
 
     def callback(data: Any, event_type: str, label: str = "") -> None:
-        if widget_id not in _events:
-            _events[widget_id] = []
-        _events[widget_id].append(
+        get_event_buffer(_events, widget_id).append(
+            event_type,
             {
                 "event_type": event_type,
                 "data": data,
                 "label": label,
-            }
+            },
         )
 
     return callback
@@ -359,6 +360,8 @@ def create_server(settings: MCPSettings | None = None) -> FastMCP:
         except ImportError:
             version = "0.1.0"
 
+    set_event_buffer_size(settings.event_buffer_size)
+
     # Build FastMCP kwargs - only server identity settings go here
     # Transport/runtime settings go to run() to avoid deprecation warnings
     fastmcp_kwargs: dict[str, Any] = {
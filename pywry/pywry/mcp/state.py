@@ -8,12 +8,16 @@ from __future__ import annotations
 
 import contextlib
 import threading
+import time
 import uuid
 
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pywry import PyWry
 
 # Global PyWry app instance for MCP server (mutable singleton, not a constant)
@@ -31,6 +35,15 @@ _pending_responses: dict[str, dict[str, Any]] = {}
 _pending_events: dict[str, threading.Event] = {}
 _pending_lock = threading.Lock()
 
+# Mutation acknowledgements, keyed by ack id.  One dispatcher listener is
+# registered per (widget, ack event) and routes acks to their waiters.
+_ack_waiters: dict[str, dict[str, Any]] = {}
+_ack_listeners: dict[tuple[int, str], Any] = {}
+
+# Capacity of newly created per-widget event buffers
+# (``MCPSettings.event_buffer_size``, applied by ``create_server``).
+_event_buffer_size = 1000
+
 
 def get_app() -> PyWry:
     """Get or create the global PyWry app instance.
@@ -150,12 +163,242 @@ def remove_widget(widget_id: str) -> bool:
         True if widget was removed, False if not found.
     """
     if widget_id in _widgets:
-        del _widgets[widget_id]
+        widget = _widgets.pop(widget_id)
         _widget_configs.pop(widget_id, None)
+        with _pending_lock:
+            for key in [k for k in _ack_listeners if k[0] == id(widget)]:
+                del _ack_listeners[key]
         return True
     return False
 
 
+# =============================================================================
+# Captured widget events
+# =============================================================================
+
+
+def set_event_buffer_size(size: int) -> None:
+    """Set the capacity of event buffers created from now on.
+
+    Parameters
+    ----------
+    size : int
+        Maximum events kept per widget before the oldest are dropped.
+    """
+    global _event_buffer_size  # noqa: PLW0603
+    _event_buffer_size = max(1, size)
+
+
+class EventBuffer:
+    """Bounded ring buffer of events captured from one widget.
+
+    Every stored event is tagged with a monotonically increasing ``seq``
+    so readers can resume from a cursor instead of re-reading (or
+    clearing) the whole buffer.  When the buffer is full the oldest
+    event is dropped and counted in ``dropped``.  An optional
+    ``event_types`` filter is applied at capture time, so unwanted
+    high-frequency events never occupy a slot.
+
+    Parameters
+    ----------
+    maxlen : int or None
+        Capacity.  Defaults to the configured ``event_buffer_size``.
+    event_types : Iterable[str] or None
+        Only capture these event types.  ``None`` captures everything.
+    """
+
+    def __init__(
+        self,
+        maxlen: int | None = None,
+        event_types: Iterable[str] | None = None,
+    ) -> None:
+        self._events: deque[dict[str, Any]] = deque(maxlen=maxlen or _event_buffer_size)
+        self._cond = threading.Condition()
+        self._last_seq = 0
+        self._event_types: frozenset[str] | None = frozenset(event_types) if event_types else None
+        self.dropped = 0
+        self.filtered = 0
+
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of buffered events."""
+        return self._events.maxlen or 0
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest captured event (0 if none)."""
+        return self._last_seq
+
+    @property
+    def event_types(self) -> frozenset[str] | None:
+        """Event types captured, or ``None`` for all."""
+        return self._event_types
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def set_event_types(self, event_types: Iterable[str] | None) -> None:
+        """Restrict capture to ``event_types`` and drop buffered events of other types.
+
+        Parameters
+        ----------
+        event_types : Iterable[str] or None
+            Event types to keep.  ``None`` or empty captures everything.
+        """
+        with self._cond:
+            self._event_types = frozenset(event_types) if event_types else None
+            if self._event_types is not None:
+                kept = [e for e in self._events if _event_type_of(e) in self._event_types]
+                self._events.clear()
+                self._events.extend(kept)
+
+    def append(self, event_type: str, entry: dict[str, Any]) -> int | None:
+        """Capture an event.
+
+        Parameters
+        ----------
+        event_type : str
+            Event name, checked against the capture filter.
+        entry : dict[str, Any]
+            Event record.  ``seq`` and ``ts`` are added to a copy.
+
+        Returns
+        -------
+        int or None
+            Sequence number assigned, or ``None`` if the event was filtered out.
+        """
+        with self._cond:
+            if self._event_types is not None and event_type not in self._event_types:
+                self.filtered += 1
+                return None
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._last_seq += 1
+            self._events.append({**entry, "seq": self._last_seq, "ts": time.time()})
+            self._cond.notify_all()
+            return self._last_seq
+
+    def read(self, since: int = 0) -> list[dict[str, Any]]:
+        """Return buffered events with ``seq`` greater than ``since``.
+
+        Parameters
+        ----------
+        since : int
+            Cursor returned by a previous read (0 for everything buffered).
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Events in capture order.
+        """
+        with self._cond:
+            if since <= 0:
+                return list(self._events)
+            return [e for e in self._events if e["seq"] > since]
+
+    def wait(self, since: int = 0, timeout: float = 0.0) -> list[dict[str, Any]]:
+        """Block until an event newer than ``since`` is buffered, then read.
+
+        Parameters
+        ----------
+        since : int
+            Cursor returned by a previous read, or 0 to wait for events
+            captured after this call.
+        timeout : float
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Events newer than ``since``; empty if the timeout expired.
+        """
+        with self._cond:
+            if since <= 0:
+                since = self._last_seq
+            if timeout > 0:
+                # Wait on the buffer, not _last_seq: cleared events must not end the wait
+                self._cond.wait_for(
+                    lambda: bool(self._events) and self._events[-1]["seq"] > since, timeout
+                )
+            return self.read(since)
+
+    def missed(self, since: int) -> int:
+        """Number of events after ``since`` that were dropped before being read.
+
+        Parameters
+        ----------
+        since : int
+            Cursor returned by a previous read.
+
+        Returns
+        -------
+        int
+            Count of events evicted from the buffer since the cursor.
+        """
+        with self._cond:
+            oldest = self._events[0]["seq"] if self._events else self._last_seq + 1
+            return max(0, oldest - since - 1)
+
+    def clear(self, up_to: int | None = None) -> None:
+        """Discard buffered events.
+
+        Parameters
+        ----------
+        up_to : int or None
+            Only discard events with ``seq <= up_to``.  ``None`` discards all.
+        """
+        with self._cond:
+            if up_to is None:
+                self._events.clear()
+                return
+            while self._events and self._events[0]["seq"] <= up_to:
+                self._events.popleft()
+
+    def stats(self) -> dict[str, Any]:
+        """Buffer occupancy and drop counters.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``buffered``, ``capacity``, ``last_seq``, ``dropped``,
+            ``filtered`` and ``event_types``.
+        """
+        with self._cond:
+            return {
+                "buffered": len(self._events),
+                "capacity": self.maxlen,
+                "last_seq": self._last_seq,
+                "dropped": self.dropped,
+                "filtered": self.filtered,
+                "event_types": sorted(self._event_types) if self._event_types else None,
+            }
+
+
+def _event_type_of(entry: dict[str, Any]) -> str:
+    return entry.get("event_type") or entry.get("event") or ""
+
+
+def get_event_buffer(events: dict[str, EventBuffer], widget_id: str) -> EventBuffer:
+    """Return the event buffer for ``widget_id``, creating it if needed.
+
+    Parameters
+    ----------
+    events : dict[str, EventBuffer]
+        The MCP-server-wide events dict (mutated in place).
+    widget_id : str
+        Widget identifier.
+
+    Returns
+    -------
+    EventBuffer
+        The widget's buffer.
+    """
+    buffer = events.get(widget_id)
+    if buffer is None:
+        buffer = events.setdefault(widget_id, EventBuffer())
+    return buffer
+
+
 # =============================================================================
 # Request/response correlation
 # =============================================================================
@@ -240,10 +483,90 @@ def request_response(
     return response if received else None
 
 
+# =============================================================================
+# Mutation acknowledgements
+# =============================================================================
+
+
+def _dispatch_ack(data: Any, _event_type: str = "", _label: str = "") -> None:
+    if not isinstance(data, dict):
+        return
+    ack_id = data.get("ackId")
+    with _pending_lock:
+        waiter = _ack_waiters.get(ack_id) if isinstance(ack_id, str) else None
+        if waiter is None:
+            return
+        waiter["ack"] = data
+    waiter["event"].set()
+
+
+def expect_ack(widget: Any, ack_event: str) -> str:
+    """Register a waiter for one mutation acknowledgement.
+
+    Must be called *before* the mutation is emitted so a fast frontend
+    reply cannot be missed.  The first call per widget registers a single
+    dispatcher listener for ``ack_event``; later calls reuse it, so
+    concurrent mutations never replace each other's listeners.
+
+    Parameters
+    ----------
+    widget : Any
+        Widget that will emit ``ack_event``.
+    ack_event : str
+        JS→Python acknowledgement event name (e.g. ``"tvchart:ack"``).
+
+    Returns
+    -------
+    str
+        Ack id to send with the mutation payload as ``ackId``.
+    """
+    ack_id = uuid.uuid4().hex
+    key = (id(widget), ack_event)
+    with _pending_lock:
+        _ack_waiters[ack_id] = {"event": threading.Event(), "ack": None}
+        registered = key in _ack_listeners
+        if not registered:
+            _ack_listeners[key] = widget
+    if not registered:
+        try:
+            widget.on(ack_event, _dispatch_ack)
+        except Exception:
+            with _pending_lock:
+                _ack_listeners.pop(key, None)
+                _ack_waiters.pop(ack_id, None)
+            raise
+    return ack_id
+
+
+def wait_for_ack(ack_id: str, timeout: float) -> dict[str, Any] | None:
+    """Block until the acknowledgement for ``ack_id`` arrives.
+
+    Parameters
+    ----------
+    ack_id : str
+        Id returned by ``expect_ack``.
+    timeout : float
+        Maximum seconds to wait.
+
+    Returns
+    -------
+    dict or None
+        The acknowledgement payload, or ``None`` on timeout.
+    """
+    with _pending_lock:
+        waiter = _ack_waiters.get(ack_id)
+    if waiter is None:
+        return None
+    waiter["event"].wait(timeout)
+    with _pending_lock:
+        _ack_waiters.pop(ack_id, None)
+    return waiter["ack"]
+
+
 def capture_widget_events(
     widget: Any,
     widget_id: str,
-    events: dict[str, list[dict[str, Any]]],
+    events: dict[str, EventBuffer],
     event_names: list[str],
 ) -> None:
     """Register handlers that store incoming events in the MCP ``events`` dict.
@@ -264,11 +587,14 @@ def capture_widget_events(
         Event names to capture.  Each incoming event becomes an entry
         in ``events[widget_id]`` tagged with ``event`` and ``data``.
     """
+    get_event_buffer(events, widget_id)
     for name in event_names:
 
         def _make_handler(ev_name: str) -> Any:
             def _handler(data: Any, _event_type: str = "", _label: str = "") -> None:
-                events.setdefault(widget_id, []).append({"event": ev_name, "data": data})
+                get_event_buffer(events, widget_id).append(
+                    ev_name, {"event": ev_name, "data": data}
+                )
 
             return _handler
 
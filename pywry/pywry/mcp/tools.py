@@ -1310,18 +1310,46 @@ Updates ALL elements matching the ticker (handles duplicated marquee content).""
         # =====================================================================
         Tool(
             name="list_widgets",
-            description="List all active widgets with their URLs.",
+            description="""List all active widgets with their URLs.
+
+Each widget also reports its event buffer: buffered, capacity, last_seq,
+dropped (evicted before being read) and filtered (rejected by event_types).""",
             inputSchema={"type": "object", "properties": {}},
         ),
         Tool(
             name="get_events",
             description="""Get events from a widget (button clicks, input changes, etc.).
 
-Events include: event_type, data, and label. Use clear=true to clear after reading.""",
+Events include: event_type, data, label, and a sequence number `seq`.
+Pass the returned `cursor` as `since` on the next call to read only newer
+events. Use clear=true to discard the returned events from the buffer.
+`event_types` restricts which events are captured from now on (empty list
+captures everything). Prefer wait_for_events over polling this tool.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "widget_id": {"type": "string"},
+                    "since": {"type": "integer", "default": 0},
+                    "event_types": {"type": "array", "items": {"type": "string"}},
+                    "clear": {"type": "boolean", "default": False},
+                },
+                "required": ["widget_id"],
+            },
+        ),
+        Tool(
+            name="wait_for_events",
+            description="""Wait until a widget captures an event newer than `since`, then return it.
+
+Returns as soon as an event arrives, or an empty list after `timeout`
+seconds (max 60). With `since` 0 only events captured after the call are
+returned. Same arguments and result shape as get_events.""",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "widget_id": {"type": "string"},
+                    "since": {"type": "integer", "default": 0},
+                    "timeout": {"type": "number", "default": 10},
+                    "event_types": {"type": "array", "items": {"type": "string"}},
                     "clear": {"type": "boolean", "default": False},
                 },
                 "required": ["widget_id"],
@@ -1346,6 +1374,7 @@ Events include: event_type, data, and label. Use clear=true to clear after readi
 - grid:update-data: {"data": [...rows...], "strategy": "update"} - Update existing
 - grid:update-columns: {"columnDefs": [...]} - Update columns
 - grid:update-cell: {"rowId": "row-1", "colId": "price", "value": 99.50} - Update cell
+- grid:apply-transaction: {"add": [...], "update": [...], "remove": [...row ids]} - In-place row changes (grid needs rowIdField)
 
 **AG Grid State Persistence:**
 - grid:request-state: {} - Request state (response via grid:state-response)
@@ -38,10 +38,9 @@ import uuid
 from collections.abc import Sequence
 from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import (
-    BaseModel,
     ConfigDict,
     Field,
     field_validator,
@@ -52,6 +51,10 @@ from .toolbar import (
     SecretInput,
     ToolbarItem,
     ToolbarItemUnion,
+    _cached_html,
+    _read_script_file,
+    _render_item,
+    _RenderCachedModel,
 )
 
 
@@ -122,7 +125,7 @@ def _get_item_type_map() -> dict[str, type[ToolbarItem]]:
     return _ITEM_TYPE_MAP
 
 
-class Modal(BaseModel):
+class Modal(_RenderCachedModel):
     """A modal overlay container with input components.
 
     Attributes
@@ -189,6 +192,7 @@ class Modal(BaseModel):
     # Content
     title: str = "Modal"
     items: Sequence[ToolbarItemUnion] = Field(default_factory=list)
+    _render_children: ClassVar[frozenset[str]] = frozenset({"items"})
 
     # Custom assets (matching Toolbar pattern)
     style: str = Field(
@@ -269,15 +273,18 @@ class Modal(BaseModel):
         -------
         str
             The modal HTML structure with overlay, container, header, and body.
+            Cached by content, like ``Toolbar.build_html``.
         """
+        return _cached_html(self, self._build_html)
+
+    def _build_html(self) -> str:
+        """Render the modal, taking unchanged items from the render cache."""
         # Size presets map to CSS widths
         # Build item HTMLs
-        item_htmls = []
-        for item in self.items:
-            if isinstance(item, Div):
-                item_htmls.append(item.build_html(parent_id=self.component_id))
-            else:
-                item_htmls.append(item.build_html())
+        item_htmls = [
+            _render_item(item, self.component_id if isinstance(item, Div) else None)
+            for item in self.items
+        ]
 
         # Build container classes
         classes = ["pywry-modal-container", f"pywry-modal-{self.size}"]
@@ -336,8 +343,9 @@ class Modal(BaseModel):
         # Modal script first (parent context available to children)
         if self.script:
             if isinstance(self.script, Path):
-                if self.script.exists():
-                    scripts.append(self.script.read_text(encoding="utf-8"))
+                content = _read_script_file(self.script)
+                if content is not None:
+                    scripts.append(content)
             elif isinstance(self.script, str):
                 # Check if it looks like a file path or inline script
                 if not self.script.strip().startswith(
@@ -356,12 +364,9 @@ class Modal(BaseModel):
                     )
                 ):
                     # Treat as file path
-                    script_path = Path(self.script)
-                    if script_path.exists():
-                        scripts.append(script_path.read_text(encoding="utf-8"))
-                    else:
-                        # Not a valid path, treat as inline script
-                        scripts.append(self.script)
+                    content = _read_script_file(Path(self.script))
+                    # Not a valid path, treat as inline script
+                    scripts.append(self.script if content is None else content)
                 else:
                     scripts.append(self.script)
 
@@ -5,6 +5,7 @@ Spawns pytauri as a subprocess and communicates via JSON IPC over stdin/stdout.
 
 from __future__ import annotations
 
+import asyncio
 import atexit
 import contextlib
 import json
@@ -12,6 +13,7 @@ import os
 import subprocess
 import sys
 import threading
+import time
 import uuid
 
 from contextlib import ExitStack
@@ -70,6 +72,34 @@ _pending_requests: dict[str, threading.Event] = {}
 _pending_responses: dict[str, dict[str, Any]] = {}
 _pending_lock = threading.Lock()
 
+# Awaitable calls (``asend_command_with_response`` and the ``a*`` helpers):
+# request_id -> (loop, future), resolved from the stdout reader thread.
+# Requests whose caller timed out or was cancelled are remembered in
+# ``_abandoned_requests`` so their late responses are dropped instead of
+# landing in the uncorrelated ``_responses`` queue.
+_async_pending: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Future[Any]]] = {}
+_abandoned_requests: dict[str, None] = {}
+_MAX_ABANDONED_REQUESTS = 1024
+
+# Warm standby: a spare subprocess launched ahead of time that has already
+# reported ready, promoted by ``start()`` instead of a cold start.
+_warm_standby = False
+_spare: _Spare | None = None
+_spare_lock = threading.Lock()
+_atexit_registered = False
+
+# Startup timings of the active subprocess (see ``get_startup_timings``)
+_startup_timings: dict[str, Any] = {}
+_start_called_at: float | None = None
+
+# Push-cached window state (see ``watch_window_state``): label -> property
+# -> value, kept current by ``window_state`` messages from the subprocess.
+# Labels in ``_stale_window_state`` re-sync on the next read because a
+# ``window_call`` may have changed them before the push arrived.
+_window_state: dict[str, dict[str, Any]] = {}
+_stale_window_state: set[str] = set()
+_window_state_lock = threading.Lock()
+
 
 def _get_registry() -> Any:
     """Get the registry, caching the reference."""
@@ -231,41 +261,73 @@ def wait_ready(timeout: float = 10.0) -> bool:
 
 def _stdout_reader() -> None:
     """Read responses from subprocess stdout."""
-    global _running
     try:
         while _running and _process and _process.stdout:
             line = _process.stdout.readline()
             if not line:
                 break
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                msg = json.loads(line)
-                if msg.get("type") == "ready":
-                    _ready_event.set()
-                elif msg.get("type") == "event":
-                    _dispatch_event(msg)
-                elif msg.get("type") == "custom_command":
-                    _handle_custom_command(msg)
-                else:
-                    # Check for request_id correlation
-                    request_id = msg.get("request_id")
-                    if request_id and request_id in _pending_requests:
-                        with _pending_lock:
-                            _pending_responses[request_id] = msg
-                            event = _pending_requests.get(request_id)
-                            if event:
-                                event.set()
-                    else:
-                        # Uncorrelated response goes to general queue
-                        _responses.put(msg)
-            except json.JSONDecodeError:
-                pass
+            _handle_stdout_line(line)
     except Exception:
         pass
 
 
+def _handle_stdout_line(line: str) -> None:
+    """Route one line of subprocess output to its handler."""
+    line = line.strip()
+    if not line:
+        return
+    try:
+        msg = json.loads(line)
+    except json.JSONDecodeError:
+        return
+    if msg.get("type") == "ready":
+        _ready_event.set()
+    elif msg.get("type") == "event":
+        _dispatch_event(msg)
+    elif msg.get("type") == "custom_command":
+        _handle_custom_command(msg)
+    elif msg.get("type") == "window_state":
+        _apply_window_state(msg)
+    else:
+        _deliver_response(msg)
+
+
+def _deliver_response(msg: dict[str, Any]) -> None:
+    """Hand a response to the caller waiting on its request_id, or queue it."""
+    request_id = msg.get("request_id")
+    if request_id:
+        with _pending_lock:
+            event = _pending_requests.get(request_id)
+            if event is not None:
+                _pending_responses[request_id] = msg
+                event.set()
+                return
+            waiter = _async_pending.pop(request_id, None)
+            if waiter is None and request_id in _abandoned_requests:
+                del _abandoned_requests[request_id]
+                return  # Caller stopped waiting
+        if waiter is not None:
+            _resolve_waiter(waiter, msg)
+            return
+    # Uncorrelated response goes to general queue
+    _responses.put(msg)
+
+
+def _resolve_waiter(
+    waiter: tuple[asyncio.AbstractEventLoop, asyncio.Future[Any]],
+    msg: dict[str, Any] | None,
+) -> None:
+    """Resolve an awaitable call's future on its own event loop."""
+    loop, future = waiter
+
+    def _set() -> None:
+        if not future.done():
+            future.set_result(msg)
+
+    with contextlib.suppress(RuntimeError):  # Loop already closed
+        loop.call_soon_threadsafe(_set)
+
+
 def _dispatch_event(msg: dict[str, Any]) -> None:
     """Dispatch an event from the subprocess to Python callbacks."""
     label = msg.get("label", "main")
@@ -280,6 +342,11 @@ def _dispatch_event(msg: dict[str, Any]) -> None:
     if event_type == "content:ready":
         event_type = "pywry:ready"
 
+    if event_type == "window:closed":
+        with _window_state_lock:
+            _window_state.pop(label, None)
+            _stale_window_state.discard(label)
+
     # Handle content request from JS (page load/reload/refresh)
     # First try user-registered handlers, then fall back to stored content
     if event_type in ("pywry:content-request", "pywry:refresh-request"):
@@ -486,6 +553,50 @@ def send_command_with_response(cmd: dict[str, Any], timeout: float = 5.0) -> dic
             _pending_responses.pop(request_id, None)
 
 
+async def asend_command_with_response(
+    cmd: dict[str, Any],
+    timeout: float = 5.0,  # noqa: ASYNC109
+) -> dict[str, Any] | None:
+    """Send a command and await its correlated response.
+
+    The awaitable counterpart of :func:`send_command_with_response`.  No
+    thread is parked per request: the response resolves an asyncio future
+    from the stdout reader, so any number of commands can be in flight
+    (pipelined) on one event loop.  Cancelling the awaiting task abandons
+    the request and its late response is discarded.
+
+    Parameters
+    ----------
+    cmd : dict[str, Any]
+        Command to send. A request_id will be added automatically.
+    timeout : float
+        Maximum time to wait for response.
+
+    Returns
+    -------
+    dict[str, Any] or None
+        The response, or None on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[Any] = loop.create_future()
+    request_id = str(uuid.uuid4())
+    cmd["request_id"] = request_id
+    with _pending_lock:
+        _async_pending[request_id] = (loop, future)
+
+    try:
+        send_command(cmd)
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        with _pending_lock:
+            if _async_pending.pop(request_id, None) is not None:
+                _abandoned_requests[request_id] = None
+                if len(_abandoned_requests) > _MAX_ABANDONED_REQUESTS:
+                    del _abandoned_requests[next(iter(_abandoned_requests))]
+
+
 def window_get(
     label: str,
     property_name: str,
@@ -517,17 +628,80 @@ def window_get(
     IPCTimeoutError
         If the request times out.
     """
-    from .exceptions import IPCTimeoutError, PropertyError
+    if args is None:
+        cached = _cached_window_property(label, property_name, timeout)
+        if cached is not _NOT_CACHED:
+            return cached
 
     response = send_command_with_response(
-        {
-            "action": "window_get",
-            "label": label,
-            "property": property_name,
-            **({"args": args} if args else {}),
-        },
-        timeout=timeout,
+        _window_get_command(label, property_name, args), timeout=timeout
     )
+    return _window_get_value(response, label, property_name, timeout)
+
+
+async def awindow_get(
+    label: str,
+    property_name: str,
+    args: dict[str, Any] | None = None,
+    timeout: float = 5.0,  # noqa: ASYNC109
+) -> Any:
+    """Awaitable :func:`window_get`.
+
+    Parameters
+    ----------
+    label : str
+        Window label.
+    property_name : str
+        Name of the property to get.
+    args : dict or None
+        Optional arguments for parameterised getters.
+    timeout : float
+        Maximum time to wait for response.
+
+    Returns
+    -------
+    Any
+        The property value.
+
+    Raises
+    ------
+    PropertyError
+        If the property cannot be retrieved.
+    IPCTimeoutError
+        If the request times out.
+    """
+    if args is None:
+        cached, stale = _peek_window_state(label, property_name)
+        if stale:
+            values = await awindow_get_many(label, stale, timeout=timeout)
+            _store_window_state(label, values)
+            return values[property_name]
+        if cached is not _NOT_CACHED:
+            return cached
+
+    response = await asend_command_with_response(
+        _window_get_command(label, property_name, args), timeout=timeout
+    )
+    return _window_get_value(response, label, property_name, timeout)
+
+
+def _window_get_command(
+    label: str, property_name: str, args: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Build a ``window_get`` command."""
+    return {
+        "action": "window_get",
+        "label": label,
+        "property": property_name,
+        **({"args": args} if args else {}),
+    }
+
+
+def _window_get_value(
+    response: dict[str, Any] | None, label: str, property_name: str, timeout: float
+) -> Any:
+    """Return the value from a ``window_get`` response or raise."""
+    from .exceptions import IPCTimeoutError, PropertyError
 
     if response is None:
         raise IPCTimeoutError(
@@ -547,6 +721,222 @@ def window_get(
     return response.get("value")
 
 
+def window_get_many(
+    label: str,
+    properties: list[str] | tuple[str, ...],
+    timeout: float = 5.0,
+) -> dict[str, Any]:
+    """Get several window properties in a single IPC round trip.
+
+    Parameters
+    ----------
+    label : str
+        Window label.
+    properties : list[str] or tuple[str, ...]
+        Names of the properties to get.
+    timeout : float
+        Maximum time to wait for response.
+
+    Returns
+    -------
+    dict[str, Any]
+        Property name -> value, in the requested order.
+
+    Raises
+    ------
+    PropertyError
+        If the window is missing or any property cannot be retrieved.
+    IPCTimeoutError
+        If the request times out.
+    """
+    response = send_command_with_response(
+        {"action": "window_get_many", "label": label, "properties": list(properties)},
+        timeout=timeout,
+    )
+    return _window_get_many_values(response, label, properties, timeout)
+
+
+async def awindow_get_many(
+    label: str,
+    properties: list[str] | tuple[str, ...],
+    timeout: float = 5.0,  # noqa: ASYNC109
+) -> dict[str, Any]:
+    """Awaitable :func:`window_get_many`.
+
+    Parameters
+    ----------
+    label : str
+        Window label.
+    properties : list[str] or tuple[str, ...]
+        Names of the properties to get.
+    timeout : float
+        Maximum time to wait for response.
+
+    Returns
+    -------
+    dict[str, Any]
+        Property name -> value, in the requested order.
+
+    Raises
+    ------
+    PropertyError
+        If the window is missing or any property cannot be retrieved.
+    IPCTimeoutError
+        If the request times out.
+    """
+    response = await asend_command_with_response(
+        {"action": "window_get_many", "label": label, "properties": list(properties)},
+        timeout=timeout,
+    )
+    return _window_get_many_values(response, label, properties, timeout)
+
+
+def _window_get_many_values(
+    response: dict[str, Any] | None,
+    label: str,
+    properties: list[str] | tuple[str, ...],
+    timeout: float,
+) -> dict[str, Any]:
+    """Return the values from a ``window_get_many`` response or raise."""
+    from .exceptions import IPCTimeoutError, PropertyError
+
+    if response is None:
+        raise IPCTimeoutError(
+            f"Timeout getting properties {list(properties)}",
+            timeout=timeout,
+            action="window_get_many",
+            label=label,
+        )
+
+    if not response.get("success", False):
+        raise PropertyError(
+            response.get("error", "Failed to get window properties"),
+            property_name=", ".join(properties),
+            label=label,
+        )
+
+    errors: dict[str, str] = response.get("errors") or {}
+    if errors:
+        prop, error = next(iter(errors.items()))
+        raise PropertyError(error, property_name=prop, label=label)
+
+    values: dict[str, Any] = response.get("values") or {}
+    return {prop: values.get(prop) for prop in properties}
+
+
+class _NotCached:
+    """Sentinel for a property that is not in the push cache."""
+
+
+_NOT_CACHED = _NotCached()
+
+
+def _peek_window_state(label: str, property_name: str) -> tuple[Any, list[str] | None]:
+    """Look a property up in the push cache.
+
+    Returns ``(value, None)`` for a fresh hit, ``(_NOT_CACHED, props)``
+    when the label is stale and ``props`` must be re-synced first, and
+    ``(_NOT_CACHED, None)`` when the property is not cached.
+    """
+    with _window_state_lock:
+        state = _window_state.get(label)
+        if state is None or property_name not in state:
+            return _NOT_CACHED, None
+        if label in _stale_window_state:
+            return _NOT_CACHED, list(state)
+        return state[property_name], None
+
+
+def _store_window_state(label: str, values: dict[str, Any]) -> None:
+    """Write re-synced values back into the push cache."""
+    with _window_state_lock:
+        state = _window_state.get(label)
+        if state is not None:
+            state.update(values)
+            _stale_window_state.discard(label)
+
+
+def _cached_window_property(label: str, property_name: str, timeout: float) -> Any:
+    """Return a push-cached property value, or ``_NOT_CACHED``."""
+    cached, stale = _peek_window_state(label, property_name)
+    if stale:
+        values = window_get_many(label, stale, timeout=timeout)
+        _store_window_state(label, values)
+        return values[property_name]
+    return cached
+
+
+def _apply_window_state(msg: dict[str, Any]) -> None:
+    """Merge a ``window_state`` push from the subprocess into the cache."""
+    with _window_state_lock:
+        state = _window_state.get(msg.get("label", ""))
+        if state is not None:
+            state.update(msg.get("state") or {})
+
+
+def watch_window_state(label: str, timeout: float = 5.0) -> dict[str, Any]:
+    """Have the subprocess push a window's size, position, focus and theme.
+
+    Once watched, ``window_get`` answers those properties from a local
+    cache instead of an IPC round trip.  A ``window_call`` on the window
+    marks the cache stale, so the next read after a setter re-syncs every
+    cached property with one ``window_get_many``.
+
+    Parameters
+    ----------
+    label : str
+        Window label.
+    timeout : float
+        Maximum time to wait for the initial state.
+
+    Returns
+    -------
+    dict[str, Any]
+        The initial value of every cached property.
+
+    Raises
+    ------
+    WindowError
+        If the window does not exist.
+    IPCTimeoutError
+        If the request times out.
+    """
+    from .exceptions import IPCTimeoutError, WindowError
+
+    response = send_command_with_response(
+        {"action": "window_watch", "label": label, "enabled": True}, timeout=timeout
+    )
+    if response is None:
+        raise IPCTimeoutError(
+            "Timeout watching window state",
+            timeout=timeout,
+            action="window_watch",
+            label=label,
+        )
+    if not response.get("success", False):
+        raise WindowError(response.get("error", "Failed to watch window state"), label=label)
+
+    values: dict[str, Any] = dict(response.get("values") or {})
+    with _window_state_lock:
+        _window_state[label] = dict(values)
+        _stale_window_state.discard(label)
+    return values
+
+
+def unwatch_window_state(label: str) -> None:
+    """Stop pushing a window's state and drop its cached values.
+
+    Parameters
+    ----------
+    label : str
+        Window label.
+    """
+    with _window_state_lock:
+        _window_state.pop(label, None)
+        _stale_window_state.discard(label)
+    send_command({"action": "window_watch", "label": label, "enabled": False})
+
+
 def window_call(
     label: str,
     method: str,
@@ -581,37 +971,96 @@ def window_call(
     IPCTimeoutError
         If the request times out (when expect_response=True).
     """
-    from .exceptions import IPCTimeoutError, WindowError
+    cmd = _window_call_command(label, method, args)
 
-    cmd: dict[str, Any] = {
+    if expect_response:
+        response = send_command_with_response(cmd, timeout=timeout)
+        return _window_call_result(response, label, method, timeout)
+
+    # Fire-and-forget
+    send_command(cmd)
+    return None
+
+
+async def awindow_call(
+    label: str,
+    method: str,
+    args: dict[str, Any] | None = None,
+    expect_response: bool = False,
+    timeout: float = 5.0,  # noqa: ASYNC109
+) -> Any:
+    """Awaitable :func:`window_call`.
+
+    Parameters
+    ----------
+    label : str
+        Window label.
+    method : str
+        Name of the method to call.
+    args : dict[str, Any] or None
+        Method arguments.
+    expect_response : bool
+        Whether to wait for a response.
+    timeout : float
+        Maximum time to wait for response (if expect_response=True).
+
+    Returns
+    -------
+    Any
+        The method result (if expect_response=True), otherwise None.
+
+    Raises
+    ------
+    WindowError
+        If the method call fails.
+    IPCTimeoutError
+        If the request times out (when expect_response=True).
+    """
+    cmd = _window_call_command(label, method, args)
+
+    if expect_response:
+        response = await asend_command_with_response(cmd, timeout=timeout)
+        return _window_call_result(response, label, method, timeout)
+
+    send_command(cmd)
+    return None
+
+
+def _window_call_command(label: str, method: str, args: dict[str, Any] | None) -> dict[str, Any]:
+    """Build a ``window_call`` command, marking the label's cached state stale."""
+    with _window_state_lock:
+        if label in _window_state:
+            _stale_window_state.add(label)
+
+    return {
         "action": "window_call",
         "label": label,
         "method": method,
         "args": args or {},
     }
 
-    if expect_response:
-        response = send_command_with_response(cmd, timeout=timeout)
 
-        if response is None:
-            raise IPCTimeoutError(
-                f"Timeout calling method '{method}'",
-                timeout=timeout,
-                action="window_call",
-                label=label,
-            )
+def _window_call_result(
+    response: dict[str, Any] | None, label: str, method: str, timeout: float
+) -> Any:
+    """Return the result from a ``window_call`` response or raise."""
+    from .exceptions import IPCTimeoutError, WindowError
 
-        if not response.get("success", False):
-            raise WindowError(
-                response.get("error", f"Failed to call method '{method}'"),
-                label=label,
-            )
+    if response is None:
+        raise IPCTimeoutError(
+            f"Timeout calling method '{method}'",
+            timeout=timeout,
+            action="window_call",
+            label=label,
+        )
 
-        return response.get("result")
+    if not response.get("success", False):
+        raise WindowError(
+            response.get("error", f"Failed to call method '{method}'"),
+            label=label,
+        )
 
-    # Fire-and-forget
-    send_command(cmd)
-    return None
+    return response.get("result")
 
 
 def create_window(
@@ -651,7 +1100,10 @@ def create_window(
     send_command(cmd)
     # Wait for the window to be created
     response = get_response(timeout=5.0)
-    return response is not None and response.get("success", False)
+    created = response is not None and response.get("success", False)
+    if created:
+        _record_first_window()
+    return created
 
 
 def set_content(label: str, html: str, theme: str = "dark") -> bool:
@@ -775,6 +1227,42 @@ def inject_css(label: str, css: str, asset_id: str) -> bool:
     return response is not None and response.get("success", False)
 
 
+def broadcast_css(labels: list[str], css: str, asset_id: str) -> bool:
+    """Inject or update the same CSS in several windows with one command.
+
+    Parameters
+    ----------
+    labels : list[str]
+        Window labels to inject into.
+    css : str
+        CSS content to inject.
+    asset_id : str
+        ID for the style element (for updates).
+
+    Returns
+    -------
+    bool
+        True if command succeeded.
+    """
+    if not labels:
+        return False
+    send_command(
+        {
+            "action": "emit",
+            "label": labels[0],
+            "labels": list(labels),
+            "event": "pywry:inject-css",
+            "payload": {
+                "css": css,
+                "id": asset_id,
+            },
+        }
+    )
+    # Consume the response to prevent queue buildup
+    response = get_response(timeout=1.0)
+    return response is not None and response.get("success", False)
+
+
 def remove_css(label: str, asset_id: str) -> bool:
     """Remove a CSS style element from a window.
 
@@ -896,6 +1384,42 @@ def emit_event(label: str, event: str, payload: dict[str, Any] | None = None) ->
     return response is not None and response.get("success", False)
 
 
+async def aemit_event(
+    label: str,
+    event: str,
+    payload: dict[str, Any] | None = None,
+    timeout: float = 5.0,  # noqa: ASYNC109
+) -> bool:
+    """Awaitable :func:`emit_event`, correlated by request_id.
+
+    Parameters
+    ----------
+    label : str
+        Window label (or "*" for all windows).
+    event : str
+        Event name.
+    payload : dict[str, Any] or None, optional
+        Event payload data.
+    timeout : float
+        Maximum time to wait for the acknowledgement.
+
+    Returns
+    -------
+    bool
+        True if command succeeded.
+    """
+    response = await asend_command_with_response(
+        {
+            "action": "emit",
+            "label": label,
+            "event": event,
+            "payload": payload or {},
+        },
+        timeout=timeout,
+    )
+    return response is not None and response.get("success", False)
+
+
 def emit_event_fire(label: str, event: str, payload: dict[str, Any] | None = None) -> None:
     """Fire-and-forget event emit — does not block on a response.
 
@@ -950,21 +1474,108 @@ def eval_js(label: str, script: str) -> bool:
     return response is not None and response.get("success", False)
 
 
-def start() -> bool:
-    """Start the pytauri subprocess.
+async def aeval_js(label: str, script: str, timeout: float = 5.0) -> bool:  # noqa: ASYNC109
+    """Awaitable :func:`eval_js`, correlated by request_id.
+
+    Parameters
+    ----------
+    label : str
+        Window label.
+    script : str
+        JavaScript code to execute.
+    timeout : float
+        Maximum time to wait for the acknowledgement.
 
     Returns
     -------
     bool
-        True if started successfully.
+        True if command was sent and succeeded.
     """
-    global _process, _reader_thread, _writer_thread, _running
+    response = await asend_command_with_response(
+        {"action": "eval", "label": label, "script": script}, timeout=timeout
+    )
+    return response is not None and response.get("success", False)
+
+
+def release_frame(name: str) -> None:
+    """Tell the subprocess to unmap a shared-memory grid frame.
+
+    Fire-and-forget; the parent unlinks the segment itself.
 
+    Parameters
+    ----------
+    name : str
+        Segment name from ``SharedFrame.name``.
+    """
     if is_running():
-        return True
+        send_command({"action": "frame_release", "name": name})
 
-    _ready_event.clear()
-    _running = True
+
+class _Spare:
+    """A subprocess spawned ahead of time, waiting to be promoted by ``start()``.
+
+    A drain thread reads the spare's stdout for its whole life, so a chatty
+    spare never fills the pipe and blocks while it waits.  Output before
+    promotion has no listener and is dropped; once promoted, the same
+    thread becomes the runtime's stdout reader.
+    """
+
+    def __init__(self, process: subprocess.Popen[str], config: tuple[str, ...]) -> None:
+        self.process = process
+        self.config = config
+        self.spawned_at = time.perf_counter()
+        self.ready_at: float | None = None
+        self.ready = threading.Event()
+        # Set once the spare is ready or its stdout has closed
+        self.settled = threading.Event()
+        self.exited = False
+        self.promoted = False
+        threading.Thread(target=self._drain, daemon=True).start()
+
+    def _drain(self) -> None:
+        try:
+            while self.process.stdout:
+                line = self.process.stdout.readline()
+                if not line:
+                    break
+                if self.promoted:
+                    if not (_running and _process is self.process):
+                        return
+                    _handle_stdout_line(line)
+                elif not self.ready.is_set():
+                    with contextlib.suppress(json.JSONDecodeError):
+                        if json.loads(line).get("type") == "ready":
+                            self.ready_at = time.perf_counter()
+                            self.ready.set()
+                            self.settled.set()
+        except Exception:
+            pass
+        finally:
+            self.exited = True
+            self.settled.set()
+
+    def alive(self) -> bool:
+        return not self.exited and self.process.poll() is None
+
+    def usable(self) -> bool:
+        """Whether the spare reported ready and is still running."""
+        return self.ready.is_set() and self.alive()
+
+    def promote(self) -> None:
+        """Route further output to the runtime's handlers."""
+        self.promoted = True
+
+    def discard(self) -> None:
+        _terminate(self.process)
+
+
+def _subprocess_config() -> tuple[str, ...]:
+    """Settings baked into the subprocess environment at spawn time."""
+    return (_ON_WINDOW_CLOSE, _WINDOW_MODE, _TAURI_PLUGINS, _EXTRA_CAPABILITIES, _CUSTOM_COMMANDS)
+
+
+def _spawn_process() -> subprocess.Popen[str] | None:
+    """Launch the pytauri subprocess and start draining its stderr."""
     pywry_dir = get_pywry_dir()
 
     # In frozen executables (PyInstaller/Nuitka), sys.executable is the
@@ -999,7 +1610,7 @@ def start() -> bool:
         creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP
 
     try:
-        _process = subprocess.Popen(
+        process = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
@@ -1013,44 +1624,224 @@ def start() -> bool:
         )
     except Exception as e:
         log_error(f"Failed to start subprocess: {e}")
-        _running = False
-        return False
-
-    # Start reader thread
-    _reader_thread = threading.Thread(target=_stdout_reader, daemon=True)
-    _reader_thread.start()
-
-    # Start writer thread
-    _writer_thread = threading.Thread(target=_stdin_writer, daemon=True)
-    _writer_thread.start()
+        return None
 
-    # Start stderr reader for debugging
+    # Forward stderr for debugging for the lifetime of the process
     def stderr_reader() -> None:
         try:
-            while _running and _process and _process.stderr:
-                line = _process.stderr.readline()
+            while process.stderr:
+                line = process.stderr.readline()
                 if not line:
                     break
                 sys.stderr.write(f"[pywry-subprocess] {line}")
         except Exception:
             pass
 
-    stderr_thread = threading.Thread(target=stderr_reader, daemon=True)
-    stderr_thread.start()
+    threading.Thread(target=stderr_reader, daemon=True).start()
+    return process
+
+
+def _terminate(process: subprocess.Popen[str]) -> None:
+    """Ask a subprocess to quit, close its pipes and reap it."""
+    try:
+        if process.stdin and not process.stdin.closed:
+            process.stdin.write('{"action": "quit"}\n')
+            process.stdin.flush()
+    except (OSError, BrokenPipeError, ValueError):
+        pass
+
+    # Close all pipes to prevent flush errors on GC
+    for pipe in (process.stdin, process.stdout, process.stderr):
+        if pipe:
+            with contextlib.suppress(OSError, BrokenPipeError, ValueError):
+                pipe.close()
+
+    # Wait for process to exit
+    try:
+        process.wait(timeout=2.0)
+    except Exception:
+        try:
+            process.terminate()
+            process.wait(timeout=1.0)
+        except Exception:
+            with contextlib.suppress(Exception):
+                process.kill()
+
+
+def _register_atexit() -> None:
+    global _atexit_registered
+    if not _atexit_registered:
+        atexit.register(stop)
+        atexit.register(discard_spare)
+        _atexit_registered = True
+
+
+def prewarm() -> None:
+    """Launch a spare subprocess in the background if none is waiting.
+
+    The spare is spawned with the current window mode, plugins and
+    custom commands; ``start()`` promotes it instead of paying the
+    interpreter and pytauri startup.  A spare whose configuration no
+    longer matches at promotion time is discarded.
+    """
+    global _spare
+    with _spare_lock:
+        if _spare is not None and _spare.alive() and _spare.config == _subprocess_config():
+            return
+        stale, _spare = _spare, None
+    if stale is not None:
+        stale.discard()
+    process = _spawn_process()
+    if process is None:
+        return
+    spare = _Spare(process, _subprocess_config())
+    with _spare_lock:
+        stale, _spare = _spare, spare
+    if stale is not None:
+        stale.discard()
+    _register_atexit()
+    debug("Spawned warm-standby subprocess")
+
+
+def discard_spare() -> None:
+    """Terminate the waiting spare subprocess, if any."""
+    global _spare
+    with _spare_lock:
+        spare, _spare = _spare, None
+    if spare is not None:
+        spare.discard()
 
-    # Wait for ready signal
-    if not wait_ready(timeout=10.0):
-        log_error("Subprocess did not become ready")
-        stop()
-        return False
+
+def enable_warm_standby(enabled: bool = True) -> None:
+    """Keep a ready spare subprocess so (re)starts are near-instant.
+
+    When enabled, a spare is launched immediately in the background and
+    replaced every time ``start()`` promotes it, so a restart after
+    ``stop()`` or a crashed subprocess does not pay a cold start.
+
+    Parameters
+    ----------
+    enabled : bool
+        ``False`` disables the mode and terminates the waiting spare.
+    """
+    global _warm_standby
+    _warm_standby = enabled
+    if enabled:
+        prewarm()
+    else:
+        discard_spare()
+
+
+def _take_spare(timeout: float) -> _Spare | None:
+    """Claim the spare if it matches the current configuration and becomes ready."""
+    global _spare
+    with _spare_lock:
+        spare, _spare = _spare, None
+    if spare is None:
+        return None
+    # A spare that dies while starting settles at once, so start() falls
+    # back to a cold start without waiting out the timeout.
+    if spare.config == _subprocess_config() and spare.settled.wait(timeout) and spare.usable():
+        return spare
+    spare.discard()
+    return None
+
+
+def get_startup_timings() -> dict[str, Any]:
+    """Timings of the most recent subprocess start.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``warm`` (whether a pre-warmed spare was promoted),
+        ``spawn_to_ready_ms`` (subprocess launch until it reported
+        ready), ``start_ms`` (time spent in ``start()``) and
+        ``first_window_ms`` (``start()`` call until the first window was
+        created, ``None`` until then).  Empty before the first start.
+    """
+    return dict(_startup_timings)
+
+
+def _record_first_window() -> None:
+    if _start_called_at is not None and _startup_timings.get("first_window_ms") is None:
+        _startup_timings["first_window_ms"] = (time.perf_counter() - _start_called_at) * 1000.0
+
+
+def _start_io_threads(read_stdout: bool = True) -> None:
+    global _reader_thread, _writer_thread
+    _reader_thread = None
+    if read_stdout:
+        _reader_thread = threading.Thread(target=_stdout_reader, daemon=True)
+        _reader_thread.start()
+    _writer_thread = threading.Thread(target=_stdin_writer, daemon=True)
+    _writer_thread.start()
+
+
+def start() -> bool:
+    """Start the pytauri subprocess.
+
+    Promotes the warm-standby spare when one is ready, otherwise spawns
+    a new subprocess and waits for it to report ready.
+
+    Returns
+    -------
+    bool
+        True if started successfully.
+    """
+    global _process, _running, _start_called_at, _startup_timings
+
+    if is_running():
+        return True
+
+    _start_called_at = started = time.perf_counter()
+    _ready_event.clear()
+    _running = True
+
+    spare = _take_spare(timeout=10.0)
+    if spare is not None:
+        _process = spare.process
+        spare.promote()
+        _start_io_threads(read_stdout=False)  # The spare's drain thread reads stdout
+        _ready_event.set()
+        spawned_at, ready_at = spare.spawned_at, spare.ready_at or started
+    else:
+        process = _spawn_process()
+        if process is None:
+            _running = False
+            return False
+        _process = process
+        spawned_at = time.perf_counter()
+        _start_io_threads()
+
+        # Wait for ready signal
+        if not wait_ready(timeout=10.0):
+            log_error("Subprocess did not become ready")
+            stop()
+            return False
+        ready_at = time.perf_counter()
+
+    _startup_timings = {
+        "warm": spare is not None,
+        "spawn_to_ready_ms": (ready_at - spawned_at) * 1000.0,
+        "start_ms": (time.perf_counter() - started) * 1000.0,
+        "first_window_ms": None,
+    }
+    debug(
+        f"Subprocess ready in {_startup_timings['start_ms']:.1f} ms"
+        + (" (warm standby)" if spare is not None else "")
+    )
 
     # Register cleanup on exit
-    atexit.register(stop)
+    _register_atexit()
+
+    # Replace the promoted (or missing) spare for the next restart
+    if _warm_standby:
+        prewarm()
 
     return True
 
 
-def stop() -> None:  # noqa: C901
+def stop() -> None:
     """Stop the pytauri subprocess."""
     global _process, _running
 
@@ -1075,33 +1866,18 @@ def stop() -> None:  # noqa: C901
             event.set()  # Wake up any waiting threads
         _pending_requests.clear()
         _pending_responses.clear()
+        waiters = list(_async_pending.values())
+        _async_pending.clear()
+        _abandoned_requests.clear()
+    for waiter in waiters:
+        _resolve_waiter(waiter, None)  # Awaiting callers see a timeout
 
-    if _process:
-        # Send quit command
-        try:
-            if _process.stdin and not _process.stdin.closed:
-                _process.stdin.write('{"action": "quit"}\n')
-                _process.stdin.flush()
-        except (OSError, BrokenPipeError, ValueError):
-            pass
-
-        # Close all pipes to prevent flush errors on GC
-        for pipe in (_process.stdin, _process.stdout, _process.stderr):
-            if pipe:
-                with contextlib.suppress(OSError, BrokenPipeError, ValueError):
-                    pipe.close()
-
-        # Wait for process to exit
-        try:
-            _process.wait(timeout=2.0)
-        except Exception:
-            try:
-                _process.terminate()
-                _process.wait(timeout=1.0)
-            except Exception:
-                with contextlib.suppress(Exception):
-                    _process.kill()
+    with _window_state_lock:
+        _window_state.clear()
+        _stale_window_state.clear()
 
+    if _process:
+        _terminate(_process)
         _process = None
 
     # Clean up portal AFTER subprocess termination
@@ -104,7 +104,6 @@ def build_init_script(
         The combined JavaScript initialization script.
     """
     scripts = [
-        f"window.__PYWRY_LABEL__ = '{window_label}';",
         _get_bridge_js(),
         _get_system_events_js(),
         get_toast_notifications_js(),
@@ -118,4 +117,10 @@ def build_init_script(
     if enable_hot_reload:
         scripts.append(_get_hot_reload_js())
 
+    return f"window.__PYWRY_LABEL__ = '{window_label}';\n" + _join_scripts(*scripts)
+
+
+@lru_cache(maxsize=4)
+def _join_scripts(*scripts: str) -> str:
+    """Join bridge scripts, memoized on the (cached) script sources."""
     return "\n".join(scripts)
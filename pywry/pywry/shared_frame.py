@@ -0,0 +1,194 @@
+"""Shared-memory handoff of large grid datasets to the native subprocess.
+
+Embedding a large table in the window HTML costs three full copies: the
+parent serializes it into the page, the page is JSON-escaped again for the
+stdin pipe, and the subprocess parses the whole command before the webview
+parses the rows a third time.
+
+A :class:`SharedFrame` instead writes the rows once, as JSON-encoded
+chunks, into a named ``multiprocessing.shared_memory`` segment.  The page
+only carries the segment descriptor; the grid pulls chunks through the
+``pywry_frame_chunk`` pytauri command, which returns the raw bytes of one
+chunk without decoding them in the subprocess.
+
+Segment layout (little-endian)::
+
+    magic "PWFR" | uint32 chunk count | uint64 offsets[count + 1] | chunk bytes
+
+Offsets are absolute positions in the segment; chunk ``i`` spans
+``offsets[i]:offsets[i + 1]`` and holds a JSON array of row objects.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import struct
+import sys
+import threading
+import uuid
+
+from multiprocessing import shared_memory
+from typing import Any
+
+from .log import debug
+
+
+FRAME_PREFIX = "pywry_"
+DEFAULT_CHUNK_ROWS = 10_000
+
+_MAGIC = b"PWFR"
+_HEADER = struct.Struct("<4sI")
+_OFFSET = struct.Struct("<Q")
+
+# Segments attached in this process (the subprocess side), by name
+_attached: dict[str, shared_memory.SharedMemory] = {}
+_attached_lock = threading.Lock()
+
+# Segments created by this process, which its resource tracker already owns
+_created: set[str] = set()
+
+
+class SharedFrame:
+    """Row data written once into a named shared-memory segment.
+
+    Parameters
+    ----------
+    rows : list[dict[str, Any]]
+        JSON-serializable row records, e.g. ``GridData.row_data``.
+    chunk_rows : int
+        Rows per chunk served to the frontend.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        chunks = [
+            json.dumps(rows[start : start + chunk_rows], separators=(",", ":")).encode()
+            for start in range(0, len(rows), chunk_rows)
+        ]
+        data_start = _HEADER.size + _OFFSET.size * (len(chunks) + 1)
+        size = data_start + sum(len(chunk) for chunk in chunks)
+
+        self._shm = shared_memory.SharedMemory(
+            name=f"{FRAME_PREFIX}{uuid.uuid4().hex[:16]}", create=True, size=size
+        )
+        buf = self._shm.buf
+        _HEADER.pack_into(buf, 0, _MAGIC, len(chunks))
+        position = data_start
+        for index, chunk in enumerate(chunks):
+            _OFFSET.pack_into(buf, _HEADER.size + _OFFSET.size * index, position)
+            buf[position : position + len(chunk)] = chunk
+            position += len(chunk)
+        _OFFSET.pack_into(buf, _HEADER.size + _OFFSET.size * len(chunks), position)
+
+        _created.add(self.name)
+        self.row_count = len(rows)
+        self.chunk_count = len(chunks)
+        self.nbytes = size
+        self._closed = False
+        debug(f"SharedFrame {self.name}: {self.row_count} rows in {self.chunk_count} chunks")
+
+    @property
+    def name(self) -> str:
+        """Name of the shared-memory segment."""
+        return self._shm.name
+
+    def descriptor(self) -> dict[str, Any]:
+        """Return the JSON-safe descriptor embedded in the page.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``{"name", "chunks", "rows"}`` used by the grid loader.
+        """
+        return {"name": self.name, "chunks": self.chunk_count, "rows": self.row_count}
+
+    def close(self) -> None:
+        """Release and unlink the segment.  Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        _created.discard(self.name)
+        self._shm.close()
+        with contextlib.suppress(FileNotFoundError):
+            self._shm.unlink()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a segment created by another process without owning it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if sys.platform != "win32" and name not in _created:
+        # Before 3.13 attaching registers the segment with this process's
+        # resource tracker, which would unlink it when the subprocess exits.
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def read_chunk(name: str, index: int) -> bytes:
+    """Return the raw JSON bytes of one chunk of a shared frame.
+
+    The segment is attached on first use and stays mapped until
+    :func:`detach` is called for it.
+
+    Parameters
+    ----------
+    name : str
+        Segment name from :meth:`SharedFrame.descriptor`.
+    index : int
+        Zero-based chunk index.
+
+    Returns
+    -------
+    bytes
+        A JSON array of row objects.
+
+    Raises
+    ------
+    ValueError
+        If ``name`` is not a PyWry frame segment or the segment is corrupt.
+    IndexError
+        If ``index`` is out of range.
+    FileNotFoundError
+        If the segment no longer exists.
+    """
+    if not name.startswith(FRAME_PREFIX):
+        raise ValueError(f"Not a PyWry frame segment: {name!r}")
+    with _attached_lock:
+        shm = _attached.get(name)
+        if shm is None:
+            shm = _attached[name] = _attach(name)
+    buf = shm.buf
+    magic, count = _HEADER.unpack_from(buf, 0)
+    if magic != _MAGIC:
+        raise ValueError(f"Segment {name!r} is not a shared frame")
+    if not 0 <= index < count:
+        raise IndexError(f"Chunk {index} out of range for {count} chunks")
+    (start,) = _OFFSET.unpack_from(buf, _HEADER.size + _OFFSET.size * index)
+    (end,) = _OFFSET.unpack_from(buf, _HEADER.size + _OFFSET.size * (index + 1))
+    return bytes(buf[start:end])
+
+
+def detach(name: str) -> bool:
+    """Unmap a segment attached by :func:`read_chunk`.
+
+    Parameters
+    ----------
+    name : str
+        Segment name.
+
+    Returns
+    -------
+    bool
+        True if the segment was attached.
+    """
+    with _attached_lock:
+        shm = _attached.pop(name, None)
+    if shm is None:
+        return False
+    shm.close()
+    return True
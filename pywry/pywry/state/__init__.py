@@ -26,27 +26,40 @@ from __future__ import annotations
 
 from ._factory import (
     clear_state_caches,
+    get_auth_state_store,
     get_chart_store,
     get_chat_store,
     get_connection_router,
     get_event_bus,
+    get_login_rate_limiter,
     get_session_store,
     get_state_backend,
     get_widget_store,
     get_worker_id,
     is_deploy_mode,
 )
-from .base import ChartStore, ChatStore, ConnectionRouter, EventBus, SessionStore, WidgetStore
+from .base import (
+    AuthStateStore,
+    ChartStore,
+    ChatStore,
+    ConnectionRouter,
+    EventBus,
+    RateLimiter,
+    SessionStore,
+    WidgetStore,
+)
 from .callbacks import (
     CallbackRegistry,
     get_callback_registry,
     reset_callback_registry,
 )
 from .memory import (
+    MemoryAuthStateStore,
     MemoryChartStore,
     MemoryChatStore,
     MemoryConnectionRouter,
     MemoryEventBus,
+    MemoryRateLimiter,
     MemorySessionStore,
     MemoryWidgetStore,
 )
@@ -62,6 +75,7 @@ from .types import (
 
 
 __all__ = [
+    "AuthStateStore",
     "CallbackRegistry",
     "ChartStore",
     "ChatStore",
@@ -69,12 +83,15 @@ __all__ = [
     "ConnectionRouter",
     "EventBus",
     "EventMessage",
+    "MemoryAuthStateStore",
     "MemoryChartStore",
     "MemoryChatStore",
     "MemoryConnectionRouter",
     "MemoryEventBus",
+    "MemoryRateLimiter",
     "MemorySessionStore",
     "MemoryWidgetStore",
+    "RateLimiter",
     "ServerStateManager",
     "SessionStore",
     "StateBackend",
@@ -83,11 +100,13 @@ __all__ = [
     "WidgetStore",
     # Factory functions
     "clear_state_caches",
+    "get_auth_state_store",
     "get_callback_registry",
     "get_chart_store",
     "get_chat_store",
     "get_connection_router",
     "get_event_bus",
+    "get_login_rate_limiter",
     "get_server_state",
     "get_session_store",
     "get_state_backend",
@@ -16,19 +16,23 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import (
+        AuthStateStore,
         ChartStore,
         ChatStore,
         ConnectionRouter,
         EventBus,
+        RateLimiter,
         SessionStore,
         WidgetStore,
     )
 
 from .memory import (
+    MemoryAuthStateStore,
     MemoryChartStore,
     MemoryChatStore,
     MemoryConnectionRouter,
     MemoryEventBus,
+    MemoryRateLimiter,
     MemorySessionStore,
     MemoryWidgetStore,
 )
@@ -286,17 +290,75 @@ def get_session_store() -> SessionStore:
             prefix=settings.redis_prefix,
             default_ttl=settings.session_ttl,
             pool_size=settings.redis_pool_size,
+            permission_cache_ttl=settings.permission_cache_ttl,
         )
 
     if backend == StateBackend.SQLITE:
         from .sqlite import SqliteSessionStore
 
         settings = _get_deploy_settings()
-        return SqliteSessionStore(db_path=_resolve_sqlite_path(settings))
+        return SqliteSessionStore(
+            db_path=_resolve_sqlite_path(settings),
+            permission_cache_ttl=settings.permission_cache_ttl,
+        )
 
     return MemorySessionStore()
 
 
+@lru_cache(maxsize=1)
+def get_login_rate_limiter() -> RateLimiter:
+    """Get the configured rate limiter for ``/auth/login``.
+
+    Uses Redis in deploy mode if configured, so the limit applies across
+    all workers; otherwise an in-process limiter.
+
+    Returns
+    -------
+    RateLimiter
+        The rate limiter instance (10 requests per client per minute).
+    """
+    backend = get_state_backend()
+
+    if backend == StateBackend.REDIS:
+        from .redis import RedisRateLimiter
+
+        settings = _get_deploy_settings()
+        return RedisRateLimiter(
+            redis_url=settings.redis_url,
+            prefix=settings.redis_prefix,
+            pool_size=settings.redis_pool_size,
+        )
+
+    return MemoryRateLimiter()
+
+
+@lru_cache(maxsize=1)
+def get_auth_state_store() -> AuthStateStore:
+    """Get the configured store for pending OAuth2 state.
+
+    Uses Redis in deploy mode if configured, so an OAuth2 callback can be
+    handled by any worker; otherwise an in-process store.
+
+    Returns
+    -------
+    AuthStateStore
+        The auth state store instance.
+    """
+    backend = get_state_backend()
+
+    if backend == StateBackend.REDIS:
+        from .redis import RedisAuthStateStore
+
+        settings = _get_deploy_settings()
+        return RedisAuthStateStore(
+            redis_url=settings.redis_url,
+            prefix=settings.redis_prefix,
+            pool_size=settings.redis_pool_size,
+        )
+
+    return MemoryAuthStateStore()
+
+
 @lru_cache(maxsize=1)
 def get_chat_store() -> ChatStore:
     """Get the configured chat store instance.
@@ -384,5 +446,7 @@ def clear_state_caches() -> None:
     get_event_bus.cache_clear()
     get_connection_router.cache_clear()
     get_session_store.cache_clear()
+    get_login_rate_limiter.cache_clear()
+    get_auth_state_store.cache_clear()
     get_chat_store.cache_clear()
     get_chart_store.cache_clear()
@@ -0,0 +1,187 @@
+"""Compiled RBAC permission cache shared by the session store backends.
+
+Permission checks run on every authenticated request and widget action.
+Resolving them from the backing store each time costs a session read plus
+one lookup per role. :class:`PermissionCache` keeps:
+
+- the role -> permission table compiled to frozensets, with the union for
+  each distinct role combination memoized, tagged with the store's version
+  so a bump from ``set_role_permissions`` (on any worker) triggers a reload;
+- a short-TTL cache of sessions read for permission checks
+  (:class:`SessionCache`, also used by ``AuthMiddleware``).
+
+Both are re-validated at most once per ``ttl`` seconds; with ``ttl=0``
+every check re-reads the session and the role table version.
+"""
+
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from .types import UserSession
+
+
+DEFAULT_CACHE_TTL = 1.0
+DEFAULT_MAX_SESSIONS = 10_000
+
+
+class SessionCache:
+    """Bounded TTL cache of sessions read from a session store.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds a cached session is served before the store is read again.
+        ``0`` disables caching.
+    max_sessions : int
+        Maximum number of cached sessions; the oldest entries are evicted.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_CACHE_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS
+    ) -> None:
+        self.ttl = ttl
+        self._max_sessions = max_sessions
+        self._sessions: dict[str, tuple[float, UserSession]] = {}
+
+    def get(self, key: str) -> UserSession | None:
+        """Return a cached, unexpired session, or None on a miss."""
+        entry = self._sessions.get(key)
+        if entry is None:
+            return None
+        cached_at, session = entry
+        if time.monotonic() - cached_at >= self.ttl or (
+            session.expires_at and session.expires_at < time.time()
+        ):
+            del self._sessions[key]
+            return None
+        return session
+
+    def put(self, key: str, session: UserSession) -> None:
+        """Cache ``session`` under ``key``."""
+        if self.ttl <= 0:
+            return
+        self._sessions.pop(key, None)
+        if len(self._sessions) >= self._max_sessions:
+            del self._sessions[next(iter(self._sessions))]
+        self._sessions[key] = (time.monotonic(), session)
+
+    def drop(self, key: str) -> None:
+        """Forget the session cached under ``key``."""
+        self._sessions.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every cached session."""
+        self._sessions.clear()
+
+
+class PermissionCache:
+    """Role permission table and session cache for one session store.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds a loaded role table or cached session is trusted before the
+        store is consulted again. ``0`` re-validates on every check.
+    max_sessions : int
+        Maximum number of cached sessions; the oldest entries are evicted.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_CACHE_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS
+    ) -> None:
+        self.ttl = ttl
+        self._sessions = SessionCache(ttl, max_sessions)
+        self._roles: dict[str, frozenset[str]] = {}
+        self._resolved: dict[tuple[str, ...], frozenset[str]] = {}
+        self._version: str | None = None
+        self._checked_at: float | None = None
+
+    # --- Role table ---
+
+    def roles_expired(self) -> bool:
+        """Return True if the role table must be re-validated against the store."""
+        return self._checked_at is None or time.monotonic() - self._checked_at >= self.ttl
+
+    def is_current(self, version: str | None) -> bool:
+        """Return True if the loaded table matches the store's ``version``.
+
+        A match also restarts the TTL window.
+        """
+        if self._checked_at is None or version != self._version:
+            return False
+        self._checked_at = time.monotonic()
+        return True
+
+    def load_roles(self, roles: Mapping[str, Iterable[str]], version: str | None = None) -> None:
+        """Replace the role table.
+
+        Parameters
+        ----------
+        roles : Mapping[str, Iterable[str]]
+            Role name -> granted permissions.
+        version : str or None
+            Store version the table was read at.
+        """
+        self._roles = {role: frozenset(perms) for role, perms in roles.items()}
+        self._resolved.clear()
+        self._version = version
+        self._checked_at = time.monotonic()
+
+    def invalidate_roles(self) -> None:
+        """Force the next check to reload the role table."""
+        self._checked_at = None
+
+    def resolve(self, roles: Sequence[str]) -> frozenset[str]:
+        """Return the union of permissions granted by ``roles``."""
+        key = tuple(roles)
+        perms = self._resolved.get(key)
+        if perms is None:
+            perms = frozenset().union(*(self._roles.get(role, ()) for role in key))
+            self._resolved[key] = perms
+        return perms
+
+    # --- Sessions ---
+
+    def get_session(self, session_id: str) -> UserSession | None:
+        """Return a cached, unexpired session, or None on a miss."""
+        return self._sessions.get(session_id)
+
+    def put_session(self, session: UserSession) -> None:
+        """Cache a session read from the store."""
+        self._sessions.put(session.session_id, session)
+
+    def drop_session(self, session_id: str) -> None:
+        """Forget a session after it is deleted or changed."""
+        self._sessions.drop(session_id)
+
+
+def resource_permission(
+    session: UserSession, resource_type: str, resource_id: str, permission: str
+) -> bool:
+    """Check the per-resource grants stored in ``session.metadata["permissions"]``.
+
+    Parameters
+    ----------
+    session : UserSession
+        Session whose metadata may map ``"{type}:{id}"`` to permissions.
+    resource_type : str
+        Resource type.
+    resource_id : str
+        Resource identifier.
+    permission : str
+        Required permission.
+
+    Returns
+    -------
+    bool
+        True if the resource entry grants ``permission``.
+    """
+    resource_perms = session.metadata.get("permissions", {})
+    return permission in resource_perms.get(f"{resource_type}:{resource_id}", ())
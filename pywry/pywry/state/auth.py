@@ -20,8 +20,12 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from ._permission_cache import DEFAULT_CACHE_TTL, SessionCache
+
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from starlette.requests import Request
     from starlette.websockets import WebSocket
 
@@ -59,6 +63,9 @@ class AuthConfig:
         Session TTL in seconds.
     require_auth_for_widgets : bool
         Whether widgets require authentication to view.
+    session_cache_ttl : float
+        Seconds ``AuthMiddleware`` reuses a validated session before reading
+        the session store again. ``0`` disables the cache.
     """
 
     enabled: bool = False
@@ -67,6 +74,7 @@ class AuthConfig:
     token_secret: str = ""
     session_ttl: int = 86400  # 24 hours
     require_auth_for_widgets: bool = False
+    session_cache_ttl: float = DEFAULT_CACHE_TTL
 
     def __post_init__(self) -> None:
         """Generate token secret if not provided."""
@@ -348,10 +356,55 @@ def is_admin(session: UserSession | None) -> bool:
     return "admin" in session.roles
 
 
+# Trie terminal marker; never a path character
+_TRIE_END = ""
+
+
+class _PrefixTrie:
+    """Character trie answering whether a path starts with any of a set of prefixes.
+
+    Built once per middleware, so a lookup walks at most the length of the
+    matching prefix instead of testing every prefix with ``startswith``.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self._root: dict[str, Any] = {}
+        for prefix in prefixes:
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_TRIE_END] = True
+
+    def matches(self, path: str) -> bool:
+        """Return True if ``path`` starts with a registered prefix."""
+        node = self._root
+        if _TRIE_END in node:
+            return True
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _TRIE_END in node:
+                return True
+        return False
+
+
+# Path prefixes served without a session lookup (static assets and probes)
+DEFAULT_SKIP_PATHS: tuple[str, ...] = ("/assets/", "/static/", "/favicon.ico", "/health")
+
+
 class AuthMiddleware:
     """ASGI middleware for authentication.
 
     Extracts session from requests and adds to request state.
+
+    Only the session cookie, the auth header and (failing both) the
+    ``session`` query parameter are read from the scope. Validated sessions
+    are cached for ``config.session_cache_ttl`` seconds, so a session
+    deleted elsewhere may still be attached for up to that long. Public
+    and static paths skip the lookup entirely.
     """
 
     def __init__(
@@ -360,6 +413,7 @@ class AuthMiddleware:
         session_store: SessionStore,
         config: AuthConfig,
         public_paths: set[str] | None = None,
+        skip_paths: Iterable[str] | None = None,
     ) -> None:
         """Initialize the middleware.
 
@@ -373,11 +427,20 @@ class AuthMiddleware:
             Authentication configuration.
         public_paths : set of str, optional
             Paths that do not require authentication (e.g., login/callback routes).
+        skip_paths : iterable of str, optional
+            Path prefixes served without a session lookup. Defaults to
+            :data:`DEFAULT_SKIP_PATHS`.
         """
         self.app = app
         self.session_store = session_store
         self.config = config
         self.public_paths = public_paths or set()
+        self.skip_paths = DEFAULT_SKIP_PATHS if skip_paths is None else tuple(skip_paths)
+        self._bypass = _PrefixTrie((*self.public_paths, *self.skip_paths))
+        self._sessions = SessionCache(config.session_cache_ttl)
+        self._bearer_sessions = SessionCache(config.session_cache_ttl)
+        self._cookie_prefix = f"{config.session_cookie}=".encode()
+        self._auth_header = config.auth_header.lower().encode("latin-1")
 
     async def __call__(
         self,
@@ -390,68 +453,70 @@ class AuthMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Skip auth for public paths (e.g., /auth/login, /auth/callback)
-        path = scope.get("path", "")
-        if any(path.startswith(p) for p in self.public_paths):
+        # Skip auth for public and static paths (e.g., /auth/login, /assets/)
+        if self._bypass.matches(scope.get("path", "")):
             await self.app(scope, receive, send)
             return
 
-        # Add session to scope
         scope["session"] = None
-
         if self.config.enabled:
-            # Create a minimal request-like object for session extraction
-            headers = dict(scope.get("headers", []))
-            cookies = {}
-
-            # Parse cookies from headers
-            cookie_header = headers.get(b"cookie", b"").decode()
-            for part in cookie_header.split(";"):
-                if "=" in part:
-                    key, value = part.strip().split("=", 1)
-                    cookies[key] = value
-
-            # Create request wrapper
-            class _RequestWrapper:
-                def __init__(
-                    self,
-                    hdrs: dict[bytes, bytes],
-                    ckies: dict[str, str],
-                    qparams: dict[str, str],
-                ) -> None:
-                    self._headers = hdrs
-                    self._cookies = ckies
-                    self._query_params = qparams
-
-                @property
-                def headers(self) -> dict[str, str]:
-                    """Get HTTP headers as decoded dict."""
-                    return {k.decode(): v.decode() for k, v in self._headers.items()}
-
-                @property
-                def cookies(self) -> dict[str, str]:
-                    """Get cookies dict."""
-                    return self._cookies
-
-                @property
-                def query_params(self) -> dict[str, str]:
-                    """Get query parameters dict."""
-                    return self._query_params
-
-            # Parse query params
-            query_string = scope.get("query_string", b"").decode()
-            query_params = {}
-            for part in query_string.split("&"):
-                if "=" in part:
-                    key, value = part.split("=", 1)
-                    query_params[key] = value
-
-            wrapper = _RequestWrapper(headers, cookies, query_params)
-            session = await get_session_from_request(
-                wrapper,  # type: ignore
-                self.session_store,
-                self.config,
-            )
-            scope["session"] = session
+            scope["session"] = await self._resolve_session(scope)
 
         await self.app(scope, receive, send)
+
+    async def _resolve_session(self, scope: dict[str, Any]) -> UserSession | None:
+        """Find the request's session from cookie, bearer token or query string."""
+        session_id: str | None = None
+        auth: bytes | None = None
+        for name, value in scope.get("headers", ()):
+            if name == b"cookie" and session_id is None:
+                session_id = self._cookie_session_id(value)
+            elif name == self._auth_header:
+                auth = value
+
+        if session_id is None and auth is not None and auth.startswith(b"Bearer "):
+            is_valid, user_id, _ = validate_session_token(
+                auth[7:].decode("latin-1"), self.config.token_secret
+            )
+            if is_valid and user_id:
+                return await self._bearer_session(user_id)
+
+        if session_id is None:
+            session_id = _query_session_id(scope.get("query_string", b""))
+        if session_id is None:
+            return None
+
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = await self.session_store.get_session(session_id)
+            if session is not None:
+                self._sessions.put(session_id, session)
+        return session
+
+    async def _bearer_session(self, user_id: str) -> UserSession | None:
+        """Return the first active session of a bearer-token user."""
+        session = self._bearer_sessions.get(user_id)
+        if session is None:
+            sessions = await self.session_store.list_user_sessions(user_id)
+            if not sessions:
+                return None
+            session = sessions[0]
+            self._bearer_sessions.put(user_id, session)
+        return session
+
+    def _cookie_session_id(self, header: bytes) -> str | None:
+        """Extract the session cookie from a ``Cookie`` header value."""
+        prefix = self._cookie_prefix
+        for raw in header.split(b";"):
+            part = raw.strip()
+            if part.startswith(prefix):
+                return part[len(prefix) :].decode("latin-1") or None
+        return None
+
+
+def _query_session_id(query_string: bytes) -> str | None:
+    """Extract the ``session`` parameter from a raw query string."""
+    for part in query_string.split(b"&"):
+        if part.startswith(b"session="):
+            return part[8:].decode("latin-1") or None
+    return None
@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
 
     from pywry.chat import ChatMessage, ChatThread
 
@@ -60,6 +60,26 @@ class WidgetStore(ABC):
         """
         ...
 
+    async def register_many(self, widgets: Sequence[WidgetData]) -> None:
+        """Register several widgets in one operation.
+
+        The default implementation registers each widget in turn; backends
+        override it to batch the writes into a single round trip.
+
+        Parameters
+        ----------
+        widgets : Sequence[WidgetData]
+            Widgets to register. ``created_at`` is ignored and set by the store.
+        """
+        for widget in widgets:
+            await self.register(
+                widget_id=widget.widget_id,
+                html=widget.html,
+                token=widget.token,
+                owner_worker_id=widget.owner_worker_id,
+                metadata=widget.metadata,
+            )
+
     @abstractmethod
     async def get(self, widget_id: str) -> WidgetData | None:
         """Get complete widget data.
@@ -520,6 +540,134 @@ class SessionStore(ABC):
         """
         ...
 
+    async def check_permissions(
+        self,
+        session_id: str,
+        checks: Sequence[tuple[str, str, str]],
+    ) -> list[bool]:
+        """Check several permissions for one session.
+
+        The default implementation calls :meth:`check_permission` for each
+        entry; backends override it to resolve the session and its roles once.
+
+        Parameters
+        ----------
+        session_id : str
+            The session ID.
+        checks : Sequence[tuple[str, str, str]]
+            ``(resource_type, resource_id, permission)`` triples.
+
+        Returns
+        -------
+        list[bool]
+            One result per entry of ``checks``, in order.
+        """
+        return [
+            await self.check_permission(session_id, resource_type, resource_id, permission)
+            for resource_type, resource_id, permission in checks
+        ]
+
+
+class RateLimiter(ABC):
+    """Abstract sliding-window rate limiter.
+
+    Backs the ``/auth/login`` limit in deploy mode. A shared backend makes
+    the limit apply across all workers instead of once per process.
+    """
+
+    @abstractmethod
+    async def is_allowed(self, key: str) -> bool:
+        """Record a request for ``key`` and return whether it is within the limit.
+
+        Parameters
+        ----------
+        key : str
+            Client identifier, e.g. the remote IP address.
+
+        Returns
+        -------
+        bool
+            True if the request is allowed; rejected requests are not counted.
+        """
+        ...
+
+    @abstractmethod
+    async def reset(self, key: str | None = None) -> None:
+        """Clear recorded requests.
+
+        Parameters
+        ----------
+        key : str or None
+            Client identifier to clear, or None to clear every client.
+        """
+        ...
+
+
+class AuthStateStore(ABC):
+    """Abstract store for pending OAuth2 authorization state.
+
+    Holds the CSRF state nonce, PKCE verifier and redirect URI between
+    ``/auth/login`` and ``/auth/callback``. A shared backend lets the
+    callback land on any worker.
+    """
+
+    @abstractmethod
+    async def put(self, state: str, data: dict[str, Any]) -> None:
+        """Store a pending auth state.
+
+        Parameters
+        ----------
+        state : str
+            The state nonce sent to the provider.
+        data : dict[str, Any]
+            JSON-serializable flow data, including ``created_at``.
+        """
+        ...
+
+    @abstractmethod
+    async def pop(self, state: str) -> dict[str, Any] | None:
+        """Retrieve and remove a pending auth state (single use).
+
+        Parameters
+        ----------
+        state : str
+            The state nonce.
+
+        Returns
+        -------
+        dict[str, Any] or None
+            The stored data, or None if unknown, expired or already consumed.
+        """
+        ...
+
+    @abstractmethod
+    async def contains(self, state: str) -> bool:
+        """Check whether a pending, unexpired state exists.
+
+        Parameters
+        ----------
+        state : str
+            The state nonce.
+
+        Returns
+        -------
+        bool
+            True if the state exists.
+        """
+        ...
+
+    async def cleanup(self) -> int:
+        """Remove expired states.
+
+        Backends whose entries expire on their own keep this no-op default.
+
+        Returns
+        -------
+        int
+            Number of states removed.
+        """
+        return 0
+
 
 class ChatStore(ABC):
     """Abstract chat storage interface.
@@ -657,6 +805,39 @@ class ChatStore(ABC):
         """
         ...
 
+    async def truncate_messages(self, widget_id: str, thread_id: str, from_id: str) -> bool:
+        """Delete a message and every message after it.
+
+        The default implementation reads the thread, clears it and
+        re-appends the messages before ``from_id``, so it is not atomic;
+        backends override it to truncate in one step.
+
+        Parameters
+        ----------
+        widget_id : str
+            The widget ID.
+        thread_id : str
+            The thread ID.
+        from_id : str
+            ID of the first message to delete.
+
+        Returns
+        -------
+        bool
+            True if ``from_id`` was found and the thread truncated, False
+            if the thread does not contain it (nothing is deleted).
+        """
+        from pywry.chat import MAX_MESSAGES_PER_THREAD
+
+        messages = await self.get_messages(widget_id, thread_id, limit=MAX_MESSAGES_PER_THREAD)
+        ids = [message.message_id for message in messages]
+        if from_id not in ids:
+            return False
+        await self.clear_messages(widget_id, thread_id)
+        for message in messages[: ids.index(from_id)]:
+            await self.append_message(widget_id, thread_id, message)
+        return True
+
     async def log_tool_call(
         self,
         message_id: str,
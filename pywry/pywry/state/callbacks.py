@@ -18,7 +18,7 @@ import asyncio
 import logging
 import time
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -117,6 +117,39 @@ class CallbackRegistry:
             )
             logger.debug("Registered callback for %s:%s", widget_id, event_type)
 
+    async def register_many(
+        self,
+        callbacks: Mapping[str, Mapping[str, CallbackFunc | AsyncCallbackFunc]],
+    ) -> int:
+        """Register callbacks for several widgets under a single lock acquisition.
+
+        Parameters
+        ----------
+        callbacks : Mapping[str, Mapping[str, CallbackFunc]]
+            Widget ID -> event type -> callback.
+
+        Returns
+        -------
+        int
+            Number of callbacks registered.
+        """
+        count = 0
+        async with self._lock:
+            for widget_id, events in callbacks.items():
+                if not events:
+                    continue
+                widget_callbacks = self._callbacks.setdefault(widget_id, {})
+                for event_type, callback in events.items():
+                    widget_callbacks[event_type] = CallbackRegistration(
+                        widget_id=widget_id,
+                        event_type=event_type,
+                        callback=callback,
+                        is_async=asyncio.iscoroutinefunction(callback),
+                    )
+                    count += 1
+        logger.debug("Registered %d callbacks for %d widgets", count, len(callbacks))
+        return count
+
     async def get(self, widget_id: str, event_type: str) -> CallbackRegistration | None:
         """Get a callback registration.
 
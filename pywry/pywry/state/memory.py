@@ -6,17 +6,28 @@ Default backend for single-process deployments and development.
 from __future__ import annotations
 
 import asyncio
+import collections
 import contextlib
 import time
 
 from typing import TYPE_CHECKING, Any
 
-from .base import ChartStore, ChatStore, ConnectionRouter, EventBus, SessionStore, WidgetStore
+from ._permission_cache import PermissionCache
+from .base import (
+    AuthStateStore,
+    ChartStore,
+    ChatStore,
+    ConnectionRouter,
+    EventBus,
+    RateLimiter,
+    SessionStore,
+    WidgetStore,
+)
 from .types import ConnectionInfo, EventMessage, UserSession, WidgetData
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
 
     from pywry.chat import ChatMessage, ChatThread
 
@@ -72,6 +83,26 @@ class MemoryWidgetStore(WidgetStore):
                 metadata=metadata or {},
             )
 
+    async def register_many(self, widgets: Sequence[WidgetData]) -> None:
+        """Register several widgets under a single lock acquisition.
+
+        Parameters
+        ----------
+        widgets : Sequence[WidgetData]
+            Widgets to register.
+        """
+        now = time.time()
+        async with self._lock:
+            for widget in widgets:
+                self._widgets[widget.widget_id] = WidgetData(
+                    widget_id=widget.widget_id,
+                    html=widget.html,
+                    token=widget.token,
+                    created_at=now,
+                    owner_worker_id=widget.owner_worker_id,
+                    metadata=widget.metadata or {},
+                )
+
     async def get(self, widget_id: str) -> WidgetData | None:
         """Get complete widget data.
 
@@ -460,6 +491,8 @@ class MemorySessionStore(SessionStore):
         Reverse index of session IDs by user.
     _role_permissions : dict[str, set[str]]
         Simple in-memory role-to-permission mapping.
+    _permissions : PermissionCache
+        Compiled form of ``_role_permissions``.
     _lock : asyncio.Lock
         Synchronizes session and permission updates.
     """
@@ -474,6 +507,8 @@ class MemorySessionStore(SessionStore):
             "editor": {"read", "write"},
             "viewer": {"read"},
         }
+        self._permissions = PermissionCache()
+        self._permissions.load_roles(self._role_permissions)
         self._lock = asyncio.Lock()
 
     async def create_session(
@@ -686,14 +721,32 @@ class MemorySessionStore(SessionStore):
         session = await self.get_session(session_id)
         if session is None:
             return False
+        return permission in self._permissions.resolve(session.roles)
 
-        # Check role-based permissions
-        for role in session.roles:
-            role_perms = self._role_permissions.get(role, set())
-            if permission in role_perms:
-                return True
+    async def check_permissions(
+        self,
+        session_id: str,
+        checks: Sequence[tuple[str, str, str]],
+    ) -> list[bool]:
+        """Check several permissions for one session.
+
+        Parameters
+        ----------
+        session_id : str
+            Session identifier.
+        checks : Sequence[tuple[str, str, str]]
+            ``(resource_type, resource_id, permission)`` triples.
 
-        return False
+        Returns
+        -------
+        list[bool]
+            One result per check, resolved from a single session lookup.
+        """
+        session = await self.get_session(session_id)
+        if session is None:
+            return [False] * len(checks)
+        perms = self._permissions.resolve(session.roles)
+        return [permission in perms for _, _, permission in checks]
 
     def set_role_permissions(self, role: str, permissions: set[str]) -> None:
         """Configure permissions for a role.
@@ -710,6 +763,105 @@ class MemorySessionStore(SessionStore):
         This method is synchronous because it is intended for startup-time setup.
         """
         self._role_permissions[role] = permissions
+        self._permissions.load_roles(self._role_permissions)
+
+
+class MemoryRateLimiter(RateLimiter):
+    """In-process sliding-window rate limiter.
+
+    Every operation completes without awaiting, so no lock is needed on
+    the event loop. Limits are per process; use the Redis backend to share
+    them across workers.
+
+    Parameters
+    ----------
+    max_requests : int
+        Maximum number of requests allowed per window.
+    window_seconds : float
+        Time window in seconds.
+    """
+
+    def __init__(self, max_requests: int = 10, window_seconds: float = 60.0) -> None:
+        self._max_requests = max_requests
+        self._window = window_seconds
+        self._requests: dict[str, collections.deque[float]] = {}
+
+    async def is_allowed(self, key: str) -> bool:
+        """Record a request for ``key`` and return whether it is within the limit."""
+        now = time.monotonic()
+        dq = self._requests.get(key)
+        if dq is None:
+            dq = self._requests[key] = collections.deque()
+        # Evict old entries outside the window
+        while dq and dq[0] < now - self._window:
+            dq.popleft()
+        if len(dq) >= self._max_requests:
+            return False
+        dq.append(now)
+        return True
+
+    async def reset(self, key: str | None = None) -> None:
+        """Clear recorded requests for ``key``, or for every client."""
+        if key is None:
+            self._requests.clear()
+        else:
+            self._requests.pop(key, None)
+
+
+class MemoryAuthStateStore(AuthStateStore):
+    """Bounded, TTL-enforced in-process store for pending OAuth2 state.
+
+    Evicts expired entries on every access and enforces a hard capacity
+    limit to prevent memory exhaustion. Operations never await, so they are
+    atomic on the event loop without a lock.
+
+    Parameters
+    ----------
+    max_pending : int
+        Maximum number of concurrent pending auth states.
+    max_age : float
+        Maximum age of a pending state in seconds before auto-eviction.
+    """
+
+    def __init__(self, max_pending: int = 1000, max_age: float = 600.0) -> None:
+        self._store: dict[str, dict[str, Any]] = {}
+        self._max_pending = max_pending
+        self._max_age = max_age
+
+    async def put(self, state: str, data: dict[str, Any]) -> None:
+        """Store a pending auth state."""
+        self._evict_expired()
+        if len(self._store) >= self._max_pending:
+            # Evict oldest entry when at capacity
+            oldest_key = min(self._store, key=lambda k: self._store[k].get("created_at", 0))
+            del self._store[oldest_key]
+        self._store[state] = data
+
+    async def pop(self, state: str) -> dict[str, Any] | None:
+        """Retrieve and remove a pending auth state (single-use)."""
+        self._evict_expired()
+        return self._store.pop(state, None)
+
+    async def contains(self, state: str) -> bool:
+        """Check if a state exists."""
+        self._evict_expired()
+        return state in self._store
+
+    async def cleanup(self) -> int:
+        """Explicitly clean up expired states. Returns count removed."""
+        return self._evict_expired()
+
+    async def size(self) -> int:
+        """Return current number of pending states."""
+        return len(self._store)
+
+    def _evict_expired(self, max_age: float | None = None) -> int:
+        """Remove entries older than ``max_age`` (default: the store's) and return the count."""
+        cutoff = time.time() - (self._max_age if max_age is None else max_age)
+        expired = [k for k, v in self._store.items() if v.get("created_at", 0) < cutoff]
+        for k in expired:
+            del self._store[k]
+        return len(expired)
 
 
 class MemoryChatStore(ChatStore):
@@ -895,6 +1047,37 @@ class MemoryChatStore(ChatStore):
                 thread.messages = []
                 thread.updated_at = time.time()
 
+    async def truncate_messages(self, widget_id: str, thread_id: str, from_id: str) -> bool:
+        """Delete a message and everything after it.
+
+        Parameters
+        ----------
+        widget_id : str
+            Widget identifier.
+        thread_id : str
+            Thread identifier.
+        from_id : str
+            ID of the first message to delete.
+
+        Returns
+        -------
+        bool
+            True when ``from_id`` was found and the thread truncated.
+        """
+        async with self._lock:
+            thread = self._threads.get(widget_id, {}).get(thread_id)
+            if thread is None:
+                return False
+            idx = next(
+                (i for i, m in enumerate(thread.messages) if m.message_id == from_id),
+                None,
+            )
+            if idx is None:
+                return False
+            thread.messages = thread.messages[:idx]
+            thread.updated_at = time.time()
+            return True
+
     async def cleanup_widget(self, widget_id: str) -> None:
         """Remove all chat data for a widget.
 
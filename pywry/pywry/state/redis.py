@@ -8,23 +8,35 @@ Features:
 - Cross-worker event bus via Pub/Sub
 - Connection routing for WebSocket affinity
 - Session management for RBAC
+- Login rate limiting and pending OAuth2 state shared across workers
 """
 
 from __future__ import annotations
 
 import contextlib
 import json
+import math
 import time
 import uuid
 
 from typing import TYPE_CHECKING, Any, cast
 
-from .base import ChartStore, ChatStore, ConnectionRouter, EventBus, SessionStore, WidgetStore
+from ._permission_cache import DEFAULT_CACHE_TTL, PermissionCache, resource_permission
+from .base import (
+    AuthStateStore,
+    ChartStore,
+    ChatStore,
+    ConnectionRouter,
+    EventBus,
+    RateLimiter,
+    SessionStore,
+    WidgetStore,
+)
 from .types import ConnectionInfo, EventMessage, UserSession, WidgetData
 
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Sequence
 
     from redis.asyncio import Redis
 
@@ -137,24 +149,38 @@ class RedisWidgetStore(WidgetStore):
         metadata: dict[str, Any] | None = None,
     ) -> None:
         """Register a widget with its HTML content."""
-        r = await self._redis()
-        key = self._widget_key(widget_id)
+        await self.register_many(
+            [
+                WidgetData(
+                    widget_id=widget_id,
+                    html=html,
+                    token=token,
+                    owner_worker_id=owner_worker_id,
+                    metadata=metadata or {},
+                )
+            ]
+        )
 
-        data = {
-            "html": html,
-            "created_at": str(time.time()),
-        }
-        if token:
-            data["token"] = token
-        if owner_worker_id:
-            data["owner_worker_id"] = owner_worker_id
-        if metadata:
-            data["metadata"] = json.dumps(metadata)
+    async def register_many(self, widgets: Sequence[WidgetData]) -> None:
+        """Register several widgets in one pipelined round trip."""
+        if not widgets:
+            return
+        r = await self._redis()
+        now = str(time.time())
 
         async with r.pipeline() as pipe:
-            await pipe.hset(key, mapping=data)
-            await pipe.expire(key, self._widget_ttl)
-            await pipe.sadd(self._active_set_key(), widget_id)
+            for widget in widgets:
+                data = {"html": widget.html, "created_at": now}
+                if widget.token:
+                    data["token"] = widget.token
+                if widget.owner_worker_id:
+                    data["owner_worker_id"] = widget.owner_worker_id
+                if widget.metadata:
+                    data["metadata"] = json.dumps(widget.metadata)
+                key = self._widget_key(widget.widget_id)
+                await pipe.hset(key, mapping=data)
+                await pipe.expire(key, self._widget_ttl)
+            await pipe.sadd(self._active_set_key(), *(widget.widget_id for widget in widgets))
             await pipe.execute()
 
     async def get(self, widget_id: str) -> WidgetData | None:
@@ -491,6 +517,13 @@ class RedisSessionStore(SessionStore):
     """Redis-backed session store for RBAC support.
 
     Uses Redis hashes for session data with automatic TTL expiry.
+
+    Permission checks use a per-store :class:`PermissionCache`: the role
+    table is reloaded only when the version key bumped by
+    ``set_role_permissions`` changes (checked at most once per
+    ``permission_cache_ttl``), and sessions read for checks are reused for
+    the same interval. A session deleted on another worker can therefore
+    pass permission checks here for up to ``permission_cache_ttl`` seconds.
     """
 
     def __init__(
@@ -501,6 +534,7 @@ class RedisSessionStore(SessionStore):
         pool_size: int = 10,
         *,
         redis_client: Redis | None = None,
+        permission_cache_ttl: float = DEFAULT_CACHE_TTL,
     ) -> None:
         """Initialize the Redis session store.
 
@@ -516,6 +550,9 @@ class RedisSessionStore(SessionStore):
             Connection pool size.
         redis_client : Redis, optional
             Pre-configured Redis client (for testing with fakeredis).
+        permission_cache_ttl : float
+            Seconds cached sessions and role permissions are trusted for
+            permission checks.
         """
         _check_redis()
         self._redis_url = redis_url
@@ -523,8 +560,10 @@ class RedisSessionStore(SessionStore):
         self._default_ttl = default_ttl
         self._pool_size = pool_size
         self._client = redis_client
-        # Role permissions stored in Redis hash
+        # Role permissions stored in Redis hash, versioned for cache invalidation
         self._role_perms_key = f"{self._prefix}:role_permissions"
+        self._role_version_key = f"{self._prefix}:role_permissions:version"
+        self._permissions = PermissionCache(ttl=permission_cache_ttl)
 
     def _session_key(self, session_id: str) -> str:
         """Get Redis key for a session."""
@@ -582,6 +621,7 @@ class RedisSessionStore(SessionStore):
             await pipe.sadd(self._user_sessions_key(user_id), session_id)
             await pipe.execute()
 
+        self._permissions.drop_session(session_id)
         return session
 
     async def get_session(self, session_id: str) -> UserSession | None:
@@ -626,6 +666,7 @@ class RedisSessionStore(SessionStore):
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
+        self._permissions.drop_session(session_id)
         r = await self._redis()
         key = self._session_key(session_id)
 
@@ -642,6 +683,7 @@ class RedisSessionStore(SessionStore):
 
     async def refresh_session(self, session_id: str, extend_ttl: int | None = None) -> bool:
         """Refresh a session's expiry time."""
+        self._permissions.drop_session(session_id)
         r = await self._redis()
         key = self._session_key(session_id)
 
@@ -688,42 +730,254 @@ class RedisSessionStore(SessionStore):
         permission: str,
     ) -> bool:
         """Check if a session has permission to access a resource."""
-        session = await self.get_session(session_id)
+        session = await self._session_for_check(session_id)
         if session is None:
             return False
-
-        r = await self._redis()
-
-        # Check role-based permissions
-        for role in session.roles:
-            role_perms = await r.hget(self._role_perms_key, role)
-            if role_perms:
-                try:
-                    perms = json.loads(role_perms)
-                    if permission in perms:
-                        return True
-                except json.JSONDecodeError:
-                    pass
-
+        permissions = await self._role_permissions()
+        if permission in permissions.resolve(session.roles):
+            return True
         # Check resource-specific permissions in session metadata
-        resource_perms = session.metadata.get("permissions", {})
-        resource_key = f"{resource_type}:{resource_id}"
-        if resource_key in resource_perms:
-            return permission in resource_perms[resource_key]
+        return resource_permission(session, resource_type, resource_id, permission)
 
-        return False
+    async def check_permissions(
+        self,
+        session_id: str,
+        checks: Sequence[tuple[str, str, str]],
+    ) -> list[bool]:
+        """Check several permissions with one session and role resolution."""
+        session = await self._session_for_check(session_id)
+        if session is None:
+            return [False] * len(checks)
+        granted = (await self._role_permissions()).resolve(session.roles)
+        return [
+            permission in granted
+            or resource_permission(session, resource_type, resource_id, permission)
+            for resource_type, resource_id, permission in checks
+        ]
+
+    async def _session_for_check(self, session_id: str) -> UserSession | None:
+        """Get a session for a permission check, served from the cache when fresh."""
+        session = self._permissions.get_session(session_id)
+        if session is None:
+            session = await self.get_session(session_id)
+            if session is not None:
+                self._permissions.put_session(session)
+        return session
+
+    async def _role_permissions(self) -> PermissionCache:
+        """Return the permission cache, reloading roles if the version changed."""
+        cache = self._permissions
+        if cache.roles_expired():
+            r = await self._redis()
+            version = _to_str(await r.get(self._role_version_key))
+            if not cache.is_current(version):
+                roles: dict[str, list[str]] = {}
+                for role, perms in _decode_hash(await r.hgetall(self._role_perms_key)).items():
+                    with contextlib.suppress(json.JSONDecodeError):
+                        roles[role] = json.loads(perms)
+                cache.load_roles(roles, version)
+        return cache
 
     async def set_role_permissions(self, role: str, permissions: list[str] | set[str]) -> None:
-        """Configure permissions for a role."""
+        """Configure permissions for a role.
+
+        Bumps the role table version so every worker reloads its cache.
+        """
         r = await self._redis()
         # Convert set to list for JSON serialization
         perms_list = list(permissions) if isinstance(permissions, set) else permissions
-        await r.hset(self._role_perms_key, role, json.dumps(perms_list))
+        async with r.pipeline() as pipe:
+            await pipe.hset(self._role_perms_key, role, json.dumps(perms_list))
+            await pipe.incr(self._role_version_key)
+            await pipe.execute()
+        self._permissions.invalidate_roles()
 
     async def close(self) -> None:
         """Close any resources (no-op for connection-per-call pattern)."""
 
 
+# Sliding-window log in a sorted set, scored by Redis server time in
+# microseconds so workers with skewed clocks share one window.
+# KEYS[1] = window key; ARGV = max requests, window (us), unique member.
+_RATE_LIMIT_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window / 1000))
+return 1
+"""
+
+
+# Trim a thread's message list just before the message with ID ARGV[1]
+_TRUNCATE_MESSAGES_SCRIPT = """
+local messages = redis.call('LRANGE', KEYS[1], 0, -1)
+for i, raw in ipairs(messages) do
+    local ok, message = pcall(cjson.decode, raw)
+    if ok and message['message_id'] == ARGV[1] then
+        if i == 1 then
+            redis.call('DEL', KEYS[1])
+        else
+            redis.call('LTRIM', KEYS[1], 0, i - 2)
+        end
+        return 1
+    end
+end
+return 0
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """Redis-backed sliding-window rate limiter shared by all workers.
+
+    Each check is a single atomic Lua call (evict, count, record), so
+    concurrent requests on different workers cannot overshoot the limit.
+
+    Parameters
+    ----------
+    redis_url : str
+        Redis connection URL.
+    prefix : str
+        Key prefix for namespacing.
+    pool_size : int
+        Connection pool size.
+    redis_client : Redis, optional
+        Pre-configured Redis client (for testing with fakeredis).
+    max_requests : int
+        Maximum number of requests allowed per window.
+    window_seconds : float
+        Time window in seconds.
+    name : str
+        Limiter name, so several limiters can share a prefix.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        prefix: str = "pywry",
+        pool_size: int = 10,
+        *,
+        redis_client: Redis | None = None,
+        max_requests: int = 10,
+        window_seconds: float = 60.0,
+        name: str = "login",
+    ) -> None:
+        _check_redis()
+        self._redis_url = redis_url
+        self._prefix = prefix
+        self._pool_size = pool_size
+        self._client = redis_client
+        self._max_requests = max_requests
+        self._window_us = math.ceil(window_seconds * 1_000_000)
+        self._key_prefix = f"{self._prefix}:ratelimit:{name}:"
+
+    async def _redis(self) -> Any:
+        """Get a Redis connection."""
+        if self._client is not None:
+            return self._client
+        return RedisClient.from_url(
+            self._redis_url,
+            decode_responses=True,
+        )
+
+    async def is_allowed(self, key: str) -> bool:
+        """Record a request for ``key`` and return whether it is within the limit."""
+        r = await self._redis()
+        script = r.register_script(_RATE_LIMIT_SCRIPT)
+        allowed = await script(
+            keys=[self._key_prefix + key],
+            args=[self._max_requests, self._window_us, uuid.uuid4().hex],
+        )
+        return bool(int(allowed))
+
+    async def reset(self, key: str | None = None) -> None:
+        """Clear recorded requests for ``key``, or for every client."""
+        r = await self._redis()
+        if key is not None:
+            await r.delete(self._key_prefix + key)
+            return
+        keys = [k async for k in r.scan_iter(match=f"{self._key_prefix}*")]
+        if keys:
+            await r.delete(*keys)
+
+
+class RedisAuthStateStore(AuthStateStore):
+    """Redis-backed pending OAuth2 state, readable from any worker.
+
+    Each state is a JSON string with a ``max_age`` TTL, so expired entries
+    disappear without cleanup. ``pop`` uses ``GETDEL`` to consume a state
+    exactly once even when callbacks race on different workers.
+
+    Parameters
+    ----------
+    redis_url : str
+        Redis connection URL.
+    prefix : str
+        Key prefix for namespacing.
+    pool_size : int
+        Connection pool size.
+    redis_client : Redis, optional
+        Pre-configured Redis client (for testing with fakeredis).
+    max_age : float
+        Seconds a pending state stays valid.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        prefix: str = "pywry",
+        pool_size: int = 10,
+        *,
+        redis_client: Redis | None = None,
+        max_age: float = 600.0,
+    ) -> None:
+        _check_redis()
+        self._redis_url = redis_url
+        self._prefix = prefix
+        self._pool_size = pool_size
+        self._client = redis_client
+        self._max_age_ms = math.ceil(max_age * 1000)
+
+    def _state_key(self, state: str) -> str:
+        """Get Redis key for a pending auth state."""
+        return f"{self._prefix}:auth_state:{state}"
+
+    async def _redis(self) -> Any:
+        """Get a Redis connection."""
+        if self._client is not None:
+            return self._client
+        return RedisClient.from_url(
+            self._redis_url,
+            decode_responses=True,
+        )
+
+    async def put(self, state: str, data: dict[str, Any]) -> None:
+        """Store a pending auth state with the ``max_age`` TTL."""
+        r = await self._redis()
+        await r.set(self._state_key(state), json.dumps(data), px=self._max_age_ms)
+
+    async def pop(self, state: str) -> dict[str, Any] | None:
+        """Retrieve and remove a pending auth state (single-use)."""
+        r = await self._redis()
+        raw = await r.getdel(self._state_key(state))
+        if raw is None:
+            return None
+        try:
+            return cast("dict[str, Any]", json.loads(_to_str(raw)))
+        except json.JSONDecodeError:
+            return None
+
+    async def contains(self, state: str) -> bool:
+        """Check if a state exists."""
+        r = await self._redis()
+        return bool(await r.exists(self._state_key(state)))
+
+
 class RedisChatStore(ChatStore):
     """Redis-backed chat store for multi-worker deployments.
 
@@ -910,6 +1164,16 @@ class RedisChatStore(ChatStore):
         thread_key = self._thread_key(widget_id, thread_id)
         await r.hset(thread_key, "updated_at", str(time.time()))
 
+    async def truncate_messages(self, widget_id: str, thread_id: str, from_id: str) -> bool:
+        """Delete a message and everything after it with one ``LTRIM`` script."""
+        r = await self._redis()
+        script = r.register_script(_TRUNCATE_MESSAGES_SCRIPT)
+        found = await script(keys=[self._messages_key(widget_id, thread_id)], args=[from_id])
+        if not int(found):
+            return False
+        await r.hset(self._thread_key(widget_id, thread_id), "updated_at", str(time.time()))
+        return True
+
     async def close(self) -> None:
         """Close any resources."""
 
@@ -20,13 +20,18 @@ import time
 import uuid
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from ._permission_cache import DEFAULT_CACHE_TTL, PermissionCache, resource_permission
 from .base import ChatStore, SessionStore, WidgetStore
 from .memory import MemoryConnectionRouter, MemoryEventBus
 from .types import UserSession, WidgetData
 
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -330,6 +335,27 @@ class SqliteWidgetStore(SqliteStateBackend, WidgetStore):
             (widget_id, html, token, owner_worker_id, time.time(), json.dumps(metadata or {})),
         )
 
+    async def register_many(self, widgets: Sequence[WidgetData]) -> None:
+        if not widgets:
+            return
+        now = time.time()
+        await self._executemany(
+            "INSERT OR REPLACE INTO widgets "
+            "(widget_id, html, token, owner_worker_id, created_at, metadata) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    w.widget_id,
+                    w.html,
+                    w.token,
+                    w.owner_worker_id,
+                    now,
+                    json.dumps(w.metadata or {}),
+                )
+                for w in widgets
+            ],
+        )
+
     async def get(self, widget_id: str) -> WidgetData | None:
         rows = await self._execute(
             "SELECT * FROM widgets WHERE widget_id = ?", (widget_id,), commit=False
@@ -392,7 +418,22 @@ class SqliteWidgetStore(SqliteStateBackend, WidgetStore):
 
 
 class SqliteSessionStore(SqliteStateBackend, SessionStore):
-    """SQLite-backed session store with RBAC."""
+    """SQLite-backed session store with RBAC.
+
+    Role permissions and sessions read for permission checks are cached for
+    ``permission_cache_ttl`` seconds; ``set_role_permissions`` and session
+    writes through this store invalidate the cache immediately.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "~/.config/pywry/pywry.db",
+        encryption_key: str | None = None,
+        encrypted: bool = True,
+        permission_cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        super().__init__(db_path, encryption_key=encryption_key, encrypted=encrypted)
+        self._permissions = PermissionCache(ttl=permission_cache_ttl)
 
     async def create_session(
         self,
@@ -425,6 +466,7 @@ class SqliteSessionStore(SqliteStateBackend, SessionStore):
                 json.dumps(session.metadata),
             ),
         )
+        self._permissions.drop_session(session_id)
         return session
 
     async def get_session(self, session_id: str) -> UserSession | None:
@@ -452,6 +494,7 @@ class SqliteSessionStore(SqliteStateBackend, SessionStore):
         return session is not None
 
     async def delete_session(self, session_id: str) -> bool:
+        self._permissions.drop_session(session_id)
         rows = await self._execute(
             "DELETE FROM sessions WHERE session_id = ? RETURNING session_id", (session_id,)
         )
@@ -467,6 +510,7 @@ class SqliteSessionStore(SqliteStateBackend, SessionStore):
                 "UPDATE sessions SET expires_at = ? WHERE session_id = ?",
                 (new_expires, session_id),
             )
+            self._permissions.drop_session(session_id)
         return True
 
     async def list_user_sessions(self, user_id: str) -> list[UserSession]:
@@ -498,34 +542,72 @@ class SqliteSessionStore(SqliteStateBackend, SessionStore):
         resource_id: str,
         permission: str,
     ) -> bool:
-        session = await self.get_session(session_id)
+        session = await self._session_for_check(session_id)
         if session is None:
             return False
-        for role in session.roles:
+        permissions = await self._role_permissions()
+        if permission in permissions.resolve(session.roles):
+            return True
+        return resource_permission(session, resource_type, resource_id, permission)
+
+    async def check_permissions(
+        self,
+        session_id: str,
+        checks: Sequence[tuple[str, str, str]],
+    ) -> list[bool]:
+        """Check several permissions with one session and role resolution."""
+        session = await self._session_for_check(session_id)
+        if session is None:
+            return [False] * len(checks)
+        granted = (await self._role_permissions()).resolve(session.roles)
+        return [
+            permission in granted
+            or resource_permission(session, resource_type, resource_id, permission)
+            for resource_type, resource_id, permission in checks
+        ]
+
+    async def set_role_permissions(self, role: str, permissions: list[str] | set[str]) -> None:
+        """Configure permissions for a role."""
+        await self._execute(
+            "INSERT OR REPLACE INTO role_permissions (role, permissions) VALUES (?, ?)",
+            (role, json.dumps(sorted(permissions))),
+        )
+        self._permissions.invalidate_roles()
+
+    async def _session_for_check(self, session_id: str) -> UserSession | None:
+        """Get a session for a permission check, served from the cache when fresh."""
+        session = self._permissions.get_session(session_id)
+        if session is None:
+            session = await self.get_session(session_id)
+            if session is not None:
+                self._permissions.put_session(session)
+        return session
+
+    async def _role_permissions(self) -> PermissionCache:
+        """Return the permission cache, reloading the role table once per TTL."""
+        cache = self._permissions
+        if cache.roles_expired():
             rows = await self._execute(
-                "SELECT permissions FROM role_permissions WHERE role = ?",
-                (role,),
-                commit=False,
+                "SELECT role, permissions FROM role_permissions", commit=False
             )
-            if rows:
-                perms = json.loads(rows[0]["permissions"])
-                if permission in perms:
-                    return True
-        resource_perms = session.metadata.get("permissions", {})
-        resource_key = f"{resource_type}:{resource_id}"
-        if resource_key in resource_perms:
-            return permission in resource_perms[resource_key]
-        return False
+            cache.load_roles({r["role"]: json.loads(r["permissions"]) for r in rows})
+        return cache
 
 
 class SqliteChatStore(SqliteStateBackend, ChatStore):
     """SQLite-backed chat store with audit trail."""
 
     async def save_thread(self, widget_id: str, thread: Any) -> None:
+        # Upsert rather than INSERT OR REPLACE: REPLACE deletes the row first,
+        # which cascades to the thread's messages.
         await self._execute(
-            "INSERT OR REPLACE INTO threads "
+            "INSERT INTO threads "
             "(thread_id, widget_id, title, status, created_at, updated_at, metadata) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(thread_id) DO UPDATE SET "
+            "widget_id = excluded.widget_id, title = excluded.title, "
+            "status = excluded.status, updated_at = excluded.updated_at, "
+            "metadata = excluded.metadata",
             (
                 thread.thread_id,
                 widget_id,
@@ -687,6 +769,18 @@ class SqliteChatStore(SqliteStateBackend, ChatStore):
             (thread_id, widget_id),
         )
 
+    async def truncate_messages(self, widget_id: str, thread_id: str, from_id: str) -> bool:
+        # One statement, ordered like get_messages (timestamp, then insertion)
+        rows = await self._execute(
+            "DELETE FROM messages WHERE thread_id = ? AND widget_id = ? "
+            "AND (timestamp, rowid) >= "
+            "(SELECT timestamp, rowid FROM messages "
+            "WHERE message_id = ? AND thread_id = ? AND widget_id = ?) "
+            "RETURNING message_id",
+            (thread_id, widget_id, from_id, thread_id, widget_id),
+        )
+        return len(rows) > 0
+
     async def log_tool_call(
         self,
         message_id: str,
@@ -10,9 +10,20 @@ All mixins assume the consuming class implements:
 
 from __future__ import annotations
 
+import datetime
+import decimal
 import json
+import math
 
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+from .utils.typed_arrays import to_typed_array
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .ticker_board import TickerBoard
 
 
 # Sentinel value to distinguish "not passed" from "passed as None"
@@ -76,19 +87,60 @@ class EmittingWidget:
         self.emit("pywry:alert", payload)
 
 
-def _normalize_figure(figure: Any) -> dict[str, Any]:
+def _to_jsonable(value: Any, typed_arrays: bool = False) -> Any:  # noqa: PLR0911
+    """Convert a nested structure into JSON-native values in a single walk.
+
+    numpy arrays and scalars, pandas objects, datetimes and decimals are
+    converted the way Plotly's JSON encoder would; non-finite floats
+    become ``None`` so the result is valid strict JSON.  With
+    ``typed_arrays`` numeric numpy arrays become typed-array specs
+    (``{"dtype", "bdata"}``) instead of number lists.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if value is None or isinstance(value, (str, int)):
+        return value
+    if isinstance(value, dict):
+        return {k: _to_jsonable(v, typed_arrays) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v, typed_arrays) for v in value]
+    if type(value).__name__ == "NaTType":
+        return None
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, decimal.Decimal):
+        return _to_jsonable(float(value))
+    if typed_arrays and (spec := to_typed_array(value)) is not None:
+        return spec
+    if getattr(getattr(value, "dtype", None), "kind", None) == "M":
+        # datetime64[ns].tolist() yields ints; microseconds yield datetimes
+        value = value.astype("datetime64[us]")
+    tolist = getattr(value, "tolist", None)
+    if callable(tolist):
+        return _to_jsonable(tolist())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _normalize_figure(figure: Any, typed_arrays: bool = False) -> dict[str, Any]:
     """Normalize a Plotly Figure or dict into a pure JSON-serializable dictionary.
 
-    Uses Plotly's to_json() when available to ensure numpy arrays are converted
-    to lists and all values are JSON-serializable.
+    Figures are converted with ``to_dict()`` (which already packs numeric
+    numpy arrays as typed-array ``bdata``) and the remaining numpy,
+    pandas and datetime leaves are converted in one walk, so the figure
+    is never serialized to a JSON string and parsed back.  Dicts are
+    returned as-is unless ``typed_arrays`` is set, in which case their
+    numpy arrays are packed as typed-array specs too.
     """
+    to_dict = getattr(figure, "to_dict", None)
+    fig_dict = to_dict() if callable(to_dict) else None
+    if isinstance(fig_dict, dict):
+        return _to_jsonable(fig_dict, typed_arrays)
     if hasattr(figure, "to_json"):
-        # Use to_json for proper numpy array handling, then parse back
         return json.loads(figure.to_json())
-    if hasattr(figure, "to_dict"):
-        return figure.to_dict()
     if isinstance(figure, dict):
-        return figure
+        return _to_jsonable(figure, typed_arrays=True) if typed_arrays else figure
     try:
         # Fallback for JSON strings
         return json.loads(str(figure))
@@ -96,6 +148,159 @@ def _normalize_figure(figure: Any) -> dict[str, Any]:
         raise ValueError("Invalid figure format. Expected Plotly Figure, dict, or JSON.") from e
 
 
+def _figure_patch(
+    previous: dict[str, Any], data: list[dict[str, Any]], layout: dict[str, Any]
+) -> dict[str, Any]:
+    """Compute the traces and top-level layout keys that differ from ``previous``.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``traceIndices``/``traces`` for changed or added traces,
+        ``numTraces`` and ``layout`` with changed keys (``None`` marks a
+        removed key).  Empty when nothing changed.
+    """
+    old_data = previous.get("data", [])
+    old_layout = previous.get("layout", {})
+    indices = [i for i, trace in enumerate(data) if i >= len(old_data) or old_data[i] != trace]
+    layout_patch: dict[str, Any] = {
+        k: v for k, v in layout.items() if k not in old_layout or old_layout[k] != v
+    }
+    layout_patch.update({k: None for k in old_layout if k not in layout})
+    if not indices and not layout_patch and len(data) == len(old_data):
+        return {}
+    return {
+        "traceIndices": indices,
+        "traces": [data[i] for i in indices],
+        "numTraces": len(data),
+        "layout": layout_patch,
+    }
+
+
+def _grid_records(rows: Any) -> list[dict[str, Any]]:
+    """Return ``rows`` as a list of JSON-ready row dicts (DataFrames included)."""
+    if rows is None:
+        return []
+    if callable(getattr(rows, "to_dict", None)) and hasattr(rows, "columns"):
+        from .grid import _serialize_row
+
+        return [_serialize_row(row) for row in rows.to_dict(orient="records")]
+    return list(rows)
+
+
+def _plain_value(value: Any) -> Any:
+    """Return ``value`` as ``_serialize_value`` would, skipping it for native scalars."""
+    kind = type(value)
+    if kind is float:
+        return None if math.isnan(value) else value
+    if value is None or kind is str or kind is int or kind is bool:
+        return value
+    from .grid import _serialize_value
+
+    return _serialize_value(value)
+
+
+def _row_snapshot(keys: tuple[Any, ...], values: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Return what ``diff_update`` compares to detect a changed row.
+
+    The JSON-ready values are kept and compared as they are, with their
+    types, since hashes collide (``hash(-1) == hash(-2)``) and ``1``,
+    ``1.0`` and ``True`` compare equal but serialize differently.  Lists
+    and dicts are kept as canonical JSON so later in-place edits are seen.
+    """
+    types = tuple(map(type, values))
+    if list in types or dict in types:
+        values = tuple(
+            json.dumps(value, sort_keys=True, default=str) if kind in (list, dict) else value
+            for value, kind in zip(values, types, strict=True)
+        )
+    return keys, values, types
+
+
+def _record_snapshot(row: dict[str, Any]) -> tuple[Any, ...]:
+    """Snapshot a row in its JSON-ready form."""
+    return _row_snapshot(tuple(row), tuple(map(_plain_value, row.values())))
+
+
+def _plain_column(series: Any) -> list[Any]:
+    """Return a DataFrame column as the JSON-ready values ``_plain_value`` gives."""
+    values = series.tolist()
+    kind = series.dtype.kind
+    if kind in "iub":
+        return values
+    if kind == "f":
+        return [None if math.isnan(value) else value for value in values]
+    return [_plain_value(value) for value in values]
+
+
+_NATIVE_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _plain_list(values: list[Any]) -> list[Any]:
+    """Return one column of a list of dicts as the JSON-ready values ``_plain_value`` gives."""
+    kinds = set(map(type, values))
+    if kinds <= _NATIVE_TYPES:
+        return values
+    if kinds == {float}:
+        return [None if math.isnan(value) else value for value in values]
+    return list(map(_plain_value, values))
+
+
+def _keyed_rows(data: Any, row_id_field: str) -> tuple[tuple[str, ...], list[Any], list[Any], Any]:
+    """Split ``data`` into columns, row IDs, per-row snapshots and a row materializer.
+
+    Rows are snapshotted in their JSON-ready records form, so the same
+    rows give the same snapshots whether they arrive as a DataFrame or as a list
+    of dicts.  Data is normalized column by column (lists of dicts only
+    when every row has the same keys), and DataFrame rows are converted
+    to dicts only when they are actually sent.
+
+    Returns
+    -------
+    tuple
+        ``(columns, ids, snapshots, rows_at)`` where ``rows_at(positions)``
+        returns the row dicts at those positions.
+
+    Raises
+    ------
+    ValueError
+        If ``row_id_field`` is missing from the data.
+    """
+    if callable(getattr(data, "to_dict", None)) and hasattr(data, "columns"):
+        if row_id_field not in data.columns and row_id_field in (data.index.names or ()):
+            data = data.reset_index()
+        if row_id_field not in data.columns:
+            raise ValueError(f"Row ID field {row_id_field!r} is not a DataFrame column")
+        keys = list(data.columns)
+        rows = list(zip(*(_plain_column(data[key]) for key in keys), strict=True))
+        ids = [row[keys.index(row_id_field)] for row in rows]
+
+        def frame_rows(positions: list[int]) -> list[dict[str, Any]]:
+            return [dict(zip(keys, rows[i], strict=True)) for i in positions]
+
+        names = tuple(keys)
+        snapshots = [_row_snapshot(names, row) for row in rows]
+        return tuple(str(key) for key in keys), ids, snapshots, frame_rows
+
+    records = list(data)
+    try:
+        ids = [_plain_value(row[row_id_field]) for row in records]
+    except KeyError:
+        raise ValueError(f"Row ID field {row_id_field!r} is missing from a row") from None
+
+    def record_rows(positions: list[int]) -> list[dict[str, Any]]:
+        return [records[i] for i in positions]
+
+    columns = tuple(records[0]) if records else ()
+    first = records[0].keys() if records else None
+    if any(row.keys() != first for row in records):
+        snapshots = [_record_snapshot(row) for row in records]
+    else:
+        values = zip(*(_plain_list([row[key] for row in records]) for key in columns), strict=True)
+        snapshots = [_row_snapshot(columns, row) for row in values]
+    return columns, ids, snapshots, record_rows
+
+
 class GridStateMixin(EmittingWidget):
     """Mixin for AG Grid state management."""
 
@@ -151,6 +356,7 @@ class GridStateMixin(EmittingWidget):
         self, row_id: str | int, col_id: str, value: Any, grid_id: str | None = None
     ) -> None:
         """Update a single cell value."""
+        self._forget_rows(grid_id)
         payload = {
             "rowId": row_id,
             "colId": col_id,
@@ -178,6 +384,7 @@ class GridStateMixin(EmittingWidget):
             Update strategy ('set', 'append', 'update').
             'set' replaces all data.
         """
+        self._forget_rows(grid_id)
         payload: dict[str, Any] = {"data": data, "strategy": strategy}
         if grid_id:
             payload["gridId"] = grid_id
@@ -219,6 +426,7 @@ class GridStateMixin(EmittingWidget):
 
         # Normalize data if it's a DataFrame
         if data is not None:
+            self._forget_rows(grid_id)
             to_dict = getattr(data, "to_dict", None)
             if callable(to_dict) and hasattr(data, "columns"):
                 # It's a DataFrame
@@ -238,24 +446,233 @@ class GridStateMixin(EmittingWidget):
         # Emit combined update event
         self.emit("grid:update-grid", payload)
 
+    def _sent_rows(self) -> dict[str, tuple[tuple[str, ...], dict[Any, tuple[Any, ...]]]]:
+        """Last rows sent per grid as ``(columns, {row_id: snapshot})``, used by ``diff_update``."""
+        sent: dict[str, tuple[tuple[str, ...], dict[Any, tuple[Any, ...]]]] | None = getattr(
+            self, "_grid_sent_rows", None
+        )
+        if sent is None:
+            sent = {}
+            self._grid_sent_rows = sent
+        return sent
+
+    def _forget_rows(self, grid_id: str | None) -> None:
+        """Drop the row snapshot after an update the snapshot cannot track."""
+        self._sent_rows().pop(grid_id or "", None)
+
+    def apply_transaction(
+        self,
+        add: list[dict[str, Any]] | Any | None = None,
+        update: list[dict[str, Any]] | Any | None = None,
+        remove: list[Any] | None = None,
+        grid_id: str | None = None,
+        add_index: int | None = None,
+        batch: bool = True,
+    ) -> None:
+        """Add, update and remove rows in place (AG Grid transaction).
+
+        Rows are matched by the grid's row ID, so ``update`` and ``remove``
+        require the grid to be created with ``grid_options={"rowIdField": ...}``.
+
+        Parameters
+        ----------
+        add : list[dict] | DataFrame, optional
+            Rows to insert.
+        update : list[dict] | DataFrame, optional
+            Rows to replace, matched by row ID.
+        remove : list, optional
+            Row IDs (or full row dicts) to delete.
+        grid_id : str, optional
+            The ID of the grid to update.
+        add_index : int, optional
+            Position at which ``add`` rows are inserted (default: the end).
+        batch : bool, optional
+            If True (default), queue the transaction with
+            ``applyTransactionAsync`` so bursts of ticks are applied in a
+            single render. If False, apply it synchronously.
+        """
+        self._forget_rows(grid_id)
+        self._emit_transaction(
+            _grid_records(add), _grid_records(update), list(remove or []), grid_id, add_index, batch
+        )
+
+    def diff_update(
+        self,
+        data: list[dict[str, Any]] | Any,
+        row_id_field: str,
+        grid_id: str | None = None,
+        batch: bool = True,
+    ) -> None:
+        """Send only the rows that changed since the last ``diff_update``.
+
+        Each row's JSON-ready values are compared with the snapshot of the
+        rows last sent to the grid; new, changed and vanished row IDs become a single
+        transaction. The first call for a grid, or a call whose columns
+        differ from the snapshot, replaces the whole dataset instead. Other
+        row updates (``update_data``, ``update_grid``, ``update_cell``,
+        ``apply_transaction``) reset the snapshot.
+
+        Parameters
+        ----------
+        data : list[dict] | DataFrame
+            Complete current dataset.
+        row_id_field : str
+            Column holding each row's unique ID. The grid must use the same
+            column as its ``rowIdField`` option.
+        grid_id : str, optional
+            The ID of the grid to update.
+        batch : bool, optional
+            Queue the transaction with ``applyTransactionAsync`` (default).
+
+        Raises
+        ------
+        ValueError
+            If ``row_id_field`` is missing or row IDs are not unique.
+        """
+        columns, ids, snapshots, rows_at = _keyed_rows(data, row_id_field)
+        snapshot = dict(zip(ids, snapshots, strict=True))
+        if len(snapshot) != len(ids):
+            raise ValueError(f"Row IDs in {row_id_field!r} are not unique")
+
+        sent = self._sent_rows()
+        key = grid_id or ""
+        previous = sent.get(key)
+        if previous is None or previous[0] != columns:
+            self.update_data(rows_at(list(range(len(ids)))), grid_id=grid_id)
+            sent[key] = (columns, snapshot)
+            return
+
+        old = previous[1]
+        added: list[int] = []
+        changed: list[int] = []
+        for position, (row_id, row) in enumerate(zip(ids, snapshots, strict=True)):
+            old_row = old.get(row_id)
+            if old_row is None:
+                added.append(position)
+            elif old_row != row:
+                changed.append(position)
+        removed = [row_id for row_id in old if row_id not in snapshot]
+        sent[key] = (columns, snapshot)
+        if added or changed or removed:
+            self._emit_transaction(rows_at(added), rows_at(changed), removed, grid_id, None, batch)
+
+    def _emit_transaction(
+        self,
+        add: list[dict[str, Any]],
+        update: list[dict[str, Any]],
+        remove: list[Any],
+        grid_id: str | None,
+        add_index: int | None,
+        batch: bool,
+    ) -> None:
+        payload: dict[str, Any] = {"async": batch}
+        if add:
+            payload["add"] = add
+            if add_index is not None:
+                payload["addIndex"] = add_index
+        if update:
+            payload["update"] = update
+        if remove:
+            payload["remove"] = remove
+        if grid_id:
+            payload["gridId"] = grid_id
+        self.emit("grid:apply-transaction", payload)
+
 
 class PlotlyStateMixin(EmittingWidget):
     """Mixin for Plotly chart state management."""
 
+    def _sent_figures(self) -> dict[str, dict[str, Any]]:
+        """Last full figure sent per chart, used by ``update_figure(diff=True)``."""
+        sent: dict[str, dict[str, Any]] | None = getattr(self, "_plotly_sent_figures", None)
+        if sent is None:
+            sent = {}
+            self._plotly_sent_figures = sent
+        return sent
+
+    def _forget_figure(self, chart_id: str | None) -> None:
+        """Drop the cached figure after a partial update the cache cannot track."""
+        self._sent_figures().pop(chart_id or "", None)
+
+    def _emit_figure_patch(
+        self,
+        fig_dict: dict[str, Any],
+        chart_id: str | None,
+        animate: bool,
+        config: dict[str, Any] | None,
+    ) -> bool:
+        """Emit ``plotly:patch-figure`` against the cached figure.
+
+        Returns False when no previous figure is cached for the chart.
+        """
+        data = fig_dict.get("data", [])
+        layout = fig_dict.get("layout", {})
+        sent = self._sent_figures()
+        key = chart_id or ""
+        previous = sent.get(key)
+        if previous is None:
+            return False
+        sent[key] = {"data": data, "layout": layout}
+        patch = _figure_patch(previous, data, layout)
+        if not patch and not config:
+            return True
+        payload: dict[str, Any] = {
+            "traceIndices": [],
+            "traces": [],
+            "numTraces": len(data),
+            "layout": {},
+            **patch,
+            "animate": animate,
+        }
+        if chart_id:
+            payload["chartId"] = chart_id
+        if config:
+            payload["config"] = config
+        self.emit("plotly:patch-figure", payload)
+        return True
+
     def update_figure(
         self,
         figure: Any,
         chart_id: str | None = None,
         animate: bool = False,
         config: dict[str, Any] | None = None,
+        diff: bool = False,
+        typed_arrays: bool = False,
     ) -> None:
-        """Update the entire chart figure (data and layout)."""
-        fig_dict = _normalize_figure(figure)
+        """Update the entire chart figure (data and layout).
+
+        Parameters
+        ----------
+        figure : Figure | dict
+            New Plotly figure.
+        chart_id : str, optional
+            Target chart ID.
+        animate : bool
+            Whether to animate the transition.
+        config : dict, optional
+            Plotly config to apply.
+        diff : bool
+            Send only the traces and top-level layout keys that changed
+            since the last figure sent to this chart
+            (``plotly:patch-figure``).  Falls back to a full update when
+            no previous figure is known.
+        typed_arrays : bool
+            Send numeric numpy arrays as typed-array specs (``bdata``)
+            instead of number lists.
+        """
+        fig_dict = _normalize_figure(figure, typed_arrays)
+        if diff and self._emit_figure_patch(fig_dict, chart_id, animate, config):
+            return
         payload = {
             "data": fig_dict.get("data", []),
             "layout": fig_dict.get("layout", {}),
             "animate": animate,
         }
+        self._sent_figures()[chart_id or ""] = {
+            "data": payload["data"],
+            "layout": payload["layout"],
+        }
         if chart_id:
             payload["chartId"] = chart_id
         if config:
@@ -264,6 +681,7 @@ class PlotlyStateMixin(EmittingWidget):
 
     def update_layout(self, layout: dict[str, Any], chart_id: str | None = None) -> None:
         """Update specific layout properties (Plotly.relayout)."""
+        self._forget_figure(chart_id)
         payload: dict[str, Any] = {"layout": layout}
         if chart_id:
             payload["chartId"] = chart_id
@@ -276,6 +694,7 @@ class PlotlyStateMixin(EmittingWidget):
         chart_id: str | None = None,
     ) -> None:
         """Update specific trace properties (Plotly.restyle)."""
+        self._forget_figure(chart_id)
         payload: dict[str, Any] = {"update": patch}
         if chart_id:
             payload["chartId"] = chart_id
@@ -283,6 +702,90 @@ class PlotlyStateMixin(EmittingWidget):
             payload["indices"] = indices
         self.emit("plotly:update-traces", payload)
 
+    def _emit_trace_points(
+        self,
+        event_type: str,
+        update: dict[str, Any],
+        indices: int | list[int],
+        max_points: int | dict[str, int] | None,
+        chart_id: str | None,
+    ) -> None:
+        if isinstance(indices, int):
+            indices = [indices]
+        columns = _to_jsonable(update)
+        for attr, arrays in columns.items():
+            if len(arrays) != len(indices):
+                raise ValueError(
+                    f"update[{attr!r}] has {len(arrays)} arrays for {len(indices)} trace indices"
+                )
+        self._forget_figure(chart_id)
+        payload: dict[str, Any] = {"update": columns, "indices": indices}
+        if max_points is not None:
+            payload["maxPoints"] = max_points
+        if chart_id:
+            payload["chartId"] = chart_id
+        self.emit(event_type, payload)
+
+    def extend_traces(
+        self,
+        update: dict[str, Any],
+        indices: int | list[int],
+        max_points: int | dict[str, int] | None = None,
+        chart_id: str | None = None,
+    ) -> None:
+        """Append points to existing traces (Plotly.extendTraces).
+
+        Only the new points cross the bridge, which makes this the
+        method of choice for streaming data into large traces.
+
+        Parameters
+        ----------
+        update : dict[str, Any]
+            Attribute name to one array of new values per trace, e.g.
+            ``{"x": [[4, 5]], "y": [[1.2, 1.5]]}``.  numpy arrays are
+            accepted.
+        indices : int | list[int]
+            Trace indices, one per array in each ``update`` entry.
+        max_points : int | dict[str, int], optional
+            Keep only the last ``max_points`` points of each trace
+            (per attribute when a dict), for a rolling window.
+        chart_id : str, optional
+            Target chart ID.
+
+        Raises
+        ------
+        ValueError
+            If an ``update`` entry does not have one array per index.
+        """
+        self._emit_trace_points("plotly:extend-traces", update, indices, max_points, chart_id)
+
+    def prepend_traces(
+        self,
+        update: dict[str, Any],
+        indices: int | list[int],
+        max_points: int | dict[str, int] | None = None,
+        chart_id: str | None = None,
+    ) -> None:
+        """Prepend points to existing traces (Plotly.prependTraces).
+
+        Parameters
+        ----------
+        update : dict[str, Any]
+            Attribute name to one array of new values per trace.
+        indices : int | list[int]
+            Trace indices, one per array in each ``update`` entry.
+        max_points : int | dict[str, int], optional
+            Keep only the first ``max_points`` points of each trace.
+        chart_id : str, optional
+            Target chart ID.
+
+        Raises
+        ------
+        ValueError
+            If an ``update`` entry does not have one array per index.
+        """
+        self._emit_trace_points("plotly:prepend-traces", update, indices, max_points, chart_id)
+
     def request_plotly_state(self, chart_id: str | None = None) -> None:
         """Request current chart state (viewport, zoom, selections)."""
         payload = {}
@@ -483,3 +986,32 @@ class ToolbarStateMixin(EmittingWidget):
         if toolbar_id:
             payload["toolbarId"] = toolbar_id
         self.emit("toolbar:set-values", payload)
+
+    def ticker_board(
+        self,
+        interval: float = 0.1,
+        min_interval: float = 0.0,
+        formatter: Callable[[str, Any], dict[str, Any]] | None = None,
+    ) -> TickerBoard:
+        """Create a batched, coalescing update channel for marquee ticker items.
+
+        Parameters
+        ----------
+        interval : float
+            Seconds between batched ``toolbar:marquee-set-items`` events.
+        min_interval : float
+            Minimum seconds between two updates of the same symbol.
+        formatter : Callable, optional
+            Turns ``(ticker, value)`` into payload fields; defaults to
+            :func:`pywry.ticker_board.format_quote`.
+
+        Returns
+        -------
+        TickerBoard
+            Board emitting to this widget; call ``close()`` when done.
+        """
+        from .ticker_board import TickerBoard
+
+        return TickerBoard(
+            self.emit, interval=interval, min_interval=min_interval, formatter=formatter
+        )
@@ -6,8 +6,10 @@ import datetime
 import html
 import json
 import re
+import string
 import uuid
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -33,13 +35,27 @@ from .toolbar import (
     get_toolbar_script,
     wrap_content_with_toolbars,
 )
+from .utils.typed_arrays import to_typed_array
 
 
 class _NumpyEncoder(json.JSONEncoder):
-    """JSON encoder that handles numpy arrays, scalars, and datetime types."""
+    """JSON encoder that handles numpy arrays, scalars, and datetime types.
 
-    def default(self, o: Any) -> Any:
+    Parameters
+    ----------
+    typed_arrays : bool
+        Encode numeric numpy arrays as Plotly typed-array specs
+        (``{"dtype", "bdata"}``) instead of number lists.
+    """
+
+    def __init__(self, *args: Any, typed_arrays: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.typed_arrays = typed_arrays
+
+    def default(self, o: Any) -> Any:  # noqa: PLR0911
         """Convert numpy/datetime types to JSON-serializable Python native types."""
+        if self.typed_arrays and (spec := to_typed_array(o)) is not None:
+            return spec
         # Check for numpy array (includes datetime64 arrays)
         if hasattr(o, "tolist"):
             return o.tolist()
@@ -71,6 +87,26 @@ if TYPE_CHECKING:
     from .config import AssetSettings, PyWrySettings, SecuritySettings
 
 
+@lru_cache(maxsize=16)
+def _wrap_tags(*parts: tuple[str, str]) -> str:
+    """Join ``(tag, source)`` pairs as ``<tag>source</tag>`` lines, skipping empty sources.
+
+    Memoized on the sources themselves.  Bundled assets are cached string
+    objects whose hash is computed once, so a lookup for a multi-MB library
+    is O(1), and a reloaded asset (``assets.clear_cache()``) gets a new entry.
+    """
+    return "\n".join(f"<{tag}>{source}</{tag}>" for tag, source in parts if source)
+
+
+@lru_cache(maxsize=4)
+def _read_css_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read a CSS file, memoized on its modification time and size."""
+    try:
+        return Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
 def build_csp_meta(settings: SecuritySettings | None = None) -> str:
     """Build the Content Security Policy meta tag.
 
@@ -130,31 +166,25 @@ def build_base_styles(settings: PyWrySettings | None = None) -> str:
     str
         The CSS styles wrapped in style tags.
     """
-    # Load base pywry.css
-    css = get_pywry_css()
-    result = f"<style>{css}</style>" if css else ""
-
-    # Load toast.css for notifications
-    toast_css = get_toast_css()
-    if toast_css:
-        result += f"\n<style>{toast_css}</style>"
-
-    # Load chat.css for chat widgets
-    chat_css = get_chat_css()
-    if chat_css:
-        result += f"\n<style>{chat_css}</style>"
-
-    # Load custom CSS file if specified
+    # Load custom CSS file if specified; re-read only when it changes on disk
+    custom_css = ""
     if settings and settings.theme and settings.theme.css_file:
-        css_path = Path(settings.theme.css_file)
-        if css_path.exists():
-            try:
-                custom_css = css_path.read_text(encoding="utf-8")
-                result += f"\n<style>{custom_css}</style>"
-            except OSError:
-                pass  # Silently ignore read errors
+        try:
+            stat = Path(settings.theme.css_file).stat()
+        except OSError:
+            pass  # Silently ignore missing files
+        else:
+            custom_css = _read_css_file(
+                str(settings.theme.css_file), stat.st_mtime_ns, stat.st_size
+            )
 
-    return result
+    # Base pywry.css, toast.css for notifications, chat.css for chat widgets
+    return _wrap_tags(
+        ("style", get_pywry_css()),
+        ("style", get_toast_css()),
+        ("style", get_chat_css()),
+        ("style", custom_css),
+    )
 
 
 def build_json_data_script(json_data: dict[str, Any] | None) -> str:
@@ -181,6 +211,7 @@ def build_plotly_init_script(
     figure: dict[str, Any],
     chart_id: str | None = None,
     theme: ThemeMode = ThemeMode.DARK,
+    typed_arrays: bool = False,
 ) -> str:
     """Build the Plotly initialization script and container.
 
@@ -199,6 +230,9 @@ def build_plotly_init_script(
         The unique chart ID. If None, one will be generated.
     theme : ThemeMode
         The window theme.
+    typed_arrays : bool
+        Embed numeric numpy arrays as typed-array specs (``bdata``),
+        which Plotly.js decodes natively, instead of number lists.
 
     Returns
     -------
@@ -225,7 +259,7 @@ def build_plotly_init_script(
         figure["config"] = {**default_config, **figure["config"]}
 
     # Don't modify original figure in-place - use _NumpyEncoder for numpy array support
-    fig_json = json.dumps(figure, cls=_NumpyEncoder)
+    fig_json = json.dumps(figure, cls=_NumpyEncoder, typed_arrays=typed_arrays)
 
     plotly_template = "plotly_dark" if theme == ThemeMode.DARK else "plotly_white"
 
@@ -315,20 +349,13 @@ def build_plotly_script(config: WindowConfig) -> str:
         # Assets not bundled - this should not happen in production
         raise RuntimeError("Plotly.js not found in bundled assets")
 
-    parts = [f"<script>{plotly_js}</script>"]
-
-    # Include Plotly templates (plotly_dark, plotly_white, etc.)
-    templates_js = get_plotly_templates_js()
-    if templates_js:
-        parts.append(f"<script>{templates_js}</script>")
-
-    # Include PyWry Plotly Defaults (event handling, registration logic)
-    # This is the single source of truth for all Plotly event bridging
-    plotly_defaults = get_plotly_defaults_js()
-    if plotly_defaults:
-        parts.append(f"<script>{plotly_defaults}</script>")
-
-    return "\n".join(parts)
+    # Plotly templates (plotly_dark, plotly_white, etc.), then PyWry Plotly
+    # Defaults: the single source of truth for all Plotly event bridging
+    return _wrap_tags(
+        ("script", plotly_js),
+        ("script", get_plotly_templates_js()),
+        ("script", get_plotly_defaults_js()),
+    )
 
 
 def build_aggrid_script(config: WindowConfig) -> str:
@@ -349,9 +376,6 @@ def build_aggrid_script(config: WindowConfig) -> str:
 
     aggrid_js = get_aggrid_js()
     aggrid_css = get_aggrid_css(config.aggrid_theme, config.theme)
-    aggrid_defaults_js = get_aggrid_defaults_js()
-
-    parts = []
 
     if not aggrid_js:
         raise RuntimeError("AG Grid JS not found in bundled assets")
@@ -361,14 +385,12 @@ def build_aggrid_script(config: WindowConfig) -> str:
     # JS first — AG Grid v35 embeds a base CSS block with light-theme
     # defaults inside the JS bundle.  Loading the theme CSS *after* the JS
     # ensures the dark-theme variables win via source-order specificity.
-    parts.append(f"<script>{aggrid_js}</script>")
-    parts.append(f"<style>{aggrid_css}</style>")
-
-    # Include our AG Grid defaults (context menu, column defaults, etc.)
-    if aggrid_defaults_js:
-        parts.append(f"<script>{aggrid_defaults_js}</script>")
-
-    return "\n".join(parts)
+    # Our AG Grid defaults (context menu, column defaults, etc.) come last.
+    return _wrap_tags(
+        ("script", aggrid_js),
+        ("style", aggrid_css),
+        ("script", get_aggrid_defaults_js()),
+    )
 
 
 def build_tvchart_script(config: WindowConfig) -> str:
@@ -380,13 +402,7 @@ def build_tvchart_script(config: WindowConfig) -> str:
     if not tvchart_js:
         raise RuntimeError("Lightweight Charts JS not found in bundled assets")
 
-    parts = [f"<script>{tvchart_js}</script>"]
-
-    tvchart_defaults = get_tvchart_defaults_js()
-    if tvchart_defaults:
-        parts.append(f"<script>{tvchart_defaults}</script>")
-
-    return "\n".join(parts)
+    return _wrap_tags(("script", tvchart_js), ("script", get_tvchart_defaults_js()))
 
 
 def build_custom_css(content: HtmlContent, loader: AssetLoader | None = None) -> str:
@@ -554,6 +570,9 @@ def fix_aggrid_theme_classes(content: str, theme: ThemeMode) -> str:
     str
         HTML with corrected AG Grid theme classes.
     """
+    if "ag-theme-" not in content:
+        return content
+
     is_dark = theme == ThemeMode.DARK
 
     # Pattern to match AG Grid theme classes
@@ -586,6 +605,9 @@ def fix_plotly_template(content: str, theme: ThemeMode) -> str:
     str
         HTML with corrected Plotly template references.
     """
+    if "plotly" not in content:
+        return content
+
     is_dark = theme == ThemeMode.DARK
     correct_template = "plotly_dark" if is_dark else "plotly_white"
 
@@ -616,34 +638,85 @@ def _add_theme_class_to_html_tag(html_str: str, theme_cls: str) -> str:
     return re.sub(pattern, replacer, html_str, count=1, flags=re.IGNORECASE)
 
 
-def _inject_modal_before_body_close(html_str: str, modal_html: str) -> str:
-    """Inject modal HTML before </body> tag if present."""
-    if not modal_html:
-        return html_str
-    body_close_pos = html_str.lower().find("</body>")
-    if body_close_pos != -1:
-        return html_str[:body_close_pos] + modal_html + html_str[body_close_pos:]
-    return html_str
+def _compile_skeleton(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a ``{field}`` document template into ``(literal, field)`` pairs."""
+    return tuple(
+        (literal, field) for literal, field, _spec, _conv in string.Formatter().parse(template)
+    )
 
 
-def _build_head_injection(components: dict[str, str]) -> str:
-    """Build the head injection string from components."""
-    return f"""
-        {components["csp_meta"]}
-        {components["base_styles"]}
-        {components["global_css"]}
-        {components["custom_css"]}
-        {components["plotly_script"]}
-        {components["aggrid_script"]}
-        {components["tvchart_script"]}
-        {components["json_script"]}
-        <script>{components["init_script"]}</script>
-        {components["toolbar_script"]}
-        {components["modal_scripts"]}
-        {components["global_scripts"]}
-        {components["custom_scripts"]}
-        {components["custom_init"]}
-    """
+def _fill_skeleton(
+    skeleton: tuple[tuple[str, str | None], ...], values: dict[str, str]
+) -> list[str]:
+    """Return the skeleton's literal text interleaved with the field values."""
+    parts: list[str] = []
+    for literal, field in skeleton:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    return parts
+
+
+# Document skeletons, compiled once so a build is a single join
+_HEAD_INJECTION = _compile_skeleton("""
+        {csp_meta}
+        {base_styles}
+        {global_css}
+        {custom_css}
+        {plotly_script}
+        {aggrid_script}
+        {tvchart_script}
+        {json_script}
+        <script>{init_script}</script>
+        {toolbar_script}
+        {modal_scripts}
+        {global_scripts}
+        {custom_scripts}
+        {custom_init}
+    """)
+
+_FRAGMENT_DOCUMENT = _compile_skeleton("""<!DOCTYPE html>
+<html lang="en" class="pywry-native {theme_class}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    {csp_meta}
+    <title>{title}</title>
+    {base_styles}
+    {global_css}
+    {custom_css}
+    {plotly_script}
+    {aggrid_script}
+    {tvchart_script}
+    {json_script}
+    <script>{init_script}</script>
+    {toolbar_script}
+    {modal_scripts}
+    {global_scripts}
+    {custom_scripts}
+</head>
+<body>
+    <div class="pywry-container">
+        {user_html}
+    </div>
+    {custom_init}
+    {modal_html}
+</body>
+</html>""")
+
+
+def _split_before_body_close(html_str: str, modal_html: str) -> list[str]:
+    """Return ``html_str`` as parts with modal HTML placed before </body> if present."""
+    if modal_html:
+        body_close_pos = html_str.lower().find("</body>")
+        if body_close_pos != -1:
+            return [html_str[:body_close_pos], modal_html, html_str[body_close_pos:]]
+    return [html_str]
+
+
+def _inject_modal_before_body_close(html_str: str, modal_html: str) -> str:
+    """Inject modal HTML before </body> tag if present."""
+    return "".join(_split_before_body_close(html_str, modal_html))
 
 
 def _inject_into_complete_doc(
@@ -651,22 +724,34 @@ def _inject_into_complete_doc(
 ) -> str:
     """Inject scripts into a complete HTML document."""
     user_html = _add_theme_class_to_html_tag(user_html, theme_class)
-    injection = _build_head_injection(components)
+    injection = _fill_skeleton(_HEAD_INJECTION, components)
 
     # Find the </head> tag and inject before it
-    head_close_pos = user_html.lower().find("</head>")
+    lowered = user_html.lower()
+    head_close_pos = lowered.find("</head>")
     if head_close_pos != -1:
-        user_html = _inject_modal_before_body_close(user_html, modal_html)
-        return user_html[:head_close_pos] + injection + user_html[head_close_pos:]
+        return "".join(
+            [
+                user_html[:head_close_pos],
+                *injection,
+                *_split_before_body_close(user_html[head_close_pos:], modal_html),
+            ]
+        )
 
     # No </head> found, inject at the beginning after <html>
-    html_pos = user_html.lower().find("<html")
+    html_pos = lowered.find("<html")
     if html_pos != -1:
         html_end = user_html.find(">", html_pos)
         if html_end != -1:
-            before = user_html[: html_end + 1]
-            after = _inject_modal_before_body_close(user_html[html_end + 1 :], modal_html)
-            return before + f"<head>{injection}</head>" + after
+            return "".join(
+                [
+                    user_html[: html_end + 1],
+                    "<head>",
+                    *injection,
+                    "</head>",
+                    *_split_before_body_close(user_html[html_end + 1 :], modal_html),
+                ]
+            )
     return user_html
 
 
@@ -678,34 +763,14 @@ def _build_fragment_document(
     components: dict[str, str],
 ) -> str:
     """Build a complete document wrapper for HTML fragments."""
-    return f"""<!DOCTYPE html>
-<html lang="en" class="pywry-native {theme_class}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    {components["csp_meta"]}
-    <title>{html.escape(config.title)}</title>
-    {components["base_styles"]}
-    {components["global_css"]}
-    {components["custom_css"]}
-    {components["plotly_script"]}
-    {components["aggrid_script"]}
-    {components["tvchart_script"]}
-    {components["json_script"]}
-    <script>{components["init_script"]}</script>
-    {components["toolbar_script"]}
-    {components["modal_scripts"]}
-    {components["global_scripts"]}
-    {components["custom_scripts"]}
-</head>
-<body>
-    <div class="pywry-container">
-        {user_html}
-    </div>
-    {components["custom_init"]}
-    {modal_html}
-</body>
-</html>"""
+    values = {
+        **components,
+        "theme_class": theme_class,
+        "title": html.escape(config.title),
+        "user_html": user_html,
+        "modal_html": modal_html,
+    }
+    return "".join(_fill_skeleton(_FRAGMENT_DOCUMENT, values))
 
 
 def build_html(
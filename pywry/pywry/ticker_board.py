@@ -0,0 +1,213 @@
+"""Coalesced, batched quote updates for Marquee ticker items.
+
+``TickerItem.update_payload`` produces one ``toolbar:marquee-set-item``
+event per change, so a 200-symbol quote strip ticking several times a
+second floods the emit path with tiny messages.  A :class:`TickerBoard`
+instead collects updates per symbol and, once per frame interval, emits
+a single ``toolbar:marquee-set-items`` event that the frontend applies in
+one ``requestAnimationFrame`` pass:
+
+- only the latest value per symbol is kept between flushes;
+- a symbol is re-sent at most once per ``min_interval`` seconds, its
+  newest value waiting for a later flush;
+- a payload identical to the one last sent for that symbol is dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+SET_ITEMS_EVENT = "toolbar:marquee-set-items"
+
+# Keys passed through unchanged when an update is already a ticker payload
+_PAYLOAD_KEYS = frozenset({"text", "html", "styles", "class_add", "class_remove"})
+
+
+def _format_number(value: Any, spec: str) -> str:
+    """Format numbers with ``spec``; pass preformatted strings through."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return format(value, spec)
+    return str(value)
+
+
+def format_quote(ticker: str, value: Any) -> dict[str, Any]:
+    """Build the default ticker payload for a quote update.
+
+    Parameters
+    ----------
+    ticker : str
+        Symbol, matching the item's ``data-ticker`` attribute.
+    value : Any
+        A price, a ``{"price", "change"}`` mapping, or a payload with any of
+        ``text``/``html``/``styles``/``class_add``/``class_remove``, which is
+        used as-is.
+
+    Returns
+    -------
+    dict[str, Any]
+        Payload fields for ``toolbar:marquee-set-items``, without ``ticker``.
+        Quotes with a ``change`` toggle the ``ticker-up``/``ticker-down``
+        classes.
+    """
+    if isinstance(value, dict):
+        if _PAYLOAD_KEYS.intersection(value):
+            return {key: value[key] for key in _PAYLOAD_KEYS if key in value}
+        price = value.get("price")
+        change = value.get("change")
+    else:
+        price, change = value, None
+    text = ticker if price is None else f"{ticker} {_format_number(price, ',.2f')}"
+    if change is None:
+        return {"text": text}
+    up = not str(change).startswith("-")
+    return {
+        "text": f"{text} {_format_number(change, '+,.2f')}",
+        "class_add": "ticker-up" if up else "ticker-down",
+        "class_remove": "ticker-down" if up else "ticker-up",
+    }
+
+
+class TickerBoard:
+    """Batching update channel for a board of ticker items.
+
+    Parameters
+    ----------
+    emit : Callable[[str, dict[str, Any]], None]
+        Function that sends an event to the frontend, e.g. ``widget.emit``.
+    interval : float
+        Seconds between flushes (default: 0.1). With ``0`` every
+        :meth:`update` flushes immediately and no thread is started.
+    min_interval : float
+        Minimum seconds between two updates of the same symbol
+        (default: 0, no per-symbol throttling).
+    formatter : Callable[[str, Any], dict[str, Any]] or None
+        Turns ``(ticker, value)`` into payload fields; defaults to
+        :func:`format_quote`.
+
+    Examples
+    --------
+    >>> board = TickerBoard(widget.emit, interval=0.1, min_interval=0.5)
+    >>> board.update({"AAPL": {"price": 186.25, "change": 0.75}, "MSFT": 415.8})
+    >>> board.close()
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[str, dict[str, Any]], None],
+        interval: float = 0.1,
+        min_interval: float = 0.0,
+        formatter: Callable[[str, Any], dict[str, Any]] | None = None,
+    ) -> None:
+        if interval < 0 or min_interval < 0:
+            raise ValueError("interval and min_interval must be non-negative")
+        self._emit = emit
+        self.interval = interval
+        self.min_interval = min_interval
+        self._format = formatter or format_quote
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._sent: dict[str, dict[str, Any]] = {}
+        self._sent_at: dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def update(self, updates: Mapping[str, Any]) -> None:
+        """Queue the latest value for each symbol in ``updates``.
+
+        Parameters
+        ----------
+        updates : Mapping[str, Any]
+            Symbol -> value, formatted by ``formatter``.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("TickerBoard is closed")
+            for ticker, value in updates.items():
+                self._pending[ticker] = self._format(ticker, value)
+            if self.interval > 0:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="pywry-ticker-board", daemon=True
+                    )
+                    self._thread.start()
+                self._cond.notify()
+                return
+        self.flush()
+
+    def flush(self, force: bool = False) -> int:
+        """Emit the pending updates that are due, in one event.
+
+        Parameters
+        ----------
+        force : bool
+            Also send symbols still inside their ``min_interval``.
+
+        Returns
+        -------
+        int
+            Number of ticker items sent.
+        """
+        now = time.monotonic()
+        items: list[dict[str, Any]] = []
+        with self._cond:
+            for ticker in list(self._pending):
+                sent_at = self._sent_at.get(ticker)
+                if not force and sent_at is not None and now - sent_at < self.min_interval:
+                    continue  # throttled: keep the newest value for a later flush
+                payload = self._pending.pop(ticker)
+                if self._sent.get(ticker) == payload:
+                    continue
+                self._sent[ticker] = payload
+                self._sent_at[ticker] = now
+                items.append({"ticker": ticker, **payload})
+        if items:
+            self._emit(SET_ITEMS_EVENT, {"items": items})
+        return len(items)
+
+    def reset(self) -> None:
+        """Forget what was sent, e.g. after the marquee content is replaced."""
+        with self._cond:
+            self._sent.clear()
+            self._sent_at.clear()
+
+    def close(self) -> None:
+        """Stop the flush thread and send the remaining updates."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush(force=True)
+
+    def __enter__(self) -> TickerBoard:
+        """Return the board for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the board, flushing pending updates."""
+        self.close()
+
+    def _run(self) -> None:
+        """Flush once per interval while updates are pending."""
+        next_flush = time.monotonic() + self.interval
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                delay = next_flush - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+            self.flush()
+            next_flush = time.monotonic() + self.interval
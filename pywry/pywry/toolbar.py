@@ -28,20 +28,27 @@ Usage:
 
 from __future__ import annotations
 
+import bisect
+import contextlib
 import html
 import json
+import math
 import re
+import stat
+import threading
 import uuid
 
+from collections import Counter, OrderedDict
 from collections.abc import Callable, Sequence
 from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     SecretStr,
     field_validator,
     model_validator,
@@ -302,14 +309,206 @@ def _resolve_script_content(script: str | Path | None) -> str | None:
             )
         )
     ):
-        script_path = Path(script) if isinstance(script, str) else script
-        if script_path.exists():
-            return script_path.read_text(encoding="utf-8")
-        return str(script)
+        content = _read_script_file(Path(script) if isinstance(script, str) else script)
+        return str(script) if content is None else content
 
     return str(script)
 
 
+# Maps path -> (mtime_ns, size, content) for script files
+_SCRIPT_FILE_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def _read_script_file(path: Path) -> str | None:
+    """Read a script file, reusing the previous read while its mtime and size match.
+
+    Parameters
+    ----------
+    path : Path
+        Script file path.
+
+    Returns
+    -------
+    str | None
+        File content, or ``None`` when the path is not a readable file.
+    """
+    try:
+        st = path.stat()
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    key = str(path)
+    cached = _SCRIPT_FILE_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    content = path.read_text(encoding="utf-8")
+    _SCRIPT_FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, content)
+    return content
+
+
+# =============================================================================
+# Render Cache - Rendered HTML keyed by a snapshot of the model content
+# =============================================================================
+
+_RENDER_CACHE_SIZE = 1024
+_RENDER_CACHE: OrderedDict[Any, str] = OrderedDict()
+_RENDER_LOCK = threading.Lock()
+
+# Returned by _render_key when a model holds state that cannot be snapshotted
+_UNCACHEABLE = object()
+
+
+def _render_key(value: Any) -> Any:  # noqa: PLR0911
+    """Build a hashable snapshot of a model (or field value) for the render cache.
+
+    Secret values only contribute whether they are set.
+
+    Parameters
+    ----------
+    value : Any
+        Model or field value.
+
+    Returns
+    -------
+    Any
+        Hashable key, or ``_UNCACHEABLE`` when the value holds objects whose
+        effect on the HTML cannot be captured.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bool, int, float)):
+        # Keep 1, 1.0 and True apart: they render differently
+        return (type(value), value)
+    if isinstance(value, _RenderCachedModel):
+        return value._render_snapshot()
+    if isinstance(value, BaseModel):
+        return _fields_key(value, frozenset())
+    if isinstance(value, (list, tuple)):
+        keys = tuple(_render_key(v) for v in value)
+        return _UNCACHEABLE if any(k is _UNCACHEABLE for k in keys) else keys
+    if isinstance(value, dict):
+        keys = tuple((k, _render_key(v)) for k, v in value.items())
+        return _UNCACHEABLE if any(k[1] is _UNCACHEABLE for k in keys) else keys
+    if isinstance(value, SecretStr):
+        return bool(value.get_secret_value())
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, OptionIndex) or callable(value):
+        # Option sources and handlers: keyed by identity, kept alive by the key
+        return value
+    return _UNCACHEABLE
+
+
+def _fields_key(model: BaseModel, skip: frozenset[str]) -> Any:
+    """Snapshot the fields of ``model`` except ``skip``, see :func:`_render_key`."""
+    parts: list[Any] = [type(model)]
+    for name, value in model.__dict__.items():
+        if name in skip:
+            continue
+        key = _render_key(value)
+        if key is _UNCACHEABLE:
+            return _UNCACHEABLE
+        parts.append(key)
+    return tuple(parts)
+
+
+def _cached_html(model: Any, build: Callable[..., str], *args: Any) -> str:
+    """Return ``build(*args)``, memoized on the content of ``model``.
+
+    Parameters
+    ----------
+    model : Any
+        The model being rendered.
+    build : Callable[..., str]
+        Renders the model's HTML.
+    *args : Any
+        Extra render arguments (e.g. ``parent_id``), part of the cache key.
+
+    Returns
+    -------
+    str
+        Rendered HTML.
+    """
+    key = _render_key(model)
+    if key is _UNCACHEABLE:
+        return build(*args)
+    key = (key, args)
+    with _RENDER_LOCK:
+        cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(key)
+            return cached
+    rendered = build(*args)
+    with _RENDER_LOCK:
+        _RENDER_CACHE[key] = rendered
+        if len(_RENDER_CACHE) > _RENDER_CACHE_SIZE:
+            _RENDER_CACHE.popitem(last=False)
+    return rendered
+
+
+def _render_item(item: Any, parent_id: str | None = None) -> str:
+    """Render a container child through the render cache.
+
+    ``Div`` and ``Marquee`` children receive ``parent_id`` as context.
+    """
+    if parent_id is not None and isinstance(item, (Div, Marquee)):
+        return _cached_html(item, item.build_html, parent_id)
+    return _cached_html(item, item.build_html)
+
+
+class _RenderCachedModel(BaseModel):
+    """Base for models whose HTML goes through the render cache.
+
+    The snapshot of the model's scalar fields is memoized and dropped
+    whenever a field is assigned, so keying an unchanged model is cheap.
+    Container fields (lists, dicts, nested models) can be edited in place,
+    e.g. ``select.options.append(...)``, so they are snapshotted on every
+    lookup, as are child models (``_render_children``); a change deep
+    inside a toolbar thus invalidates the toolbar without touching its
+    siblings. Script files are re-checked so editing one on disk
+    invalidates its owner.
+    """
+
+    # Fields holding child models, snapshotted on every lookup
+    _render_children: ClassVar[frozenset[str]] = frozenset()
+    # (id(__dict__), snapshot of scalar fields, names of container fields);
+    # the id check drops a memo inherited through model_copy()
+    _render_memo: tuple[int, Any, tuple[str, ...]] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, discarding the memoized render snapshot."""
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.__pydantic_private__["_render_memo"] = None
+
+    def _render_snapshot(self) -> Any:
+        """Return this model's render cache key, see :func:`_render_key`."""
+        private = self.__pydantic_private__
+        memo = private.get("_render_memo")
+        if memo is None or memo[0] != id(self.__dict__):
+            containers = tuple(
+                name
+                for name, value in self.__dict__.items()
+                if name not in self._render_children
+                and isinstance(value, (list, tuple, dict, BaseModel))
+            )
+            scalars = _fields_key(self, self._render_children.union(containers))
+            memo = private["_render_memo"] = (id(self.__dict__), scalars, containers)
+        if memo[1] is _UNCACHEABLE:
+            return _UNCACHEABLE
+        parts: list[Any] = [memo[1], memo[2]]
+        for name in (*memo[2], *self._render_children):
+            key = _render_key(self.__dict__[name])
+            if key is _UNCACHEABLE:
+                return _UNCACHEABLE
+            parts.append(key)
+        script = self.__dict__.get("script")
+        if script:
+            parts.append(_resolve_script_content(script))
+        return tuple(parts)
+
+
 class Option(BaseModel):
     """A single option for select/multiselect inputs."""
 
@@ -329,7 +528,295 @@ class Option(BaseModel):
         return self
 
 
-class ToolbarItem(BaseModel):
+def _normalize_options(v: Any) -> list[Option]:
+    """Accept a list of Option objects, dicts, or strings."""
+    if not v:
+        return []
+    result = []
+    for opt in v:
+        if isinstance(opt, Option):
+            result.append(opt)
+        elif isinstance(opt, dict):
+            result.append(Option(**opt))
+        elif isinstance(opt, str):
+            result.append(Option(label=opt, value=opt))
+        else:
+            raise TypeError(f"Invalid option type: {type(opt)}")
+    return result
+
+
+# Sorts after every string that starts with a given prefix
+_PREFIX_END = "\U0010ffff"
+_WORD_SPLIT = re.compile(r"[\W_]+")
+
+
+def _trigrams(text: str) -> set[str]:
+    """Return the distinct 3-character substrings of ``text``."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class OptionIndex:
+    """Precomputed search index over a large option list.
+
+    Backs the server-side option source of :class:`Select` and
+    :class:`MultiSelect`: the dropdown only renders a virtual-scrolling
+    shell and requests ranked pages of matches from Python as the user
+    types and scrolls.
+
+    Matches are ranked, best first:
+
+    1. label or value equal to the query;
+    2. label or value starting with the query;
+    3. any word of the label or value starting with the query;
+    4. options sharing at least ``min_similarity`` of the query's
+       trigrams (queries of three or more characters), most shared first,
+       which also catches substrings and small typos.
+
+    Ties keep the original option order. Matching is case-insensitive.
+    Prefix lookups bisect sorted key lists and the posting list of each
+    trigram is built on first use and kept.
+
+    The sorted key lists cost about 1 s per 100,000 options to build.
+    They are built by the first non-empty search, which runs on the
+    thread that handles option page requests, not on the event loop.
+    Call :meth:`build` ahead of time, for example from a worker thread,
+    to pay that cost before the first search instead.
+
+    Parameters
+    ----------
+    options : list of Option, dict, or str
+        Options to index.
+    min_similarity : float
+        Fraction of the query's trigrams an option must contain to match
+        in the trigram tier (default: 0.5).
+    cache_size : int
+        Number of recent queries whose ranked results are kept, so
+        scrolling through pages of one query does not re-rank it.
+
+    Examples
+    --------
+    >>> index = OptionIndex([Option(label=name, value=sym) for sym, name in tickers])
+    >>> options, total = index.search("micro", offset=0, limit=50)
+    """
+
+    def __init__(
+        self,
+        options: Sequence[Option | dict[str, Any] | str],
+        min_similarity: float = 0.5,
+        cache_size: int = 32,
+    ) -> None:
+        self.options: tuple[Option, ...] = tuple(_normalize_options(options))
+        self.min_similarity = min_similarity
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, Sequence[int]] = OrderedDict()
+        self._by_value = {str(opt.value): opt for opt in self.options}
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._keys: list[str] = []
+        self._key_ids: list[int] = []
+        self._words: list[str] = []
+        self._word_ids: list[int] = []
+        self._texts: list[str] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def build(self) -> None:
+        """Build the sorted key lists now; searches otherwise build them on first use."""
+        with self._build_lock:
+            if self._built:
+                return
+            self._build()
+            self._built = True
+
+    def _build(self) -> None:
+        keys: list[tuple[str, int]] = []
+        words: list[tuple[str, int]] = []
+        # Label and value joined with a separator no query trigram can span
+        texts: list[str] = []
+        split = _WORD_SPLIT.split
+        for i, opt in enumerate(self.options):
+            label = opt.label.casefold()
+            value = str(opt.value).casefold()
+            keys.append((label, i))
+            text = label
+            if value != label:
+                keys.append((value, i))
+                text = f"{label}\n{value}"
+            texts.append(text)
+            words.extend((word, i) for word in set(split(text)) if word)
+        keys.sort()
+        words.sort()
+        self._texts = texts
+        self._keys = [key for key, _ in keys]
+        self._key_ids = [i for _, i in keys]
+        self._words = [word for word, _ in words]
+        self._word_ids = [i for _, i in words]
+
+    def __len__(self) -> int:
+        """Return the number of indexed options."""
+        return len(self.options)
+
+    def get(self, value: str) -> Option | None:
+        """Return the option with ``value``, or None."""
+        return self._by_value.get(value)
+
+    def label_for(self, value: str) -> str | None:
+        """Return the label of the option with ``value``, or None."""
+        opt = self._by_value.get(value)
+        return None if opt is None else opt.label
+
+    def search(self, query: str, offset: int = 0, limit: int = 50) -> tuple[list[Option], int]:
+        """Return one page of ranked matches for ``query``.
+
+        Parameters
+        ----------
+        query : str
+            Search text; an empty query matches every option in order.
+        offset : int
+            Index of the first match to return.
+        limit : int
+            Maximum number of matches to return.
+
+        Returns
+        -------
+        tuple[list[Option], int]
+            The page of options and the total number of matches.
+        """
+        ranked = self._rank(query.strip().casefold())
+        offset = max(offset, 0)
+        return [self.options[i] for i in ranked[offset : offset + max(limit, 0)]], len(ranked)
+
+    def _prefix_range(self, keys: list[str], prefix: str) -> tuple[int, int]:
+        """Return the slice of sorted ``keys`` starting with ``prefix``."""
+        lo = bisect.bisect_left(keys, prefix)
+        return lo, bisect.bisect_left(keys, prefix + _PREFIX_END, lo)
+
+    def _posting(self, gram: str) -> list[int]:
+        """Return the indices of the options containing trigram ``gram``."""
+        posting = self._postings.get(gram)
+        if posting is None:
+            posting = [i for i, text in enumerate(self._texts) if gram in text]
+            self._postings[gram] = posting
+        return posting
+
+    def _rank(self, query: str) -> Sequence[int]:
+        """Return the indices of the options matching ``query``, best first."""
+        if not query:
+            return range(len(self.options))
+        ranked = self._cache.get(query)
+        if ranked is not None:
+            with contextlib.suppress(KeyError):  # evicted by a concurrent search
+                self._cache.move_to_end(query)
+            return ranked
+        if not self._built:
+            self.build()
+
+        lo, hi = self._prefix_range(self._keys, query)
+        split = bisect.bisect_right(self._keys, query, lo, hi)
+        exact = set(self._key_ids[lo:split])
+        prefix = set(self._key_ids[split:hi]) - exact
+        lo, hi = self._prefix_range(self._words, query)
+        word_prefix = set(self._word_ids[lo:hi]) - exact - prefix
+        ranked = sorted(exact) + sorted(prefix) + sorted(word_prefix)
+
+        grams = _trigrams(query)
+        if grams:
+            # Short queries need every trigram; longer ones tolerate typos
+            required = max(min(len(grams), 2), math.ceil(self.min_similarity * len(grams)))
+            hits: Counter[int] = Counter()
+            for gram in grams:
+                hits.update(self._posting(gram))
+            seen = exact | prefix | word_prefix
+            by_count: list[list[int]] = [[] for _ in range(len(grams) + 1)]
+            for i, count in hits.items():
+                if count >= required and i not in seen:
+                    by_count[count].append(i)
+            for similar in reversed(by_count[required:]):
+                ranked.extend(sorted(similar))
+
+        self._cache[query] = ranked
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return ranked
+
+
+# Callable option source: (query, offset, limit) -> (options, total matches)
+OptionSourceFunc = Callable[[str, int, int], tuple[Sequence[Any], int]]
+
+
+def search_option_source(
+    source: OptionIndex | OptionSourceFunc, query: str, offset: int, limit: int
+) -> tuple[list[Option], int]:
+    """Return one page of options from an option source.
+
+    Parameters
+    ----------
+    source : OptionIndex or callable
+        An :class:`OptionIndex`, or a callable
+        ``(query, offset, limit) -> (options, total)`` whose options may be
+        Option objects, dicts, or strings.
+    query : str
+        Search text.
+    offset : int
+        Index of the first match to return.
+    limit : int
+        Maximum number of matches to return.
+
+    Returns
+    -------
+    tuple[list[Option], int]
+        The page of options and the total number of matches.
+    """
+    if isinstance(source, OptionIndex):
+        return source.search(query, offset, limit)
+    options, total = source(query, offset, limit)
+    return _normalize_options(options), total
+
+
+def _coerce_option_source(v: Any) -> Any:
+    """Index a plain option list; pass indexes, callables, and None through."""
+    if isinstance(v, (list, tuple)):
+        return OptionIndex(v)
+    return v
+
+
+def _option_labels(
+    source: OptionIndex | OptionSourceFunc | None, options: list[Option], values: list[str]
+) -> list[str]:
+    """Return the display label of each value.
+
+    Labels come from the source's ``label_for(value)`` hook when it has
+    one (:class:`OptionIndex` does; callables may set it as an attribute),
+    then from the static ``options``, and fall back to the value itself.
+    """
+    label_for = getattr(source, "label_for", None)
+    by_value = {str(opt.value): opt.label for opt in options}
+    labels = []
+    for value in values:
+        label = label_for(value) if callable(label_for) else None
+        if label is None:
+            label = by_value.get(value, value)
+        labels.append(str(label))
+    return labels
+
+
+# Virtual-scrolling container filled by toolbar-handlers.js from option pages
+_OPTION_VIEWPORT_HTML = (
+    '<div class="{cls} pywry-option-viewport">'
+    '<div class="pywry-option-spacer"></div>'
+    '<div class="pywry-option-rows"></div>'
+    "</div>"
+)
+
+
+def _option_source_attrs(item: Select | MultiSelect) -> str:
+    """Build the data attributes that switch a dropdown to server-side options."""
+    return (
+        f' data-option-source="server" data-page-size="{item.page_size}"'
+        f' data-debounce="{item.debounce}"'
+    )
+
+
+class ToolbarItem(_RenderCachedModel):
     """Base class for all toolbar items.
 
     Attributes
@@ -487,6 +974,19 @@ class Select(ToolbarItem):
         Currently selected value.
     searchable : bool
         Enable search input to filter options (default: False).
+    option_source : OptionIndex, callable, list, or None
+        Serve options from Python instead of rendering them. A list of
+        options is indexed with :class:`OptionIndex`; a callable is called
+        as ``(query, offset, limit) -> (options, total)``. The dropdown then
+        renders only a searchable, virtually scrolled shell and requests
+        ranked pages through ``{event}:options`` events. Selected labels
+        come from the source's ``label_for(value)`` attribute if it has
+        one, then from ``options``, else the value itself is shown.
+    page_size : int
+        Options per page requested from ``option_source`` (default: 50).
+    debounce : int
+        Milliseconds to wait after typing before searching ``option_source``
+        (default: 150).
 
     Examples
     --------
@@ -500,8 +1000,14 @@ class Select(ToolbarItem):
     ...     selected="dark",
     ...     searchable=True,
     ... )
+
+    Large option lists are searched server-side:
+
+    >>> Select(label="Symbol:", event="symbol:pick", option_source=all_symbols)
     """
 
+    model_config = {"arbitrary_types_allowed": True}
+
     type: Literal["select"] = "select"
     options: list[Option] = Field(default_factory=list)
     selected: str = ""
@@ -509,65 +1015,69 @@ class Select(ToolbarItem):
         default=False,
         description="Enable search input to filter dropdown options",
     )
+    option_source: OptionIndex | OptionSourceFunc | None = Field(default=None, exclude=True)
+    page_size: int = Field(default=50, ge=1, le=1000)
+    debounce: int = Field(default=150, ge=0)
 
     @field_validator("options", mode="before")
     @classmethod
     def normalize_options(cls, v: Any) -> list[Option]:
         """Accept list of dicts or Option objects."""
-        if not v:
-            return []
-        result = []
-        for opt in v:
-            if isinstance(opt, Option):
-                result.append(opt)
-            elif isinstance(opt, dict):
-                result.append(Option(**opt))
-            elif isinstance(opt, str):
-                result.append(Option(label=opt, value=opt))
-            else:
-                raise TypeError(f"Invalid option type: {type(opt)}")
-        return result
+        return _normalize_options(v)
+
+    @field_validator("option_source", mode="before")
+    @classmethod
+    def index_option_source(cls, v: Any) -> Any:
+        """Index a plain option list for server-side search."""
+        return _coerce_option_source(v)
 
     def build_html(self) -> str:
         """Build custom dropdown HTML (not native select, for consistent styling)."""
         disabled_attr = " pywry-disabled" if self.disabled else ""
-        searchable_class = " pywry-searchable" if self.searchable else ""
+        server_side = self.option_source is not None
+        searchable_class = " pywry-searchable" if self.searchable or server_side else ""
         title_attr = self._build_title_attr()
 
         # Find selected option label
-        selected_label = self.selected
-        for opt in self.options:
-            if str(opt.value) == self.selected:
-                selected_label = opt.label
-                break
-
-        # Build options HTML
-        options_html = "".join(
-            f'<div class="pywry-dropdown-option{" pywry-selected" if str(opt.value) == self.selected else ""}" '
-            f'data-value="{html.escape(str(opt.value))}">'
-            f"{html.escape(str(opt.label))}</div>"
-            for opt in self.options
-        )
+        (selected_label,) = _option_labels(self.option_source, self.options, [self.selected])
+
+        source_attrs = ""
+        if server_side:
+            # Options are requested page by page from the backend
+            source_attrs = _option_source_attrs(self)
+            options_html = ""
+        else:
+            options_html = "".join(
+                f'<div class="pywry-dropdown-option{" pywry-selected" if str(opt.value) == self.selected else ""}" '
+                f'data-value="{html.escape(str(opt.value))}">'
+                f"{html.escape(str(opt.label))}</div>"
+                for opt in self.options
+            )
 
         # Search header (if searchable)
         search_header = ""
-        if self.searchable:
+        if self.searchable or server_side:
             search_input = SearchInput(placeholder="Search...")
             search_header = (
                 f'<div class="pywry-select-header">{search_input.build_inline_html()}</div>'
             )
 
         # Custom dropdown structure
+        options_container = (
+            _OPTION_VIEWPORT_HTML.format(cls="pywry-select-options")
+            if server_side
+            else f'<div class="pywry-select-options">{options_html}</div>'
+        )
         dropdown_html = (
             f'<div class="pywry-dropdown{searchable_class}{disabled_attr}" id="{self.component_id}" '
-            f'data-event="{self.event}"{title_attr}>'
+            f'data-event="{self.event}"{source_attrs}{title_attr}>'
             f'<div class="pywry-dropdown-selected">'
             f'<span class="pywry-dropdown-text">{html.escape(str(selected_label))}</span>'
             f'<span class="pywry-dropdown-arrow"></span>'
             f"</div>"
             f'<div class="pywry-dropdown-menu">'
             f"{search_header}"
-            f'<div class="pywry-select-options">{options_html}</div>'
+            f"{options_container}"
             f"</div>"
             f"</div>"
         )
@@ -594,6 +1104,14 @@ class MultiSelect(ToolbarItem):
         List of Option items for the dropdown.
     selected : list of str
         Currently selected values.
+    option_source : OptionIndex, callable, list, or None
+        Serve options from Python instead of rendering them; see
+        :attr:`Select.option_source`. The "All" action is not offered.
+    page_size : int
+        Options per page requested from ``option_source`` (default: 50).
+    debounce : int
+        Milliseconds to wait after typing before searching ``option_source``
+        (default: 150).
 
     Examples
     --------
@@ -605,27 +1123,26 @@ class MultiSelect(ToolbarItem):
     ... )
     """
 
+    model_config = {"arbitrary_types_allowed": True}
+
     type: Literal["multiselect"] = "multiselect"
     options: list[Option] = Field(default_factory=list)
     selected: list[str] = Field(default_factory=list)
+    option_source: OptionIndex | OptionSourceFunc | None = Field(default=None, exclude=True)
+    page_size: int = Field(default=50, ge=1, le=1000)
+    debounce: int = Field(default=150, ge=0)
 
     @field_validator("options", mode="before")
     @classmethod
     def normalize_options(cls, v: Any) -> list[Option]:
         """Accept list of dicts or Option objects."""
-        if not v:
-            return []
-        result = []
-        for opt in v:
-            if isinstance(opt, Option):
-                result.append(opt)
-            elif isinstance(opt, dict):
-                result.append(Option(**opt))
-            elif isinstance(opt, str):
-                result.append(Option(label=opt, value=opt))
-            else:
-                raise TypeError(f"Invalid option type: {type(opt)}")
-        return result
+        return _normalize_options(v)
+
+    @field_validator("option_source", mode="before")
+    @classmethod
+    def index_option_source(cls, v: Any) -> Any:
+        """Index a plain option list for server-side search."""
+        return _coerce_option_source(v)
 
     @field_validator("selected", mode="before")
     @classmethod
@@ -641,8 +1158,13 @@ class MultiSelect(ToolbarItem):
         disabled_attr = " pywry-disabled" if self.disabled else ""
         title_attr = self._build_title_attr()
 
+        server_side = self.option_source is not None
+
         # Build display text for selected items
-        selected_labels = [opt.label for opt in self.options if str(opt.value) in selected_set]
+        if server_side:
+            selected_labels = _option_labels(self.option_source, self.options, self.selected)
+        else:
+            selected_labels = [opt.label for opt in self.options if str(opt.value) in selected_set]
 
         if len(selected_labels) == 0:
             display_text = "Select..."
@@ -651,10 +1173,25 @@ class MultiSelect(ToolbarItem):
         else:
             display_text = f"{len(selected_labels)} selected"
 
-        # Separate options: selected first, then unselected
-        selected_opts = [opt for opt in self.options if str(opt.value) in selected_set]
-        unselected_opts = [opt for opt in self.options if str(opt.value) not in selected_set]
-        sorted_options = selected_opts + unselected_opts
+        source_attrs = ""
+        if server_side:
+            # Options are requested page by page; the frontend tracks the selection
+            selected_json = json.dumps(
+                [
+                    {"value": value, "label": label}
+                    for value, label in zip(self.selected, selected_labels, strict=True)
+                ]
+            )
+            source_attrs = (
+                f"{_option_source_attrs(self)}"
+                f' data-selected="{html.escape(selected_json, quote=True)}"'
+            )
+            sorted_options = []
+        else:
+            # Separate options: selected first, then unselected
+            selected_opts = [opt for opt in self.options if str(opt.value) in selected_set]
+            unselected_opts = [opt for opt in self.options if str(opt.value) not in selected_set]
+            sorted_options = selected_opts + unselected_opts
 
         # Build options HTML with checkboxes
         options_html_parts = []
@@ -673,27 +1210,37 @@ class MultiSelect(ToolbarItem):
 
         # Header with search (using SearchInput) and select all/none buttons
         search_input = SearchInput(placeholder="Search...")
+        all_button = (
+            ""
+            if server_side
+            else '<button type="button" class="pywry-multiselect-action" data-action="all">All</button>'
+        )
         header_html = (
             '<div class="pywry-multiselect-header">'
             f"{search_input.build_inline_html()}"
             '<div class="pywry-multiselect-actions">'
-            '<button type="button" class="pywry-multiselect-action" data-action="all">All</button>'
+            f"{all_button}"
             '<button type="button" class="pywry-multiselect-action" data-action="none">None</button>'
             "</div>"
             "</div>"
         )
 
         # Custom dropdown structure (similar to Select but with multiselect class)
+        options_container = (
+            _OPTION_VIEWPORT_HTML.format(cls="pywry-multiselect-options")
+            if server_side
+            else f'<div class="pywry-multiselect-options">{options_html}</div>'
+        )
         dropdown_html = (
             f'<div class="pywry-dropdown pywry-multiselect{disabled_attr}" id="{self.component_id}" '
-            f'data-event="{self.event}"{title_attr}>'
+            f'data-event="{self.event}"{source_attrs}{title_attr}>'
             f'<div class="pywry-dropdown-selected">'
             f'<span class="pywry-dropdown-text">{html.escape(str(display_text))}</span>'
             f'<span class="pywry-dropdown-arrow"></span>'
             f"</div>"
             f'<div class="pywry-dropdown-menu pywry-multiselect-menu">'
             f"{header_html}"
-            f'<div class="pywry-multiselect-options">{options_html}</div>'
+            f"{options_container}"
             f"</div>"
             f"</div>"
         )
@@ -1977,19 +2524,7 @@ class RadioGroup(ToolbarItem):
     @classmethod
     def normalize_options(cls, v: Any) -> list[Option]:
         """Accept list of dicts or Option objects."""
-        if not v:
-            return []
-        result = []
-        for opt in v:
-            if isinstance(opt, Option):
-                result.append(opt)
-            elif isinstance(opt, dict):
-                result.append(Option(**opt))
-            elif isinstance(opt, str):
-                result.append(Option(label=opt, value=opt))
-            else:
-                raise TypeError(f"Invalid option type: {type(opt)}")
-        return result
+        return _normalize_options(v)
 
     def build_html(self) -> str:
         """Build radio group HTML."""
@@ -2076,19 +2611,7 @@ class TabGroup(ToolbarItem):
     @classmethod
     def normalize_options(cls, v: Any) -> list[Option]:
         """Accept list of dicts or Option objects."""
-        if not v:
-            return []
-        result = []
-        for opt in v:
-            if isinstance(opt, Option):
-                result.append(opt)
-            elif isinstance(opt, dict):
-                result.append(Option(**opt))
-            elif isinstance(opt, str):
-                result.append(Option(label=opt, value=opt))
-            else:
-                raise TypeError(f"Invalid option type: {type(opt)}")
-        return result
+        return _normalize_options(v)
 
     def build_html(self) -> str:
         """Build tab group HTML."""
@@ -2188,6 +2711,7 @@ class Div(ToolbarItem):
         default=None,
         description="Nested toolbar items (supports all item types including Div)",
     )
+    _render_children: ClassVar[frozenset[str]] = frozenset({"children"})
 
     def build_html(self, parent_id: str | None = None) -> str:
         """Build div HTML with content and nested children.
@@ -2222,10 +2746,9 @@ class Div(ToolbarItem):
             for child in self.children:
                 if hasattr(child, "build_html"):
                     # Pass this div's component_id as parent context
-                    if isinstance(child, Div):
-                        children_html += child.build_html(parent_id=self.component_id)
-                    else:
-                        children_html += child.build_html()
+                    children_html += _render_item(
+                        child, self.component_id if isinstance(child, Div) else None
+                    )
 
         # Resolve own script
         script_tag = ""
@@ -2487,6 +3010,7 @@ class Marquee(ToolbarItem):
         default=None,
         description="Nested toolbar items to scroll (alternative to text)",
     )
+    _render_children: ClassVar[frozenset[str]] = frozenset({"children"})
 
     @model_validator(mode="after")
     def validate_content(self) -> Marquee:
@@ -2515,14 +3039,8 @@ class Marquee(ToolbarItem):
         children_html = ""
         for child in self.children:
             if hasattr(child, "build_html"):
-                # Pass context to Div children
-                if isinstance(child, Div):
-                    children_html += child.build_html(parent_id=parent_id or self.component_id)
-                elif isinstance(child, Marquee):
-                    # Nested marquees get parent context
-                    children_html += child.build_html(parent_id=parent_id or self.component_id)
-                else:
-                    children_html += child.build_html()
+                # Pass context to Div and nested Marquee children
+                children_html += _render_item(child, parent_id or self.component_id)
         return children_html
 
     def _build_inner_content(self) -> str:
@@ -2755,7 +3273,7 @@ Div.model_rebuild()
 Marquee.model_rebuild()
 
 
-class Toolbar(BaseModel):
+class Toolbar(_RenderCachedModel):
     """A toolbar container with positioned items.
 
     Attributes
@@ -2800,6 +3318,7 @@ class Toolbar(BaseModel):
     component_id: str = Field(default_factory=lambda: _generate_component_id("toolbar"))
     position: ToolbarPosition = "top"
     items: Sequence[ToolbarItemUnion] = Field(default_factory=list)
+    _render_children: ClassVar[frozenset[str]] = frozenset({"items"})
     style: str = ""
 
     # New optional parameters
@@ -2841,7 +3360,15 @@ class Toolbar(BaseModel):
         return result
 
     def build_html(self) -> str:
-        """Build complete toolbar HTML with collapsible/resizable support."""
+        """Build complete toolbar HTML with collapsible/resizable support.
+
+        Rendered HTML is cached by content: re-showing an unchanged toolbar
+        reuses it, and after a change only the modified items are rebuilt.
+        """
+        return _cached_html(self, self._build_html)
+
+    def _build_html(self) -> str:
+        """Render the toolbar, taking unchanged items from the render cache."""
         if not self.items:
             return ""
 
@@ -2849,9 +3376,9 @@ class Toolbar(BaseModel):
         item_htmls = []
         for item in self.items:
             if isinstance(item, Div):
-                item_htmls.append(item.build_html(parent_id=self.component_id))
+                item_htmls.append(_render_item(item, self.component_id))
             else:
-                item_htmls.append(item.build_html())
+                item_htmls.append(_render_item(item))
 
         # Build container classes
         classes = ["pywry-toolbar", f"pywry-toolbar-{self.position}"]
@@ -2986,6 +3513,26 @@ class Toolbar(BaseModel):
         collect_from_items(self.items)
         return secrets
 
+    def get_option_source_items(self) -> list[Select | MultiSelect]:
+        """Get all Select/MultiSelect items with an ``option_source`` (including nested in Divs).
+
+        Returns
+        -------
+        list[Select | MultiSelect]
+            All dropdowns whose options are served from Python.
+        """
+        found: list[Select | MultiSelect] = []
+
+        def collect_from_items(items: Sequence[ToolbarItemUnion]) -> None:
+            for item in items:
+                if isinstance(item, (Select, MultiSelect)) and item.option_source is not None:
+                    found.append(item)
+                elif isinstance(item, Div) and item.children:
+                    collect_from_items(item.children)
+
+        collect_from_items(self.items)
+        return found
+
     def register_secrets(self) -> None:
         """Register all SecretInput values in the secret registry.
 
@@ -3166,6 +3713,83 @@ def register_secret_handlers_for_toolbar(
     return registered
 
 
+def create_option_source_handler(
+    items: Sequence[Select | MultiSelect],
+    dispatch_func: Callable[[str, dict[str, Any]], None],
+) -> Callable[[dict[str, Any], str, str], None]:
+    """Create the handler answering ``{event}:options`` page requests.
+
+    Parameters
+    ----------
+    items : Sequence[Select | MultiSelect]
+        Dropdowns sharing one event, each with an ``option_source``.
+    dispatch_func : Callable
+        Function to dispatch events to frontend: dispatch(event_type, data)
+
+    Returns
+    -------
+    Callable[[dict[str, Any], str, str], None]
+        Handler that looks up the requesting component by ``componentId``,
+        searches its option source, and dispatches ``{event}:options-response``
+        with ``{componentId, query, offset, total, options}``.
+    """
+    by_id = {item.component_id: item for item in items}
+
+    def handler(data: dict[str, Any], event_type: str, label: str) -> None:
+        item = by_id.get(data.get("componentId", ""))
+        if item is None or item.option_source is None:
+            return
+        query = str(data.get("query", ""))
+        offset = int(data.get("offset", 0))
+        limit = min(int(data.get("limit", item.page_size)), item.page_size)
+        options, total = search_option_source(item.option_source, query, offset, limit)
+        dispatch_func(
+            f"{item.event}:options-response",
+            {
+                "componentId": item.component_id,
+                "query": query,
+                "offset": offset,
+                "total": total,
+                "options": [
+                    {"label": opt.label, "value": str(opt.value), "description": opt.description}
+                    for opt in options
+                ],
+            },
+        )
+
+    return handler
+
+
+def register_option_source_handlers_for_toolbar(
+    toolbar: Toolbar,
+    on_func: Callable[[str, Callable[..., Any]], Any],
+    dispatch_func: Callable[[str, dict[str, Any]], None],
+) -> list[str]:
+    """Register option page handlers for all server-side dropdowns in a toolbar.
+
+    Parameters
+    ----------
+    toolbar : Toolbar
+        The toolbar containing Select/MultiSelect items with ``option_source``.
+    on_func : Callable
+        Function to register event handlers: on(event_type, handler) -> Any
+    dispatch_func : Callable
+        Function to dispatch events to frontend: dispatch(event_type, data)
+
+    Returns
+    -------
+    list[str]
+        List of event types that were registered.
+    """
+    by_event: dict[str, list[Select | MultiSelect]] = {}
+    for item in toolbar.get_option_source_items():
+        by_event.setdefault(f"{item.event}:options", []).append(item)
+
+    for options_event, items in by_event.items():
+        on_func(options_event, create_option_source_handler(items, dispatch_func))
+    return list(by_event)
+
+
 _ITEM_TYPE_MAP: dict[str, type[ToolbarItem]] = {
     "button": Button,
     "select": Select,
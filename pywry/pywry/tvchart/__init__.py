@@ -1,11 +1,16 @@
 """TradingView chart package — models, normalization, toolbars, mixin, datafeed.
 
 All public symbols are re-exported here so that
-``from pywry.tvchart import ...`` works.
+``from pywry.tvchart import ...`` works.  The UDF adapter (which pulls in
+``httpx``) is loaded on first access.
 """
 
 from __future__ import annotations
 
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
 # -- config --
 from .config import (
     ChartTemplate,
@@ -71,13 +76,39 @@ from .models import (
 )
 
 # -- normalization --
-from .normalize import normalize_ohlcv
+from .normalize import encode_bars, normalize_ohlcv
 
 # -- toolbars --
 from .toolbars import build_tvchart_toolbars
 
-# -- UDF adapter --
-from .udf import QuoteData, UDFAdapter, from_udf_resolution, parse_udf_columns, to_udf_resolution
+
+# -- UDF adapter (lazy) --
+if TYPE_CHECKING:
+    from .udf import (
+        QuoteData,
+        UDFAdapter,
+        from_udf_resolution,
+        parse_udf_columns,
+        to_udf_resolution,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "QuoteData": ".udf",
+    "UDFAdapter": ".udf",
+    "from_udf_resolution": ".udf",
+    "parse_udf_columns": ".udf",
+    "to_udf_resolution": ".udf",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -136,6 +167,7 @@ __all__ = [
     "UDFAdapter",
     "WatermarkConfig",
     "build_tvchart_toolbars",
+    "encode_bars",
     "from_udf_resolution",
     "normalize_ohlcv",
     "parse_udf_columns",
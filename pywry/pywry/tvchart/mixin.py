@@ -119,6 +119,7 @@ class TVChartStateMixin(EmittingWidget):
         chart_id: str | None = None,
         series_id: str | None = None,
         fit_content: bool = True,
+        typed_arrays: bool = False,
     ) -> None:
         """Replace all bar data for a series.
 
@@ -133,8 +134,15 @@ class TVChartStateMixin(EmittingWidget):
             Series to update (defaults to 'main').
         fit_content : bool
             Whether to auto-fit the time scale after update.
+        typed_arrays : bool
+            Send bars and volume as columnar base64 typed arrays instead
+            of lists of objects.
         """
         bars, volume = self._normalize_tvchart_data(data)
+        if typed_arrays:
+            from .normalize import encode_bars
+
+            bars, volume = encode_bars(bars), encode_bars(volume)
         payload: dict[str, Any] = {"bars": bars, "fitContent": fit_content}
         if volume:
             payload["volume"] = volume
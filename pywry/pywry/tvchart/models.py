@@ -32,6 +32,9 @@ class TVChartSeriesData(BaseModel):
         Original row count before truncation.
     truncated_rows : int
         Number of rows dropped due to max_bars limit.
+    typed_arrays : bool
+        Whether the frontend payload carries bars and volume as columnar
+        typed arrays (see ``bars_payload``).
     """
 
     series_id: str
@@ -41,6 +44,31 @@ class TVChartSeriesData(BaseModel):
     has_volume: bool = False
     total_rows: int = 0
     truncated_rows: int = 0
+    typed_arrays: bool = False
+
+    def bars_payload(self) -> list[dict[str, Any]] | dict[str, Any]:
+        """Bars as sent to the frontend.
+
+        Returns
+        -------
+        list[dict] or dict
+            ``bars``, or a ``{"length", "columns"}`` block of base64
+            typed arrays when ``typed_arrays`` is set and numpy is
+            available.
+        """
+        if not self.typed_arrays:
+            return self.bars
+        from .normalize import encode_bars
+
+        return encode_bars(self.bars)
+
+    def volume_payload(self) -> list[dict[str, Any]] | dict[str, Any]:
+        """Volume bars as sent to the frontend (see ``bars_payload``)."""
+        if not self.typed_arrays:
+            return self.volume
+        from .normalize import encode_bars
+
+        return encode_bars(self.volume)
 
 
 class TVChartData(BaseModel):
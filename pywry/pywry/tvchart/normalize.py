@@ -489,11 +489,37 @@ def _handle_multiindex_columns(data: Any) -> tuple[Any, str]:  # noqa: PLR0912
     return data_copy, "single"
 
 
-def normalize_ohlcv(  # noqa: C901, PLR0912, PLR0915
+def encode_bars(bars: list[dict[str, Any]]) -> list[dict[str, Any]] | dict[str, Any]:
+    """Encode a bar list as columnar typed arrays when possible.
+
+    Each bar key becomes one base64 typed array (``i4`` for integral
+    columns such as ``time``, ``f8`` for prices), which the frontend
+    decodes back into bar objects without parsing JSON numbers.
+
+    Parameters
+    ----------
+    bars : list[dict]
+        Bars sharing the same numeric keys.
+
+    Returns
+    -------
+    list[dict] or dict
+        ``{"length": n, "columns": {key: {"dtype", "bdata"}}}``, or
+        ``bars`` unchanged when they are empty, have mixed keys or
+        non-numeric values, or numpy is not installed.
+    """
+    from ..utils.typed_arrays import encode_records
+
+    encoded = encode_records(bars)
+    return bars if encoded is None else encoded
+
+
+def normalize_ohlcv(
     data: Any,
     *,
     symbol_col: str | None = None,
     max_bars: int = 10_000,
+    typed_arrays: bool = False,
 ) -> TVChartData:
     """Convert Python data formats to normalized TVChartData.
 
@@ -505,6 +531,10 @@ def normalize_ohlcv(  # noqa: C901, PLR0912, PLR0915
         Column name for multi-series grouping.
     max_bars : int
         Maximum bars per series.
+    typed_arrays : bool
+        Mark every series so ``bars_payload()``/``volume_payload()``
+        return columnar typed arrays for the frontend.  ``bars`` and
+        ``volume`` stay plain lists either way.
 
     Returns
     -------
@@ -515,6 +545,19 @@ def normalize_ohlcv(  # noqa: C901, PLR0912, PLR0915
     ValueError
         If required columns cannot be resolved.
     """
+    chart_data = _normalize_ohlcv(data, symbol_col=symbol_col, max_bars=max_bars)
+    if typed_arrays:
+        for series in chart_data.series:
+            series.typed_arrays = True
+    return chart_data
+
+
+def _normalize_ohlcv(  # noqa: C901, PLR0912, PLR0915
+    data: Any,
+    *,
+    symbol_col: str | None,
+    max_bars: int,
+) -> TVChartData:
     if isinstance(data, TVChartData):
         return data
 
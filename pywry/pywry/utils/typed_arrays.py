@@ -0,0 +1,143 @@
+"""Binary typed-array encoding for numeric payloads.
+
+Numeric arrays can cross the bridge as Plotly's typed-array spec,
+``{"dtype": "f8", "bdata": "<base64>"}``, instead of JSON number lists.
+The base64 of the raw little-endian buffer is several times smaller than
+the decimal text and the browser decodes it without parsing numbers.
+Plotly.js understands the spec natively; the TVChart frontend decodes
+the columnar bar blocks built by :func:`encode_records`.
+
+numpy is optional: without it every encoder returns ``None`` and callers
+keep sending plain lists.
+"""
+
+from __future__ import annotations
+
+import base64
+import numbers
+import sys
+
+from typing import Any
+
+
+# numpy dtype name -> Plotly.js typed-array code
+_DTYPE_CODES: dict[str, str] = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+
+# Largest integer a float64 holds exactly (JavaScript's Number.MAX_SAFE_INTEGER)
+_MAX_SAFE_INTEGER = 2**53 - 1
+
+
+def _smallest_int_dtype(np: Any, array: Any) -> Any:
+    """Return the narrowest supported integer dtype holding every value, or None."""
+    lo, hi = int(array.min()), int(array.max())
+    for name in ("int8", "uint8", "int16", "uint16", "int32", "uint32"):
+        info = np.iinfo(name)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(name)
+    if lo >= -_MAX_SAFE_INTEGER and hi <= _MAX_SAFE_INTEGER:
+        return np.dtype("float64")
+    return None
+
+
+def to_typed_array(value: Any) -> dict[str, str] | None:
+    """Encode a numeric numpy array as a typed-array spec.
+
+    64-bit integers are narrowed to the smallest 8/16/32-bit type that
+    holds every value (Plotly.js has no BigInt arrays), falling back to
+    float64 while the values stay exactly representable.
+
+    Parameters
+    ----------
+    value : Any
+        Candidate array.
+
+    Returns
+    -------
+    dict[str, str] or None
+        ``{"dtype", "bdata"}`` plus ``"shape"`` for multi-dimensional
+        arrays, or ``None`` when ``value`` is not a non-empty integer or
+        float numpy array.
+    """
+    np = sys.modules.get("numpy")
+    if np is None or not isinstance(value, np.ndarray) or value.size == 0:
+        return None
+    kind = value.dtype.kind
+    if kind not in "iuf":
+        return None
+    if kind == "f" and value.dtype.itemsize < 4:
+        value = value.astype("float32")
+    elif value.dtype.name not in _DTYPE_CODES:
+        narrowed = _smallest_int_dtype(np, value)
+        if narrowed is None:
+            return None
+        value = value.astype(narrowed)
+    array = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("<"))
+    spec = {
+        "dtype": _DTYPE_CODES[value.dtype.name],
+        "bdata": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+    if array.ndim > 1:
+        spec["shape"] = ", ".join(str(dim) for dim in array.shape)
+    return spec
+
+
+def _is_number(value: Any) -> bool:
+    """Return whether ``value`` is a Python or numpy real number other than a bool."""
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def encode_records(records: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Encode homogeneous numeric records column by column.
+
+    Each key becomes one typed array: ``i4`` when every value is an
+    integer that fits in 32 bits (e.g. epoch-second timestamps and most
+    volumes), ``f8`` otherwise.
+
+    Parameters
+    ----------
+    records : list[dict[str, Any]]
+        Rows that all share the same keys with ``int``/``float`` values,
+        such as TVChart bars.
+
+    Returns
+    -------
+    dict[str, Any] or None
+        ``{"length": n, "columns": {key: spec}}``, or ``None`` when numpy
+        is unavailable, ``records`` is empty, or the rows are not
+        homogeneous and numeric.
+    """
+    if not records:
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    keys = records[0].keys()
+    if any(row.keys() != keys for row in records):
+        return None
+    count = len(records)
+    columns: dict[str, Any] = {}
+    for key in keys:
+        values = [row[key] for row in records]
+        if not all(_is_number(value) for value in values):
+            return None
+        column = np.fromiter(values, dtype="float64", count=count)
+        if np.all(np.isfinite(column)) and np.array_equal(column, np.trunc(column)):
+            info = np.iinfo("int32")
+            if info.min <= column.min() and column.max() <= info.max:
+                column = column.astype("int32")
+        spec = to_typed_array(column)
+        if spec is None:
+            return None
+        columns[key] = spec
+    return {"length": count, "columns": columns}
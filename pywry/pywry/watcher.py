@@ -1,14 +1,17 @@
 """File watcher for hot reload functionality.
 
-Uses watchdog for cross-platform file system monitoring with per-window debouncing.
+Uses watchdog for cross-platform file system monitoring.  Changes are
+debounced by a single scheduler thread shared by every window, so a burst
+of saves across many files and windows is delivered as one batch.
 """
 
 from __future__ import annotations
 
 import threading
+import time
 
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -31,25 +34,19 @@ class WatchedFile:
     """Information about a watched file."""
 
     path: Path
-    callback: Callable[[Path, str], None]
+    callback: Callable[..., None]
     label: str
     last_triggered: float = 0.0
-
-
-@dataclass
-class WindowDebouncer:
-    """Per-window debounce state."""
-
-    pending_paths: set[Path] = field(default_factory=set)
-    timer: threading.Timer | None = None
-    lock: threading.Lock = field(default_factory=threading.Lock)
+    batched: bool = False
 
 
 class FileWatcher:
     """Watch files for changes and trigger callbacks with debouncing.
 
-    Supports per-window debouncing so rapid saves across multiple files
-    trigger a single callback per window.
+    One scheduler thread collects changed paths for every window and
+    fires once the files have been quiet for ``debounce_ms``.  Per-file
+    callbacks receive ``(path, label)`` for each watch of a changed file;
+    batched callbacks receive every change of the flush in a single call.
     """
 
     def __init__(self, debounce_ms: int = 100) -> None:
@@ -67,8 +64,11 @@ class FileWatcher:
         # Map: path -> list of (label, callback)
         self._watches: dict[Path, list[WatchedFile]] = defaultdict(list)
 
-        # Map: label -> WindowDebouncer
-        self._debouncers: dict[str, WindowDebouncer] = {}
+        # Changed paths awaiting the shared debounce deadline (ordered set)
+        self._pending: dict[Path, None] = {}
+        self._deadline = 0.0
+        self._scheduler: threading.Thread | None = None
+        self._scheduler_cond = threading.Condition()
 
         # Map: directory -> set of watched files
         self._watched_dirs: dict[Path, set[Path]] = defaultdict(set)
@@ -92,8 +92,9 @@ class FileWatcher:
     def watch(
         self,
         path: str | Path,
-        callback: Callable[[Path, str], None],
+        callback: Callable[..., None],
         label: str,
+        batched: bool = False,
     ) -> None:
         """Watch a file for changes.
 
@@ -101,11 +102,15 @@ class FileWatcher:
         ----------
         path : str or Path
             Path to the file to watch.
-        callback : Callable[[Path, str], None]
+        callback : Callable[..., None]
             Function to call when file changes.
             Receives (path, label) as arguments.
         label : str
-            Window label for grouping debounce.
+            Window label the watch belongs to.
+        batched : bool, optional
+            Call ``callback`` once per debounce flush with a
+            ``dict[Path, list[str]]`` of every changed file it watches
+            and the labels watching it, instead of once per file and label.
         """
         resolved = Path(path).resolve()
         if not resolved.exists():
@@ -117,6 +122,7 @@ class FileWatcher:
                 path=resolved,
                 callback=callback,
                 label=label,
+                batched=batched,
             )
             self._watches[resolved].append(watched)
 
@@ -187,13 +193,6 @@ class FileWatcher:
                     if not self._watched_dirs[directory]:
                         del self._watched_dirs[directory]
 
-            # Cancel any pending debounce timer
-            if label in self._debouncers:
-                debouncer = self._debouncers[label]
-                if debouncer.timer:
-                    debouncer.timer.cancel()
-                del self._debouncers[label]
-
             debug(f"Unwatched all files for window: {label}")
 
     def start(self) -> None:
@@ -220,12 +219,7 @@ class FileWatcher:
 
         with self._lock:
             self._running = False
-
-            # Cancel all pending debounce timers
-            for debouncer in self._debouncers.values():
-                if debouncer.timer:
-                    debouncer.timer.cancel()
-            self._debouncers.clear()
+            self._stop_scheduler()
 
             if self._observer:
                 self._observer.stop()
@@ -253,64 +247,70 @@ class FileWatcher:
 
     def _on_file_change(self, path: Path) -> None:
         """Handle a file change event."""
-        if path not in self._watches:
+        if not self._watches.get(path):
             return
 
-        watches = self._watches[path]
-        if not watches:
-            return
+        with self._scheduler_cond:
+            self._pending[path] = None
+            self._deadline = time.monotonic() + self._debounce_sec
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(
+                    target=self._run_scheduler,
+                    name="pywry-file-watcher",
+                    daemon=True,
+                )
+                self._scheduler.start()
+            self._scheduler_cond.notify()
+
+    def _stop_scheduler(self) -> None:
+        """Drop pending changes and let the scheduler thread exit."""
+        with self._scheduler_cond:
+            self._pending.clear()
+            self._scheduler = None
+            self._scheduler_cond.notify_all()
+
+    def _run_scheduler(self) -> None:
+        """Flush pending changes once they have been quiet for the debounce time."""
+        current = threading.current_thread()
+        while True:
+            with self._scheduler_cond:
+                while self._scheduler is current and not self._pending:
+                    self._scheduler_cond.wait()
+                if self._scheduler is not current:
+                    return
+                delay = self._deadline - time.monotonic()
+                if delay > 0:
+                    self._scheduler_cond.wait(delay)
+                    continue
+                paths = list(self._pending)
+                self._pending.clear()
+            self._dispatch(paths)
+
+    def _dispatch(self, paths: list[Path]) -> None:
+        """Invoke the callbacks watching ``paths``.
+
+        Watches are re-read at flush time so subscription changes made
+        during the debounce interval are respected.
+        """
+        with self._lock:
+            watches = [watch for path in paths for watch in self._watches.get(path, ())]
 
-        # Group by label for debouncing
-        labels_to_notify: dict[str, list[WatchedFile]] = defaultdict(list)
+        batches: dict[Callable[..., None], dict[Path, list[str]]] = {}
         for watch in watches:
-            labels_to_notify[watch.label].append(watch)
-
-        for label, label_watches in labels_to_notify.items():
-            self._schedule_debounced_callback(label, path, label_watches)
-
-    def _schedule_debounced_callback(
-        self,
-        label: str,
-        path: Path,
-        watches: list[WatchedFile],
-    ) -> None:
-        """Schedule a debounced callback for a window.
-
-        Note: `watches` is currently unused as callbacks are re-fetched
-        from self._watches when the debounce timer fires. This ensures
-        any subscription changes are reflected.
-        """
-        if label not in self._debouncers:
-            self._debouncers[label] = WindowDebouncer()
-
-        debouncer = self._debouncers[label]
-
-        with debouncer.lock:
-            debouncer.pending_paths.add(path)
-
-            # Cancel existing timer
-            if debouncer.timer:
-                debouncer.timer.cancel()
-
-            # Schedule new timer
-            def fire_callback() -> None:
-                with debouncer.lock:
-                    paths = list(debouncer.pending_paths)
-                    debouncer.pending_paths.clear()
-                    debouncer.timer = None
-
-                for p in paths:
-                    if p in self._watches:
-                        for watch in self._watches[p]:
-                            if watch.label == label:
-                                try:
-                                    watch.callback(p, label)
-                                except Exception as e:
-                                    warn(f"Error in file watch callback: {e}")
-
-            debouncer.timer = threading.Timer(self._debounce_sec, fire_callback)
-            debouncer.timer.daemon = True
-            debouncer.timer.start()
+            if watch.batched:
+                changes = batches.setdefault(watch.callback, {})
+                changes.setdefault(watch.path, []).append(watch.label)
+                continue
+            try:
+                watch.callback(watch.path, watch.label)
+            except Exception as e:
+                warn(f"Error in file watch callback: {e}")
+
+        for callback, changes in batches.items():
+            try:
+                callback(changes)
+            except Exception as e:
+                warn(f"Error in file watch callback: {e}")
 
 
 class _WatchHandler(FileSystemEventHandler):
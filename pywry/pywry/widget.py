@@ -1670,6 +1670,7 @@ if HAS_ANYWIDGET:
             from .modal import Modal, wrap_content_with_modals
             from .toolbar import (
                 Toolbar,
+                register_option_source_handlers_for_toolbar,
                 register_secret_handlers_for_toolbar,
                 wrap_content_with_toolbars,
             )
@@ -1709,6 +1710,11 @@ if HAS_ANYWIDGET:
                             widget.on,
                             widget.emit,
                         )
+                        register_option_source_handlers_for_toolbar(
+                            toolbar_cfg,
+                            widget.on,
+                            widget.emit,
+                        )
 
             # Register secret handlers for modals as well
             if modals:
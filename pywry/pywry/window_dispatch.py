@@ -246,6 +246,63 @@ def get_window_property(window: Window, prop: str, args: dict[str, Any] | None =
     return getter(window)
 
 
+def get_window_properties(
+    window: Window, props: list[str] | tuple[str, ...]
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Get several properties from a WebviewWindow in one pass.
+
+    Parameters
+    ----------
+    window : Any
+        The WebviewWindow instance.
+    props : list[str] or tuple[str, ...]
+        Property names to get.
+
+    Returns
+    -------
+    tuple[dict[str, Any], dict[str, str]]
+        ``(values, errors)``: the value of every property that could be
+        read, and the error message for every one that could not.
+    """
+    values: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+    for prop in props:
+        try:
+            values[prop] = get_window_property(window, prop)
+        except Exception as e:
+            errors[prop] = str(e)
+    return values, errors
+
+
+# WindowEvent variant name -> properties whose value that event can change.
+# Used to push state for windows watched with ``window_watch``.
+STATE_EVENT_PROPERTIES: dict[str, tuple[str, ...]] = {
+    "Resized": ("inner_size", "outer_size", "is_maximized", "is_minimized", "is_fullscreen"),
+    "Moved": ("inner_position", "outer_position"),
+    "Focused": ("is_focused",),
+    "ScaleFactorChanged": ("scale_factor", "inner_size", "outer_size"),
+    "ThemeChanged": ("theme",),
+}
+
+# WindowEvent variant name -> properties too costly to read on every event.
+# A drag fires many ``Moved`` events; these are read once the events stop
+# for ``STATE_DEBOUNCE_SECONDS``.
+DEBOUNCED_EVENT_PROPERTIES: dict[str, tuple[str, ...]] = {
+    "Moved": ("current_monitor",),
+}
+STATE_DEBOUNCE_SECONDS = 0.2
+
+# Every property kept up to date for a watched window
+WATCHED_PROPERTIES: tuple[str, ...] = tuple(
+    dict.fromkeys(
+        prop
+        for table in (STATE_EVENT_PROPERTIES, DEBOUNCED_EVENT_PROPERTIES)
+        for props in table.values()
+        for prop in props
+    )
+)
+
+
 # =============================================================================
 # Method Callers - Organized by category
 # =============================================================================
@@ -29,6 +29,52 @@ if TYPE_CHECKING:
     )
 
 
+# Properties returned by ``WindowProxy.snapshot()`` when none are named.
+# Monitor enumeration is left out: it is slow and rarely changes.
+SNAPSHOT_PROPERTIES: tuple[str, ...] = (
+    "title",
+    "url",
+    "theme",
+    "scale_factor",
+    "inner_position",
+    "outer_position",
+    "inner_size",
+    "outer_size",
+    "current_monitor",
+    "is_fullscreen",
+    "is_minimized",
+    "is_maximized",
+    "is_focused",
+    "is_decorated",
+    "is_resizable",
+    "is_enabled",
+    "is_visible",
+    "is_closable",
+    "is_maximizable",
+    "is_minimizable",
+    "is_always_on_top",
+    "is_always_on_bottom",
+    "is_devtools_open",
+)
+
+
+def _convert_property(name: str, value: Any) -> Any:
+    """Convert a raw IPC property value to the type its WindowProxy property returns."""
+    from .types import Monitor, PhysicalPosition, PhysicalSize, Theme
+
+    if name == "theme":
+        return Theme(value)
+    if name in ("inner_position", "outer_position", "cursor_position"):
+        return PhysicalPosition.from_dict(value)
+    if name in ("inner_size", "outer_size"):
+        return PhysicalSize.from_dict(value)
+    if name in ("current_monitor", "primary_monitor"):
+        return Monitor.from_dict(value) if value else None
+    if name == "available_monitors":
+        return [Monitor.from_dict(m) for m in value]
+    return value
+
+
 # WindowProxy mirrors the complete pytauri.webview.WebviewWindow API.
 # The large number of methods is intentional to provide full API coverage.
 class WindowProxy:
@@ -249,6 +295,46 @@ class WindowProxy:
         result: bool = runtime.window_get(self._label, "is_devtools_open")
         return result
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # Batched and Cached Reads
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def snapshot(self, props: list[str] | tuple[str, ...] | None = None) -> dict[str, Any]:
+        """Read several properties in one IPC round trip.
+
+        Parameters
+        ----------
+        props : list[str] or tuple[str, ...], optional
+            Property names, e.g. ``["inner_size", "is_focused"]``.
+            Defaults to ``SNAPSHOT_PROPERTIES``.
+
+        Returns
+        -------
+        dict[str, Any]
+            Property name -> value, typed like the matching property.
+
+        Examples
+        --------
+        >>> state = proxy.snapshot(["inner_size", "outer_position", "is_maximized"])
+        >>> state["inner_size"].width
+        """
+        values = runtime.window_get_many(self._label, props or SNAPSHOT_PROPERTIES)
+        return {name: _convert_property(name, value) for name, value in values.items()}
+
+    def watch_state(self) -> None:
+        """Cache size, position, focus, scale and theme locally.
+
+        The subprocess pushes those properties whenever the window is
+        resized, moved, focused or re-themed, so reading them no longer
+        costs an IPC round trip.  The cache is per window label and shared
+        by every proxy for the window.
+        """
+        runtime.watch_window_state(self._label)
+
+    def unwatch_state(self) -> None:
+        """Stop caching window state; reads go back to IPC."""
+        runtime.unwatch_window_state(self._label)
+
     # ─────────────────────────────────────────────────────────────────────────
     # Window Actions (No Parameters) - Fire-and-forget
     # ─────────────────────────────────────────────────────────────────────────
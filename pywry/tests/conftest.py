@@ -888,7 +888,8 @@ def mcp_fresh_state():
     """Reset all MCP global state before and after each test.
 
     Clears the singleton app, widget registry, widget configs, pending
-    responses, pending events, and the server-side events bucket.
+    responses, pending events, ack waiters, and the server-side events
+    bucket.
     """
     from pywry.mcp import state as mcp_state
     from pywry.mcp.server import _events
@@ -898,6 +899,8 @@ def mcp_fresh_state():
     mcp_state._widget_configs.clear()
     mcp_state._pending_responses.clear()
     mcp_state._pending_events.clear()
+    mcp_state._ack_waiters.clear()
+    mcp_state._ack_listeners.clear()
     _events.clear()
     yield
     mcp_state._app = None
@@ -905,6 +908,8 @@ def mcp_fresh_state():
     mcp_state._widget_configs.clear()
     mcp_state._pending_responses.clear()
     mcp_state._pending_events.clear()
+    mcp_state._ack_waiters.clear()
+    mcp_state._ack_listeners.clear()
     _events.clear()
 
 
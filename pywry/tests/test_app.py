@@ -21,6 +21,8 @@ the test exercises:
 
 from __future__ import annotations
 
+import json
+
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -104,7 +106,7 @@ class TestConstructor:
         assert app._default_config.height == 768
 
     def test_init_with_hot_reload_flag(self):
-        with patch("pywry.app.HotReloadManager") as mock_mgr_cls:
+        with patch("pywry.hot_reload.HotReloadManager") as mock_mgr_cls:
             mock_mgr = MagicMock()
             mock_mgr_cls.return_value = mock_mgr
             app = make_app(hot_reload=True)
@@ -117,7 +119,7 @@ class TestConstructor:
         settings = PyWrySettings()
         settings.hot_reload.enabled = True
 
-        with patch("pywry.app.HotReloadManager") as mock_mgr_cls:
+        with patch("pywry.hot_reload.HotReloadManager") as mock_mgr_cls:
             mock_mgr = MagicMock()
             mock_mgr_cls.return_value = mock_mgr
             app = make_app(settings=settings)
@@ -1111,6 +1113,62 @@ class TestShowDataframe:
         with patch("pywry.app.build_html", return_value="<html>"):
             app.show_dataframe([{"a": 1}])
 
+    def _shared_frame_app(self):
+        from pywry.config import PyWrySettings
+
+        settings = PyWrySettings()
+        settings.window.shared_frame_rows = 3
+        app = make_app(settings=settings)
+        app._mode = MagicMock()
+        app._mode.show = MagicMock(return_value="lbl")
+        app._mode.get_labels = MagicMock(return_value=["lbl"])
+        return app
+
+    def test_large_frame_goes_through_shared_memory(self):
+        from pywry.shared_frame import read_chunk
+
+        app = self._shared_frame_app()
+        rows = [{"a": i, "b": f"row {i}"} for i in range(5)]
+        with (
+            patch("pywry.app.build_html", return_value="<html>") as mock_build,
+            patch("pywry.runtime.release_frame") as mock_release,
+        ):
+            app.show_dataframe(rows)
+            html = mock_build.call_args.kwargs["content"].html
+            frame, _ = app._shared_frames["lbl"]
+            try:
+                assert "row 4" not in html
+                assert json.dumps(frame.descriptor()) in html
+                assert json.loads(read_chunk(frame.name, 0)) == rows
+            finally:
+                get_registry().dispatch("lbl", "window:closed", {})
+
+        assert "lbl" not in app._shared_frames
+        mock_release.assert_called_once_with(frame.name)
+
+    def test_small_frame_is_embedded(self):
+        app = self._shared_frame_app()
+        with patch("pywry.app.build_html", return_value="<html>") as mock_build:
+            app.show_dataframe([{"a": "embedded"}])
+        assert "embedded" in mock_build.call_args.kwargs["content"].html
+        assert not getattr(app, "_shared_frames", {})
+
+    def test_reshow_releases_previous_frame(self):
+        app = self._shared_frame_app()
+        rows = [{"a": i} for i in range(3)]
+        with (
+            patch("pywry.app.build_html", return_value="<html>"),
+            patch("pywry.runtime.release_frame") as mock_release,
+        ):
+            app.show_dataframe(rows)
+            first, _ = app._shared_frames["lbl"]
+            app.show_dataframe(rows)
+            second, _ = app._shared_frames["lbl"]
+            mock_release.assert_called_once_with(first.name)
+            app.destroy()
+        assert second.name != first.name
+        assert not app._shared_frames
+
 
 # ---------------------------------------------------------------------------
 # show_tvchart
@@ -1617,7 +1675,7 @@ class TestEnableDisableHotReload:
     def test_enable_when_missing(self):
         app = make_app()
         app._hot_reload_manager = None
-        with patch("pywry.app.HotReloadManager") as mock_cls:
+        with patch("pywry.hot_reload.HotReloadManager") as mock_cls:
             mock_mgr = MagicMock()
             mock_cls.return_value = mock_mgr
             app.enable_hot_reload()
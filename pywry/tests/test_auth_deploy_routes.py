@@ -14,19 +14,22 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from pywry.auth.deploy_routes import (
-    AuthStateStore,
-    LoginRateLimiter,
-    _login_rate_limiter,
-    _pending_auth_states,
     _verify_csrf_origin,
     cleanup_expired_states,
     create_auth_router,
 )
 from pywry.auth.token_store import MemoryTokenStore
 from pywry.state.auth import AuthConfig
+from pywry.state.memory import MemoryAuthStateStore, MemoryRateLimiter
 from pywry.state.types import OAuthTokenSet
 
 
+# Login limiter and pending state shared by every router built in this module
+_login_rate_limiter = MemoryRateLimiter()
+_auth_state_store = MemoryAuthStateStore()
+_pending_auth_states = _auth_state_store._store
+
+
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
@@ -119,7 +122,9 @@ def _build_app(
             request.state.session = inject_session
             return await call_next(request)
 
-    router = create_auth_router(**deps)
+    router = create_auth_router(
+        **deps, rate_limiter=_login_rate_limiter, state_store=_auth_state_store
+    )
     app.include_router(router)
     return app, deps
 
@@ -350,7 +355,7 @@ class TestCleanupExpiredStates:
         _pending_auth_states["old"] = {"created_at": time.time() - 700}
         _pending_auth_states["fresh"] = {"created_at": time.time()}
 
-        removed = cleanup_expired_states(max_age=600.0)
+        removed = cleanup_expired_states(max_age=600.0, store=_auth_state_store)
         assert removed == 1
         assert "old" not in _pending_auth_states
         assert "fresh" in _pending_auth_states
@@ -358,7 +363,7 @@ class TestCleanupExpiredStates:
     def test_cleanup_empty(self) -> None:
         """No-op when no states exist."""
         _pending_auth_states.clear()
-        removed = cleanup_expired_states()
+        removed = cleanup_expired_states(store=_auth_state_store)
         assert removed == 0
 
     def test_admin_role_for_admin_user(self) -> None:
@@ -443,7 +448,7 @@ class TestLoginRateLimiting:
 
     def test_login_rate_limit_exceeded(self) -> None:
         """Login returns 429 after too many attempts."""
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
         app = _create_test_app()
         client = TestClient(app, follow_redirects=False)
 
@@ -457,18 +462,18 @@ class TestLoginRateLimiting:
         assert resp.status_code == 429
         assert resp.json()["error"] == "rate_limited"
 
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
 
     def test_login_within_limit(self) -> None:
         """Login succeeds within rate limit."""
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
         app = _create_test_app()
         client = TestClient(app, follow_redirects=False)
 
         resp = client.get("/auth/login")
         assert resp.status_code == 302
 
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
 
 
 # ── Unit tests: _verify_csrf_origin ─────────────────────────────────
@@ -554,34 +559,34 @@ class TestVerifyCSRFOrigin:
         )
 
 
-# ── Unit tests: LoginRateLimiter ────────────────────────────────────
+# ── Unit tests: MemoryRateLimiter ───────────────────────────────────
 
 
 class TestLoginRateLimiterEviction:
-    """Cover the eviction branch in LoginRateLimiter."""
+    """Cover the eviction branch in MemoryRateLimiter."""
 
     def test_old_entries_evicted(self) -> None:
         """Old entries fall outside the window and are popped, freeing the slot."""
-        limiter = LoginRateLimiter(max_requests=2, window_seconds=0.05)
-        assert limiter.is_allowed("1.1.1.1") is True
-        assert limiter.is_allowed("1.1.1.1") is True
+        limiter = MemoryRateLimiter(max_requests=2, window_seconds=0.05)
+        assert _run(limiter.is_allowed("1.1.1.1")) is True
+        assert _run(limiter.is_allowed("1.1.1.1")) is True
         # Now exhausted
-        assert limiter.is_allowed("1.1.1.1") is False
+        assert _run(limiter.is_allowed("1.1.1.1")) is False
         # Wait for window to pass
         time.sleep(0.1)
         # Old entries should be evicted
-        assert limiter.is_allowed("1.1.1.1") is True
+        assert _run(limiter.is_allowed("1.1.1.1")) is True
 
 
-# ── Unit tests: AuthStateStore ──────────────────────────────────────
+# ── Unit tests: MemoryAuthStateStore ────────────────────────────────
 
 
 class TestAuthStateStoreInternals:
-    """Cover internal AuthStateStore branches."""
+    """Cover internal MemoryAuthStateStore branches."""
 
     def test_eviction_on_capacity(self) -> None:
         """When at capacity, oldest entry is evicted on put()."""
-        store = AuthStateStore(max_pending=2, max_age=600.0)
+        store = MemoryAuthStateStore(max_pending=2, max_age=600.0)
         now = time.time()
         _run(store.put("a", {"created_at": now - 10, "value": "A"}))
         _run(store.put("b", {"created_at": now - 5, "value": "B"}))
@@ -593,7 +598,7 @@ class TestAuthStateStoreInternals:
 
     def test_evict_expired_internal(self) -> None:
         """_evict_expired removes entries older than max_age."""
-        store = AuthStateStore(max_pending=10, max_age=1.0)
+        store = MemoryAuthStateStore(max_pending=10, max_age=1.0)
         store._store["old"] = {"created_at": time.time() - 100}
         store._store["fresh"] = {"created_at": time.time()}
         store._evict_expired()
@@ -602,7 +607,7 @@ class TestAuthStateStoreInternals:
 
     def test_cleanup_returns_count(self) -> None:
         """cleanup() returns the number of expired entries removed."""
-        store = AuthStateStore(max_pending=10, max_age=1.0)
+        store = MemoryAuthStateStore(max_pending=10, max_age=1.0)
         # Pre-populate manually because put() itself runs _evict_expired.
         store._store["expired1"] = {"created_at": time.time() - 100}
         store._store["expired2"] = {"created_at": time.time() - 100}
@@ -612,7 +617,7 @@ class TestAuthStateStoreInternals:
 
     def test_size_returns_count(self) -> None:
         """size() returns the current number of pending states."""
-        store = AuthStateStore(max_pending=10, max_age=600.0)
+        store = MemoryAuthStateStore(max_pending=10, max_age=600.0)
         assert _run(store.size()) == 0
         _run(store.put("a", {"created_at": time.time()}))
         assert _run(store.size()) == 1
@@ -626,7 +631,7 @@ class TestLoginRedirectConfiguration:
 
     def test_login_uses_configured_redirect_uri(self) -> None:
         """If auth_redirect_uri is configured, it overrides the request-derived URI."""
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
         _pending_auth_states.clear()
         deploy = _make_mock_deploy_settings(
             auth_redirect_uri="https://my-app.example.com/auth/callback"
@@ -638,11 +643,11 @@ class TestLoginRedirectConfiguration:
         deps["provider"].build_authorize_url.assert_called_once()
         call_kwargs = deps["provider"].build_authorize_url.call_args[1]
         assert call_kwargs["redirect_uri"] == "https://my-app.example.com/auth/callback"
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
 
     def test_login_force_https_rewrites_uri(self) -> None:
         """force_https rewrites http:// to https:// for non-localhost hosts."""
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
         _pending_auth_states.clear()
         deploy = _make_mock_deploy_settings(
             force_https=True,
@@ -654,11 +659,11 @@ class TestLoginRedirectConfiguration:
         assert resp.status_code == 302
         call_kwargs = deps["provider"].build_authorize_url.call_args[1]
         assert call_kwargs["redirect_uri"].startswith("https://example.com/")
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
 
     def test_login_force_https_skips_localhost(self) -> None:
         """force_https leaves localhost http:// untouched."""
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
         _pending_auth_states.clear()
         deploy = _make_mock_deploy_settings(
             force_https=True,
@@ -670,7 +675,7 @@ class TestLoginRedirectConfiguration:
         assert resp.status_code == 302
         call_kwargs = deps["provider"].build_authorize_url.call_args[1]
         assert call_kwargs["redirect_uri"].startswith("http://localhost")
-        _login_rate_limiter.reset()
+        _run(_login_rate_limiter.reset())
 
 
 # ── /auth/callback extra branches ───────────────────────────────────
@@ -688,15 +693,13 @@ class TestCallbackPopBranch:
             "nonce": "nonce",
             "created_at": time.time(),
         }
-        # Patch AuthStateStore.pop to return None even though contains() returns True
-        from pywry.auth import deploy_routes as dr
-
-        original_pop = dr._auth_state_store.pop
+        # Patch pop to return None even though contains() returns True
+        original_pop = _auth_state_store.pop
 
         async def patched_pop(_state: str) -> dict | None:
             return None
 
-        dr._auth_state_store.pop = patched_pop  # type: ignore[assignment]
+        _auth_state_store.pop = patched_pop  # type: ignore[assignment]
         try:
             app = _create_test_app()
             client = TestClient(app, follow_redirects=False)
@@ -705,7 +708,7 @@ class TestCallbackPopBranch:
             assert resp.json()["error"] == "invalid_state"
             assert "consumed" in resp.json()["error_description"]
         finally:
-            dr._auth_state_store.pop = original_pop  # type: ignore[assignment]
+            _auth_state_store.pop = original_pop  # type: ignore[assignment]
 
 
 class TestCallbackUserInfoFailure:
@@ -0,0 +1,100 @@
+"""Benchmarks for the per-request overhead of ``AuthMiddleware``.
+
+Each request carries typical browser headers and a session cookie.  With
+the validated-session cache only the first request reaches the store, so
+the middleware must stay under ``PYWRY_AUTH_BENCH_MAX_US`` (default 50)
+microseconds per request with both the memory store and the Redis store
+on fakeredis, whose per-command overhead stands in for a network round
+trip.  Static asset requests skip the lookup and must cost no more than
+``PYWRY_AUTH_BENCH_STATIC_MAX_US`` (default 20).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from typing import Any
+
+import pytest
+
+from pywry.state.auth import AuthConfig, AuthMiddleware
+from pywry.state.memory import MemorySessionStore
+
+
+try:
+    import fakeredis.aioredis
+
+    HAS_FAKEREDIS = True
+except ImportError:
+    HAS_FAKEREDIS = False
+
+
+BENCH_REQUESTS = int(os.environ.get("PYWRY_AUTH_BENCH_REQUESTS", "5000"))
+MAX_US = float(os.environ.get("PYWRY_AUTH_BENCH_MAX_US", "50"))
+STATIC_MAX_US = float(os.environ.get("PYWRY_AUTH_BENCH_STATIC_MAX_US", "20"))
+
+_HEADERS = [
+    (b"host", b"dashboard.example.com"),
+    (b"user-agent", b"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"),
+    (b"accept", b"text/html,application/xhtml+xml,*/*;q=0.8"),
+    (b"accept-language", b"en-US,en;q=0.5"),
+    (b"cookie", b"theme=dark; pywry_session=bench-session; _ga=GA1.2.3"),
+]
+
+
+async def _app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+    pass
+
+
+def _redis_store():
+    from pywry.state.redis import RedisSessionStore
+
+    return RedisSessionStore(redis_client=fakeredis.aioredis.FakeRedis(), prefix="bench")
+
+
+@pytest.fixture(
+    params=[
+        "memory",
+        pytest.param(
+            "redis", marks=pytest.mark.skipif(not HAS_FAKEREDIS, reason="fakeredis not installed")
+        ),
+    ]
+)
+async def middleware(request) -> AuthMiddleware:
+    store = MemorySessionStore() if request.param == "memory" else _redis_store()
+    await store.create_session("bench-session", "bench-user", roles=["viewer"])
+    return AuthMiddleware(_app, store, AuthConfig(enabled=True, token_secret="bench"))
+
+
+async def _best_us_per_request(middleware: AuthMiddleware, path: str) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(BENCH_REQUESTS):
+            scope = {"type": "http", "path": path, "headers": _HEADERS, "query_string": b""}
+            await middleware(scope, None, None)
+        best = min(best, time.perf_counter() - start)
+    return best / BENCH_REQUESTS * 1e6
+
+
+async def test_session_resolved_once_and_static_skipped(middleware: AuthMiddleware) -> None:
+    for _ in range(2):  # Uncached, then cached
+        scope = {"type": "http", "path": "/widget/chart-1", "headers": _HEADERS}
+        await middleware(scope, None, None)
+        assert scope["session"].user_id == "bench-user"
+    scope = {"type": "http", "path": "/assets/plotly.js", "headers": _HEADERS}
+    await middleware(scope, None, None)
+    assert "session" not in scope
+
+
+@pytest.mark.benchmark
+async def test_session_request_overhead(middleware: AuthMiddleware) -> None:
+    per_request = await _best_us_per_request(middleware, "/widget/chart-1")
+    assert per_request <= MAX_US, f"{per_request:.1f} us/request > {MAX_US} us"
+
+
+@pytest.mark.benchmark
+async def test_static_request_overhead(middleware: AuthMiddleware) -> None:
+    per_request = await _best_us_per_request(middleware, "/assets/plotly.js")
+    assert per_request <= STATIC_MAX_US, f"{per_request:.1f} us/request > {STATIC_MAX_US} us"
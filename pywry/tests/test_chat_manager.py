@@ -20,6 +20,7 @@ Tests cover:
 - Asset injection for AG Grid / Plotly / TradingView (emit + anywidget paths)
 - @-context attachments and auto-attached widget context
 - Edit/Resend flows including provider integration
+- Persistent provider loop: connection reuse, concurrency, task cancellation
 """
 
 from __future__ import annotations
@@ -499,6 +500,7 @@ class TestChatManagerInit:
             "chat:input-response",
             "chat:edit-message",
             "chat:resend-from",
+            "chat:request-history",
         }
         assert set(cbs.keys()) == expected
 
@@ -830,6 +832,85 @@ class TestStreamCancelPaths:
         assert done
 
 
+class TestStreamBuffering:
+    """Chunk accumulation and adaptive flushing."""
+
+    def test_stream_state_accumulates_without_concatenation(self):
+        state = _StreamState("m")
+        for word in ("alpha ", "beta ", "gamma"):
+            state.append(word)
+        assert state.buffer == "alpha beta gamma"
+        assert state.buffer_len == len("alpha beta gamma")
+        assert state.take_buffer() == "alpha beta gamma"
+        assert state.buffer_len == 0
+        assert state.sent == len("alpha beta gamma")
+        state.append("!")
+        assert state.full_text == "alpha beta gamma!"
+        # Reading full_text compacts the parts so later reads are O(1)
+        assert state._parts == ["alpha beta gamma!"]
+
+    def test_chunks_carry_offsets(self, widget):
+        mgr = ChatManager(handler=echo_handler)
+        mgr.bind(widget)
+        mgr._handle_stream(iter(["ab", "cde", "f"]), "msg-1", "thread-1", threading.Event())
+        chunks = [c for c in widget.get_events("chat:stream-chunk") if not c["done"]]
+        assert [(c["offset"], c["chunk"]) for c in chunks] == [(0, "ab"), (2, "cde"), (5, "f")]
+        assert mgr._threads["thread-1"][-1]["text"] == "abcdef"
+
+    def test_offsets_round_trip_non_bmp_text(self, widget):
+        # Mirrors appendStreamChunk in chat-handlers.js, which measures in UTF-16 units
+        def append(received: bytes, chunk: str, offset: int) -> bytes:
+            units = chunk.encode("utf-16-le")
+            if 2 * offset + len(units) <= len(received):
+                return received
+            return received + units[max(len(received) - 2 * offset, 0) :]
+
+        mgr = ChatManager(handler=echo_handler)
+        mgr.bind(widget)
+        parts = ["Rocket \U0001f680", " lift", "off \U0001f30d\U0001f30e", " done"]
+        mgr._handle_stream(iter(parts), "msg-1", "thread-1", threading.Event())
+        chunks = [c for c in widget.get_events("chat:stream-chunk") if not c["done"]]
+
+        received = b""
+        for chunk in chunks + chunks[1:]:  # Replayed chunks must be dropped
+            received = append(received, chunk["chunk"], chunk["offset"])
+        assert received.decode("utf-16-le") == "".join(parts)
+
+    def test_flush_interval_defaults_to_base(self, monkeypatch):
+        monkeypatch.setattr(ChatManager, "_STREAM_FLUSH_INTERVAL", 0.030)
+        mgr = ChatManager(handler=echo_handler)
+        mgr.bind(FakeWidget())
+        assert mgr._stream_flush_interval() == pytest.approx(0.030)
+
+    def test_flush_interval_stretches_with_latency_and_backlog(self, monkeypatch):
+        monkeypatch.setattr(ChatManager, "_STREAM_FLUSH_INTERVAL", 0.030)
+        widget = FakeWidget()
+        mgr = ChatManager(handler=echo_handler)
+        mgr.bind(widget)
+        mgr._emit_latency = 0.015
+        assert mgr._stream_flush_interval() == pytest.approx(0.060)
+        widget.pending_events = ChatManager._STREAM_QUEUE_SOFT_LIMIT
+        assert mgr._stream_flush_interval() == pytest.approx(0.120)
+        widget.pending_events = 10_000
+        assert mgr._stream_flush_interval() == ChatManager._STREAM_MAX_FLUSH_INTERVAL
+
+    def test_slow_transport_batches_more_per_frame(self, monkeypatch):
+        monkeypatch.setattr(ChatManager, "_STREAM_FLUSH_INTERVAL", 0.030)
+        monkeypatch.setattr(ChatManager, "_STREAM_MAX_BUFFER", 10)
+        widget = FakeWidget()
+        mgr = ChatManager(handler=echo_handler)
+        mgr.bind(widget)
+        state = _StreamState("m")
+        state.last_flush = time.monotonic() + 60  # keep the time trigger out of the way
+        mgr._buffer_text(state, "x" * 10)
+        assert len(widget.get_events("chat:stream-chunk")) == 1
+        mgr._emit_latency = 0.030  # 4x latency -> 120 ms interval -> 40 char threshold
+        mgr._buffer_text(state, "x" * 20)
+        assert len(widget.get_events("chat:stream-chunk")) == 1
+        mgr._buffer_text(state, "x" * 20)
+        assert len(widget.get_events("chat:stream-chunk")) == 2
+
+
 # =============================================================================
 # Asset injection
 # =============================================================================
@@ -2013,6 +2094,175 @@ class TestProviderRun:
         assert offs
 
 
+class _LoopBoundClientProvider(_MinimalAsyncProvider):
+    """Provider whose client pays a handshake once per event loop.
+
+    Mimics ``AsyncOpenAI``/``AsyncAnthropic``: the HTTP pool is bound to
+    the loop that first used it, so a fresh loop per turn re-pays the
+    connection setup before the first token.
+    """
+
+    HANDSHAKE = 0.15
+
+    def __init__(self) -> None:
+        self.loops: list[asyncio.AbstractEventLoop] = []
+        self._connected: set[int] = set()
+
+    async def prompt(self, _sid, _content, _cancel_event=None):
+        loop = asyncio.get_running_loop()
+        self.loops.append(loop)
+        if id(loop) not in self._connected:
+            await asyncio.sleep(self.HANDSHAKE)
+            self._connected.add(id(loop))
+        yield AgentMessageUpdate(text="token")
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestProviderRuntime:
+    """Provider turns run as tasks on one persistent loop per manager."""
+
+    def _send(self, mgr: ChatManager, tid: str, text: str = "hi") -> None:
+        mgr._on_user_message({"text": text, "threadId": tid}, "chat:user-message", "")
+
+    def test_turns_share_one_loop(self, widget):
+        provider = _LoopBoundClientProvider()
+        mgr = ChatManager(provider=provider)
+        mgr.bind(widget)
+        tid = mgr.active_thread_id
+        for _ in range(3):
+            done_before = len(widget.get_events("chat:thinking-done"))
+            self._send(mgr, tid)
+            assert _wait_for(lambda n=done_before: len(widget.get_events("chat:thinking-done")) > n)
+        assert len(provider.loops) == 3
+        assert len(set(map(id, provider.loops))) == 1
+        assert provider.loops[0].is_running()
+        mgr.close()
+
+    def test_time_to_first_token_after_first_turn(self, widget):
+        """Later turns skip the per-loop handshake that asyncio.run() re-paid."""
+        provider = _LoopBoundClientProvider()
+        mgr = ChatManager(provider=provider)
+        mgr.bind(widget)
+        tid = mgr.active_thread_id
+
+        def _ttft() -> float:
+            widget.clear()
+            start = time.monotonic()
+            self._send(mgr, tid)
+            assert _wait_for(lambda: widget.get_events("chat:stream-chunk"))
+            return time.monotonic() - start
+
+        cold = _ttft()
+        _wait_for(lambda: widget.get_events("chat:thinking-done"))
+        warm = _ttft()
+        assert cold >= _LoopBoundClientProvider.HANDSHAKE
+        assert warm < _LoopBoundClientProvider.HANDSHAKE
+        mgr.close()
+
+    def test_concurrent_threads_generate_in_parallel(self, widget):
+        started: list[str] = []
+        release = threading.Event()
+
+        class _Provider(_MinimalAsyncProvider):
+            async def prompt(self, sid, _content, _cancel_event=None):
+                started.append(sid)
+                await asyncio.to_thread(release.wait, 5)
+                yield AgentMessageUpdate(text=f"reply-{sid}")
+
+        mgr = ChatManager(provider=_Provider())
+        mgr.bind(widget)
+        self._send(mgr, "thread_a")
+        self._send(mgr, "thread_b")
+        assert _wait_for(lambda: len(started) == 2)
+        assert set(mgr._generations) == {"thread_a", "thread_b"}
+        release.set()
+        assert _wait_for(lambda: not mgr._generations)
+        chunks = "".join(c.get("chunk", "") for c in widget.get_events("chat:stream-chunk"))
+        assert "reply-thread_a" in chunks
+        assert "reply-thread_b" in chunks
+        mgr.close()
+
+    def test_stop_cancels_task_without_next_update(self, widget):
+        """Stop interrupts a provider blocked on I/O instead of waiting for its next update."""
+        cancelled: list[str] = []
+
+        class _Provider(_MinimalAsyncProvider):
+            async def prompt(self, _sid, _content, _cancel_event=None):
+                yield AgentMessageUpdate(text="partial")
+                await asyncio.sleep(30)
+                yield AgentMessageUpdate(text="never")  # pragma: no cover
+
+            async def cancel(self, sid):
+                cancelled.append(sid)
+
+        mgr = ChatManager(provider=_Provider())
+        mgr.bind(widget)
+        tid = mgr.active_thread_id
+        self._send(mgr, tid)
+        assert _wait_for(lambda: widget.get_events("chat:stream-chunk"))
+        mgr._on_stop_generation({"threadId": tid}, "chat:stop-generation", "")
+        assert _wait_for(
+            lambda: any(c.get("stopped") for c in widget.get_events("chat:stream-chunk")),
+            timeout=1.0,
+        )
+        assert cancelled == [tid]
+        assert _wait_for(lambda: tid not in mgr._cancel_events)
+        assert mgr._threads[tid][-1] == {
+            "id": mgr._threads[tid][-1]["id"],
+            "role": "assistant",
+            "text": "partial",
+            "stopped": True,
+        }
+        mgr.close()
+
+    def test_async_handler_reuses_runtime_loop(self, widget):
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        async def handler(messages, ctx):
+            loops.append(asyncio.get_running_loop())
+            return "ok"
+
+        mgr = ChatManager(handler=handler)
+        mgr.bind(widget)
+        tid = mgr.active_thread_id
+        self._send(mgr, tid)
+        assert _wait_for(lambda: len(widget.get_events("chat:assistant-message")) == 1)
+        self._send(mgr, tid)
+        assert _wait_for(lambda: len(widget.get_events("chat:assistant-message")) == 2)
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        mgr.close()
+
+    def test_close_restarts_lazily(self, widget):
+        mgr = ChatManager(provider=_LoopBoundClientProvider())
+        mgr.bind(widget)
+        first = mgr._runtime.loop
+        mgr.close()
+        assert not mgr._runtime.running
+        second = mgr._runtime.loop
+        assert second is not first
+        assert second.is_running()
+        mgr.close()
+
+    def test_run_from_loop_thread_raises(self):
+        mgr = ChatManager(provider=_MinimalAsyncProvider())
+
+        async def _inner():
+            return mgr._runtime.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="cannot be called from the provider loop"):
+            mgr._runtime.run(_inner())
+        mgr.close()
+
+
 class TestTruncateProviderState:
     """_truncate_provider_state forwards to provider.truncate_session."""
 
@@ -2068,3 +2318,155 @@ class TestResendWithProvider:
         assert any(
             "provider-reply" in c.get("chunk", "") for c in widget.get_events("chat:stream-chunk")
         )
+
+
+# =============================================================================
+# Write-behind persistence
+# =============================================================================
+
+
+class TestPersistence:
+    """History journaled into a ChatStore, restored, and paged back in."""
+
+    @pytest.fixture
+    def store(self):
+        from pywry.state.memory import MemoryChatStore
+
+        return MemoryChatStore()
+
+    def _fill(self, mgr: ChatManager, count: int) -> str:
+        tid = mgr.active_thread_id
+        for i in range(count):
+            role = "user" if i % 2 == 0 else "assistant"
+            mgr._append_message(tid, {"id": f"m{i}", "role": role, "text": f"text {i}"})
+        return tid
+
+    def test_history_restored_after_restart(self, store):
+        mgr = ChatManager(handler=echo_handler, store=store, chat_id="app")
+        tid = self._fill(mgr, 4)
+        mgr._on_thread_rename({"threadId": tid, "title": "Kept"}, "", "")
+        mgr.close()
+
+        restored = ChatManager(handler=echo_handler, store=store, chat_id="app")
+        assert restored.active_thread_id == tid
+        assert restored._thread_titles[tid] == "Kept"
+        assert [m["text"] for m in restored.threads[tid]] == [f"text {i}" for i in range(4)]
+
+    def test_sqlite_store_round_trip(self, tmp_path):
+        from pywry.state.sqlite import SqliteChatStore
+
+        store = SqliteChatStore(db_path=tmp_path / "chat.db", encrypted=False)
+        mgr = ChatManager(handler=echo_handler, store=store)
+        tid = self._fill(mgr, 3)
+        mgr._on_thread_rename({"threadId": tid, "title": "Renamed"}, "", "")
+        mgr.close()
+
+        restored = ChatManager(handler=echo_handler, store=store)
+        assert restored._thread_titles[tid] == "Renamed"
+        assert len(restored.threads[tid]) == 3
+
+    def test_memory_window_evicts_oldest(self, store):
+        mgr = ChatManager(handler=echo_handler, store=store, history_window=3)
+        tid = self._fill(mgr, 8)
+        assert [m["id"] for m in mgr.threads[tid]] == ["m5", "m6", "m7"]
+        mgr.close()
+        restored = ChatManager(handler=echo_handler, store=store, history_window=3)
+        assert [m["id"] for m in restored.threads[tid]] == ["m5", "m6", "m7"]
+        assert tid in restored._older_available
+
+    def test_request_history_pages_from_store(self, store, widget):
+        mgr = ChatManager(handler=echo_handler, store=store, history_window=3)
+        mgr.bind(widget)
+        tid = self._fill(mgr, 8)
+        mgr._on_request_history({"threadId": tid, "beforeId": "m5", "limit": 3}, "", "")
+        page = widget.get_events("chat:history-page")[-1]
+        assert [m["id"] for m in page["messages"]] == ["m2", "m3", "m4"]
+        assert page["hasMore"] is True
+        mgr._on_request_history({"threadId": tid, "beforeId": "m2", "limit": 3}, "", "")
+        page = widget.get_events("chat:history-page")[-1]
+        assert [m["id"] for m in page["messages"]] == ["m0", "m1"]
+        assert page["hasMore"] is False
+
+    def test_request_history_without_before_id_is_ignored(self, store, widget):
+        mgr = ChatManager(handler=echo_handler, store=store)
+        mgr.bind(widget)
+        mgr._on_request_history({"threadId": mgr.active_thread_id}, "", "")
+        assert widget.get_events("chat:history-page") == []
+
+    def test_resend_of_evicted_message_reloads_history(self, store, widget):
+        mgr = ChatManager(handler=echo_handler, store=store, history_window=2)
+        mgr.bind(widget)
+        tid = self._fill(mgr, 6)
+        mgr._on_resend_from({"messageId": "m2", "threadId": tid}, "chat:resend-from", "")
+        time.sleep(0.3)
+        ids = [m["id"] for m in mgr.threads[tid]]
+        assert "m2" in ids
+        assert "m3" not in ids
+        mgr.close()
+        stored = ChatManager(handler=echo_handler, store=store, history_window=50)
+        stored_ids = [m["id"] for m in stored.threads[tid]]
+        assert stored_ids[:3] == ["m0", "m1", "m2"]
+        assert "m3" not in stored_ids
+
+    def test_truncate_of_long_thread_keeps_older_history(self, store, widget):
+        mgr = ChatManager(handler=echo_handler, store=store, chat_id="app", history_window=5)
+        mgr.bind(widget)
+        tid = self._fill(mgr, 600)
+        mgr._on_resend_from({"messageId": "m400", "threadId": tid}, "chat:resend-from", "")
+        time.sleep(0.3)
+        mgr.close()
+        stored = asyncio.run(store.get_messages("app", tid, limit=1000))
+        stored_ids = [m.message_id for m in stored]
+        assert stored_ids[:401] == [f"m{i}" for i in range(401)]
+        assert "m401" not in stored_ids
+
+    def test_truncate_with_missing_message_warns(self, store, caplog):
+        from pywry.chat.journal import ChatJournal, _JournalOp
+        from pywry.chat.models import ChatMessage, ChatThread
+
+        async def run() -> list[str]:
+            await store.save_thread("app", ChatThread(thread_id="t1", title="A"))
+            await store.append_message("app", "t1", ChatMessage(role="user", content="x"))
+            await ChatJournal(store, "app")._apply(_JournalOp("truncate", "t1", from_id="ghost"))
+            return [m.text_content() for m in await store.get_messages("app", "t1")]
+
+        with caplog.at_level("WARNING", logger="pywry.chat.journal"):
+            assert asyncio.run(run()) == ["x"]
+        assert "ghost" in caplog.text
+
+    def test_clear_and_delete_reach_store(self, store):
+        mgr = ChatManager(handler=echo_handler, store=store)
+        tid = self._fill(mgr, 2)
+        mgr._on_slash_command_event({"command": "/clear", "threadId": tid}, "", "")
+        mgr._on_thread_create({"title": "Other"}, "", "")
+        other = mgr.active_thread_id
+        mgr._on_thread_delete({"threadId": tid}, "", "")
+        mgr.close()
+        restored = ChatManager(handler=echo_handler, store=store)
+        assert list(restored.threads) == [other]
+
+    def test_journal_coalesces_superseded_writes(self):
+        from pywry.chat.journal import ChatJournal, _JournalOp
+
+        batch = [
+            _JournalOp("save", "t1", title="a"),
+            _JournalOp("save", "t1", title="b"),
+            _JournalOp("append", "t1", message={"id": "x"}),
+            _JournalOp("clear", "t1"),
+            _JournalOp("append", "t1", message={"id": "y"}),
+            _JournalOp("append", "t2", message={"id": "z"}),
+        ]
+        kept = ChatJournal._coalesce(batch)
+        assert [(op.kind, op.thread_id) for op in kept] == [
+            ("save", "t1"),
+            ("clear", "t1"),
+            ("append", "t1"),
+            ("append", "t2"),
+        ]
+        assert kept[0].title == "b"
+
+    def test_no_store_keeps_everything_in_memory(self):
+        mgr = ChatManager(handler=echo_handler, history_window=2)
+        tid = self._fill(mgr, 5)
+        assert len(mgr.threads[tid]) == 5
+        assert mgr._journal is None
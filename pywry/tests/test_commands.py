@@ -12,6 +12,7 @@ import pytest
 from pywry.commands import (
     COMMAND_HANDLERS,
     EventPayload,
+    FrameChunkPayload,
     OpenPayload,
     ResultPayload,
     dispatch_command,
@@ -323,8 +324,8 @@ class TestRegisterCommandsAsyncWrappers:
                 return deco
 
         register_commands(_CommandsStub())
-        # Should have captured the four async commands
-        assert len(captured) == 4
+        # Should have captured the five async commands
+        assert len(captured) == 5
 
         import asyncio
 
@@ -355,6 +356,17 @@ class TestRegisterCommandsAsyncWrappers:
             result = asyncio.run(captured[3](OpenPayload(target="https://x")))
         assert result["success"] is True
 
+        # pywry_frame_chunk returns the raw chunk bytes
+        from pywry.shared_frame import SharedFrame, detach
+
+        frame = SharedFrame([{"a": 1}])
+        try:
+            chunk = asyncio.run(captured[4](FrameChunkPayload(name=frame.name, index=0)))
+            assert chunk == b'[{"a":1}]'
+        finally:
+            detach(frame.name)
+            frame.close()
+
 
 class TestPlatformSpecificOpenFile:
     """Cover the darwin and linux branches of handle_open_file."""
@@ -0,0 +1,162 @@
+"""Tests for parallel payload preparation in ``pywry.dashboard``."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from pywry import dashboard as dashboard_mod
+from pywry.dashboard import Dashboard
+from pywry.grid import GridConfig
+from pywry.tvchart.models import TVChartData
+
+
+ROWS = [{"symbol": "A", "price": 1.5}, {"symbol": "B", "price": 2.5}]
+BARS = [
+    {"time": 1_700_000_000 + i * 60, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10}
+    for i in range(5)
+]
+
+
+class _Figure:
+    """Minimal Plotly-like figure whose dict still holds numpy values."""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"data": [{"type": "bar", "y": np.array([1.0, np.nan])}], "layout": {}}
+
+
+def _dashboard(**kwargs: Any) -> Dashboard:
+    return (
+        Dashboard(**kwargs)
+        .add_plotly(_Figure(), title="Chart")
+        .add_dataframe(ROWS, widget_id="grid-1", column_defs=[{"field": "price"}])
+        .add_tvchart(BARS, max_bars=3)
+        .add_tvchart(use_datafeed=True, symbol="BTC")
+    )
+
+
+class TestPrepare:
+    def test_serial_payloads(self) -> None:
+        figure, grid, chart, feed = _dashboard(max_workers=0).prepare()
+        assert figure["data"][0]["y"] == [1.0, None]
+        assert isinstance(grid, GridConfig)
+        assert grid.context.grid_id == "grid-1"
+        assert [col["field"] for col in grid.options.column_defs] == ["price"]
+        assert isinstance(chart, TVChartData)
+        assert len(chart.series[0].bars) == 3
+        assert feed is None
+
+    def test_executor_matches_serial(self) -> None:
+        serial = _dashboard(max_workers=0).prepare()
+        with ThreadPoolExecutor(2) as executor:
+            threaded = _dashboard(executor=executor).prepare()
+        assert threaded[0] == serial[0]
+        assert threaded[1].options == serial[1].options
+        assert threaded[2] == serial[2]
+
+    def test_single_worker_skips_pool(self) -> None:
+        with patch.object(dashboard_mod, "_get_pool") as get_pool:
+            _dashboard(max_workers=1).prepare()
+        get_pool.assert_not_called()
+
+    def test_process_pool(self) -> None:
+        try:
+            payloads = _dashboard(max_workers=2).prepare()
+        finally:
+            dashboard_mod._shutdown_pool()
+        assert payloads[0]["data"][0]["y"] == [1.0, None]
+        assert payloads[1].context.grid_id == "grid-1"
+        assert isinstance(payloads[2], TVChartData)
+
+    def test_invalid_max_workers(self) -> None:
+        with pytest.raises(ValueError, match="non-negative"):
+            Dashboard(max_workers=-1)
+
+
+class TestShow:
+    def test_creates_in_order_then_displays(self) -> None:
+        calls: list[str] = []
+        widgets = [MagicMock(name=kind) for kind in ("plotly", "grid", "chart", "feed")]
+        for kind, widget in zip(("plotly", "grid", "chart", "feed"), widgets, strict=True):
+            widget.display.side_effect = lambda kind=kind: calls.append(f"display:{kind}")
+
+        def create(kind: str, widget: MagicMock) -> Any:
+            def _create(**_: Any) -> MagicMock:
+                calls.append(f"create:{kind}")
+                return widget
+
+            return _create
+
+        charts = iter([create("chart", widgets[2]), create("feed", widgets[3])])
+
+        def create_chart(**kwargs: Any) -> MagicMock:
+            return next(charts)(**kwargs)
+
+        callback = MagicMock()
+        with (
+            patch("pywry.notebook.create_plotly_widget", create("plotly", widgets[0])),
+            patch("pywry.notebook.create_dataframe_widget", create("grid", widgets[1])),
+            patch("pywry.notebook.create_tvchart_widget", create_chart),
+            patch("pywry.inline.is_headless", return_value=False),
+        ):
+            dashboard = _dashboard(max_workers=0)
+            dashboard._items[0].kwargs["callbacks"] = {"plotly_click": callback}
+            result = dashboard.show()
+
+        assert result == widgets
+        assert calls == [
+            "create:plotly",
+            "create:grid",
+            "create:chart",
+            "create:feed",
+            "display:plotly",
+            "display:grid",
+            "display:chart",
+            "display:feed",
+        ]
+        widgets[0].on.assert_called_once_with("plotly_click", callback)
+
+    def test_display_false_and_open_browser(self) -> None:
+        widget = MagicMock()
+        with (
+            patch("pywry.notebook.create_dataframe_widget", return_value=widget),
+            patch("pywry.inline.is_headless", return_value=False),
+        ):
+            Dashboard(max_workers=0).add_dataframe(ROWS, display=False).add_dataframe(
+                ROWS, open_browser=True
+            ).show()
+        widget.display.assert_not_called()
+        widget.open_in_browser.assert_called_once()
+
+    def test_registers_widgets_in_one_batch(self) -> None:
+        from pywry.inline import InlineWidget, _state
+
+        def create(**kwargs: Any) -> InlineWidget:
+            return InlineWidget(kwargs["figure_json"], browser_only=True)
+
+        with (
+            patch("pywry.notebook.create_plotly_widget", create),
+            patch("pywry.inline.HAS_IPYTHON", False),
+            patch("pywry.inline._start_server"),
+            patch("pywry.inline.is_headless", return_value=True),
+            patch.object(_state, "register_widget") as register_one,
+            patch.object(_state, "register_widgets") as register_many,
+        ):
+            widgets = Dashboard(max_workers=0).add_plotly({}).add_plotly({}).show()
+
+        register_one.assert_not_called()
+        (batch,) = register_many.call_args.args
+        assert [entry["widget_id"] for entry in batch] == [w.widget_id for w in widgets]
+
+    def test_headless_skips_display(self) -> None:
+        widget = MagicMock()
+        with (
+            patch("pywry.notebook.create_dataframe_widget", return_value=widget),
+            patch("pywry.inline.is_headless", return_value=True),
+        ):
+            assert len(Dashboard(max_workers=0).add_dataframe(ROWS).show()) == 1
+        widget.display.assert_not_called()
@@ -0,0 +1,79 @@
+"""Wall-clock benchmark for ``Dashboard.prepare`` on the process pool.
+
+Prepares ``PYWRY_DASHBOARD_BENCH_GRIDS`` (default 8) grids of
+``PYWRY_DASHBOARD_BENCH_ROWS`` (default 20000) rows plus as many Plotly
+figures, once on the calling thread and once on the shared worker pool
+(warmed up first so process start-up is not timed).  The pool must finish
+within ``PYWRY_DASHBOARD_BENCH_MAX_RATIO`` (default 0.8) of the serial
+time.  Skipped on machines with fewer than 4 CPUs, where the pickling
+round trip for each ``GridConfig`` eats most of the gain; run with ``-s``
+to see both timings.  The untimed check prepares a small dashboard on
+two workers and compares it with the serial payloads.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pywry import dashboard as dashboard_mod
+from pywry.dashboard import Dashboard
+
+
+GRIDS = int(os.environ.get("PYWRY_DASHBOARD_BENCH_GRIDS", "8"))
+ROWS = int(os.environ.get("PYWRY_DASHBOARD_BENCH_ROWS", "20000"))
+MAX_RATIO = float(os.environ.get("PYWRY_DASHBOARD_BENCH_MAX_RATIO", "0.8"))
+
+
+def _dashboard(max_workers: int | None, grids: int = GRIDS, rows: int = ROWS) -> Dashboard:
+    rng = np.random.default_rng(0)
+    dashboard = Dashboard(max_workers=max_workers)
+    for i in range(grids):
+        frame = pd.DataFrame(rng.random((rows, 6)), columns=list("abcdef"))
+        frame["label"] = [f"row-{n}" for n in range(rows)]
+        dashboard.add_dataframe(frame, widget_id=f"grid-{i}")
+        dashboard.add_plotly(
+            {"data": [{"type": "scatter", "y": rng.random(rows)}], "layout": {"title": str(i)}}
+        )
+    return dashboard
+
+
+def _timed(dashboard: Dashboard) -> float:
+    start = time.perf_counter()
+    payloads = dashboard.prepare()
+    assert len(payloads) == 2 * GRIDS
+    return time.perf_counter() - start
+
+
+def test_pool_payloads_match_serial() -> None:
+    serial = _dashboard(max_workers=0, grids=2, rows=100).prepare()
+    try:
+        pooled = _dashboard(max_workers=2, grids=2, rows=100).prepare()
+    finally:
+        dashboard_mod._shutdown_pool()
+
+    for grid, pooled_grid in zip(serial[::2], pooled[::2], strict=True):
+        assert pooled_grid.options == grid.options
+        assert pooled_grid.context == grid.context
+    assert pooled[1::2] == serial[1::2]
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 CPUs")
+def test_pool_prepares_dashboard_faster() -> None:
+    try:
+        warmup = Dashboard(max_workers=None)
+        for _ in range(os.cpu_count() or 1):
+            warmup.add_plotly({})
+        warmup.prepare()  # Start every worker before timing
+        serial = _timed(_dashboard(max_workers=0))
+        pooled = _timed(_dashboard(max_workers=None))
+    finally:
+        dashboard_mod._shutdown_pool()
+
+    print(f"\n{GRIDS} grids x {ROWS} rows: serial {serial:.2f}s, pool {pooled:.2f}s")
+    assert pooled <= serial * MAX_RATIO, f"pool {pooled:.2f}s vs serial {serial:.2f}s"
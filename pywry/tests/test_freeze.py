@@ -131,27 +131,27 @@ class TestFreezeSupport:
 
 
 class TestRuntimeIntegration:
-    """Verify that runtime.start() uses get_subprocess_command()."""
+    """Verify that runtime.start() spawns via get_subprocess_command()."""
 
     def test_start_uses_get_subprocess_command(self) -> None:
         """runtime.start() must delegate to get_subprocess_command()."""
         from pywry import runtime
 
-        source = inspect.getsource(runtime.start)
+        source = inspect.getsource(runtime._spawn_process)
         assert "get_subprocess_command" in source
 
     def test_start_no_longer_hardcodes_python_m_pywry(self) -> None:
         """The old hardcoded [python, -m, pywry] pattern must be gone."""
         from pywry import runtime
 
-        source = inspect.getsource(runtime.start)
+        source = inspect.getsource(runtime._spawn_process)
         assert '"-m", "pywry"' not in source
 
     def test_start_sets_pywry_is_subprocess_for_frozen(self) -> None:
         """In frozen mode, PYWRY_IS_SUBPROCESS=1 must be set in env."""
         from pywry import runtime
 
-        source = inspect.getsource(runtime.start)
+        source = inspect.getsource(runtime._spawn_process)
         assert "PYWRY_IS_SUBPROCESS" in source
 
 
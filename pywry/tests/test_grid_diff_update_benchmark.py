@@ -0,0 +1,113 @@
+"""Ticking-grid benchmark for ``GridStateMixin.diff_update``.
+
+A grid of ``PYWRY_DIFF_BENCH_ROWS`` (default 10000) rows x 5 columns
+receives ticks that change the price of ``PYWRY_DIFF_BENCH_CHANGES``
+(default 100) random rows.  Each tick is pushed once as a full
+``update_data(df.to_dict("records"))`` and once as
+``diff_update(df, "symbol")``; every emitted payload is JSON-encoded, as
+the transport would.  Best of ``PYWRY_DIFF_BENCH_RUNS`` (default 10)
+ticks.  ``diff_update`` must take at most ``PYWRY_DIFF_BENCH_MAX_RATIO``
+(default 0.5) of the full update's time, for DataFrame and list-of-dict
+input alike.  Run with ``-s`` to see the timings and payload sizes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+from typing import Any
+
+import pytest
+
+from pywry.state_mixins import GridStateMixin
+
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+ROWS = int(os.environ.get("PYWRY_DIFF_BENCH_ROWS", "10000"))
+CHANGES = int(os.environ.get("PYWRY_DIFF_BENCH_CHANGES", "100"))
+RUNS = int(os.environ.get("PYWRY_DIFF_BENCH_RUNS", "10"))
+MAX_RATIO = float(os.environ.get("PYWRY_DIFF_BENCH_MAX_RATIO", "0.5"))
+
+
+class _Grid(GridStateMixin):
+    """Grid widget whose transport only JSON-encodes the payload."""
+
+    def __init__(self) -> None:
+        self.sent_bytes = 0
+
+    def emit(self, event_type: str, data: dict[str, Any]) -> None:
+        self.sent_bytes = len(json.dumps({"type": event_type, "data": data}))
+
+
+def _ticks() -> list[pd.DataFrame]:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "symbol": [f"S{i:05d}" for i in range(ROWS)],
+            "bid": rng.random(ROWS),
+            "ask": rng.random(ROWS),
+            "price": rng.random(ROWS),
+            "qty": rng.integers(0, 1000, ROWS),
+        }
+    )
+    ticks = [frame]
+    for _ in range(RUNS):
+        frame = frame.copy()
+        rows = rng.choice(ROWS, CHANGES, replace=False)
+        frame.loc[rows, "price"] += 0.01
+        ticks.append(frame)
+    return ticks
+
+
+def _best(push: Any, ticks: list[Any]) -> tuple[float, int]:
+    """Push every tick after the first; return the fastest time and its bytes."""
+    grid = _Grid()
+    push(grid, ticks[0])
+    best, size = float("inf"), 0
+    for tick in ticks[1:]:
+        start = time.perf_counter()
+        push(grid, tick)
+        elapsed = time.perf_counter() - start
+        if elapsed < best:
+            best, size = elapsed, grid.sent_bytes
+    return best, size
+
+
+def _full(grid: _Grid, df: pd.DataFrame) -> None:
+    grid.update_data(df.to_dict("records"))
+
+
+def _diff(grid: _Grid, data: Any) -> None:
+    grid.diff_update(data, "symbol")
+
+
+def test_diff_update_sends_a_fraction_of_the_bytes() -> None:
+    ticks = _ticks()[:2]
+    records = [tick.to_dict("records") for tick in ticks]
+    _, full_bytes = _best(_full, ticks)
+    _, diff_bytes = _best(_diff, ticks)
+    _, rows_bytes = _best(_diff, records)
+    assert diff_bytes == rows_bytes
+    assert diff_bytes * 10 < full_bytes
+
+
+@pytest.mark.benchmark
+def test_diff_update_beats_full_update() -> None:
+    ticks = _ticks()
+    records = [tick.to_dict("records") for tick in ticks]
+    full, full_bytes = _best(_full, ticks)
+    diff, diff_bytes = _best(_diff, ticks)
+    rows, rows_bytes = _best(_diff, records)
+
+    print(
+        f"\n{ROWS} rows, {CHANGES} changes per tick:"
+        f"\n  update_data            {full * 1e3:7.1f} ms, {full_bytes:>9,} bytes"
+        f"\n  diff_update(DataFrame) {diff * 1e3:7.1f} ms, {diff_bytes:>9,} bytes"
+        f"\n  diff_update(records)   {rows * 1e3:7.1f} ms, {rows_bytes:>9,} bytes"
+    )
+    assert diff <= full * MAX_RATIO, f"DataFrame diff {diff:.3f}s vs full {full:.3f}s"
+    assert rows <= full * MAX_RATIO, f"records diff {rows:.3f}s vs full {full:.3f}s"
@@ -53,6 +53,7 @@ def mock_asset_loader() -> MagicMock:
     loader.resolve_path = MagicMock(side_effect=lambda p: Path(p).resolve())
     loader.get_asset_id = MagicMock(side_effect=lambda p: f"asset_{p.name}")
     loader.load_css = MagicMock(return_value="body { color: red; }")
+    loader.load_script = MagicMock(return_value="console.log('hello');")
     loader.invalidate = MagicMock()
     return loader
 
@@ -496,6 +497,115 @@ class TestFileChangeHandler:
         refresh_cb.assert_not_called()
 
 
+class TestBatchedChanges:
+    """Test coalesced handling of a debounced change batch."""
+
+    @pytest.fixture
+    def real_manager(self, mock_settings: MagicMock, mock_file_watcher: MagicMock):
+        """HotReloadManager with a real AssetLoader so file reads are observable."""
+        from pywry.asset_loader import AssetLoader
+
+        return HotReloadManager(
+            settings=mock_settings,
+            asset_loader=AssetLoader(),
+            file_watcher=mock_file_watcher,
+        )
+
+    def test_enable_registers_batched_watch(
+        self, manager: HotReloadManager, mock_file_watcher: MagicMock, tmp_path: Path
+    ) -> None:
+        """Files are watched with the manager's batch handler."""
+        css_file = tmp_path / "style.css"
+        css_file.write_text("body {}")
+        manager.enable_for_window("w1", _make_content(css_files=[css_file]))
+
+        assert mock_file_watcher.watch.call_args.kwargs == {"batched": True}
+        assert mock_file_watcher.watch.call_args.args[1] == manager._on_changes
+
+    def test_shared_css_read_once_and_broadcast(
+        self, real_manager: HotReloadManager, tmp_path: Path
+    ) -> None:
+        """A stylesheet shared by many windows is read once and sent in one broadcast."""
+        css_file = tmp_path / "shared.css"
+        css_file.write_text("body { color: blue; }")
+        labels = [f"w{i}" for i in range(20)]
+        for label in labels:
+            real_manager.enable_for_window(label, _make_content(css_files=[css_file]))
+
+        inject_cb = MagicMock()
+        broadcast_cb = MagicMock()
+        real_manager.set_inject_css_callback(inject_cb)
+        real_manager.set_broadcast_css_callback(broadcast_cb)
+
+        css_file.write_text("body { color: green; }")
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as reads:
+            real_manager._on_changes({css_file.resolve(): labels})
+
+        assert reads.call_count == 1
+        inject_cb.assert_not_called()
+        broadcast_cb.assert_called_once()
+        sent_labels, css, _asset_id = broadcast_cb.call_args.args
+        assert sent_labels == labels
+        assert css == "body { color: green; }"
+
+    def test_unchanged_content_is_skipped(
+        self, real_manager: HotReloadManager, tmp_path: Path
+    ) -> None:
+        """Saving a file without changing it sends nothing."""
+        css_file = tmp_path / "style.css"
+        css_file.write_text("body {}")
+        real_manager.enable_for_window("w1", _make_content(css_files=[css_file]))
+        inject_cb = MagicMock()
+        real_manager.set_inject_css_callback(inject_cb)
+
+        real_manager._on_changes({css_file.resolve(): ["w1"]})
+        real_manager._on_changes({css_file.resolve(): ["w1"]})
+        assert inject_cb.call_count == 1
+
+        css_file.write_text("body { margin: 0; }")
+        real_manager._on_changes({css_file.resolve(): ["w1"]})
+        assert inject_cb.call_count == 2
+
+    def test_failed_delivery_is_retried(
+        self, real_manager: HotReloadManager, tmp_path: Path
+    ) -> None:
+        """A change that did not reach the window is sent again on the next save."""
+        css_file = tmp_path / "style.css"
+        css_file.write_text("body {}")
+        real_manager.enable_for_window("w1", _make_content(css_files=[css_file]))
+        inject_cb = MagicMock(side_effect=[False, RuntimeError("closed"), True, True])
+        real_manager.set_inject_css_callback(inject_cb)
+
+        for _ in range(4):
+            real_manager._on_changes({css_file.resolve(): ["w1"]})
+        assert inject_cb.call_count == 3
+
+        script = tmp_path / "app.js"
+        script.write_text("1;")
+        real_manager.enable_for_window("w2", _make_content(script_files=[script]))
+        refresh_cb = MagicMock(side_effect=[False, True, True])
+        real_manager.set_refresh_callback(refresh_cb)
+        for _ in range(3):
+            real_manager._on_changes({script.resolve(): ["w2"]})
+        assert refresh_cb.call_count == 2
+
+    def test_scripts_refresh_each_window_once(
+        self, real_manager: HotReloadManager, tmp_path: Path
+    ) -> None:
+        """Several changed scripts cause one refresh per affected window."""
+        a, b = tmp_path / "a.js", tmp_path / "b.js"
+        a.write_text("1;")
+        b.write_text("2;")
+        real_manager.enable_for_window("w1", _make_content(script_files=[a, b]))
+        real_manager.enable_for_window("w2", _make_content(script_files=[b]))
+        refresh_cb = MagicMock()
+        real_manager.set_refresh_callback(refresh_cb)
+
+        real_manager._on_changes({a.resolve(): ["w1"], b.resolve(): ["w1", "w2"]})
+
+        assert [c.args[0] for c in refresh_cb.call_args_list] == ["w1", "w2"]
+
+
 # =============================================================================
 # Get Watched Files Tests
 # =============================================================================
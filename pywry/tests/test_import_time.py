@@ -0,0 +1,99 @@
+"""Import-time regression tests for ``import pywry``.
+
+The package resolves its public names lazily (PEP 562), so a bare
+``import pywry`` must not drag in the inline server stack, the hot-reload
+watcher, IPython or the chat/tvchart models.  Each check runs a fresh
+interpreter with ``-X importtime`` so modules already imported by the test
+session cannot hide a regression.
+
+The cumulative budget defaults to 250 ms and can be overridden with the
+``PYWRY_IMPORT_BUDGET_MS`` environment variable on slow CI runners.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pywry
+
+
+IMPORT_BUDGET_MS = float(os.environ.get("PYWRY_IMPORT_BUDGET_MS", "250"))
+
+# Modules that only specific features need.
+HEAVY_MODULES = (
+    "fastapi",
+    "uvicorn",
+    "starlette",
+    "watchdog",
+    "IPython",
+    "ipywidgets",
+    "anywidget",
+    "httpx",
+    "pywry.inline",
+    "pywry.chat",
+    "pywry.hot_reload",
+)
+
+
+def _import_profile(statement: str) -> dict[str, int]:
+    """Run ``statement`` in a fresh interpreter and return cumulative µs per module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def test_import_pywry_skips_heavy_dependencies() -> None:
+    profile = _import_profile("import pywry")
+    loaded = [name for name in HEAVY_MODULES if name in profile]
+    assert not loaded, f"'import pywry' eagerly imported {loaded}"
+
+
+@pytest.mark.benchmark
+def test_import_pywry_within_budget() -> None:
+    # Best of three to smooth out scheduler noise.
+    timings_ms = [_import_profile("import pywry")["pywry"] / 1000 for _ in range(3)]
+    assert min(timings_ms) < IMPORT_BUDGET_MS, (
+        f"'import pywry' took {min(timings_ms):.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+    )
+
+
+def test_pywry_app_skips_inline_server() -> None:
+    profile = _import_profile("from pywry import PyWry")
+    for name in ("fastapi", "uvicorn", "watchdog", "pywry.inline", "httpx"):
+        assert name not in profile, f"'from pywry import PyWry' imported {name}"
+
+
+@pytest.mark.parametrize("name", pywry.__all__)
+def test_public_name_resolves(name: str) -> None:
+    assert getattr(pywry, name) is not None
+    assert name in dir(pywry)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = pywry.no_such_name  # type: ignore[attr-defined]
+
+
+def test_lazy_udf_exports() -> None:
+    from pywry import tvchart
+    from pywry.tvchart.udf import UDFAdapter
+
+    assert tvchart.UDFAdapter is UDFAdapter
+    with pytest.raises(AttributeError):
+        _ = tvchart.no_such_name  # type: ignore[attr-defined]
@@ -30,6 +30,9 @@ from pywry import inline as inline_mod
 from pywry.config import clear_settings, get_settings
 from pywry.inline import (
     InlineWidget,
+    _claim_connection,
+    _forward_push,
+    _forward_ws_message,
     _generate_widget_token,
     _get_app,
     _get_default_theme,
@@ -39,6 +42,8 @@ from pywry.inline import (
     _invoke_callback,
     _make_server_request,
     _process_callbacks,
+    _relay_worker_events,
+    _release_connection,
     _route_ws_message,
     _ServerState,
     _state,
@@ -88,9 +93,11 @@ def reset_state():
     _state.widget_tokens.clear()
     _state.event_queues.clear()
     _state.widget_revisions.clear()
+    _state.widget_owners.clear()
     _state._widget_store = None
     _state._callback_registry = None
     _state._connection_router = None
+    _state._event_bus = None
     _state._worker_id = None
     _state.app = None
     clear_settings()
@@ -104,9 +111,11 @@ def reset_state():
     _state.widget_tokens.clear()
     _state.event_queues.clear()
     _state.widget_revisions.clear()
+    _state.widget_owners.clear()
     _state._widget_store = None
     _state._callback_registry = None
     _state._connection_router = None
+    _state._event_bus = None
     _state._worker_id = None
     _state.app = None
     clear_settings()
@@ -335,6 +344,66 @@ class TestServerStateDeployMode:
             assert "wd" in _state.local_widgets
             assert _state.local_widgets["wd"]["callbacks"] == {"click": cb}
 
+    def test_register_widgets_deploy_mode_single_hop(self):
+        store = MagicMock()
+        store.register_many = AsyncMock()
+        registry = MagicMock()
+        registry.register_many = AsyncMock()
+
+        def cb(d):
+            return None
+
+        widgets = [
+            {"widget_id": f"wd{i}", "html": f"<p>{i}</p>", "callbacks": {"click": cb}}
+            for i in range(30)
+        ]
+
+        def mock_run_async(coro):
+            return asyncio.run(coro)
+
+        with (
+            patch("pywry.state.is_deploy_mode", return_value=True),
+            patch.object(_state, "get_widget_store", return_value=store),
+            patch.object(_state, "get_callback_registry", return_value=registry),
+            patch("pywry.state.run_async", side_effect=mock_run_async) as ra,
+        ):
+            _state.register_widgets(widgets)
+        assert ra.call_count == 1
+        (stored,) = store.register_many.await_args.args
+        assert [w.widget_id for w in stored] == [f"wd{i}" for i in range(30)]
+        assert all(w.owner_worker_id == _state.worker_id for w in stored)
+        (callbacks,) = registry.register_many.await_args.args
+        assert callbacks["wd3"] == {"click": cb}
+        assert _state.local_widgets["wd29"]["callbacks"] == {"click": cb}
+
+    async def test_register_widget_async_deploy_mode(self):
+        from pywry.state import CallbackRegistry, MemoryWidgetStore
+
+        store = MemoryWidgetStore()
+        registry = CallbackRegistry()
+
+        def cb(d):
+            return None
+
+        with (
+            patch("pywry.state.is_deploy_mode", return_value=True),
+            patch.object(_state, "get_widget_store", return_value=store),
+            patch.object(_state, "get_callback_registry", return_value=registry),
+        ):
+            await _state.register_widget_async("wd", "<p>x</p>", callbacks={"click": cb}, token="t")
+        assert await store.get_token("wd") == "t"
+        assert (await registry.get("wd", "click")).callback is cb
+        assert "wd" in _state.local_widgets
+        assert "wd" not in _state.widgets
+
+    async def test_register_widgets_async_local_mode(self):
+        await _state.register_widgets_async(
+            [{"widget_id": "a", "html": "<p>a</p>", "token": "ta"}, {"widget_id": "b", "html": "b"}]
+        )
+        assert _state.widgets["a"]["html"] == "<p>a</p>"
+        assert _state.widget_tokens == {"a": "ta"}
+        assert _state.widgets["b"]["callbacks"] == {}
+
     def test_get_widget_html_deploy_mode(self):
         store = MagicMock()
         store.get_html = AsyncMock(return_value="<p>x</p>")
@@ -390,7 +459,6 @@ class TestServerStateDeployMode:
         def mock_run_async(coro):
             if hasattr(coro, "close"):
                 coro.close()
-            return None
 
         with (
             patch("pywry.state.is_deploy_mode", return_value=True),
@@ -587,7 +655,7 @@ class TestRouteWsMessage:
     def test_route_ws_message_with_callback_local(self):
         cb = MagicMock()
         _state.widgets["w1"] = {"html": "x", "callbacks": {"click": cb}}
-        _route_ws_message("w1", {"type": "click", "data": {"x": 1}})
+        assert _route_ws_message("w1", {"type": "click", "data": {"x": 1}}) is True
         # Item should be queued
         item = _state.callback_queue.get(timeout=0.5)
         assert item[0] is cb
@@ -604,7 +672,7 @@ class TestRouteWsMessage:
 
     def test_route_ws_message_event_not_in_callbacks(self):
         _state.widgets["w1"] = {"html": "x", "callbacks": {}}
-        _route_ws_message("w1", {"type": "unknown_event", "data": {}})
+        assert _route_ws_message("w1", {"type": "unknown_event", "data": {}}) is False
         # No callback - queue stays empty
         assert _state.callback_queue.qsize() == 0
 
@@ -888,6 +956,185 @@ class TestWsSenderLoop:
             task.cancel()
 
 
+# =============================================================================
+# Cross-worker delivery (deploy mode)
+# =============================================================================
+
+
+@pytest.fixture
+def two_workers(monkeypatch):
+    """Deploy mode with memory backends shared by this worker and ``worker-b``."""
+    from pywry.state import MemoryConnectionRouter, MemoryEventBus, MemoryWidgetStore
+
+    monkeypatch.setenv("PYWRY_DEPLOY_MODE", "1")
+    _state._worker_id = "worker-a"
+    _state._event_bus = MemoryEventBus()
+    _state._connection_router = MemoryConnectionRouter()
+    _state._widget_store = MemoryWidgetStore()
+    return _state
+
+
+async def _next_message(bus: Any, channel: str, publish: Any) -> Any:
+    """Subscribe to *channel*, run *publish*, and return the first message."""
+    stream = bus.subscribe(channel)
+    receive = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+    await publish()
+    try:
+        return await asyncio.wait_for(receive, timeout=1.0)
+    finally:
+        await stream.aclose()
+
+
+class TestCrossWorkerDelivery:
+    async def test_push_forwarded_to_connection_owner(self, two_workers):
+        await two_workers._connection_router.register_connection("w1", "worker-b")
+        event = {"type": "update", "data": {"x": 1}, "ts": "t"}
+        published: list[bool] = []
+
+        async def publish() -> None:
+            published.append(await _forward_push("w1", event))
+
+        message = await _next_message(two_workers._event_bus, "worker:worker-b", publish)
+        assert published == [True]
+        assert message.event_type == inline_mod._RELAY_PUSH
+        assert message.widget_id == "w1"
+        assert message.data == event
+        assert message.source_worker_id == "worker-a"
+
+    async def test_push_stays_local_when_owned_here(self, two_workers):
+        await two_workers._connection_router.register_connection("w1", "worker-a")
+        assert await _forward_push("w1", {"type": "update"}) is False
+
+    async def test_push_stays_local_without_owner(self, two_workers):
+        assert await _forward_push("w1", {"type": "update"}) is False
+
+    async def test_push_not_forwarded_outside_deploy_mode(self):
+        router = MagicMock()
+        router.get_owner = AsyncMock(return_value="worker-b")
+        with patch.object(_state, "get_connection_router", return_value=router):
+            assert await _forward_push("w1", {"type": "update"}) is False
+        router.get_owner.assert_not_called()
+
+    async def test_push_falls_back_when_router_fails(self, two_workers):
+        router = MagicMock()
+        router.get_owner = AsyncMock(side_effect=ConnectionError("down"))
+        with patch.object(_state, "get_connection_router", return_value=router):
+            assert await _forward_push("w1", {"type": "update"}) is False
+
+    async def test_message_forwarded_to_widget_owner(self, two_workers):
+        await two_workers._widget_store.register("w1", "<p/>", owner_worker_id="worker-b")
+        msg = {"type": "click", "data": {"x": 1}}
+        published: list[bool] = []
+
+        async def publish() -> None:
+            published.append(await _forward_ws_message("w1", msg))
+
+        message = await _next_message(two_workers._event_bus, "worker:worker-b", publish)
+        assert published == [True]
+        assert message.event_type == inline_mod._RELAY_MESSAGE
+        assert message.data == msg
+        assert two_workers.widget_owners["w1"] == "worker-b"
+
+    async def test_message_not_forwarded_for_own_or_unknown_widget(self, two_workers):
+        await two_workers._widget_store.register("mine", "<p/>", owner_worker_id="worker-a")
+        assert await _forward_ws_message("mine", {"type": "click"}) is False
+        assert await _forward_ws_message("unknown", {"type": "click"}) is False
+
+    async def test_relay_delivers_pushes_and_messages(self, two_workers):
+        from pywry.state import EventMessage
+
+        cb = MagicMock()
+        two_workers.local_widgets["w1"] = {"callbacks": {"click": cb}}
+        two_workers.event_queues["w1"] = asyncio.Queue()
+        relay = asyncio.create_task(_relay_worker_events())
+        await asyncio.sleep(0)
+        try:
+            for kind, payload in (
+                (inline_mod._RELAY_PUSH, {"type": "update", "data": {}}),
+                (inline_mod._RELAY_MESSAGE, {"type": "click", "data": {"x": 1}}),
+            ):
+                await two_workers._event_bus.publish(
+                    "worker:worker-a",
+                    EventMessage(
+                        event_type=kind,
+                        widget_id="w1",
+                        data=payload,
+                        source_worker_id="worker-b",
+                    ),
+                )
+            pushed = await asyncio.wait_for(two_workers.event_queues["w1"].get(), timeout=1.0)
+            assert pushed == {"type": "update", "data": {}}
+            # A callback thread started by an earlier test may run the callback itself
+            for _ in range(100):
+                if cb.called or not _state.callback_queue.empty():
+                    break
+                await asyncio.sleep(0.01)
+            if cb.called:
+                assert cb.call_args.args[:2] == ({"x": 1}, "click")
+            else:
+                item = _state.callback_queue.get_nowait()
+                assert item[0] is cb
+                assert item[1] == {"x": 1}
+        finally:
+            relay.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await relay
+
+    async def test_claim_heartbeat_and_release(self, two_workers):
+        router = two_workers._connection_router
+        with patch.object(inline_mod, "_ws_heartbeat_loop", AsyncMock()):
+            heartbeat = await _claim_connection("w1")
+        assert heartbeat is not None
+        await heartbeat
+        assert await router.get_owner("w1") == "worker-a"
+
+        # Another worker took over the connection: leave its claim alone
+        await router.register_connection("w1", "worker-b")
+        await _release_connection("w1")
+        assert await router.get_owner("w1") == "worker-b"
+
+        await router.register_connection("w1", "worker-a")
+        await _release_connection("w1")
+        assert await router.get_owner("w1") is None
+
+    async def test_heartbeat_reclaims_expired_entry(self, two_workers):
+        router = two_workers._connection_router
+        task = asyncio.create_task(inline_mod._ws_heartbeat_loop("w1", 0.01))
+        try:
+            for _ in range(100):
+                if await router.get_owner("w1"):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        assert await router.get_owner("w1") == "worker-a"
+
+    def test_ws_endpoint_claims_connection(self, two_workers, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        monkeypatch.setenv("PYWRY_SERVER__WEBSOCKET_REQUIRE_TOKEN", "false")
+        clear_settings()
+        router = MagicMock()
+        router.register_connection = AsyncMock()
+        router.refresh_heartbeat = AsyncMock(return_value=True)
+        router.get_owner = AsyncMock(return_value="worker-a")
+        router.unregister_connection = AsyncMock(return_value=True)
+        two_workers._connection_router = router
+        _state.app = None
+        client = TestClient(_get_app())
+        with client.websocket_connect("/ws/w-deploy") as ws:
+            ws.send_json({"type": "noop"})
+        for _ in range(100):
+            if router.unregister_connection.await_count:
+                break
+            time.sleep(0.01)
+        router.register_connection.assert_awaited_once_with("w-deploy", "worker-a")
+        router.unregister_connection.assert_awaited_once_with("w-deploy")
+
+
 # =============================================================================
 # _get_verification_settings
 # =============================================================================
@@ -1471,6 +1718,24 @@ class TestDeploy:
             assert "host" in kwargs
             assert "port" in kwargs
 
+    def test_deploy_passes_protocol_settings(self):
+        clear_settings()
+        os.environ["PYWRY_SERVER__LOOP"] = "asyncio"
+        os.environ["PYWRY_SERVER__WS_PING_INTERVAL"] = "5"
+        os.environ["PYWRY_SERVER__WS_PER_MESSAGE_DEFLATE"] = "false"
+        try:
+            with patch("pywry.inline.uvicorn") as mock_uvicorn:
+                deploy()
+                kwargs = mock_uvicorn.run.call_args.kwargs
+                assert kwargs["loop"] == "asyncio"
+                assert kwargs["http"] == "auto"
+                assert kwargs["ws_ping_interval"] == 5.0
+                assert kwargs["ws_per_message_deflate"] is False
+        finally:
+            for key in ("LOOP", "WS_PING_INTERVAL", "WS_PER_MESSAGE_DEFLATE"):
+                os.environ.pop(f"PYWRY_SERVER__{key}", None)
+            clear_settings()
+
     def test_deploy_with_optional_settings(self):
         clear_settings()
         os.environ["PYWRY_SERVER__RELOAD"] = "true"
@@ -1886,6 +2151,17 @@ class TestShowPlotly:
             show_plotly(figure)
             mw.display.assert_called_once()
 
+    def test_show_plotly_display_false(self):
+        with (
+            patch("pywry.notebook.create_plotly_widget") as mock_create,
+            patch("pywry.inline.is_headless", return_value=False),
+        ):
+            mw = MagicMock()
+            mock_create.return_value = mw
+            show_plotly({"data": [], "layout": {}}, display=False)
+            mw.display.assert_not_called()
+            mw.open_in_browser.assert_not_called()
+
     def test_show_plotly_pydantic_config(self):
         figure = MagicMock()
         figure.to_json.return_value = '{"data": [], "layout": {}}'
@@ -1966,6 +2242,20 @@ class TestShowDataframe:
             show_dataframe([{"a": 1}])
             mw.display.assert_called_once()
 
+    def test_show_dataframe_prebuilt_config(self):
+        from pywry.grid import build_grid_config
+
+        config = build_grid_config([{"a": 1}], grid_id="prebuilt")
+        with (
+            patch("pywry.notebook.create_dataframe_widget") as mock_create,
+            patch("pywry.grid.build_grid_config") as mock_build,
+            patch("pywry.inline.is_headless", return_value=True),
+        ):
+            show_dataframe(config)
+            mock_build.assert_not_called()
+            assert mock_create.call_args.kwargs["config"] is config
+            assert mock_create.call_args.kwargs["widget_id"] == "prebuilt"
+
     def test_show_dataframe_dark(self):
         with (
             patch("pywry.notebook.create_dataframe_widget") as mock_create,
@@ -2146,6 +2436,24 @@ class TestInlineWidgetInstance:
             with pytest.raises(ImportError, match="IPython required"):
                 InlineWidget("<p>x</p>", browser_only=False)
 
+    @patch("pywry.inline.HAS_IPYTHON", False)
+    def test_deferred_registration_collects_callbacks(self):
+        from pywry.inline import _defer_registration
+
+        def cb(d):
+            return None
+
+        with patch("pywry.inline._start_server"), _defer_registration() as pending:
+            w = InlineWidget("<p>x</p>", browser_only=True)
+            w.on("click", cb)
+        assert w.widget_id not in _state.widgets
+        assert pending[w.widget_id]["html"] == "<p>x</p>"
+        assert pending[w.widget_id]["callbacks"] == {"click": cb}
+
+        w.on("hover", cb)  # Outside the block nothing is deferred
+        with patch("pywry.inline._start_server"):
+            assert InlineWidget("<p>y</p>", browser_only=True).widget_id in _state.widgets
+
     @patch("pywry.inline.HAS_IPYTHON", True)
     @patch("pywry.inline.Output", FakeOutput)
     def test_widget_label_alias(self):
@@ -19,6 +19,7 @@ import json
 import os
 import sys
 import threading
+import time
 import types
 
 from pathlib import Path
@@ -708,6 +709,7 @@ class TestHandleCommand:
             ("tray_create", "tray_create"),
             ("tray_update", "tray_update"),
             ("tray_remove", "tray_remove"),
+            ("frame_release", "release_frame"),
             ("quit", "quit"),
         ],
     )
@@ -1164,6 +1166,17 @@ class TestEmitEvent:
             ipc.emit_event({"label": "g", "event": "x:y"})
         assert ipc.windows["g"] is win
 
+    def test_emit_to_label_list(self, ipc, capture_stdout):
+        win1, win2, other = MagicMock(), MagicMock(), MagicMock()
+        ipc.windows = {"a": win1, "b": win2, "c": other}
+        ipc.app_handle = None
+        with patch.object(sys, "stderr", io.StringIO()):
+            ipc.emit_event({"label": "a", "labels": ["a", "b", "gone"], "event": "x:y"})
+        win1.eval.assert_called_once()
+        win2.eval.assert_called_once()
+        other.eval.assert_not_called()
+        assert json.loads(capture_stdout.buf.getvalue())["success"] is True
+
     def test_emit_window_not_found(self, ipc, capture_stdout):
         ipc.app_handle = None
         with patch.object(sys, "stderr", io.StringIO()):
@@ -1222,6 +1235,49 @@ class TestEvalJS:
             ipc.eval_js({"label": "a", "script": "1"})
         assert "error" in capture_stdout.buf.getvalue()
 
+    def test_result_echoes_request_id(self, ipc, capture_stdout):
+        ipc.windows["a"] = MagicMock()
+        ipc.eval_js({"label": "a", "script": "1", "request_id": "r1"})
+        msg = json.loads(capture_stdout.buf.getvalue())
+        assert msg == {"type": "result", "label": "a", "success": True, "request_id": "r1"}
+
+    def test_error_echoes_request_id(self, ipc, capture_stdout):
+        with patch.object(sys, "stderr", io.StringIO()):
+            ipc.eval_js({"label": "a", "request_id": "r2"})
+        assert json.loads(capture_stdout.buf.getvalue())["request_id"] == "r2"
+
+    def test_closed_window_answers_correlated_request(self, ipc, capture_stdout):
+        ipc.app_handle = None
+        ipc._destroyed_windows.add("gone")
+        with patch.object(sys, "stderr", io.StringIO()):
+            ipc.eval_js({"label": "gone", "script": "1", "request_id": "r3"})
+            ipc.eval_js({"label": "gone", "script": "1"})
+        lines = capture_stdout.buf.getvalue().splitlines()
+        assert len(lines) == 1
+        msg = json.loads(lines[0])
+        assert msg["success"] is False
+        assert msg["request_id"] == "r3"
+
+
+class TestReleaseFrame:
+    def test_detaches_attached_frame(self, ipc, capture_stdout):
+        from pywry.shared_frame import SharedFrame, read_chunk
+
+        frame = SharedFrame([{"a": 1}])
+        try:
+            read_chunk(frame.name, 0)
+            ipc.release_frame({"action": "frame_release", "name": frame.name})
+            from pywry import shared_frame
+
+            assert frame.name not in shared_frame._attached
+        finally:
+            frame.close()
+        assert capture_stdout.buf.getvalue() == ""
+
+    def test_unknown_frame_is_ignored(self, ipc, capture_stdout):
+        ipc.release_frame({"action": "frame_release", "name": "pywry_missing"})
+        assert capture_stdout.buf.getvalue() == ""
+
 
 # ──────────────────────────────────────────────────────────────────────
 # window_get / window_call
@@ -1267,6 +1323,77 @@ class TestWindowGetSet:
         msg = json.loads(capture_stdout.buf.getvalue())
         assert msg["success"] is False
 
+    def test_window_get_many(self, ipc, capture_stdout):
+        ipc.windows["a"] = MagicMock()
+        fake_dispatch = types.ModuleType("pywry.window_dispatch")
+        fake_dispatch.get_window_properties = lambda w, props: ({"title": "T"}, {"bogus": "x"})
+        with patch.dict(sys.modules, {"pywry.window_dispatch": fake_dispatch}):
+            ipc.window_get_properties(
+                {"label": "a", "properties": ["title", "bogus"], "request_id": "r"}
+            )
+        msg = json.loads(capture_stdout.buf.getvalue())
+        assert msg["success"] is True
+        assert msg["values"] == {"title": "T"}
+        assert msg["errors"] == {"bogus": "x"}
+
+    def test_window_watch_pushes_state(self, ipc, capture_stdout):
+        class Resized:
+            pass
+
+        ipc.windows["a"] = MagicMock()
+        fake_dispatch = types.ModuleType("pywry.window_dispatch")
+        fake_dispatch.WATCHED_PROPERTIES = ("inner_size",)
+        fake_dispatch.STATE_EVENT_PROPERTIES = {"Resized": ("inner_size",)}
+        fake_dispatch.DEBOUNCED_EVENT_PROPERTIES = {}
+        fake_dispatch.STATE_DEBOUNCE_SECONDS = 0.0
+        fake_dispatch.get_window_properties = lambda w, props: ({"inner_size": {"width": 1}}, {})
+        with patch.dict(sys.modules, {"pywry.window_dispatch": fake_dispatch}):
+            ipc.push_window_state("a", Resized())
+            assert capture_stdout.buf.getvalue() == ""
+            ipc.window_watch({"label": "a", "request_id": "r"})
+            ipc.push_window_state("a", Resized())
+            ipc.window_watch({"label": "a", "enabled": False})
+            ipc.push_window_state("a", Resized())
+        lines = [json.loads(line) for line in capture_stdout.buf.getvalue().splitlines()]
+        assert len(lines) == 2
+        assert lines[0]["values"] == {"inner_size": {"width": 1}}
+        assert lines[1] == {
+            "type": "window_state",
+            "label": "a",
+            "state": {"inner_size": {"width": 1}},
+        }
+
+    def test_moved_burst_reads_monitor_once(self, ipc, capture_stdout):
+        class Moved:
+            pass
+
+        reads: list[tuple[str, ...]] = []
+
+        def get_window_properties(window, props):
+            reads.append(tuple(props))
+            return dict.fromkeys(props, 1), {}
+
+        ipc.windows["a"] = MagicMock()
+        ipc.watched_windows.add("a")
+        fake_dispatch = types.ModuleType("pywry.window_dispatch")
+        fake_dispatch.STATE_EVENT_PROPERTIES = {"Moved": ("outer_position",)}
+        fake_dispatch.DEBOUNCED_EVENT_PROPERTIES = {"Moved": ("current_monitor",)}
+        fake_dispatch.STATE_DEBOUNCE_SECONDS = 0.05
+        fake_dispatch.get_window_properties = get_window_properties
+        with patch.dict(sys.modules, {"pywry.window_dispatch": fake_dispatch}):
+            for _ in range(20):
+                ipc.push_window_state("a", Moved())
+            assert ("current_monitor",) not in reads
+            deadline = time.monotonic() + 2
+            while ("current_monitor",) not in reads and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+        assert reads.count(("outer_position",)) == 20
+        assert reads.count(("current_monitor",)) == 1
+        last = json.loads(capture_stdout.buf.getvalue().splitlines()[-1])
+        assert last == {"type": "window_state", "label": "a", "state": {"current_monitor": 1}}
+        assert ipc._state_timers == {}
+
     def test_window_call_no_method_with_request_id(self, ipc, capture_stdout):
         ipc.window_call_method({"label": "a", "request_id": "r"})
         msg = json.loads(capture_stdout.buf.getvalue())
@@ -535,7 +535,7 @@ class TestMCPEventFlow:
         assert len(data["events"]) >= 3
 
         # Buffer should be empty now
-        assert _events[widget_id] == []
+        assert _events[widget_id].read() == []
 
         # Confirm via MCP
         empty_result = await mcp_client.call_tool(
@@ -909,7 +909,7 @@ class TestEventCallbackIntegration:
         assert "test-widget" in _events
         assert len(_events["test-widget"]) == 2
 
-        event1 = _events["test-widget"][0]
+        event1 = _events["test-widget"].read()[0]
         assert event1["event_type"] == "button:click"
         assert event1["data"] == {"x": 10, "y": 20}
         assert event1["label"] == "Save Button"
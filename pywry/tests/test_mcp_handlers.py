@@ -9,9 +9,8 @@ Covers:
 - Helper internals: ``_apply_action``, ``_make_action_callback``,
   ``_infer_callbacks_from_toolbars``, ``_register_widget_events``,
   ``_resolve_widget_id``, ``_get_widget_or_error``, ``_check_required_args``,
-  ``_minimal_confirm_state``, ``_fetch_tvchart_state``,
-  ``_wait_for_data_settled``, ``_poll_tvchart_state``,
-  ``_snapshot_compare_set``, ``_build_compare_payload``.
+  ``_minimal_confirm_state``, ``_emit_with_ack``, ``_ack_state``,
+  ``_normalize_interval``, ``_build_compare_payload``.
 - The async ``handle_tool`` entry point: unknown tools, missing required
   args, and pass-through to ``get_skills``.
 - Defensive ``error or {default}`` branches reachable only by stubbing
@@ -37,6 +36,19 @@ pytest.importorskip("fastmcp")
 from tests.conftest import make_handler_ctx as _make_ctx
 
 
+def _buffers(spec: dict[str, list[tuple[str, dict[str, Any]]]]) -> dict[str, Any]:
+    """Build an events dict of ``EventBuffer``s from ``(event_type, entry)`` pairs."""
+    from pywry.mcp.state import EventBuffer
+
+    events: dict[str, Any] = {}
+    for widget_id, entries in spec.items():
+        buffer = EventBuffer()
+        for event_type, entry in entries:
+            buffer.append(event_type, entry)
+        events[widget_id] = buffer
+    return events
+
+
 # ---------------------------------------------------------------------------
 # _apply_action helper
 # ---------------------------------------------------------------------------
@@ -952,21 +964,22 @@ class TestWidgetManagementHandlers:
     def test_get_events_returns_events(self, mcp_fresh_state) -> None:
         from pywry.mcp.handlers import _handle_get_events
 
-        events: dict[str, list[dict[str, Any]]] = {
-            "widget-1": [{"event_type": "click", "data": {}, "label": "btn"}]
-        }
+        events = _buffers(
+            {"widget-1": [("click", {"event_type": "click", "data": {}, "label": "btn"})]}
+        )
         out = _handle_get_events(
             _make_ctx({"widget_id": "widget-1", "clear": False}, events=events)
         )
         assert "events" in out
         assert len(out["events"]) == 1
+        assert out["cursor"] == 1
 
     def test_get_events_clear(self, mcp_fresh_state) -> None:
         from pywry.mcp.handlers import _handle_get_events
 
-        events: dict[str, list[dict[str, Any]]] = {
-            "widget-2": [{"event_type": "submit", "data": {}, "label": ""}]
-        }
+        events = _buffers(
+            {"widget-2": [("submit", {"event_type": "submit", "data": {}, "label": ""})]}
+        )
         _handle_get_events(_make_ctx({"widget_id": "widget-2", "clear": True}, events=events))
         assert not events["widget-2"]
 
@@ -979,18 +992,90 @@ class TestWidgetManagementHandlers:
     def test_get_events_auto_resolves_single(self, mcp_widget) -> None:
         from pywry.mcp.handlers import _handle_get_events
 
-        events = {"w": [{"event_type": "x", "data": {}, "label": ""}]}
+        events = _buffers({"w": [("x", {"event_type": "x", "data": {}, "label": ""})]})
         out = _handle_get_events(_make_ctx({}, events=events))
         assert out["widget_id"] == "w"
         assert len(out["events"]) == 1
 
+    def test_get_events_since_cursor(self, mcp_fresh_state) -> None:
+        from pywry.mcp.handlers import _handle_get_events
+
+        events = _buffers(
+            {"w1": [(f"e{i}", {"event_type": f"e{i}", "data": {}, "label": ""}) for i in range(3)]}
+        )
+        out = _handle_get_events(_make_ctx({"widget_id": "w1", "since": 2}, events=events))
+        assert [e["event_type"] for e in out["events"]] == ["e2"]
+        assert out["cursor"] == 3
+        out = _handle_get_events(_make_ctx({"widget_id": "w1", "since": 3}, events=events))
+        assert out["events"] == []
+        assert out["cursor"] == 3
+
+    def test_get_events_event_types_filters_capture(self, mcp_fresh_state) -> None:
+        from pywry.mcp.handlers import _handle_get_events
+
+        events = _buffers({"w1": [("a", {"event_type": "a"}), ("b", {"event_type": "b"})]})
+        out = _handle_get_events(
+            _make_ctx({"widget_id": "w1", "event_types": ["b"]}, events=events)
+        )
+        assert [e["event_type"] for e in out["events"]] == ["b"]
+        assert events["w1"].append("a", {"event_type": "a"}) is None
+        assert events["w1"].stats()["filtered"] == 1
+
+    def test_wait_for_events_wakes_on_capture(self, mcp_fresh_state) -> None:
+        from pywry.mcp.handlers import _handle_wait_for_events
+
+        events = _buffers({"w1": []})
+        timer = threading.Timer(0.05, events["w1"].append, ("late", {"event_type": "late"}))
+        timer.start()
+        start = time.monotonic()
+        out = _handle_wait_for_events(_make_ctx({"widget_id": "w1", "timeout": 5}, events=events))
+        assert time.monotonic() - start < 2
+        assert [e["event_type"] for e in out["events"]] == ["late"]
+
+    def test_wait_for_events_blocks_after_clearing_read(self, mcp_fresh_state) -> None:
+        from pywry.mcp.handlers import _handle_get_events, _handle_wait_for_events
+
+        events = _buffers({"w1": [("a", {"event_type": "a"})]})
+        out = _handle_get_events(_make_ctx({"widget_id": "w1", "clear": True}, events=events))
+        assert len(out["events"]) == 1
+        timer = threading.Timer(0.05, events["w1"].append, ("late", {"event_type": "late"}))
+        timer.start()
+        out = _handle_wait_for_events(_make_ctx({"widget_id": "w1", "timeout": 5}, events=events))
+        assert [e["event_type"] for e in out["events"]] == ["late"]
+
+    def test_wait_for_events_times_out_empty(self, mcp_fresh_state) -> None:
+        from pywry.mcp.handlers import _handle_wait_for_events
+
+        events = _buffers({"w1": [("a", {"event_type": "a"})]})
+        out = _handle_wait_for_events(
+            _make_ctx({"widget_id": "w1", "since": 1, "timeout": 0.05}, events=events)
+        )
+        assert out["events"] == []
+        assert out["cursor"] == 1
+
+    def test_list_widgets_reports_event_stats(self, mcp_fresh_state) -> None:
+        from pywry.mcp import state as mcp_state
+        from pywry.mcp.handlers import _handle_list_widgets
+        from pywry.mcp.state import EventBuffer
+
+        mcp_state._widgets["a"] = MagicMock()
+        buffer = EventBuffer(maxlen=2)
+        for i in range(3):
+            buffer.append("x", {"event_type": "x", "n": i})
+        out = _handle_list_widgets(_make_ctx({}, events={"a": buffer}))
+        stats = out["widgets"][0]["events"]
+        assert stats["buffered"] == 2
+        assert stats["capacity"] == 2
+        assert stats["dropped"] == 1
+        assert stats["last_seq"] == 3
+
     def test_destroy_widget(self, mcp_fresh_state) -> None:
         from pywry.mcp.handlers import _handle_destroy_widget
         from pywry.mcp.state import _widgets
 
         _widgets.clear()
         _widgets["to-destroy"] = MagicMock()
-        events: dict[str, list[dict[str, Any]]] = {"to-destroy": []}
+        events = _buffers({"to-destroy": []})
 
         out = _handle_destroy_widget(_make_ctx({"widget_id": "to-destroy"}, events=events))
         assert out["destroyed"] is True
@@ -1068,6 +1153,58 @@ class TestHandleTool:
         assert "error" in out
         assert "component_id" in out["error"]
 
+    async def test_wait_for_events_runs_off_loop(self) -> None:
+        """A long-poll must not stall other work on the server loop."""
+        import asyncio
+
+        from pywry.mcp.handlers import handle_tool
+        from pywry.mcp.state import EventBuffer
+
+        buffer = EventBuffer()
+        events = {"w1": buffer}
+
+        async def _produce() -> None:
+            await asyncio.sleep(0.05)
+            buffer.append("tick", {"event_type": "tick"})
+
+        out, _ = await asyncio.gather(
+            handle_tool(
+                "wait_for_events",
+                {"widget_id": "w1", "timeout": 5},
+                events,
+                lambda w: lambda d, e, lbl: None,
+            ),
+            _produce(),
+        )
+        assert [e["event_type"] for e in out["events"]] == ["tick"]
+
+    async def test_confirmed_tvchart_mutation_runs_off_loop(self, monkeypatch) -> None:
+        """Waiting for a tvchart ack must not stall the server loop."""
+        from pywry.mcp import handlers as h
+
+        loop_thread = threading.get_ident()
+        seen: list[int] = []
+
+        def _handler(ctx: Any) -> dict[str, Any]:
+            seen.append(threading.get_ident())
+            return {"ok": True}
+
+        monkeypatch.setitem(h._HANDLERS, "tvchart_undo", _handler)
+        assert await h.handle_tool("tvchart_undo", {}, {}, lambda w: None) == {"ok": True}
+        assert seen
+        assert seen[0] != loop_thread
+
+    def test_every_ack_waiting_handler_is_blocking(self) -> None:
+        import inspect
+
+        from pywry.mcp import handlers as h
+
+        for name, handler in h._HANDLERS.items():
+            source = inspect.getsource(handler)
+            calls = ("confirm=True", "_emit_with_ack(", "_emit_zoom_and_confirm(", ".wait(")
+            if any(call in source for call in calls):
+                assert name in h._BLOCKING_HANDLERS, name
+
     async def test_get_skills_pass_through(self) -> None:
         from pywry.mcp.handlers import handle_tool
 
@@ -1156,8 +1293,7 @@ class TestResourceHandlers:
 
 
 # ---------------------------------------------------------------------------
-# TVChart internals — _minimal_confirm_state, _fetch_tvchart_state,
-# _wait_for_data_settled, _poll_tvchart_state
+# TVChart internals — _minimal_confirm_state, _emit_with_ack, _ack_state
 # ---------------------------------------------------------------------------
 
 
@@ -1196,171 +1332,78 @@ class TestMinimalConfirmState:
         assert "compareSymbols" not in out
 
 
-class TestFetchTvchartState:
-    def test_returns_none_on_error(self) -> None:
-        from pywry.mcp.handlers import _fetch_tvchart_state
-
-        with patch(
-            "pywry.mcp.handlers.request_response",
-            return_value={"chartId": "x", "error": "not found"},
-        ):
-            assert _fetch_tvchart_state(MagicMock()) is None
-
-    def test_returns_none_on_timeout(self) -> None:
-        from pywry.mcp.handlers import _fetch_tvchart_state
-
-        with patch("pywry.mcp.handlers.request_response", return_value=None):
-            assert _fetch_tvchart_state(MagicMock()) is None
+def _ack(state: dict[str, Any] | None = None, changed: tuple[str, ...] = ()) -> dict[str, Any]:
+    """Build a successful ``tvchart:ack`` payload."""
+    return {"ok": True, "state": state or {}, "changed": list(changed)}
 
-    def test_strips_correlation_token(self) -> None:
-        from pywry.mcp.handlers import _fetch_tvchart_state
 
-        with patch(
-            "pywry.mcp.handlers.request_response",
-            return_value={"context": "tok", "symbol": "X"},
-        ):
-            out = _fetch_tvchart_state(MagicMock())
-        assert out is not None
-        assert "context" not in out
-        assert out["symbol"] == "X"
+class TestEmitWithAck:
+    def test_tags_payload_and_returns_ack(self, mcp_widget) -> None:
+        from pywry.mcp import handlers as h, state as mcp_state
 
+        def fake_emit(event: str, payload: dict[str, Any]) -> None:
+            listener = mcp_widget.on.call_args.args[1]
+            listener({"ackId": payload["ackId"], "ok": True, "state": {"symbol": "X"}}, "", "")
 
-class TestWaitForDataSettled:
-    def test_returns_payload_on_match(self) -> None:
-        from pywry.mcp.handlers import _wait_for_data_settled
+        mcp_widget.emit.side_effect = fake_emit
+        ack, latency_ms = h._emit_with_ack(mcp_widget, "tvchart:undo", {"chartId": "c"})
+        assert ack is not None
+        assert ack["state"] == {"symbol": "X"}
+        assert latency_ms >= 0
+        event, payload = mcp_widget.emit.call_args.args
+        assert event == "tvchart:undo"
+        assert payload["chartId"] == "c"
+        assert payload["ackId"]
+        assert not mcp_state._ack_waiters
 
-        widget = MagicMock()
-        captured: dict[str, Any] = {}
+    def test_timeout_returns_none(self, mcp_widget, monkeypatch) -> None:
+        from pywry.mcp import handlers as h
 
-        def fake_on(event: str, listener: Any) -> Any:
-            captured["listener"] = listener
+        monkeypatch.setattr(h, "_TVCHART_ACK_TIMEOUT", 0.05)
+        ack, _latency = h._emit_with_ack(mcp_widget, "tvchart:redo", {}, timeout=0.05)
+        assert ack is None
 
-            def unsubscribe() -> None:
-                captured["unsubscribed"] = True
+    def test_ack_state_requires_ok(self) -> None:
+        from pywry.mcp.handlers import _ack_state
 
-            return unsubscribe
+        assert _ack_state(None) is None
+        assert _ack_state({"ok": False, "state": {"symbol": "X"}}) is None
+        assert _ack_state({"ok": True, "state": "bad"}) is None
+        assert _ack_state(_ack({"symbol": "X"})) == {"symbol": "X"}
 
-        widget.on = fake_on
 
-        def trigger():
-            time.sleep(0.05)
-            captured["listener"]({"symbol": "AAPL"}, "", "")
+class TestEmitTvchartConfirm:
+    def test_confirmed_mutation(self, mcp_widget, monkeypatch) -> None:
+        from pywry.mcp import handlers as h
 
-        threading.Thread(target=trigger, daemon=True).start()
-        out = _wait_for_data_settled(widget, lambda s: s.get("symbol") == "AAPL", timeout=1.0)
-        assert out is not None
+        monkeypatch.setattr(
+            h, "_wait_for_ack", lambda *_a, **_kw: _ack({"symbol": "AAPL", "rawData": [1]})
+        )
+        out = h._handle_tvchart_undo(_make_ctx({"widget_id": "w"}))
+        assert out["confirmed"] is True
         assert out["symbol"] == "AAPL"
-        assert captured.get("unsubscribed") is True
-
-    def test_ignores_non_dict_and_errors(self) -> None:
-        from pywry.mcp.handlers import _wait_for_data_settled
-
-        widget = MagicMock()
-        captured: dict[str, Any] = {}
-
-        def fake_on(event: str, listener: Any) -> Any:
-            captured["listener"] = listener
-            return None
-
-        widget.on = fake_on
-
-        def trigger():
-            time.sleep(0.05)
-            captured["listener"]("not-a-dict", "", "")
-            captured["listener"]({"error": "x"}, "", "")
-            captured["listener"]({"symbol": "AAPL"}, "", "")
-
-        threading.Thread(target=trigger, daemon=True).start()
-        out = _wait_for_data_settled(widget, lambda s: s.get("symbol") == "AAPL", timeout=1.0)
-        assert out is not None
-
-    def test_widget_on_raises(self) -> None:
-        """When widget.on raises, the helper still returns on timeout."""
-        from pywry.mcp.handlers import _wait_for_data_settled
-
-        widget = MagicMock()
-        widget.on.side_effect = RuntimeError("nope")
-        out = _wait_for_data_settled(widget, lambda _s: True, timeout=0.1)
-        assert out is None
-
-    def test_unsubscribe_raises(self) -> None:
-        """A raising unsubscribe callback must not propagate."""
-        from pywry.mcp.handlers import _wait_for_data_settled
-
-        widget = MagicMock()
-        captured: dict[str, Any] = {}
-
-        def fake_on(event: str, listener: Any) -> Any:
-            captured["listener"] = listener
-
-            def bad_unsubscribe() -> None:
-                raise RuntimeError("boom")
-
-            return bad_unsubscribe
-
-        widget.on = fake_on
-        out = _wait_for_data_settled(widget, lambda _s: True, timeout=0.1)
-        assert out is None
-
-
-class TestPollTvchartState:
-    def test_matches_after_settle(self) -> None:
-        from pywry.mcp.handlers import _poll_tvchart_state
-
-        states = [{"symbol": "OLD"}, {"symbol": "NEW"}]
-
-        def fake_fetch(_w, timeout=1.0):
-            return states.pop(0) if states else None
-
-        with patch("pywry.mcp.handlers._fetch_tvchart_state", side_effect=fake_fetch):
-            out = _poll_tvchart_state(
-                MagicMock(),
-                matcher=lambda s: s.get("symbol") == "NEW",
-                total_timeout=1.0,
-                poll_interval=0.05,
-                settle_delay=0.0,
-            )
-        assert out is not None
-        assert out["symbol"] == "NEW"
+        assert "rawData" not in out
+        assert "latency_ms" in out
 
-    def test_with_settle_delay(self, monkeypatch) -> None:
-        """``settle_delay > 0`` triggers the leading time.sleep call."""
+    def test_frontend_error_is_reported(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        called: dict[str, float] = {}
-        original_sleep = h.time.sleep
-
-        def fake_sleep(seconds):
-            called["sleep"] = seconds
-            original_sleep(0)
-
-        monkeypatch.setattr(h.time, "sleep", fake_sleep)
-        with patch.object(h, "_fetch_tvchart_state", return_value={"symbol": "X"}):
-            h._poll_tvchart_state(
-                MagicMock(),
-                matcher=lambda s: s.get("symbol") == "X",
-                total_timeout=0.5,
-                poll_interval=0.05,
-                settle_delay=0.1,
-            )
-        assert called.get("sleep") == 0.1
-
-    def test_returns_latest_on_timeout(self) -> None:
-        from pywry.mcp.handlers import _poll_tvchart_state
+        monkeypatch.setattr(
+            h, "_wait_for_ack", lambda *_a, **_kw: {"ok": False, "error": "bad options"}
+        )
+        out = h._handle_tvchart_apply_options(
+            _make_ctx({"widget_id": "w", "chart_options": {"x": 1}})
+        )
+        assert out["confirmed"] is False
+        assert "bad options" in out["reason"]
 
-        def fake_fetch(_w, timeout=1.0):
-            return {"symbol": "OLD"}
+    def test_ui_only_event_skips_ack(self, mcp_widget) -> None:
+        from pywry.mcp import handlers as h
 
-        with patch("pywry.mcp.handlers._fetch_tvchart_state", side_effect=fake_fetch):
-            out = _poll_tvchart_state(
-                MagicMock(),
-                matcher=lambda s: s.get("symbol") == "NEW",
-                total_timeout=0.05,
-                poll_interval=0.02,
-                settle_delay=0.0,
-            )
-        assert out is not None
-        assert out["symbol"] == "OLD"
+        out = h._handle_tvchart_show_settings(_make_ctx({"widget_id": "w"}))
+        assert "confirmed" not in out
+        assert "ackId" not in mcp_widget.emit.call_args.args[1]
+        mcp_widget.on.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -1369,15 +1412,14 @@ class TestPollTvchartState:
 
 
 class TestTvchartConfirmPaths:
-    def test_symbol_search_confirmed_via_settled(self, mcp_widget, monkeypatch) -> None:
+    def test_symbol_search_confirmed_via_ack(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
         monkeypatch.setattr(
             h,
-            "_wait_for_data_settled",
-            lambda *_a, **_kw: {"symbol": "MSFT", "interval": "1D"},
+            "_wait_for_ack",
+            lambda *_a, **_kw: _ack({"symbol": "MSFT", "interval": "1D"}, ("symbol",)),
         )
-        monkeypatch.setattr(h, "_fetch_tvchart_state", lambda *_a, **_kw: {"symbol": "AAPL"})
         out = h._handle_tvchart_symbol_search(
             _make_ctx({"widget_id": "w", "query": "MSFT", "auto_select": True})
         )
@@ -1387,43 +1429,84 @@ class TestTvchartConfirmPaths:
     def test_symbol_search_confirmed_fuzzy(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: {"symbol": "MSFT"})
-        monkeypatch.setattr(h, "_fetch_tvchart_state", lambda *_a, **_kw: {"symbol": "AAPL"})
+        monkeypatch.setattr(
+            h, "_wait_for_ack", lambda *_a, **_kw: _ack({"symbol": "MSFT"}, ("symbol",))
+        )
         out = h._handle_tvchart_symbol_search(
             _make_ctx({"widget_id": "w", "query": "microsoft", "auto_select": True})
         )
         assert out["confirmed"] is True
 
+    def test_symbol_search_unchanged_is_unconfirmed(self, mcp_widget, monkeypatch) -> None:
+        """An ack whose symbol neither matches nor changed is not success."""
+        from pywry.mcp import handlers as h
+
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: _ack({"symbol": "AAPL"}))
+        out = h._handle_tvchart_symbol_search(
+            _make_ctx({"widget_id": "w", "query": "zzzz", "auto_select": True})
+        )
+        assert out["confirmed"] is False
+
     def test_symbol_search_unconfirmed_emits_reason(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: None)
-        monkeypatch.setattr(h, "_fetch_tvchart_state", lambda *_a, **_kw: None)
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: None)
         out = h._handle_tvchart_symbol_search(
             _make_ctx({"widget_id": "w", "query": "MSFT", "auto_select": True})
         )
         assert out["confirmed"] is False
         assert "reason" in out
 
+    def test_symbol_search_without_auto_select_skips_ack(self, mcp_widget) -> None:
+        from pywry.mcp import handlers as h
+
+        out = h._handle_tvchart_symbol_search(
+            _make_ctx({"widget_id": "w", "query": "MSFT", "auto_select": False})
+        )
+        assert "confirmed" not in out
+        assert "ackId" not in mcp_widget.emit.call_args.args[1]
+
     def test_compare_confirmed(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
         monkeypatch.setattr(
-            h,
-            "_wait_for_data_settled",
-            lambda *_a, **_kw: {"compareSymbols": {"a": "GOOGL"}},
+            h, "_wait_for_ack", lambda *_a, **_kw: _ack({"compareSymbols": {"a": "GOOGL"}})
         )
-        monkeypatch.setattr(h, "_fetch_tvchart_state", lambda *_a, **_kw: None)
         out = h._handle_tvchart_compare(
             _make_ctx({"widget_id": "w", "query": "GOOGL", "auto_add": True})
         )
         assert out["confirmed"] is True
 
+    def test_compare_confirmed_fuzzy(self, mcp_widget, monkeypatch) -> None:
+        from pywry.mcp import handlers as h
+
+        monkeypatch.setattr(
+            h,
+            "_wait_for_ack",
+            lambda *_a, **_kw: _ack(
+                {"compareSymbols": {"a": "PRE", "b": "MSFT"}}, ("compareSymbols",)
+            ),
+        )
+        out = h._handle_tvchart_compare(
+            _make_ctx({"widget_id": "w", "query": "microsoft", "auto_add": True})
+        )
+        assert out["confirmed"] is True
+
+    def test_compare_unchanged_set_is_unconfirmed(self, mcp_widget, monkeypatch) -> None:
+        from pywry.mcp import handlers as h
+
+        monkeypatch.setattr(
+            h, "_wait_for_ack", lambda *_a, **_kw: _ack({"compareSymbols": {"a": "PRE"}})
+        )
+        out = h._handle_tvchart_compare(
+            _make_ctx({"widget_id": "w", "query": "microsoft", "auto_add": True})
+        )
+        assert out["confirmed"] is False
+
     def test_compare_unconfirmed(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: None)
-        monkeypatch.setattr(h, "_fetch_tvchart_state", lambda *_a, **_kw: None)
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: None)
         out = h._handle_tvchart_compare(
             _make_ctx({"widget_id": "w", "query": "GOOGL", "auto_add": True})
         )
@@ -1434,77 +1517,38 @@ class TestTvchartConfirmPaths:
 
         monkeypatch.setattr(
             h,
-            "_wait_for_data_settled",
-            lambda *_a, **_kw: {"interval": "5m", "symbol": "AAPL"},
+            "_wait_for_ack",
+            lambda *_a, **_kw: _ack({"interval": "5m", "symbol": "AAPL"}, ("interval",)),
         )
         out = h._handle_tvchart_change_interval(_make_ctx({"widget_id": "w", "value": "5m"}))
         assert out["confirmed"] is True
+        assert "latency_ms" in out
 
     def test_change_interval_normalises_1d(self, mcp_widget, monkeypatch) -> None:
         """Frontend reports "1D" while caller asked "D" — must still match."""
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: {"interval": "1D"})
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: _ack({"interval": "1D"}))
         out = h._handle_tvchart_change_interval(_make_ctx({"widget_id": "w", "value": "D"}))
         assert out["confirmed"] is True
 
-    def test_change_interval_matcher_branches(self, mcp_widget, monkeypatch) -> None:
-        """Probe the inner ``_matches`` closure with several states."""
+    def test_change_interval_mismatch(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        def fake_wait(_widget, matcher, **_kw):
-            assert matcher({"interval": "5m"}) is True
-            assert matcher({"interval": ""}) is False
-            return {"interval": "5m"}
-
-        monkeypatch.setattr(h, "_wait_for_data_settled", fake_wait)
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: _ack({"interval": ""}))
         out = h._handle_tvchart_change_interval(_make_ctx({"widget_id": "w", "value": "5m"}))
-        assert out["confirmed"] is True
-
-    def test_symbol_search_matcher_branches(self, mcp_widget, monkeypatch) -> None:
-        from pywry.mcp import handlers as h
-
-        monkeypatch.setattr(h, "_fetch_tvchart_state", lambda *_a, **_kw: {"symbol": "OLD"})
-
-        def fake_wait(_widget, matcher, **_kw):
-            assert matcher({"symbol": ""}) is False
-            assert matcher({"symbol": "MSFT"}) is True
-            assert matcher({"symbol": "AAPL"}) is True
-            return {"symbol": "MSFT"}
-
-        monkeypatch.setattr(h, "_wait_for_data_settled", fake_wait)
-        out = h._handle_tvchart_symbol_search(
-            _make_ctx({"widget_id": "w", "query": "MSFT", "auto_select": True})
-        )
-        assert out["confirmed"] is True
-
-    def test_compare_matcher_branches(self, mcp_widget, monkeypatch) -> None:
-        from pywry.mcp import handlers as h
-
-        monkeypatch.setattr(
-            h,
-            "_fetch_tvchart_state",
-            lambda *_a, **_kw: {"compareSymbols": {"a": "PRE"}},
-        )
+        assert out["confirmed"] is False
 
-        def fake_wait(_widget, matcher, **_kw):
-            assert matcher({"compareSymbols": "not a dict"}) is False
-            assert matcher({"compareSymbols": {"x": "GOOGL"}}) is True
-            assert matcher({"compareSymbols": {"a": "PRE", "b": "NEW"}}) is True
-            assert matcher({"compareSymbols": {"a": "PRE"}}) is False
-            return {"compareSymbols": {"x": "GOOGL"}}
+    def test_normalize_interval(self) -> None:
+        from pywry.mcp.handlers import _normalize_interval
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", fake_wait)
-        out = h._handle_tvchart_compare(
-            _make_ctx({"widget_id": "w", "query": "GOOGL", "auto_add": True})
-        )
-        assert out["confirmed"] is True
+        assert _normalize_interval("1D") == _normalize_interval("d")
+        assert _normalize_interval("5m") == "5M"
 
     def test_symbol_search_with_chart_id_and_filters(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: None)
-        monkeypatch.setattr(h, "_fetch_tvchart_state", lambda *_a, **_kw: None)
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: None)
         out = h._handle_tvchart_symbol_search(
             _make_ctx(
                 {
@@ -1538,11 +1582,8 @@ class TestTvchartConfirmPaths:
 
         monkeypatch.setattr(
             h,
-            "_wait_for_data_settled",
-            lambda *_a, **_kw: {
-                "symbol": "AAPL",
-                "visibleRange": {"from": 1, "to": 2},
-            },
+            "_wait_for_ack",
+            lambda *_a, **_kw: _ack({"symbol": "AAPL", "visibleRange": {"from": 1, "to": 2}}),
         )
         out = h._handle_tvchart_set_visible_range(
             _make_ctx({"widget_id": "w", "from_time": 1, "to_time": 2})
@@ -1556,11 +1597,10 @@ class TestTvchartConfirmPaths:
 
         monkeypatch.setattr(
             h,
-            "_wait_for_data_settled",
-            lambda *_a, **_kw: {
-                "symbol": "AAPL",
-                "visibleLogicalRange": {"from": 0.0, "to": 10.0},
-            },
+            "_wait_for_ack",
+            lambda *_a, **_kw: _ack(
+                {"symbol": "AAPL", "visibleLogicalRange": {"from": 0.0, "to": 10.0}}
+            ),
         )
         out = h._handle_tvchart_fit_content(_make_ctx({"widget_id": "w"}))
         assert out["confirmed"] is True
@@ -1569,7 +1609,7 @@ class TestTvchartConfirmPaths:
     def test_emit_zoom_unconfirmed(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: None)
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: None)
         out = h._handle_tvchart_time_range(_make_ctx({"widget_id": "w", "value": "1Y"}))
         assert out["confirmed"] is False
         assert "reason" in out
@@ -1600,16 +1640,6 @@ class TestTvchartConfirmPaths:
         out = h._handle_tvchart_symbol_search(_make_ctx({"widget_id": "ghost", "query": "x"}))
         assert "error" in out
 
-    def test_snapshot_compare_set_non_dict(self, monkeypatch) -> None:
-        from pywry.mcp import handlers as h
-
-        monkeypatch.setattr(
-            h,
-            "_fetch_tvchart_state",
-            lambda *_a, **_kw: {"compareSymbols": "not a dict"},
-        )
-        assert h._snapshot_compare_set(MagicMock()) == set()
-
     def test_build_compare_payload_filters_blanks(self) -> None:
         from pywry.mcp.handlers import _build_compare_payload
 
@@ -1675,7 +1705,7 @@ class TestTvchartStateHandlers:
     def test_change_interval_with_chart_id(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: None)
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: None)
         h._handle_tvchart_change_interval(
             _make_ctx({"widget_id": "w", "value": "5m", "chart_id": "alt"})
         )
@@ -1687,7 +1717,7 @@ class TestTvchartStateHandlers:
     def test_emit_zoom_with_chart_id(self, mcp_widget, monkeypatch) -> None:
         from pywry.mcp import handlers as h
 
-        monkeypatch.setattr(h, "_wait_for_data_settled", lambda *_a, **_kw: None)
+        monkeypatch.setattr(h, "_wait_for_ack", lambda *_a, **_kw: None)
         h._handle_tvchart_set_visible_range(
             _make_ctx(
                 {
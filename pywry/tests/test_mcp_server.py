@@ -110,17 +110,21 @@ class TestEventCallback:
         cb({"clicked": True}, "button:click", "Save")
         assert "w" in _events
         assert len(_events["w"]) == 1
-        assert _events["w"][0]["event_type"] == "button:click"
+        assert _events["w"].read()[0]["event_type"] == "button:click"
+        assert _events["w"].read()[0]["seq"] == 1
         _events.pop("w", None)
 
     def test_appends_to_existing_bucket(self) -> None:
         from pywry.mcp.server import _events, _make_event_callback
+        from pywry.mcp.state import EventBuffer
 
         _events.clear()
-        _events["w"] = [{"event_type": "old", "data": {}, "label": ""}]
+        _events["w"] = EventBuffer()
+        _events["w"].append("old", {"event_type": "old", "data": {}, "label": ""})
         cb = _make_event_callback("w")
         cb({"x": 1}, "click", "")
         assert len(_events["w"]) == 2
+        assert [e["seq"] for e in _events["w"].read()] == [1, 2]
 
 
 # ---------------------------------------------------------------------------
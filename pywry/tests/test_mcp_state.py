@@ -13,13 +13,20 @@ Covers:
 from __future__ import annotations
 
 import threading
+import time
 
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pywry.mcp.state import capture_widget_events, request_response
+from pywry.mcp.state import (
+    EventBuffer,
+    capture_widget_events,
+    expect_ack,
+    request_response,
+    wait_for_ack,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -27,6 +34,11 @@ from pywry.mcp.state import capture_widget_events, request_response
 # ---------------------------------------------------------------------------
 
 
+def _strip(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop the capture timestamp so entries compare deterministically."""
+    return [{k: v for k, v in e.items() if k != "ts"} for e in entries]
+
+
 class _FakeWidget:
     """Minimal widget surface that mimics ``on``/``emit`` behaviour."""
 
@@ -48,9 +60,13 @@ def _clear_pending() -> None:
 
     mcp_state._pending_responses.clear()
     mcp_state._pending_events.clear()
+    mcp_state._ack_waiters.clear()
+    mcp_state._ack_listeners.clear()
     yield
     mcp_state._pending_responses.clear()
     mcp_state._pending_events.clear()
+    mcp_state._ack_waiters.clear()
+    mcp_state._ack_listeners.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -297,21 +313,72 @@ class TestRequestResponse:
 # ---------------------------------------------------------------------------
 
 
+class TestMutationAcks:
+    def test_ack_routed_to_waiter(self) -> None:
+        widget = _FakeWidget()
+        ack_id = expect_ack(widget, "tvchart:ack")
+        (dispatch,) = widget.handlers["tvchart:ack"]
+        dispatch({"ackId": ack_id, "ok": True, "state": {"symbol": "X"}}, "", "")
+        ack = wait_for_ack(ack_id, timeout=1.0)
+        assert ack is not None
+        assert ack["state"] == {"symbol": "X"}
+
+    def test_single_listener_for_concurrent_waiters(self) -> None:
+        widget = _FakeWidget()
+        first = expect_ack(widget, "tvchart:ack")
+        second = expect_ack(widget, "tvchart:ack")
+        assert len(widget.handlers["tvchart:ack"]) == 1
+        dispatch = widget.handlers["tvchart:ack"][0]
+
+        def reply() -> None:
+            dispatch({"ackId": second, "ok": True}, "", "")
+            dispatch({"ackId": first, "ok": False}, "", "")
+
+        threading.Timer(0.02, reply).start()
+        assert wait_for_ack(first, timeout=1.0) == {"ackId": first, "ok": False}
+        assert wait_for_ack(second, timeout=1.0) == {"ackId": second, "ok": True}
+
+    def test_ignores_unknown_and_malformed_acks(self) -> None:
+        widget = _FakeWidget()
+        ack_id = expect_ack(widget, "tvchart:ack")
+        dispatch = widget.handlers["tvchart:ack"][0]
+        dispatch("not-a-dict", "", "")
+        dispatch({"ackId": "someone-else"}, "", "")
+        assert wait_for_ack(ack_id, timeout=0.05) is None
+
+    def test_timeout_releases_waiter(self) -> None:
+        from pywry.mcp import state as mcp_state
+
+        ack_id = expect_ack(_FakeWidget(), "tvchart:ack")
+        assert wait_for_ack(ack_id, timeout=0.01) is None
+        assert ack_id not in mcp_state._ack_waiters
+        assert wait_for_ack(ack_id, timeout=0.01) is None
+
+    def test_remove_widget_drops_listener(self) -> None:
+        from pywry.mcp import state as mcp_state
+
+        widget = _FakeWidget()
+        mcp_state.register_widget("ack-w", widget)
+        expect_ack(widget, "tvchart:ack")
+        assert mcp_state.remove_widget("ack-w") is True
+        assert not mcp_state._ack_listeners
+
+
 class TestCaptureWidgetEvents:
     def test_buckets_events_by_widget_id(self) -> None:
         widget = _FakeWidget()
-        events: dict[str, list[dict[str, Any]]] = {}
+        events: dict[str, EventBuffer] = {}
         capture_widget_events(widget, "chart-1", events, ["tvchart:click", "tvchart:drawing-added"])
         widget.handlers["tvchart:click"][0]({"x": 1, "y": 2}, "", "")
         widget.handlers["tvchart:drawing-added"][0]({"id": "d-1"}, "", "")
-        assert events["chart-1"] == [
-            {"event": "tvchart:click", "data": {"x": 1, "y": 2}},
-            {"event": "tvchart:drawing-added", "data": {"id": "d-1"}},
+        assert _strip(events["chart-1"].read()) == [
+            {"event": "tvchart:click", "data": {"x": 1, "y": 2}, "seq": 1},
+            {"event": "tvchart:drawing-added", "data": {"id": "d-1"}, "seq": 2},
         ]
 
     def test_registers_handler_per_event_name(self) -> None:
         widget = _FakeWidget()
-        events: dict[str, list[dict[str, Any]]] = {}
+        events: dict[str, EventBuffer] = {}
         capture_widget_events(widget, "chart-1", events, ["a", "b", "c"])
         assert set(widget.handlers.keys()) == {"a", "b", "c"}
 
@@ -325,17 +392,110 @@ class TestCaptureWidgetEvents:
                 raise RuntimeError("nope")
 
         widget.on = fake_on
-        events: dict[str, list[dict[str, Any]]] = {}
+        events: dict[str, EventBuffer] = {}
         capture_widget_events(widget, "chart-1", events, ["ok-1", "boom", "ok-2"])
         assert calls == ["ok-1", "boom", "ok-2"]
 
     def test_separate_widget_buckets(self) -> None:
         widget_a = _FakeWidget()
         widget_b = _FakeWidget()
-        events: dict[str, list[dict[str, Any]]] = {}
+        events: dict[str, EventBuffer] = {}
         capture_widget_events(widget_a, "chart-A", events, ["tvchart:click"])
         capture_widget_events(widget_b, "chart-B", events, ["tvchart:click"])
         widget_a.handlers["tvchart:click"][0]({"x": 1}, "", "")
         widget_b.handlers["tvchart:click"][0]({"x": 2}, "", "")
-        assert events["chart-A"] == [{"event": "tvchart:click", "data": {"x": 1}}]
-        assert events["chart-B"] == [{"event": "tvchart:click", "data": {"x": 2}}]
+        assert _strip(events["chart-A"].read()) == [
+            {"event": "tvchart:click", "data": {"x": 1}, "seq": 1}
+        ]
+        assert _strip(events["chart-B"].read()) == [
+            {"event": "tvchart:click", "data": {"x": 2}, "seq": 1}
+        ]
+
+
+# ---------------------------------------------------------------------------
+# EventBuffer
+# ---------------------------------------------------------------------------
+
+
+class TestEventBuffer:
+    def test_overflow_drops_oldest_and_counts(self) -> None:
+        buffer = EventBuffer(maxlen=3)
+        for i in range(5):
+            buffer.append("e", {"n": i})
+        assert [e["n"] for e in buffer.read()] == [2, 3, 4]
+        assert buffer.dropped == 2
+        assert buffer.last_seq == 5
+
+    def test_read_since_cursor(self) -> None:
+        buffer = EventBuffer()
+        for i in range(4):
+            buffer.append("e", {"n": i})
+        assert [e["seq"] for e in buffer.read(2)] == [3, 4]
+        assert buffer.read(4) == []
+
+    def test_missed_reports_events_evicted_after_cursor(self) -> None:
+        buffer = EventBuffer(maxlen=2)
+        for i in range(6):
+            buffer.append("e", {"n": i})
+        assert buffer.missed(1) == 3
+        assert buffer.missed(4) == 0
+
+    def test_capture_filter(self) -> None:
+        buffer = EventBuffer(event_types=["keep"])
+        assert buffer.append("skip", {"event": "skip"}) is None
+        assert buffer.append("keep", {"event": "keep"}) == 1
+        assert buffer.filtered == 1
+        buffer.set_event_types(None)
+        assert buffer.append("skip", {"event": "skip"}) == 2
+
+    def test_set_event_types_prunes_buffered(self) -> None:
+        buffer = EventBuffer()
+        buffer.append("a", {"event_type": "a"})
+        buffer.append("b", {"event": "b"})
+        buffer.set_event_types(["b"])
+        assert [e["event"] for e in buffer.read()] == ["b"]
+
+    def test_clear_up_to_keeps_newer(self) -> None:
+        buffer = EventBuffer()
+        for i in range(3):
+            buffer.append("e", {"n": i})
+        buffer.clear(2)
+        assert [e["seq"] for e in buffer.read()] == [3]
+        buffer.clear()
+        assert len(buffer) == 0
+
+    def test_wait_returns_when_event_arrives(self) -> None:
+        buffer = EventBuffer()
+        threading.Timer(0.05, buffer.append, ("e", {"n": 1})).start()
+        assert [e["n"] for e in buffer.wait(0, timeout=5)] == [1]
+
+    def test_wait_after_clear_blocks_for_new_event(self) -> None:
+        buffer = EventBuffer()
+        buffer.append("e", {"n": 1})
+        buffer.clear()
+        assert buffer.wait(0, timeout=0.05) == []
+        assert buffer.wait(1, timeout=0.05) == []
+        threading.Timer(0.05, buffer.append, ("e", {"n": 2})).start()
+        assert [e["n"] for e in buffer.wait(0, timeout=5)] == [2]
+
+    def test_wait_since_zero_skips_buffered_events(self) -> None:
+        buffer = EventBuffer()
+        buffer.append("e", {"n": 1})
+        start = time.monotonic()
+        assert buffer.wait(0, timeout=0.1) == []
+        assert time.monotonic() - start >= 0.09
+
+    def test_wait_times_out(self) -> None:
+        buffer = EventBuffer()
+        buffer.append("e", {"n": 1})
+        assert buffer.wait(1, timeout=0.05) == []
+
+    def test_default_capacity_follows_setting(self) -> None:
+        from pywry.mcp import state as mcp_state
+
+        original = mcp_state._event_buffer_size
+        try:
+            mcp_state.set_event_buffer_size(25)
+            assert EventBuffer().maxlen == 25
+        finally:
+            mcp_state.set_event_buffer_size(original)
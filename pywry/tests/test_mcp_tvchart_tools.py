@@ -28,43 +28,43 @@ def _make_ctx(args: dict[str, Any]) -> HandlerContext:
 def _find_emit(widget: MagicMock, event_name: str) -> tuple[str, dict[str, Any]] | None:
     """Return the (name, payload) of the first ``widget.emit(event_name, ...)`` call.
 
-    Handlers that confirm mutations via state polling may emit helper
-    events (``tvchart:request-state``) before or after the mutation
-    event; tests that care about the mutation payload should locate
-    it by name rather than by positional index.
+    Mutating handlers tag the payload with a per-call ``ackId``
+    correlation token; it is stripped so tests can compare payloads
+    literally.
     """
     for call in widget.emit.call_args_list:
         args = call[0]
         if args and args[0] == event_name:
             name = args[0]
-            payload = args[1] if len(args) > 1 else {}
+            payload = dict(args[1]) if len(args) > 1 else {}
+            payload.pop("ackId", None)
             return name, payload
     return None
 
 
+def _last_emit(widget: MagicMock) -> tuple[str, dict[str, Any]]:
+    """Return the (name, payload) of the last emit, without its ``ackId``."""
+    name, payload = widget.emit.call_args[0]
+    return name, {k: v for k, v in payload.items() if k != "ackId"}
+
+
 @pytest.fixture
 def widget(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     """A fresh widget mock registered under ``"chart"`` for the duration of a test.
 
-    Mutation handlers (``tvchart_symbol_search`` / ``_compare`` /
-    ``_change_interval``) block on the real ``tvchart:data-settled``
-    round-trip, which never fires against a mocked widget.  Patch
-    ``_wait_for_data_settled`` to return ``None`` immediately so tests
-    exercise the emit + result-shape contract without waiting on a
-    real frontend.  Tests that want to assert the confirmed-success
-    path should patch it themselves with a stand-in state.
+    Mutation handlers block on the frontend's ``tvchart:ack``, which
+    never fires against a mocked widget.  Patch ``_wait_for_ack`` to
+    return ``None`` immediately so tests exercise the emit +
+    result-shape contract without waiting on a real frontend.  Tests
+    that want to assert the confirmed-success path should patch it
+    themselves with a stand-in ack.
     """
     mcp_state._widgets.clear()
     w = MagicMock()
     mcp_state._widgets["chart"] = w
     monkeypatch.setattr(
         mcp_handlers,
-        "_wait_for_data_settled",
-        lambda *_a, **_kw: None,
-    )
-    monkeypatch.setattr(
-        mcp_handlers,
-        "_fetch_tvchart_state",
+        "_wait_for_ack",
         lambda *_a, **_kw: None,
     )
     yield w
@@ -175,7 +175,7 @@ def test_update_series_emits_tvchart_update(widget: MagicMock) -> None:
     out = mcp_handlers._handle_tvchart_update_series(ctx)
     assert out["event_type"] == "tvchart:update"
     widget.emit.assert_called_once()
-    event_name, payload = widget.emit.call_args[0]
+    event_name, payload = _last_emit(widget)
     assert event_name == "tvchart:update"
     assert payload["bars"] == bars
     assert payload["seriesId"] == "main"
@@ -192,7 +192,7 @@ def test_update_series_passes_chart_id_when_set(widget: MagicMock) -> None:
         }
     )
     mcp_handlers._handle_tvchart_update_series(ctx)
-    payload = widget.emit.call_args[0][1]
+    payload = _last_emit(widget)[1]
     assert payload["chartId"] == "alt-chart"
     assert payload["fitContent"] is False
 
@@ -200,7 +200,7 @@ def test_update_series_passes_chart_id_when_set(widget: MagicMock) -> None:
 def test_update_bar_emits_tvchart_stream(widget: MagicMock) -> None:
     bar = {"time": 1, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 100}
     mcp_handlers._handle_tvchart_update_bar(_make_ctx({"widget_id": "chart", "bar": bar}))
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:stream"
     assert payload["bar"] == bar
 
@@ -218,7 +218,7 @@ def test_add_series_emits_tvchart_add_series(widget: MagicMock) -> None:
     )
     out = mcp_handlers._handle_tvchart_add_series(ctx)
     assert out["series_id"] == "overlay-1"
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:add-series"
     assert payload == {
         "seriesId": "overlay-1",
@@ -233,7 +233,7 @@ def test_remove_series_emits_tvchart_remove_series(widget: MagicMock) -> None:
         _make_ctx({"widget_id": "chart", "series_id": "overlay-1"})
     )
     assert out["series_id"] == "overlay-1"
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:remove-series"
     assert payload == {"seriesId": "overlay-1"}
 
@@ -245,7 +245,7 @@ def test_add_markers_emits_tvchart_add_markers(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_add_markers(
         _make_ctx({"widget_id": "chart", "markers": markers, "series_id": "main"})
     )
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:add-markers"
     assert payload["markers"] == markers
     assert payload["seriesId"] == "main"
@@ -253,7 +253,7 @@ def test_add_markers_emits_tvchart_add_markers(widget: MagicMock) -> None:
 
 def test_add_price_line_uses_defaults(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_add_price_line(_make_ctx({"widget_id": "chart", "price": 170.5}))
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:add-price-line"
     assert payload["price"] == 170.5
     assert payload["color"] == "#2196F3"
@@ -266,7 +266,7 @@ def test_apply_options_strips_none_keys(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_apply_options(
         _make_ctx({"widget_id": "chart", "chart_options": chart_options})
     )
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:apply-options"
     assert payload == {"chartOptions": chart_options}
 
@@ -291,7 +291,7 @@ def test_add_indicator_passes_all_options(widget: MagicMock) -> None:
         }
     )
     mcp_handlers._handle_tvchart_add_indicator(ctx)
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:add-indicator"
     assert payload == {
         "name": "Bollinger Bands",
@@ -307,7 +307,7 @@ def test_add_indicator_passes_all_options(widget: MagicMock) -> None:
 
 def test_add_indicator_omits_unset_optionals(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_add_indicator(_make_ctx({"widget_id": "chart", "name": "RSI"}))
-    payload = widget.emit.call_args[0][1]
+    payload = _last_emit(widget)[1]
     assert payload == {"name": "RSI"}
 
 
@@ -316,13 +316,13 @@ def test_remove_indicator_emits_remove(widget: MagicMock) -> None:
         _make_ctx({"widget_id": "chart", "series_id": "ind_sma_99"})
     )
     assert out["series_id"] == "ind_sma_99"
-    payload = widget.emit.call_args[0][1]
+    payload = _last_emit(widget)[1]
     assert payload == {"seriesId": "ind_sma_99"}
 
 
 def test_show_indicators_takes_no_payload(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_show_indicators(_make_ctx({"widget_id": "chart"}))
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:show-indicators"
     assert payload == {}
 
@@ -481,40 +481,40 @@ def test_set_visible_range_packs_from_to(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_set_visible_range(
         _make_ctx({"widget_id": "chart", "from_time": 100, "to_time": 200})
     )
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:time-scale"
     assert payload == {"visibleRange": {"from": 100, "to": 200}}
 
 
 def test_fit_content_emits_fit_flag(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_fit_content(_make_ctx({"widget_id": "chart"}))
-    payload = widget.emit.call_args[0][1]
+    payload = _last_emit(widget)[1]
     assert payload == {"fitContent": True}
 
 
 def test_time_range_passes_preset_value(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_time_range(_make_ctx({"widget_id": "chart", "value": "1Y"}))
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:time-range"
     assert payload == {"value": "1Y"}
 
 
 def test_time_range_picker_emits_open_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_time_range_picker(_make_ctx({"widget_id": "chart"}))
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:time-range-picker"
     assert payload == {}
 
 
 def test_log_scale_coerces_value_to_bool(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_log_scale(_make_ctx({"widget_id": "chart", "value": 1}))
-    payload = widget.emit.call_args[0][1]
+    payload = _last_emit(widget)[1]
     assert payload == {"value": True}
 
 
 def test_auto_scale_emits_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_auto_scale(_make_ctx({"widget_id": "chart", "value": False}))
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:auto-scale"
     assert payload == {"value": False}
 
@@ -528,7 +528,7 @@ def test_chart_type_emits_change(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_chart_type(
         _make_ctx({"widget_id": "chart", "value": "Heikin Ashi", "series_id": "main"})
     )
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:chart-type-change"
     assert payload == {"value": "Heikin Ashi", "seriesId": "main"}
 
@@ -551,7 +551,7 @@ def test_chart_type_emits_change(widget: MagicMock) -> None:
 )
 def test_drawing_tool_dispatch(widget: MagicMock, mode: str, expected_event: str) -> None:
     mcp_handlers._handle_tvchart_drawing_tool(_make_ctx({"widget_id": "chart", "mode": mode}))
-    assert widget.emit.call_args[0][0] == expected_event
+    assert _last_emit(widget)[0] == expected_event
 
 
 def test_drawing_tool_unknown_mode_returns_error(widget: MagicMock) -> None:
@@ -564,12 +564,12 @@ def test_drawing_tool_unknown_mode_returns_error(widget: MagicMock) -> None:
 
 def test_undo_emits_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_undo(_make_ctx({"widget_id": "chart"}))
-    assert widget.emit.call_args[0][0] == "tvchart:undo"
+    assert _last_emit(widget)[0] == "tvchart:undo"
 
 
 def test_redo_emits_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_redo(_make_ctx({"widget_id": "chart"}))
-    assert widget.emit.call_args[0][0] == "tvchart:redo"
+    assert _last_emit(widget)[0] == "tvchart:redo"
 
 
 # ---------------------------------------------------------------------------
@@ -579,24 +579,24 @@ def test_redo_emits_event(widget: MagicMock) -> None:
 
 def test_show_settings_emits_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_show_settings(_make_ctx({"widget_id": "chart"}))
-    assert widget.emit.call_args[0][0] == "tvchart:show-settings"
+    assert _last_emit(widget)[0] == "tvchart:show-settings"
 
 
 def test_toggle_dark_mode_emits_value(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_toggle_dark_mode(_make_ctx({"widget_id": "chart", "value": True}))
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:toggle-dark-mode"
     assert payload == {"value": True}
 
 
 def test_screenshot_emits_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_screenshot(_make_ctx({"widget_id": "chart"}))
-    assert widget.emit.call_args[0][0] == "tvchart:screenshot"
+    assert _last_emit(widget)[0] == "tvchart:screenshot"
 
 
 def test_fullscreen_emits_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_fullscreen(_make_ctx({"widget_id": "chart"}))
-    assert widget.emit.call_args[0][0] == "tvchart:fullscreen"
+    assert _last_emit(widget)[0] == "tvchart:fullscreen"
 
 
 # ---------------------------------------------------------------------------
@@ -608,26 +608,26 @@ def test_save_layout_passes_optional_name(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_save_layout(
         _make_ctx({"widget_id": "chart", "name": "Daily Setup"})
     )
-    name, payload = widget.emit.call_args[0]
+    name, payload = _last_emit(widget)
     assert name == "tvchart:save-layout"
     assert payload == {"name": "Daily Setup"}
 
 
 def test_save_layout_omits_name_when_none(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_save_layout(_make_ctx({"widget_id": "chart"}))
-    payload = widget.emit.call_args[0][1]
+    payload = _last_emit(widget)[1]
     assert payload == {}
 
 
 def test_open_layout_emits_event(widget: MagicMock) -> None:
     mcp_handlers._handle_tvchart_open_layout(_make_ctx({"widget_id": "chart"}))
-    assert widget.emit.call_args[0][0] == "tvchart:open-layout"
+    assert _last_emit(widget)[0] == "tvchart:open-layout"
 
 
 def test_save_state_emits_event(widget: MagicMock) -> None:
     out = mcp_handlers._handle_tvchart_save_state(_make_ctx({"widget_id": "chart"}))
     assert out["event_sent"] is True
-    assert widget.emit.call_args[0][0] == "tvchart:save-state"
+    assert _last_emit(widget)[0] == "tvchart:save-state"
 
 
 def test_request_state_round_trip_returns_decoded_state(widget: MagicMock) -> None:
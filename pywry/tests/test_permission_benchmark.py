@@ -0,0 +1,79 @@
+"""Benchmark for cached RBAC permission checks.
+
+Runs permission checks against ``RedisSessionStore`` on fakeredis, whose
+per-command overhead stands in for a network round trip.  With the
+permission cache every check after the first is served from memory, so the
+store must sustain at least ``PYWRY_PERMISSION_BENCH_RATE`` (default
+10,000) checks per second, both one at a time and through the batch
+``check_permissions`` API.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+
+try:
+    import fakeredis.aioredis
+
+    HAS_FAKEREDIS = True
+except ImportError:
+    HAS_FAKEREDIS = False
+
+
+pytestmark = pytest.mark.skipif(
+    not HAS_FAKEREDIS,
+    reason="fakeredis not installed (pip install fakeredis)",
+)
+
+BENCH_CHECKS = int(os.environ.get("PYWRY_PERMISSION_BENCH_CHECKS", "10000"))
+BENCH_RATE = float(os.environ.get("PYWRY_PERMISSION_BENCH_RATE", "10000"))
+
+
+@pytest.fixture
+async def store():
+    from pywry.state.redis import RedisSessionStore
+
+    store = RedisSessionStore(redis_client=fakeredis.aioredis.FakeRedis(), prefix="bench")
+    await store.set_role_permissions("viewer", ["read"])
+    await store.set_role_permissions("editor", ["read", "write"])
+    await store.create_session("s1", "u1", roles=["viewer", "editor"])
+    return store
+
+
+async def test_cached_checks_match_roles(store) -> None:
+    for _ in range(2):  # Uncached, then cached
+        assert await store.check_permission("s1", "widget", "w0", "write")
+        assert not await store.check_permission("s1", "widget", "w0", "admin")
+        assert await store.check_permissions(
+            "s1", [("widget", "w0", "read"), ("widget", "w1", "admin")]
+        ) == [True, False]
+
+
+@pytest.mark.benchmark
+async def test_check_permission_rate(store) -> None:
+    await store.check_permission("s1", "widget", "w0", "read")
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for i in range(BENCH_CHECKS):
+            await store.check_permission("s1", "widget", f"w{i}", "write")
+        best = min(best, time.perf_counter() - start)
+    rate = BENCH_CHECKS / best
+    assert rate >= BENCH_RATE, f"{rate:,.0f} checks/s < {BENCH_RATE:,.0f}"
+
+
+@pytest.mark.benchmark
+async def test_check_permissions_batch_rate(store) -> None:
+    checks = [("widget", f"w{i}", "read") for i in range(BENCH_CHECKS)]
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        results = await store.check_permissions("s1", checks)
+        best = min(best, time.perf_counter() - start)
+    assert all(results)
+    rate = BENCH_CHECKS / best
+    assert rate >= BENCH_RATE, f"{rate:,.0f} checks/s < {BENCH_RATE:,.0f}"
@@ -16,6 +16,7 @@ is never started.  They exercise:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import threading
 import time
@@ -64,10 +65,18 @@ def _reset_runtime_module():
     runtime_mod._WINDOW_MODE = "new"
     runtime_mod._TAURI_PLUGINS = "dialog,fs"
     runtime_mod._EXTRA_CAPABILITIES = ""
+    runtime_mod._warm_standby = False
+    runtime_mod._spare = None
+    runtime_mod._startup_timings = {}
+    runtime_mod._start_called_at = None
+    runtime_mod._window_state.clear()
+    runtime_mod._stale_window_state.clear()
 
     with runtime_mod._pending_lock:
         runtime_mod._pending_requests.clear()
         runtime_mod._pending_responses.clear()
+        runtime_mod._async_pending.clear()
+        runtime_mod._abandoned_requests.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -277,6 +286,134 @@ class TestSendCommandWithResponse:
             assert len(runtime_mod._pending_requests) == 0
 
 
+class _FakeSubprocess:
+    """Answers commands from a thread, the way ``_stdout_reader`` delivers them."""
+
+    def __init__(self, reply=None, delay=0.01):
+        self.reply = reply or (lambda cmd: {"success": True})
+        self.delay = delay
+        self.commands: list[dict] = []
+
+    def __call__(self, cmd):
+        self.commands.append(cmd)
+
+        def answer():
+            time.sleep(self.delay)
+            response = self.reply(cmd)
+            if response is not None:
+                runtime_mod._deliver_response({**response, "request_id": cmd["request_id"]})
+
+        threading.Thread(target=answer, daemon=True).start()
+
+
+class TestAsyncIPC:
+    async def test_response_resolves_future(self):
+        fake = _FakeSubprocess(lambda cmd: {"success": True, "value": "ok"})
+        with patch.object(runtime_mod, "send_command", side_effect=fake):
+            response = await runtime_mod.asend_command_with_response({"action": "ping"})
+        assert response is not None
+        assert response["value"] == "ok"
+        assert runtime_mod._async_pending == {}
+
+    async def test_requests_are_pipelined(self):
+        # Later requests are answered first; each caller still gets its own value
+        def reply(cmd):
+            time.sleep(0.2 - int(cmd["property"]) * 0.01)
+            return {"success": True, "value": cmd["property"]}
+
+        fake = _FakeSubprocess(reply, delay=0)
+        with patch.object(runtime_mod, "send_command", side_effect=fake):
+            start = time.perf_counter()
+            values = await asyncio.gather(
+                *(runtime_mod.awindow_get("main", str(i)) for i in range(10))
+            )
+            elapsed = time.perf_counter() - start
+        assert values == [str(i) for i in range(10)]
+        assert len({cmd["request_id"] for cmd in fake.commands}) == 10
+        assert elapsed < 1.0
+
+    async def test_timeout_returns_none_and_drops_late_response(self):
+        with patch.object(runtime_mod, "send_command") as mock_send:
+            assert await runtime_mod.asend_command_with_response({"action": "x"}, 0.05) is None
+        request_id = mock_send.call_args.args[0]["request_id"]
+        assert request_id in runtime_mod._abandoned_requests
+
+        runtime_mod._deliver_response({"request_id": request_id, "success": True})
+        assert runtime_mod._responses.empty()
+        assert request_id not in runtime_mod._abandoned_requests
+
+    async def test_cancellation_abandons_request(self):
+        with patch.object(runtime_mod, "send_command") as mock_send:
+            task = asyncio.create_task(runtime_mod.awindow_get("main", "title"))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        request_id = mock_send.call_args.args[0]["request_id"]
+        assert runtime_mod._async_pending == {}
+        runtime_mod._deliver_response({"request_id": request_id, "success": True})
+        assert runtime_mod._responses.empty()
+
+    async def test_stop_releases_awaiting_callers(self):
+        with patch.object(runtime_mod, "send_command"):
+            task = asyncio.create_task(runtime_mod.asend_command_with_response({"action": "x"}))
+            await asyncio.sleep(0.01)
+            runtime_mod.stop()
+            assert await asyncio.wait_for(task, 1.0) is None
+
+    async def test_awindow_get_errors(self):
+        from pywry.exceptions import IPCTimeoutError, PropertyError
+
+        fake = _FakeSubprocess(lambda cmd: {"success": False, "error": "missing"})
+        with patch.object(runtime_mod, "send_command", side_effect=fake):
+            with pytest.raises(PropertyError):
+                await runtime_mod.awindow_get("main", "size")
+        with patch.object(runtime_mod, "send_command"), pytest.raises(IPCTimeoutError):
+            await runtime_mod.awindow_get("main", "size", timeout=0.05)
+
+    async def test_awindow_get_uses_push_cache(self):
+        runtime_mod._window_state["main"] = {"is_focused": False, "title": "A"}
+        with patch.object(runtime_mod, "send_command") as mock_send:
+            assert await runtime_mod.awindow_get("main", "is_focused") is False
+        mock_send.assert_not_called()
+
+        runtime_mod._stale_window_state.add("main")
+        fake = _FakeSubprocess(
+            lambda cmd: {"success": True, "values": {"is_focused": True, "title": "B"}}
+        )
+        with patch.object(runtime_mod, "send_command", side_effect=fake):
+            assert await runtime_mod.awindow_get("main", "title") == "B"
+        assert fake.commands[0]["action"] == "window_get_many"
+        assert "main" not in runtime_mod._stale_window_state
+        assert runtime_mod._window_state["main"]["is_focused"] is True
+
+    async def test_awindow_call(self):
+        from pywry.exceptions import WindowError
+
+        fake = _FakeSubprocess(lambda cmd: {"success": True, "result": 7})
+        with patch.object(runtime_mod, "send_command", side_effect=fake):
+            assert await runtime_mod.awindow_call("main", "scale", expect_response=True) == 7
+        with patch.object(runtime_mod, "send_command") as mock_send:
+            assert await runtime_mod.awindow_call("main", "show") is None
+        assert "request_id" not in mock_send.call_args.args[0]
+
+        fake = _FakeSubprocess(lambda cmd: {"success": False, "error": "nope"})
+        with (
+            patch.object(runtime_mod, "send_command", side_effect=fake),
+            pytest.raises(WindowError),
+        ):
+            await runtime_mod.awindow_call("main", "scale", expect_response=True)
+
+    async def test_aeval_js_and_aemit_event(self):
+        fake = _FakeSubprocess(lambda cmd: {"type": "result", "success": cmd["action"] == "eval"})
+        with patch.object(runtime_mod, "send_command", side_effect=fake):
+            assert await runtime_mod.aeval_js("main", "1 + 1") is True
+            assert await runtime_mod.aemit_event("main", "app:x", {"a": 1}) is False
+        assert [cmd["action"] for cmd in fake.commands] == ["eval", "emit"]
+        assert fake.commands[1]["payload"] == {"a": 1}
+        assert runtime_mod._responses.empty()
+
+
 # ---------------------------------------------------------------------------
 # window_get / window_call
 # ---------------------------------------------------------------------------
@@ -329,6 +466,146 @@ class TestWindowGet:
         assert captured["cmd"]["args"] == {"x": 10}
 
 
+class TestWindowGetMany:
+    def test_single_round_trip_in_requested_order(self):
+        captured = []
+
+        def fake_send(cmd, timeout):
+            captured.append(cmd)
+            return {"success": True, "values": {"is_focused": True, "title": "T"}, "errors": {}}
+
+        with patch.object(runtime_mod, "send_command_with_response", side_effect=fake_send):
+            values = runtime_mod.window_get_many("main", ["title", "is_focused"])
+        assert list(values.items()) == [("title", "T"), ("is_focused", True)]
+        assert captured == [
+            {"action": "window_get_many", "label": "main", "properties": ["title", "is_focused"]}
+        ]
+
+    def test_property_error_names_failed_property(self):
+        from pywry.exceptions import PropertyError
+
+        response = {"success": True, "values": {"title": "T"}, "errors": {"nope": "Unknown"}}
+        with (
+            patch.object(runtime_mod, "send_command_with_response", return_value=response),
+            pytest.raises(PropertyError) as exc_info,
+        ):
+            runtime_mod.window_get_many("main", ["title", "nope"])
+        assert exc_info.value.property_name == "nope"
+
+    def test_missing_window_and_timeout(self):
+        from pywry.exceptions import IPCTimeoutError, PropertyError
+
+        with (
+            patch.object(
+                runtime_mod,
+                "send_command_with_response",
+                return_value={"success": False, "error": "Window not found: main"},
+            ),
+            pytest.raises(PropertyError, match="Window not found"),
+        ):
+            runtime_mod.window_get_many("main", ["title"])
+        with (
+            patch.object(runtime_mod, "send_command_with_response", return_value=None),
+            pytest.raises(IPCTimeoutError),
+        ):
+            runtime_mod.window_get_many("main", ["title"])
+
+    def test_proxy_snapshot_converts_types(self):
+        from pywry.window_proxy import WindowProxy
+
+        values = {"inner_size": {"width": 800, "height": 600}, "theme": "Dark", "title": "T"}
+        with patch.object(runtime_mod, "window_get_many", return_value=values) as mock_many:
+            state = WindowProxy("main").snapshot(["inner_size", "theme", "title"])
+        mock_many.assert_called_once_with("main", ["inner_size", "theme", "title"])
+        assert state["inner_size"].width == 800
+        assert state["theme"].value == "Dark"
+        assert state["title"] == "T"
+
+
+class TestWindowStateCache:
+    @pytest.fixture
+    def watched(self):
+        initial = {"inner_size": {"width": 800, "height": 600}, "is_focused": False}
+        with patch.object(
+            runtime_mod,
+            "send_command_with_response",
+            return_value={"success": True, "values": initial},
+        ):
+            assert runtime_mod.watch_window_state("main") == initial
+
+    def test_reads_are_served_from_cache(self, watched):
+        with patch.object(runtime_mod, "send_command_with_response") as mock_send:
+            assert runtime_mod.window_get("main", "inner_size") == {"width": 800, "height": 600}
+            assert runtime_mod.window_get("main", "is_focused") is False
+        mock_send.assert_not_called()
+
+    def test_uncached_property_uses_ipc(self, watched):
+        with patch.object(
+            runtime_mod,
+            "send_command_with_response",
+            return_value={"success": True, "value": "Title"},
+        ) as mock_send:
+            assert runtime_mod.window_get("main", "title") == "Title"
+        assert mock_send.call_args.args[0]["action"] == "window_get"
+
+    def test_pushed_state_updates_cache(self, watched):
+        proc = MagicMock()
+        push = {"type": "window_state", "label": "main", "state": {"is_focused": True}}
+        proc.stdout.readline = MagicMock(side_effect=[json.dumps(push) + "\n", ""])
+        runtime_mod._process = proc
+        runtime_mod._running = True
+        runtime_mod._stdout_reader()
+        assert runtime_mod.window_get("main", "is_focused") is True
+
+    def test_window_call_forces_one_resync(self, watched):
+        with patch.object(runtime_mod, "send_command"):
+            runtime_mod.window_call("main", "set_size", {"width": 1024, "height": 768})
+        resync = {
+            "success": True,
+            "values": {"inner_size": {"width": 1024, "height": 768}, "is_focused": True},
+            "errors": {},
+        }
+        with patch.object(
+            runtime_mod, "send_command_with_response", return_value=resync
+        ) as mock_send:
+            assert runtime_mod.window_get("main", "inner_size") == {"width": 1024, "height": 768}
+            assert runtime_mod.window_get("main", "is_focused") is True
+        mock_send.assert_called_once()
+        assert mock_send.call_args.args[0]["properties"] == ["inner_size", "is_focused"]
+
+    def test_unwatch_and_stop_clear_cache(self, watched):
+        with patch.object(runtime_mod, "send_command") as mock_send:
+            runtime_mod.unwatch_window_state("main")
+        assert mock_send.call_args.args[0] == {
+            "action": "window_watch",
+            "label": "main",
+            "enabled": False,
+        }
+        assert runtime_mod._window_state == {}
+
+        runtime_mod._window_state["other"] = {"is_focused": True}
+        runtime_mod.stop()
+        assert runtime_mod._window_state == {}
+
+    def test_window_closed_drops_cache(self, watched):
+        runtime_mod._dispatch_event({"label": "main", "event_type": "window:closed", "data": {}})
+        assert "main" not in runtime_mod._window_state
+
+    def test_watch_missing_window_raises(self):
+        from pywry.exceptions import WindowError
+
+        with (
+            patch.object(
+                runtime_mod,
+                "send_command_with_response",
+                return_value={"success": False, "error": "Window not found: x"},
+            ),
+            pytest.raises(WindowError),
+        ):
+            runtime_mod.watch_window_state("x")
+        assert "x" not in runtime_mod._window_state
+
+
 class TestWindowCall:
     def test_fire_and_forget_default(self):
         with patch.object(runtime_mod, "send_command") as mock_send:
@@ -534,6 +811,39 @@ class TestCssAndRefresh:
         ):
             assert runtime_mod.inject_css("main", "body{}", "css1") is False
 
+    def test_broadcast_css_single_command(self):
+        with (
+            patch.object(runtime_mod, "send_command") as mock_send,
+            patch.object(runtime_mod, "get_response", return_value={"success": True}),
+        ):
+            assert runtime_mod.broadcast_css(["a", "b", "c"], "body{}", "css1") is True
+        mock_send.assert_called_once()
+        sent = mock_send.call_args.args[0]
+        assert sent["labels"] == ["a", "b", "c"]
+        assert sent["event"] == "pywry:inject-css"
+        assert sent["payload"] == {"css": "body{}", "id": "css1"}
+
+    def test_broadcast_css_no_labels(self):
+        with patch.object(runtime_mod, "send_command") as mock_send:
+            assert runtime_mod.broadcast_css([], "body{}", "css1") is False
+        mock_send.assert_not_called()
+
+    def test_release_frame_sends_fire_and_forget_command(self):
+        with (
+            patch.object(runtime_mod, "is_running", return_value=True),
+            patch.object(runtime_mod, "send_command") as mock_send,
+        ):
+            runtime_mod.release_frame("pywry_abc")
+        mock_send.assert_called_once_with({"action": "frame_release", "name": "pywry_abc"})
+
+    def test_release_frame_without_subprocess(self):
+        with (
+            patch.object(runtime_mod, "is_running", return_value=False),
+            patch.object(runtime_mod, "send_command") as mock_send,
+        ):
+            runtime_mod.release_frame("pywry_abc")
+        mock_send.assert_not_called()
+
     def test_remove_css_success(self):
         with (
             patch.object(runtime_mod, "send_command") as mock_send,
@@ -1311,6 +1621,158 @@ class TestStartStop:
             runtime_mod._responses = original_resp
 
 
+def _ready_process(*lines: str, ready: bool = True) -> MagicMock:
+    """A fake subprocess that prints ``lines`` after its ready line, then
+    blocks on stdout until the pipe is closed (or EOFs at once if not ready)."""
+    proc = MagicMock()
+    output = [json.dumps({"type": "ready"}) + "\n", *lines] if ready else []
+    closed = threading.Event()
+
+    def readline() -> str:
+        if ready and not output:
+            closed.wait()
+        return output.pop(0) if output else ""
+
+    proc.stdout.readline = MagicMock(side_effect=readline)
+    proc.stdout.close = MagicMock(side_effect=closed.set)
+    proc.pending_output = output
+    proc.stderr.readline = MagicMock(side_effect=[""])
+    proc.stdin.closed = False
+    proc.poll.return_value = None
+    proc.wait = MagicMock(return_value=0)
+    return proc
+
+
+@pytest.fixture
+def fake_spawn():
+    """Patch subprocess spawning so every Popen returns a fresh ready process."""
+    with (
+        patch.object(
+            runtime_mod.subprocess, "Popen", side_effect=lambda *a, **k: _ready_process()
+        ) as popen,
+        patch("pywry._freeze.get_subprocess_command", return_value=["x"]),
+        patch("pywry._freeze.is_frozen", return_value=False),
+        patch.object(runtime_mod, "atexit"),
+    ):
+        yield popen
+    runtime_mod._running = False
+    runtime_mod.discard_spare()
+
+
+class TestWarmStandby:
+    def test_prewarm_spawns_ready_spare(self, fake_spawn):
+        runtime_mod.prewarm()
+        spare = runtime_mod._spare
+        assert spare is not None
+        assert spare.ready.wait(2.0)
+        assert fake_spawn.call_count == 1
+
+        # A matching, live spare is kept
+        runtime_mod.prewarm()
+        assert runtime_mod._spare is spare
+        assert fake_spawn.call_count == 1
+
+    def test_start_promotes_spare(self, fake_spawn):
+        runtime_mod.prewarm()
+        spare = runtime_mod._spare
+        assert spare.ready.wait(2.0)
+
+        assert runtime_mod.start() is True
+        assert runtime_mod._process is spare.process
+        assert runtime_mod._spare is None
+        assert fake_spawn.call_count == 1
+        timings = runtime_mod.get_startup_timings()
+        assert timings["warm"] is True
+        assert timings["first_window_ms"] is None
+
+    def test_start_discards_spare_with_stale_config(self, fake_spawn):
+        runtime_mod.prewarm()
+        stale = runtime_mod._spare
+        assert stale.ready.wait(2.0)
+        runtime_mod.set_window_mode("single")
+
+        assert runtime_mod.start() is True
+        assert runtime_mod._process is not stale.process
+        assert fake_spawn.call_count == 2
+        stale.process.wait.assert_called()
+        assert runtime_mod.get_startup_timings()["warm"] is False
+
+    def test_warm_standby_replaces_promoted_spare(self, fake_spawn):
+        runtime_mod.enable_warm_standby()
+        first = runtime_mod._spare
+        assert first.ready.wait(2.0)
+
+        assert runtime_mod.start() is True
+        assert runtime_mod._process is first.process
+        assert runtime_mod._spare is not None
+        assert runtime_mod._spare is not first
+        assert fake_spawn.call_count == 2
+
+    def test_disable_warm_standby_discards_spare(self, fake_spawn):
+        runtime_mod.enable_warm_standby()
+        spare = runtime_mod._spare
+        runtime_mod.enable_warm_standby(False)
+        assert runtime_mod._warm_standby is False
+        assert runtime_mod._spare is None
+        spare.process.wait.assert_called()
+
+    def test_stop_keeps_spare(self, fake_spawn):
+        runtime_mod.enable_warm_standby()
+        assert runtime_mod.start() is True
+        spare = runtime_mod._spare
+        runtime_mod.stop()
+        assert runtime_mod._spare is spare
+
+    def test_spare_output_is_drained_until_promoted(self, fake_spawn):
+        chatter = [f"log line {i}\n" for i in range(5000)]
+        fake_spawn.side_effect = [_ready_process(*chatter)]
+        runtime_mod.prewarm()
+        spare = runtime_mod._spare
+        assert spare.ready.wait(2.0)
+        deadline = time.monotonic() + 5
+        while spare.process.pending_output and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert spare.process.pending_output == []
+
+        assert runtime_mod.start() is True
+        # The drain thread now feeds the runtime's handlers
+        spare.process.pending_output.append(json.dumps({"request_id": "r1", "ok": 1}) + "\n")
+        spare.process.stdout.close()  # Wake the blocked readline
+        assert runtime_mod._responses.get(timeout=2.0) == {"request_id": "r1", "ok": 1}
+
+    def test_dead_spare_falls_back_to_cold_start_immediately(self, fake_spawn):
+        dead = _ready_process(ready=False)
+        dead.poll.return_value = 1
+        fake_spawn.side_effect = [dead, _ready_process()]
+        runtime_mod.prewarm()
+
+        started = time.monotonic()
+        assert runtime_mod.start() is True
+        assert time.monotonic() - started < 5.0
+        assert runtime_mod._process is not dead
+        assert runtime_mod.get_startup_timings()["warm"] is False
+
+    def test_cold_start_timings(self, fake_spawn):
+        assert runtime_mod.get_startup_timings() == {}
+        assert runtime_mod.start() is True
+        timings = runtime_mod.get_startup_timings()
+        assert timings["warm"] is False
+        assert timings["spawn_to_ready_ms"] >= 0
+        assert timings["start_ms"] >= timings["spawn_to_ready_ms"]
+        assert timings["first_window_ms"] is None
+
+    def test_create_window_records_first_window(self, fake_spawn):
+        assert runtime_mod.start() is True
+        runtime_mod._responses.put({"success": True})
+        assert runtime_mod.create_window("w1") is True
+        first = runtime_mod.get_startup_timings()["first_window_ms"]
+        assert first is not None
+
+        runtime_mod._responses.put({"success": True})
+        runtime_mod.create_window("w2")
+        assert runtime_mod.get_startup_timings()["first_window_ms"] == first
+
+
 # ---------------------------------------------------------------------------
 # Portal management
 # ---------------------------------------------------------------------------
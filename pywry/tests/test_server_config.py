@@ -241,6 +241,48 @@ class TestServerSettingsLimits:
         assert settings.limit_max_requests == 1000
 
 
+class TestServerSettingsProtocols:
+    """Tests for event loop, protocol and WebSocket tuning settings."""
+
+    def test_defaults_pick_fastest_installed(self):
+        """Loop, HTTP parser and WebSocket implementation default to auto."""
+        settings = ServerSettings()
+        assert (settings.loop, settings.http, settings.ws) == ("auto", "auto", "auto")
+
+    def test_websocket_defaults_match_uvicorn(self):
+        """WebSocket tuning defaults mirror uvicorn's own defaults."""
+        settings = ServerSettings()
+        assert settings.ws_max_size == 16 * 1024 * 1024
+        assert settings.ws_max_queue == 32
+        assert settings.ws_ping_interval == 20.0
+        assert settings.ws_ping_timeout == 20.0
+        assert settings.ws_per_message_deflate is True
+
+    def test_invalid_loop_rejected(self):
+        """Unknown event loop names are rejected."""
+        with pytest.raises(ValueError):
+            ServerSettings(loop="trio")
+
+    def test_ping_can_be_disabled(self):
+        """Pings can be disabled with None."""
+        settings = ServerSettings(ws_ping_interval=None, ws_ping_timeout=None)
+        assert settings.ws_ping_interval is None
+
+    def test_protocol_settings_from_env(self, clean_env):
+        """Protocol settings can be set via environment variables."""
+        os.environ["PYWRY_SERVER__LOOP"] = "asyncio"
+        os.environ["PYWRY_SERVER__HTTP"] = "h11"
+        os.environ["PYWRY_SERVER__WS"] = "websockets-sansio"
+        os.environ["PYWRY_SERVER__WS_PER_MESSAGE_DEFLATE"] = "false"
+        settings = ServerSettings()
+        assert (settings.loop, settings.http, settings.ws) == (
+            "asyncio",
+            "h11",
+            "websockets-sansio",
+        )
+        assert settings.ws_per_message_deflate is False
+
+
 # =============================================================================
 # ServerSettings SSL Tests
 # =============================================================================
@@ -0,0 +1,145 @@
+"""Load benchmark for the inline server's event loop and WebSocket settings.
+
+Starts uvicorn with the same ``_uvicorn_protocol_kwargs`` and loop factory
+as ``inline._start_server`` for several ``ServerSettings`` variants, then
+streams widget events to many concurrent WebSocket clients: each of
+``PYWRY_WS_BENCH_WIDGETS`` (default 50) connections receives
+``PYWRY_WS_BENCH_EVENTS`` (default 200) ``toolbar:marquee-set-items``
+messages.  Variants that need uvloop or httptools are skipped when those
+packages are not installed.
+
+Every variant must deliver all events at ``PYWRY_WS_BENCH_MIN_RATE``
+(default 2000) events per second or better; run with ``-s`` to compare
+the printed per-variant rates.  The untimed check only requires each
+variant to deliver a few events intact.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+import uvicorn
+
+from fastapi import FastAPI, WebSocket
+from websockets.asyncio.client import connect
+
+from pywry.config import ServerSettings
+from pywry.inline import _uvicorn_protocol_kwargs
+
+
+WIDGETS = int(os.environ.get("PYWRY_WS_BENCH_WIDGETS", "50"))
+EVENTS = int(os.environ.get("PYWRY_WS_BENCH_EVENTS", "200"))
+MIN_RATE = float(os.environ.get("PYWRY_WS_BENCH_MIN_RATE", "2000"))
+
+# One quote-board update, the typical high-rate widget event
+EVENT = json.dumps(
+    {
+        "type": "toolbar:marquee-set-items",
+        "data": {
+            "items": [
+                {"ticker": f"SYM{i}", "text": f"SYM{i} {100 + i:.2f} +0.25", "class_add": "up"}
+                for i in range(8)
+            ]
+        },
+    }
+)
+
+VARIANTS = {
+    "auto": {},
+    "asyncio-h11": {"loop": "asyncio", "http": "h11"},
+    "no-deflate": {"ws_per_message_deflate": False},
+    "websockets-sansio": {"ws": "websockets-sansio"},
+    "uvloop-httptools": {"loop": "uvloop", "http": "httptools"},
+}
+_REQUIRES = {"uvloop-httptools": ("uvloop", "httptools")}
+
+
+def _stream_app(events: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.websocket("/ws/{widget_id}")
+    async def stream(websocket: WebSocket, widget_id: str) -> None:
+        await websocket.accept()
+        for _ in range(events):
+            await websocket.send_text(EVENT)
+        await websocket.receive_text()  # Client acknowledges before closing
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _widget_client(url: str, events: int) -> list[str]:
+    received = []
+    async with connect(url, max_size=None) as ws:
+        while len(received) < events:
+            received.append(await ws.recv())
+        await ws.send("done")
+    return received
+
+
+async def _load(port: int, widgets: int, events: int) -> tuple[list[list[str]], float]:
+    start = time.perf_counter()
+    received = await asyncio.gather(
+        *(_widget_client(f"ws://127.0.0.1:{port}/ws/w{i}", events) for i in range(widgets))
+    )
+    return list(received), time.perf_counter() - start
+
+
+def _stream(variant: str, widgets: int, events: int) -> tuple[list[list[str]], float]:
+    """Serve one settings variant and stream ``events`` messages to ``widgets`` clients."""
+    for module in _REQUIRES.get(variant, ()):
+        if importlib.util.find_spec(module) is None:
+            pytest.skip(f"{module} is not installed")
+
+    settings = ServerSettings(**VARIANTS[variant])
+    port = _free_port()
+    config = uvicorn.Config(
+        _stream_app(events),
+        host="127.0.0.1",
+        port=port,
+        log_level="critical",
+        **_uvicorn_protocol_kwargs(settings),
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    try:
+        deadline = time.monotonic() + 10
+        while not server.started and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert server.started, "server did not start"
+
+        return asyncio.run(_load(port, widgets, events))
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+@pytest.mark.parametrize("variant", list(VARIANTS))
+def test_every_variant_delivers_identical_events(variant: str) -> None:
+    received, _ = _stream(variant, widgets=3, events=5)
+    assert received == [[EVENT] * 5] * 3
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", list(VARIANTS))
+def test_concurrent_widget_streaming(variant: str) -> None:
+    received, seconds = _stream(variant, WIDGETS, EVENTS)
+    delivered = sum(len(messages) for messages in received)
+
+    rate = delivered / seconds
+    print(f"\n{variant}: {WIDGETS} widgets x {EVENTS} events in {seconds:.2f}s ({rate:,.0f}/s)")
+    assert delivered == WIDGETS * EVENTS
+    assert rate >= MIN_RATE, f"{variant}: {rate:,.0f} events/s"
@@ -0,0 +1,90 @@
+"""Tests for the shared-memory grid frame handoff in ``pywry.shared_frame``."""
+
+from __future__ import annotations
+
+import json
+
+from multiprocessing import shared_memory
+
+import pytest
+
+from pywry import shared_frame
+from pywry.shared_frame import FRAME_PREFIX, SharedFrame, detach, read_chunk
+
+
+@pytest.fixture
+def frame():
+    rows = [{"id": i, "name": f"row {i}", "price": i * 1.5} for i in range(25)]
+    frame = SharedFrame(rows, chunk_rows=10)
+    yield frame
+    detach(frame.name)
+    frame.close()
+
+
+class TestSharedFrame:
+    def test_descriptor(self, frame: SharedFrame) -> None:
+        assert frame.name.startswith(FRAME_PREFIX)
+        assert frame.descriptor() == {"name": frame.name, "chunks": 3, "rows": 25}
+
+    def test_chunks_round_trip(self, frame: SharedFrame) -> None:
+        rows = [row for index in range(3) for row in json.loads(read_chunk(frame.name, index))]
+        assert [row["id"] for row in rows] == list(range(25))
+        assert rows[24] == {"id": 24, "name": "row 24", "price": 36.0}
+        assert len(json.loads(read_chunk(frame.name, 2))) == 5
+
+    def test_empty_rows(self) -> None:
+        frame = SharedFrame([])
+        try:
+            assert frame.descriptor()["chunks"] == 0
+            with pytest.raises(IndexError):
+                read_chunk(frame.name, 0)
+        finally:
+            detach(frame.name)
+            frame.close()
+
+    def test_invalid_chunk_rows(self) -> None:
+        with pytest.raises(ValueError, match="chunk_rows"):
+            SharedFrame([{"a": 1}], chunk_rows=0)
+
+    def test_close_unlinks_and_is_idempotent(self) -> None:
+        frame = SharedFrame([{"a": 1}])
+        name = frame.name
+        frame.close()
+        frame.close()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+class TestReadChunk:
+    def test_index_out_of_range(self, frame: SharedFrame) -> None:
+        with pytest.raises(IndexError):
+            read_chunk(frame.name, 3)
+        with pytest.raises(IndexError):
+            read_chunk(frame.name, -1)
+
+    def test_rejects_foreign_segment_names(self) -> None:
+        with pytest.raises(ValueError, match="Not a PyWry frame"):
+            read_chunk("psm_other", 0)
+
+    def test_rejects_segment_without_header(self) -> None:
+        shm = shared_memory.SharedMemory(name=f"{FRAME_PREFIX}badmagic", create=True, size=16)
+        try:
+            with pytest.raises(ValueError, match="not a shared frame"):
+                read_chunk(shm.name, 0)
+        finally:
+            detach(shm.name)
+            shm.close()
+            shm.unlink()
+
+    def test_missing_segment(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            read_chunk(f"{FRAME_PREFIX}doesnotexist", 0)
+
+    def test_attach_is_cached_until_detach(self, frame: SharedFrame) -> None:
+        read_chunk(frame.name, 0)
+        attached = shared_frame._attached[frame.name]
+        read_chunk(frame.name, 1)
+        assert shared_frame._attached[frame.name] is attached
+        assert detach(frame.name) is True
+        assert detach(frame.name) is False
+        assert frame.name not in shared_frame._attached
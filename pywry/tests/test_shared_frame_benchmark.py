@@ -0,0 +1,110 @@
+"""Benchmarks for handing a large DataFrame to the native window.
+
+Compares the embedded path (rows serialized into the page HTML, escaped
+again into the stdin command and parsed by the subprocess) with the
+shared-memory path (rows written once into a ``SharedFrame`` and read back
+chunk by chunk as raw bytes).  Memory is the peak Python heap measured
+with ``tracemalloc``; the shared segment itself is not heap memory.
+
+The frame defaults to 100,000 rows; set ``PYWRY_SHARED_FRAME_BENCH_ROWS``
+to ``1000000`` for the full-size comparison.  The shared path must use at
+most ``PYWRY_SHARED_FRAME_MEMORY_RATIO`` (default 0.5) of the embedded
+path's peak heap, and at most ``PYWRY_SHARED_FRAME_TIME_RATIO`` (default
+1.2, to absorb scheduler noise) of its best wall time.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pywry.shared_frame import SharedFrame, detach, read_chunk
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+BENCH_ROWS = int(os.environ.get("PYWRY_SHARED_FRAME_BENCH_ROWS", "100000"))
+MEMORY_RATIO = float(os.environ.get("PYWRY_SHARED_FRAME_MEMORY_RATIO", "0.5"))
+TIME_RATIO = float(os.environ.get("PYWRY_SHARED_FRAME_TIME_RATIO", "1.2"))
+
+
+@pytest.fixture(scope="module")
+def rows() -> list[dict]:
+    return [
+        {
+            "id": i,
+            "symbol": f"SYM{i % 500}",
+            "price": i * 0.25,
+            "qty": i % 1000,
+            "side": "buy" if i % 2 else "sell",
+        }
+        for i in range(BENCH_ROWS)
+    ]
+
+
+def _embedded(rows: list[dict]) -> int:
+    html = f"<script>var rowData = {json.dumps(rows)};</script>"
+    line = json.dumps({"action": "set_content", "label": "main", "html": html})
+    return len(json.loads(line)["html"])
+
+
+def _shared(rows: list[dict]) -> int:
+    frame = SharedFrame(rows)
+    try:
+        return sum(len(read_chunk(frame.name, i)) for i in range(frame.chunk_count))
+    finally:
+        detach(frame.name)
+        frame.close()
+
+
+def _measure(handoff: Callable[[list[dict]], int], rows: list[dict]) -> tuple[float, int]:
+    """Return (best seconds of three runs, peak traced bytes)."""
+    seconds = []
+    for _ in range(3):
+        gc.collect()
+        start = time.perf_counter()
+        handoff(rows)
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        handoff(rows)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(seconds), peak
+
+
+def test_both_paths_deliver_the_same_rows(rows: list[dict]) -> None:
+    sample = rows[:2500]
+    frame = SharedFrame(sample, chunk_rows=1000)
+    try:
+        shared = [
+            row
+            for index in range(frame.chunk_count)
+            for row in json.loads(read_chunk(frame.name, index))
+        ]
+    finally:
+        detach(frame.name)
+        frame.close()
+    assert shared == json.loads(json.dumps(sample))
+
+
+@pytest.mark.benchmark
+def test_shared_frame_beats_embedding(rows: list[dict]) -> None:
+    embedded_s, embedded_peak = _measure(_embedded, rows)
+    shared_s, shared_peak = _measure(_shared, rows)
+    summary = (
+        f"{BENCH_ROWS:,} rows: embedded {embedded_s:.2f}s / {embedded_peak / 1e6:.0f} MB, "
+        f"shared {shared_s:.2f}s / {shared_peak / 1e6:.0f} MB"
+    )
+    assert shared_peak <= embedded_peak * MEMORY_RATIO, summary
+    assert shared_s <= embedded_s * TIME_RATIO, summary
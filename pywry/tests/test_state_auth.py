@@ -443,3 +443,118 @@ class TestAuthMiddleware:
 
         await middleware(scope, receive, send)
         assert scope["session"] is not None
+
+    async def test_static_paths_skip_session_lookup(
+        self, session_store: MemorySessionStore, auth_config: AuthConfig
+    ) -> None:
+        app = AsyncMock()
+        store = AsyncMock(wraps=session_store)
+        middleware = AuthMiddleware(app, store, auth_config)
+        scope = {
+            "type": "http",
+            "path": "/assets/app.js",
+            "headers": [(b"cookie", b"pywry_session=session1")],
+            "query_string": b"",
+        }
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+        store.get_session.assert_not_awaited()
+        assert "session" not in scope
+        app.assert_awaited_once()
+
+    async def test_custom_skip_paths(
+        self, session_store: MemorySessionStore, auth_config: AuthConfig
+    ) -> None:
+        middleware = AuthMiddleware(AsyncMock(), session_store, auth_config, skip_paths=["/cdn"])
+        scope = {"type": "http", "path": "/assets/app.js", "headers": [], "query_string": b""}
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+        assert scope["session"] is None
+
+    async def test_validated_session_is_cached(
+        self, session_store: MemorySessionStore, auth_config: AuthConfig
+    ) -> None:
+        await session_store.create_session("session1", "user1")
+        store = AsyncMock(wraps=session_store)
+        middleware = AuthMiddleware(AsyncMock(), store, auth_config)
+
+        for _ in range(3):
+            scope = {
+                "type": "http",
+                "path": "/api",
+                "headers": [(b"cookie", b"pywry_session=session1")],
+                "query_string": b"",
+            }
+            await middleware(scope, AsyncMock(), AsyncMock())
+            assert scope["session"].user_id == "user1"
+        assert store.get_session.await_count == 1
+
+    async def test_cache_disabled_reads_store_each_time(
+        self, session_store: MemorySessionStore
+    ) -> None:
+        await session_store.create_session("session1", "user1")
+        config = AuthConfig(enabled=True, token_secret="test-secret", session_cache_ttl=0)
+        store = AsyncMock(wraps=session_store)
+        middleware = AuthMiddleware(AsyncMock(), store, config)
+
+        for _ in range(2):
+            scope = {
+                "type": "http",
+                "path": "/api",
+                "headers": [],
+                "query_string": b"session=session1",
+            }
+            await middleware(scope, AsyncMock(), AsyncMock())
+        assert store.get_session.await_count == 2
+
+    async def test_bearer_header_name_is_case_insensitive(
+        self, session_store: MemorySessionStore, auth_config: AuthConfig
+    ) -> None:
+        await session_store.create_session("session1", "user1")
+        token = generate_session_token("user1", auth_config.token_secret)
+        middleware = AuthMiddleware(AsyncMock(), session_store, auth_config)
+        scope = {
+            "type": "http",
+            "path": "/api",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "query_string": b"",
+        }
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+        assert scope["session"].session_id == "session1"
+
+    async def test_empty_cookie_falls_back_to_query(
+        self, session_store: MemorySessionStore, auth_config: AuthConfig
+    ) -> None:
+        await session_store.create_session("session1", "user1")
+        middleware = AuthMiddleware(AsyncMock(), session_store, auth_config)
+        scope = {
+            "type": "websocket",
+            "path": "/ws/w1",
+            "headers": [(b"cookie", b"other=1; pywry_session=")],
+            "query_string": b"token=x&session=session1",
+        }
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+        assert scope["session"].session_id == "session1"
+
+
+class TestPrefixTrie:
+    """Tests for the path prefix trie used by AuthMiddleware."""
+
+    def test_matches_prefixes(self) -> None:
+        from pywry.state.auth import _PrefixTrie
+
+        trie = _PrefixTrie(["/auth/", "/assets/", "/health"])
+        assert trie.matches("/auth/login")
+        assert trie.matches("/assets/js/app.js")
+        assert trie.matches("/healthz")
+        assert not trie.matches("/api")
+        assert not trie.matches("/aut")
+        assert not trie.matches("")
+
+    def test_empty_prefix_matches_everything(self) -> None:
+        from pywry.state.auth import _PrefixTrie
+
+        assert _PrefixTrie([""]).matches("/anything")
+        assert not _PrefixTrie([]).matches("/anything")
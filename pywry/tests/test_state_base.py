@@ -188,6 +188,72 @@ class TestChartStoreDefault:
         assert store.rename_calls == [("u1", "l1", "New")]
 
 
+# --- ChatStore default truncate_messages ---
+
+
+class TestChatStoreDefaultTruncate:
+    """Tests for the default read-clear-reappend truncate_messages."""
+
+    async def test_truncate_messages_keeps_earlier_messages(self) -> None:
+        from pywry.chat import ChatMessage, ChatThread
+        from pywry.state.memory import MemoryChatStore
+
+        store = MemoryChatStore()
+        await store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
+        for i in range(4):
+            await store.append_message(
+                "w1", "t1", ChatMessage(role="user", content=f"msg{i}", message_id=f"m{i}")
+            )
+        assert await ChatStore.truncate_messages(store, "w1", "t1", "ghost") is False
+        assert len(await store.get_messages("w1", "t1")) == 4
+        assert await ChatStore.truncate_messages(store, "w1", "t1", "m2") is True
+        assert [m.message_id for m in await store.get_messages("w1", "t1")] == ["m0", "m1"]
+
+    async def test_minimal_store_is_instantiable(self) -> None:
+        assert await _MinimalChatStore().truncate_messages("w1", "t1", "m1") is False
+
+
+# --- WidgetStore default register_many ---
+
+
+class TestWidgetStoreDefault:
+    """Tests for the default per-widget register_many implementation."""
+
+    async def test_register_many_registers_each_widget(self) -> None:
+        from pywry.state.memory import MemoryWidgetStore
+        from pywry.state.types import WidgetData
+
+        store = MemoryWidgetStore()
+        await WidgetStore.register_many(
+            store,
+            [
+                WidgetData(widget_id="a", html="<p>a</p>", token="t"),
+                WidgetData(widget_id="b", html="<p>b</p>", owner_worker_id="w1"),
+            ],
+        )
+        assert await store.get_token("a") == "t"
+        widget = await store.get("b")
+        assert widget is not None
+        assert widget.owner_worker_id == "w1"
+
+
+# --- SessionStore default check_permissions ---
+
+
+class TestSessionStoreDefault:
+    """Tests for the default per-check check_permissions implementation."""
+
+    async def test_check_permissions_delegates_to_check_permission(self) -> None:
+        store = AsyncMock(spec=SessionStore)
+        store.check_permission.side_effect = [True, False]
+
+        result = await SessionStore.check_permissions(
+            store, "s1", [("widget", "w1", "read"), ("widget", "w1", "write")]
+        )
+        assert result == [True, False]
+        store.check_permission.assert_any_await("s1", "widget", "w1", "write")
+
+
 # --- EventBus subscribe default raises NotImplementedError ---
 
 
@@ -49,6 +49,25 @@ class TestCallbackRegistry:
         assert reg.is_async is False
         assert reg.callback is cb
 
+    async def test_register_many(self, registry: CallbackRegistry) -> None:
+        def on_click(data: dict, widget_id: str, event_type: str) -> None:
+            pass
+
+        async def on_change(data: dict, widget_id: str, event_type: str) -> None:
+            pass
+
+        count = await registry.register_many(
+            {"w1": {"click": on_click, "change": on_change}, "w2": {"click": on_click}, "w3": {}}
+        )
+        assert count == 3
+        assert sorted(await registry.list_widgets()) == ["w1", "w2"]
+        change = await registry.get("w1", "change")
+        assert change is not None
+        assert change.is_async is True
+        click = await registry.get("w2", "click")
+        assert click is not None
+        assert click.callback is on_click
+
     async def test_register_async_callback(self, registry: CallbackRegistry) -> None:
         async def cb(data: dict, widget_id: str, event_type: str) -> str:
             return "async-ok"
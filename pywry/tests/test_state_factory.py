@@ -14,10 +14,12 @@ from pywry.state._factory import (
     _resolve_sqlite_path,
     _WorkerIdHolder,
     clear_state_caches,
+    get_auth_state_store,
     get_chart_store,
     get_chat_store,
     get_connection_router,
     get_event_bus,
+    get_login_rate_limiter,
     get_session_store,
     get_state_backend,
     get_widget_store,
@@ -274,6 +276,46 @@ class TestGetSessionStore:
         assert isinstance(store, SqliteSessionStore)
 
 
+class TestGetLoginRateLimiter:
+    """Tests for get_login_rate_limiter."""
+
+    def test_memory_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PYWRY_DEPLOY__STATE_BACKEND", raising=False)
+        from pywry.state.memory import MemoryRateLimiter
+
+        assert isinstance(get_login_rate_limiter(), MemoryRateLimiter)
+
+    def test_redis_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYWRY_DEPLOY__STATE_BACKEND", "redis")
+        from pywry.state.redis import RedisRateLimiter
+
+        assert isinstance(get_login_rate_limiter(), RedisRateLimiter)
+
+    def test_sqlite_backend_stays_in_process(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYWRY_DEPLOY__STATE_BACKEND", "sqlite")
+        from pywry.state.memory import MemoryRateLimiter
+
+        assert isinstance(get_login_rate_limiter(), MemoryRateLimiter)
+
+
+class TestGetAuthStateStore:
+    """Tests for get_auth_state_store."""
+
+    def test_memory_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PYWRY_DEPLOY__STATE_BACKEND", raising=False)
+        from pywry.state.memory import MemoryAuthStateStore
+
+        store = get_auth_state_store()
+        assert isinstance(store, MemoryAuthStateStore)
+        assert get_auth_state_store() is store
+
+    def test_redis_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYWRY_DEPLOY__STATE_BACKEND", "redis")
+        from pywry.state.redis import RedisAuthStateStore
+
+        assert isinstance(get_auth_state_store(), RedisAuthStateStore)
+
+
 class TestGetChatStore:
     """Tests for get_chat_store."""
 
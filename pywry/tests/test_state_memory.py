@@ -19,7 +19,7 @@ from pywry.state.memory import (
     MemoryWidgetStore,
     create_memory_stores,
 )
-from pywry.state.types import EventMessage
+from pywry.state.types import EventMessage, WidgetData
 
 
 # --- MemoryWidgetStore Tests ---
@@ -48,6 +48,21 @@ class TestMemoryWidgetStore:
         assert widget.token == "secret-token"
         assert widget.owner_worker_id == "worker-1"
         assert widget.metadata == {"title": "Test Widget"}
+
+    async def test_register_many(self, store: MemoryWidgetStore) -> None:
+        await store.register_many(
+            [
+                WidgetData(widget_id="a", html="<p>a</p>", token="ta", owner_worker_id="w1"),
+                WidgetData(widget_id="b", html="<p>b</p>", metadata={"title": "B"}),
+            ]
+        )
+        assert sorted(await store.list_active()) == ["a", "b"]
+        widget = await store.get("a")
+        assert widget is not None
+        assert widget.token == "ta"
+        assert widget.owner_worker_id == "w1"
+        assert widget.created_at > 0
+        assert (await store.get("b")).metadata == {"title": "B"}  # type: ignore[union-attr]
         assert widget.created_at > 0
 
     async def test_get_nonexistent(self, store: MemoryWidgetStore) -> None:
@@ -447,6 +462,18 @@ class TestMemorySessionStore:
         await store.create_session("s1", "u1", roles=["custom-role"])
         assert await store.check_permission("s1", "widget", "w1", "my-perm") is True
 
+    async def test_set_role_permissions_invalidates_cache(self, store: MemorySessionStore) -> None:
+        await store.create_session("s1", "u1", roles=["custom-role"])
+        assert await store.check_permission("s1", "widget", "w1", "my-perm") is False
+        store.set_role_permissions("custom-role", {"my-perm"})
+        assert await store.check_permission("s1", "widget", "w1", "my-perm") is True
+
+    async def test_check_permissions_batch(self, store: MemorySessionStore) -> None:
+        await store.create_session("viewer-session", "user-2", roles=["viewer"])
+        checks = [("widget", "1", "read"), ("widget", "1", "write"), ("widget", "2", "read")]
+        assert await store.check_permissions("viewer-session", checks) == [True, False, True]
+        assert await store.check_permissions("missing", checks) == [False, False, False]
+
     async def test_session_with_ttl(self, store: MemorySessionStore) -> None:
         await store.create_session("short-session", "user-1", ttl=1)
         assert await store.validate_session("short-session") is True
@@ -587,6 +614,26 @@ class TestMemoryChatStore:
         """Clearing a nonexistent thread is a silent no-op."""
         await store.clear_messages("w1", "missing")
 
+    async def test_truncate_messages(self, store: MemoryChatStore) -> None:
+        await store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
+        for i in range(5):
+            await store.append_message(
+                "w1", "t1", ChatMessage(role="user", content=f"msg{i}", message_id=f"m{i}")
+            )
+        assert await store.truncate_messages("w1", "t1", "m2") is True
+        assert [m.message_id for m in await store.get_messages("w1", "t1")] == ["m0", "m1"]
+        assert await store.truncate_messages("w1", "t1", "m0") is True
+        assert await store.get_messages("w1", "t1") == []
+
+    async def test_truncate_messages_missing_id(self, store: MemoryChatStore) -> None:
+        await store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
+        await store.append_message(
+            "w1", "t1", ChatMessage(role="user", content="hi", message_id="m1")
+        )
+        assert await store.truncate_messages("w1", "t1", "ghost") is False
+        assert await store.truncate_messages("w1", "missing", "m1") is False
+        assert len(await store.get_messages("w1", "t1")) == 1
+
     async def test_cleanup_widget(self, store: MemoryChatStore) -> None:
         await store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
         await store.cleanup_widget("w1")
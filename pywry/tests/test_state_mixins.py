@@ -12,9 +12,15 @@ All tests use mock emitter classes to verify event emission.
 
 from __future__ import annotations
 
+import base64
+import datetime
+import json
+
 from typing import Any
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from pywry.state_mixins import (
@@ -23,6 +29,7 @@ from pywry.state_mixins import (
     PlotlyStateMixin,
     ToolbarStateMixin,
     _normalize_figure,
+    _to_jsonable,
 )
 
 
@@ -82,9 +89,9 @@ class TestNormalizeFigure:
         assert result is fig  # Same object, no copy
 
     def test_object_with_to_dict(self) -> None:
-        """Test that objects with to_json() are converted (to_json takes precedence)."""
+        """Test that to_json() is used when to_dict() does not return a dict."""
         mock_figure = MagicMock()
-        # _normalize_figure checks to_json first, which should return a JSON string
+        # MagicMock.to_dict() returns a mock, so the to_json fallback is used
         mock_figure.to_json.return_value = '{"data": [], "layout": {"title": "Mock"}}'
 
         result = _normalize_figure(mock_figure)
@@ -278,10 +285,10 @@ class TestPlotlyStateMixin:
         assert data["animate"] is False
 
     def test_update_figure_with_plotly_object(self) -> None:
-        """Test update_figure with Plotly Figure-like object (to_json takes precedence)."""
+        """Test update_figure with a Figure-like object exposing only to_json."""
         widget = MockPlotlyWidget()
         mock_figure = MagicMock()
-        # _normalize_figure checks to_json first, which should return a JSON string
+        # MagicMock.to_dict() returns a mock, so the to_json fallback is used
         mock_figure.to_json.return_value = '{"data": [{"x": [1]}], "layout": {"title": "Mock"}}'
 
         widget.update_figure(mock_figure)
@@ -851,6 +858,151 @@ class TestUpdateGridDataFrame:
         assert data["gridId"] == "gx"
 
 
+def _positions(n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": [f"S{i:05d}" for i in range(n)],
+            "qty": np.arange(n, dtype="int64"),
+            "price": np.linspace(1.0, 2.0, n),
+        }
+    )
+
+
+class TestGridTransactions:
+    def test_apply_transaction_payload(self) -> None:
+        w = MockGridWidget()
+        w.apply_transaction(
+            add=[{"id": 3}], update=[{"id": 1, "v": 2}], remove=[2], add_index=0, grid_id="g"
+        )
+        evt, data = w.get_last_event()
+        assert evt == "grid:apply-transaction"
+        assert data == {
+            "async": True,
+            "add": [{"id": 3}],
+            "addIndex": 0,
+            "update": [{"id": 1, "v": 2}],
+            "remove": [2],
+            "gridId": "g",
+        }
+
+    def test_apply_transaction_accepts_dataframes(self) -> None:
+        w = MockGridWidget()
+        df = pd.DataFrame({"id": [1], "when": [pd.Timestamp("2024-01-02")], "x": [np.nan]})
+        w.apply_transaction(update=df, batch=False)
+        _evt, data = w.get_last_event()
+        assert data == {
+            "async": False,
+            "update": [{"id": 1, "when": "2024-01-02T00:00:00", "x": None}],
+        }
+
+    def test_first_diff_replaces_dataset(self) -> None:
+        w = MockGridWidget()
+        w.diff_update(_positions(3), "symbol")
+        evt, data = w.get_last_event()
+        assert evt == "grid:update-data"
+        assert data["strategy"] == "set"
+        assert [row["symbol"] for row in data["data"]] == ["S00000", "S00001", "S00002"]
+
+    def test_diff_sends_only_added_changed_and_removed_rows(self) -> None:
+        w = MockGridWidget()
+        w.diff_update(_positions(4), "symbol")
+        tick = _positions(4).drop(index=0)
+        tick.loc[2, "price"] = 9.5
+        tick = pd.concat([tick, pd.DataFrame({"symbol": ["NEW"], "qty": [7], "price": [1.0]})])
+        w.diff_update(tick, "symbol", grid_id="g")
+        # grid_id is part of the snapshot key, so the first call for "g" sends everything
+        assert w.get_last_event()[0] == "grid:update-data"
+
+        w.diff_update(_positions(4), "symbol", grid_id="g")
+        evt, data = w.get_last_event()
+        assert evt == "grid:apply-transaction"
+        assert data["remove"] == ["NEW"]
+        assert [row["symbol"] for row in data["add"]] == ["S00000"]
+        assert [row["symbol"] for row in data["update"]] == ["S00002"]
+        assert data["gridId"] == "g"
+
+    def test_unchanged_data_emits_nothing(self) -> None:
+        w = MockGridWidget()
+        rows = [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}]
+        w.diff_update(rows, "id")
+        w.diff_update([dict(r) for r in rows], "id")
+        assert len(w.emitted_events) == 1
+
+    def test_dataframe_and_records_hash_alike(self) -> None:
+        w = MockGridWidget()
+        df = _positions(3)
+        df["when"] = [pd.Timestamp("2024-01-02"), pd.NaT, pd.Timestamp("2024-01-03")]
+        df.loc[1, "price"] = np.nan
+        w.diff_update(df, "symbol")
+        w.diff_update(df.to_dict("records"), "symbol")
+        assert len(w.emitted_events) == 1
+
+        rows = df.to_dict("records")
+        rows[2]["price"] = 9.5
+        w.diff_update(rows, "symbol")
+        w.diff_update(df, "symbol")
+        evt, data = w.get_last_event()
+        assert evt == "grid:apply-transaction"
+        assert data["update"] == [
+            {"symbol": "S00002", "qty": 2, "price": 2.0, "when": "2024-01-03T00:00:00"}
+        ]
+
+    @pytest.mark.parametrize(("before", "after"), [(-1, -2), (1, 1.0), (1, True), ([1], [True])])
+    def test_values_with_equal_hashes_are_changes(self, before: Any, after: Any) -> None:
+        w = MockGridWidget()
+        w.diff_update([{"id": "a", "v": before}], "id")
+        w.diff_update([{"id": "a", "v": after}], "id")
+        evt, data = w.get_last_event()
+        assert evt == "grid:apply-transaction"
+        assert data["update"] == [{"id": "a", "v": after}]
+
+    def test_in_place_list_edit_is_a_change(self) -> None:
+        w = MockGridWidget()
+        rows = [{"id": "a", "tags": ["x"]}]
+        w.diff_update(rows, "id")
+        rows[0]["tags"].append("y")
+        w.diff_update(rows, "id")
+        assert w.get_last_event()[1]["update"] == [{"id": "a", "tags": ["x", "y"]}]
+
+    def test_column_change_and_other_updates_reset_snapshot(self) -> None:
+        w = MockGridWidget()
+        w.diff_update([{"id": 1, "a": 1}], "id")
+        w.diff_update([{"id": 1, "b": 1}], "id")
+        assert w.get_last_event()[0] == "grid:update-data"
+        w.update_cell(1, "b", 2)
+        w.diff_update([{"id": 1, "b": 1}], "id")
+        assert w.get_last_event()[0] == "grid:update-data"
+
+    def test_index_row_id_and_validation(self) -> None:
+        w = MockGridWidget()
+        w.diff_update(_positions(2).set_index("symbol"), "symbol")
+        _evt, data = w.get_last_event()
+        assert data["data"][0]["symbol"] == "S00000"
+        with pytest.raises(ValueError, match="not a DataFrame column"):
+            w.diff_update(_positions(2), "missing")
+        with pytest.raises(ValueError, match="missing from a row"):
+            w.diff_update([{"id": 1}, {"x": 2}], "id")
+        with pytest.raises(ValueError, match="not unique"):
+            w.diff_update([{"id": 1}, {"id": 1}], "id")
+
+    def test_ticking_grid_payload(self) -> None:
+        """A 10k-row tick touching 1% of rows sends ~1% of the full payload."""
+        w = MockGridWidget()
+        df = _positions(10_000)
+        w.diff_update(df, "symbol")
+        full = len(json.dumps(w.get_last_event()[1]))
+
+        tick = df.copy()
+        tick.loc[::100, "price"] += 0.01
+        w.diff_update(tick, "symbol")
+        evt, data = w.get_last_event()
+        assert evt == "grid:apply-transaction"
+        assert len(data["update"]) == 100
+        assert "add" not in data
+        assert "remove" not in data
+        assert len(json.dumps(data)) * 50 < full
+
+
 # =============================================================================
 # PlotlyStateMixin extra paths
 # =============================================================================
@@ -902,6 +1054,163 @@ class TestPlotlyStateMixinOptionalChartId:
         assert data["chartId"] == "cid"
 
 
+# =============================================================================
+# Single-pass figure serialization
+# =============================================================================
+
+
+class TestToJsonable:
+    def test_converts_numpy_pandas_and_datetime_leaves(self) -> None:
+        import pandas as pd
+
+        value = {
+            "arr": np.array([1.5, np.nan]),
+            "ints": (np.int64(1), 2),
+            "dates": np.array(["2024-01-02"], dtype="datetime64[ns]"),
+            "ts": pd.Timestamp("2024-01-02 03:04"),
+            "nat": pd.NaT,
+            "when": datetime.date(2024, 1, 2),
+            "inf": float("inf"),
+        }
+        result = _to_jsonable(value)
+        assert result == {
+            "arr": [1.5, None],
+            "ints": [1, 2],
+            "dates": ["2024-01-02T00:00:00"],
+            "ts": "2024-01-02T03:04:00",
+            "nat": None,
+            "when": "2024-01-02",
+            "inf": None,
+        }
+        json.dumps(result, allow_nan=False)
+
+    def test_unknown_type_raises(self) -> None:
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            _to_jsonable({"x": object()})
+
+    def test_plotly_figure_skips_json_round_trip(self, monkeypatch) -> None:
+        go = pytest.importorskip("plotly.graph_objects")
+
+        fig = go.Figure(go.Scatter(x=np.arange(3), y=np.array([1.0, np.nan, 3.0])))
+        expected = json.loads(fig.to_json())
+        monkeypatch.setattr(type(fig), "to_json", MagicMock(side_effect=AssertionError))
+
+        result = _normalize_figure(fig)
+        assert result == expected
+        json.dumps(result, allow_nan=False)
+
+
+# =============================================================================
+# Delta updates: update_figure(diff=True), extend/prepend traces
+# =============================================================================
+
+
+def _fig(ys: list[list[float]], title: str = "T") -> dict[str, Any]:
+    return {
+        "data": [{"type": "scatter", "y": y} for y in ys],
+        "layout": {"title": title, "xaxis": {"type": "linear"}},
+    }
+
+
+class TestPlotlyFigureDiff:
+    def test_first_diff_sends_full_figure(self) -> None:
+        w = MockPlotlyWidget()
+        w.update_figure(_fig([[1, 2]]), diff=True)
+        evt, data = w.get_last_event()
+        assert evt == "plotly:update-figure"
+        assert data["data"] == [{"type": "scatter", "y": [1, 2]}]
+
+    def test_diff_sends_only_changed_traces_and_layout_keys(self) -> None:
+        w = MockPlotlyWidget()
+        w.update_figure(_fig([[1, 2], [3, 4]]))
+        w.update_figure(_fig([[1, 2], [3, 5]], title="U"), diff=True)
+        evt, data = w.get_last_event()
+        assert evt == "plotly:patch-figure"
+        assert data["traceIndices"] == [1]
+        assert data["traces"] == [{"type": "scatter", "y": [3, 5]}]
+        assert data["numTraces"] == 2
+        assert data["layout"] == {"title": "U"}
+
+    def test_diff_handles_added_removed_traces_and_layout_keys(self) -> None:
+        w = MockPlotlyWidget()
+        w.update_figure(_fig([[1], [2]]))
+        fig = _fig([[1]])
+        del fig["layout"]["xaxis"]
+        w.update_figure(fig, diff=True)
+        _evt, data = w.get_last_event()
+        assert data["traceIndices"] == []
+        assert data["numTraces"] == 1
+        assert data["layout"] == {"xaxis": None}
+
+        w.update_figure(_fig([[1], [9]]), diff=True)
+        _evt, data = w.get_last_event()
+        assert data["traceIndices"] == [1]
+        assert data["layout"] == {"xaxis": {"type": "linear"}}
+
+    def test_unchanged_figure_emits_nothing(self) -> None:
+        w = MockPlotlyWidget()
+        w.update_figure(_fig([[1, 2]]))
+        w.update_figure(_fig([[1, 2]]), diff=True)
+        assert len(w.emitted_events) == 1
+
+    def test_diff_is_per_chart(self) -> None:
+        w = MockPlotlyWidget()
+        w.update_figure(_fig([[1]]), chart_id="a")
+        w.update_figure(_fig([[2]]), chart_id="b", diff=True)
+        evt, data = w.get_last_event()
+        assert evt == "plotly:update-figure"
+        assert data["chartId"] == "b"
+
+    def test_partial_updates_reset_diff_baseline(self) -> None:
+        w = MockPlotlyWidget()
+        w.update_figure(_fig([[1]]))
+        w.extend_traces({"y": [[2]]}, [0])
+        w.update_figure(_fig([[1]]), diff=True)
+        evt, _data = w.get_last_event()
+        assert evt == "plotly:update-figure"
+
+    def test_typed_arrays_encode_numpy_trace_data(self) -> None:
+        w = MockPlotlyWidget()
+        fig = {"data": [{"type": "scatter", "y": np.array([1.0, 2.0]), "name": "a"}]}
+        w.update_figure(fig, typed_arrays=True)
+        _evt, data = w.get_last_event()
+        spec = data["data"][0]["y"]
+        assert spec["dtype"] == "f8"
+        assert np.frombuffer(base64.b64decode(spec["bdata"]), "<f8").tolist() == [1.0, 2.0]
+        assert data["data"][0]["name"] == "a"
+
+        w.update_figure(fig)
+        _evt, data = w.get_last_event()
+        assert isinstance(data["data"][0]["y"], np.ndarray)
+
+    def test_extend_traces_payload(self) -> None:
+        w = MockPlotlyWidget()
+        w.extend_traces(
+            {"x": [np.array([3, 4])], "y": [[0.5, 0.7]]}, 0, max_points=1000, chart_id="c"
+        )
+        evt, data = w.get_last_event()
+        assert evt == "plotly:extend-traces"
+        assert data == {
+            "update": {"x": [[3, 4]], "y": [[0.5, 0.7]]},
+            "indices": [0],
+            "maxPoints": 1000,
+            "chartId": "c",
+        }
+
+    def test_prepend_traces_payload(self) -> None:
+        w = MockPlotlyWidget()
+        w.prepend_traces({"y": np.array([[1.0], [2.0]])}, [0, 1])
+        evt, data = w.get_last_event()
+        assert evt == "plotly:prepend-traces"
+        assert data == {"update": {"y": [[1.0], [2.0]]}, "indices": [0, 1]}
+
+    def test_extend_traces_rejects_mismatched_indices(self) -> None:
+        w = MockPlotlyWidget()
+        with pytest.raises(ValueError, match="2 trace indices"):
+            w.extend_traces({"y": [[1]]}, [0, 1])
+        assert not w.emitted_events
+
+
 # =============================================================================
 # ChatStateMixin — entire mixin block (lines 349-430)
 # =============================================================================
@@ -0,0 +1,88 @@
+"""Tests for the compiled RBAC permission cache in ``pywry.state._permission_cache``."""
+
+from __future__ import annotations
+
+import time
+
+from unittest.mock import patch
+
+from pywry.state._permission_cache import PermissionCache, resource_permission
+from pywry.state.types import UserSession
+
+
+def _session(session_id: str = "s1", **kwargs) -> UserSession:
+    return UserSession(session_id=session_id, user_id="u1", **kwargs)
+
+
+class TestRoleTable:
+    def test_resolve_unions_roles(self) -> None:
+        cache = PermissionCache()
+        cache.load_roles({"viewer": ["read"], "editor": ["read", "write"]})
+        assert cache.resolve(["viewer", "editor"]) == frozenset({"read", "write"})
+        assert cache.resolve(["unknown"]) == frozenset()
+
+    def test_resolve_is_memoized_until_reload(self) -> None:
+        cache = PermissionCache()
+        cache.load_roles({"viewer": ["read"]})
+        assert cache.resolve(["viewer"]) is cache.resolve(["viewer"])
+        cache.load_roles({"viewer": ["read", "export"]})
+        assert "export" in cache.resolve(["viewer"])
+
+    def test_expiry_and_version(self) -> None:
+        cache = PermissionCache(ttl=60)
+        assert cache.roles_expired()
+        cache.load_roles({}, version="3")
+        assert not cache.roles_expired()
+        assert cache.is_current("3")
+        assert not cache.is_current("4")
+        cache.invalidate_roles()
+        assert cache.roles_expired()
+        assert not cache.is_current("3")
+
+    def test_zero_ttl_always_expired(self) -> None:
+        cache = PermissionCache(ttl=0)
+        cache.load_roles({"viewer": ["read"]})
+        assert cache.roles_expired()
+
+
+class TestSessionCache:
+    def test_put_get_drop(self) -> None:
+        cache = PermissionCache(ttl=60)
+        session = _session()
+        cache.put_session(session)
+        assert cache.get_session("s1") is session
+        cache.drop_session("s1")
+        assert cache.get_session("s1") is None
+
+    def test_ttl_expiry(self) -> None:
+        cache = PermissionCache(ttl=1)
+        cache.put_session(_session())
+        later = time.monotonic() + 2
+        with patch("pywry.state._permission_cache.time.monotonic", return_value=later):
+            assert cache.get_session("s1") is None
+
+    def test_expired_session_not_served(self) -> None:
+        cache = PermissionCache(ttl=60)
+        cache.put_session(_session(expires_at=time.time() - 1))
+        assert cache.get_session("s1") is None
+
+    def test_zero_ttl_disables_session_cache(self) -> None:
+        cache = PermissionCache(ttl=0)
+        cache.put_session(_session())
+        assert cache.get_session("s1") is None
+
+    def test_evicts_oldest(self) -> None:
+        cache = PermissionCache(ttl=60, max_sessions=2)
+        for session_id in ("a", "b", "c"):
+            cache.put_session(_session(session_id))
+        assert cache.get_session("a") is None
+        assert cache.get_session("b") is not None
+        assert cache.get_session("c") is not None
+
+
+def test_resource_permission() -> None:
+    session = _session(metadata={"permissions": {"widget:w1": ["read"]}})
+    assert resource_permission(session, "widget", "w1", "read")
+    assert not resource_permission(session, "widget", "w1", "write")
+    assert not resource_permission(session, "widget", "w2", "read")
+    assert not resource_permission(_session(), "widget", "w1", "read")
@@ -202,6 +202,25 @@ class TestRedisWidgetStore:
     async def test_get_nonexistent(self, store) -> None:
         assert await store.get("nonexistent") is None
 
+    async def test_register_many_single_round_trip(self, store, fake_redis) -> None:
+        from pywry.state.types import WidgetData
+
+        widgets = [
+            WidgetData(widget_id=f"w{i}", html=f"<p>{i}</p>", token=f"t{i}", owner_worker_id="wk")
+            for i in range(30)
+        ]
+        with patch.object(fake_redis, "pipeline", wraps=fake_redis.pipeline) as pipeline:
+            await store.register_many(widgets)
+            await store.register_many([])
+        assert pipeline.call_count == 1
+        assert await store.count() == 30
+        widget = await store.get("w7")
+        assert widget is not None
+        assert widget.html == "<p>7</p>"
+        assert widget.token == "t7"
+        assert widget.owner_worker_id == "wk"
+        assert await fake_redis.ttl(store._widget_key("w7")) > 0
+
     async def test_get_html(self, store) -> None:
         await store.register("widget-1", "<p>Content</p>")
         assert await store.get_html("widget-1") == "<p>Content</p>"
@@ -650,6 +669,45 @@ class TestRedisSessionStore:
         assert await store.check_permission("s1", "widget", "w1", "read") is True
         assert await store.check_permission("s1", "widget", "w1", "write") is False
 
+    async def test_check_permissions_batch(self, store) -> None:
+        await store.set_role_permissions("viewer", ["read"])
+        metadata = {"permissions": {"widget:w9": ["write"]}}
+        await store.create_session("s1", "u1", roles=["viewer"], metadata=metadata)
+        checks = [("widget", "w1", "read"), ("widget", "w1", "write"), ("widget", "w9", "write")]
+
+        assert await store.check_permissions("s1", checks) == [True, False, True]
+        assert await store.check_permissions("missing", checks) == [False, False, False]
+
+    async def test_role_table_read_once_per_version(self, store, fake_redis) -> None:
+        await store.set_role_permissions("viewer", ["read"])
+        await store.create_session("s1", "u1", roles=["viewer"])
+        await store.check_permission("s1", "widget", "w1", "read")
+
+        store._permissions.ttl = 0  # re-validate the version on every check
+        with patch.object(fake_redis, "hgetall", wraps=fake_redis.hgetall) as hgetall:
+            for _ in range(5):
+                assert await store.check_permission("s1", "widget", "w1", "read") is True
+        role_reads = [c for c in hgetall.call_args_list if c.args[0] == store._role_perms_key]
+        assert role_reads == []
+
+    async def test_version_bump_invalidates_other_workers(self, store, fake_redis) -> None:
+        from pywry.state.redis import RedisSessionStore
+
+        other = RedisSessionStore(redis_client=fake_redis, prefix="test:", permission_cache_ttl=0)
+        await store.create_session("s1", "u1", roles=["analyst"])
+        assert await other.check_permission("s1", "widget", "w1", "export") is False
+
+        await store.set_role_permissions("analyst", ["export"])
+        assert await other.check_permission("s1", "widget", "w1", "export") is True
+        assert await store.check_permission("s1", "widget", "w1", "export") is True
+
+    async def test_session_cache_dropped_on_delete(self, store) -> None:
+        await store.set_role_permissions("viewer", ["read"])
+        await store.create_session("s1", "u1", roles=["viewer"])
+        assert await store.check_permission("s1", "widget", "w1", "read") is True
+        await store.delete_session("s1")
+        assert await store.check_permission("s1", "widget", "w1", "read") is False
+
     async def test_set_role_permissions_with_set(self, store, fake_redis) -> None:
         """Set input is converted to list for JSON serialization."""
         await store.set_role_permissions("custom", {"a", "b", "c"})
@@ -675,6 +733,107 @@ class TestRedisSessionStore:
             assert await store._redis() is mock_client
 
 
+# --- RedisRateLimiter / RedisAuthStateStore Tests ---
+
+
+try:
+    import lupa  # fakeredis needs it to run Lua scripts
+
+    HAS_LUA = True
+except ImportError:
+    HAS_LUA = False
+
+
+@pytest.mark.skipif(not HAS_LUA, reason="lupa not installed (pip install fakeredis[lua])")
+class TestRedisRateLimiter:
+    """Tests for RedisRateLimiter."""
+
+    @pytest_asyncio.fixture
+    async def limiter(self, fake_redis: fakeredis.aioredis.FakeRedis):
+        from pywry.state.redis import RedisRateLimiter
+
+        return RedisRateLimiter(redis_client=fake_redis, prefix="test", max_requests=3)
+
+    async def test_limits_per_key(self, limiter) -> None:
+        assert [await limiter.is_allowed("1.1.1.1") for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        assert await limiter.is_allowed("2.2.2.2") is True
+
+    async def test_limit_shared_across_workers(self, limiter, fake_redis) -> None:
+        from pywry.state.redis import RedisRateLimiter
+
+        other = RedisRateLimiter(redis_client=fake_redis, prefix="test", max_requests=3)
+        assert await limiter.is_allowed("ip") is True
+        assert await other.is_allowed("ip") is True
+        assert await limiter.is_allowed("ip") is True
+        assert await other.is_allowed("ip") is False
+
+    async def test_window_expires(self, fake_redis) -> None:
+        from pywry.state.redis import RedisRateLimiter
+
+        limiter = RedisRateLimiter(
+            redis_client=fake_redis, prefix="test", max_requests=1, window_seconds=0.05
+        )
+        assert await limiter.is_allowed("ip") is True
+        assert await limiter.is_allowed("ip") is False
+        await asyncio.sleep(0.1)
+        assert await limiter.is_allowed("ip") is True
+
+    async def test_key_has_ttl(self, limiter, fake_redis) -> None:
+        await limiter.is_allowed("ip")
+        ttl = await fake_redis.pttl("test:ratelimit:login:ip")
+        assert 0 < ttl <= 60_000
+
+    async def test_reset(self, limiter) -> None:
+        for ip in ("a", "b"):
+            for _ in range(3):
+                await limiter.is_allowed(ip)
+        await limiter.reset("a")
+        assert await limiter.is_allowed("a") is True
+        assert await limiter.is_allowed("b") is False
+        await limiter.reset()
+        assert await limiter.is_allowed("b") is True
+
+
+class TestRedisAuthStateStore:
+    """Tests for RedisAuthStateStore."""
+
+    @pytest_asyncio.fixture
+    async def store(self, fake_redis: fakeredis.aioredis.FakeRedis):
+        from pywry.state.redis import RedisAuthStateStore
+
+        return RedisAuthStateStore(redis_client=fake_redis, prefix="test", max_age=600)
+
+    async def test_put_pop_is_single_use(self, store) -> None:
+        data = {"redirect_uri": "https://app/auth/callback", "created_at": time.time()}
+        await store.put("state1", data)
+        assert await store.contains("state1") is True
+        assert await store.pop("state1") == data
+        assert await store.pop("state1") is None
+        assert await store.contains("state1") is False
+
+    async def test_callback_on_another_worker(self, store, fake_redis) -> None:
+        from pywry.state.redis import RedisAuthStateStore
+
+        await store.put("state1", {"nonce": "n"})
+        other = RedisAuthStateStore(redis_client=fake_redis, prefix="test")
+        assert await other.pop("state1") == {"nonce": "n"}
+
+    async def test_state_has_ttl(self, store, fake_redis) -> None:
+        await store.put("state1", {"nonce": "n"})
+        ttl = await fake_redis.pttl("test:auth_state:state1")
+        assert 590_000 < ttl <= 600_000
+        assert await store.cleanup() == 0
+
+    async def test_pop_corrupt_returns_none(self, store, fake_redis) -> None:
+        await fake_redis.set("test:auth_state:bad", "not json")
+        assert await store.pop("bad") is None
+
+
 # --- RedisChatStore Tests ---
 
 
@@ -801,6 +960,23 @@ class TestRedisChatStore:
         await store.clear_messages("w1", "t1")
         assert await store.get_messages("w1", "t1") == []
 
+    async def test_truncate_messages(self, store) -> None:
+        await store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
+        for i in range(5):
+            await store.append_message(
+                "w1", "t1", ChatMessage(role="user", content=f"msg{i}", message_id=f"m{i}")
+            )
+        assert await store.truncate_messages("w1", "t1", "m3") is True
+        assert [m.message_id for m in await store.get_messages("w1", "t1")] == ["m0", "m1", "m2"]
+        assert await store.truncate_messages("w1", "t1", "m0") is True
+        assert await store.get_messages("w1", "t1") == []
+
+    async def test_truncate_messages_missing_id(self, store) -> None:
+        await store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
+        await store.append_message("w1", "t1", ChatMessage(role="user", content="hi"))
+        assert await store.truncate_messages("w1", "t1", "ghost") is False
+        assert len(await store.get_messages("w1", "t1")) == 1
+
     async def test_close_noop(self, store) -> None:
         await store.close()
 
@@ -307,6 +307,24 @@ class TestSqliteWidgetStore:
         assert widget.html == "<h1>hi</h1>"
         assert widget.token == "tok1"
 
+    async def test_register_many(self, widget_store: SqliteWidgetStore) -> None:
+        from pywry.state.types import WidgetData
+
+        await widget_store.register_many(
+            [
+                WidgetData(widget_id="w1", html="<p>1</p>", owner_worker_id="worker-a"),
+                WidgetData(widget_id="w2", html="<p>2</p>", metadata={"theme": "dark"}),
+            ]
+        )
+        await widget_store.register_many([])
+        assert sorted(await widget_store.list_active()) == ["w1", "w2"]
+        w1 = await widget_store.get("w1")
+        assert w1 is not None
+        assert w1.owner_worker_id == "worker-a"
+        w2 = await widget_store.get("w2")
+        assert w2 is not None
+        assert w2.metadata == {"theme": "dark"}
+
     async def test_get_missing(self, widget_store: SqliteWidgetStore) -> None:
         assert await widget_store.get("missing") is None
 
@@ -421,6 +439,20 @@ class TestSqliteSessionStore:
         assert await session_store.check_permission("s1", "widget", "w1", "read") is True
         assert await session_store.check_permission("s1", "widget", "w1", "write") is False
 
+    async def test_check_permissions_batch(self, session_store: SqliteSessionStore) -> None:
+        await session_store.create_session("viewer_s", "viewer_user", roles=["viewer"])
+        checks = [("widget", "w1", "read"), ("widget", "w1", "write")]
+
+        assert await session_store.check_permissions("viewer_s", checks) == [True, False]
+        assert await session_store.check_permissions("missing", checks) == [False, False]
+
+    async def test_set_role_permissions(self, session_store: SqliteSessionStore) -> None:
+        await session_store.create_session("s1", "u1", roles=["analyst"])
+        assert await session_store.check_permission("s1", "widget", "w1", "export") is False
+
+        await session_store.set_role_permissions("analyst", {"export", "read"})
+        assert await session_store.check_permission("s1", "widget", "w1", "export") is True
+
     async def test_delete_session(self, session_store: SqliteSessionStore) -> None:
         await session_store.create_session(session_id="del_s", user_id="u1")
         assert await session_store.delete_session("del_s") is True
@@ -522,6 +554,29 @@ class TestSqliteChatStoreCRUD:
         await chat_store.clear_messages("w1", "t1")
         assert len(await chat_store.get_messages("w1", "t1")) == 0
 
+    async def test_truncate_messages(self, chat_store: SqliteChatStore) -> None:
+        await chat_store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
+        for i in range(5):
+            # Equal timestamps fall back to insertion order
+            await chat_store.append_message(
+                "w1",
+                "t1",
+                ChatMessage(role="user", content=f"msg{i}", message_id=f"m{i}", timestamp=1.0),
+            )
+        assert await chat_store.truncate_messages("w1", "t1", "m2") is True
+        assert [m.message_id for m in await chat_store.get_messages("w1", "t1")] == ["m0", "m1"]
+        assert await chat_store.truncate_messages("w1", "t1", "ghost") is False
+        assert len(await chat_store.get_messages("w1", "t1")) == 2
+
+    async def test_resave_thread_keeps_messages(self, chat_store: SqliteChatStore) -> None:
+        await chat_store.save_thread("w1", ChatThread(thread_id="t1", title="A"))
+        await chat_store.append_message("w1", "t1", ChatMessage(role="user", content="x"))
+        await chat_store.save_thread("w1", ChatThread(thread_id="t1", title="Renamed"))
+        assert len(await chat_store.get_messages("w1", "t1")) == 1
+        thread = await chat_store.get_thread("w1", "t1")
+        assert thread is not None
+        assert thread.title == "Renamed"
+
     async def test_widget_isolation(self, chat_store: SqliteChatStore) -> None:
         await chat_store.save_thread("w1", ChatThread(thread_id="t1", title="W1"))
         await chat_store.save_thread("w2", ChatThread(thread_id="t2", title="W2"))
@@ -72,6 +72,11 @@ class TestFixAggridThemeClasses:
         assert f"ag-theme-{theme_name}" in result
         assert f"ag-theme-{theme_name}-dark" not in result
 
+    def test_html_without_grid_is_returned_as_is(self):
+        """Content with no ag-theme class skips the regex pass."""
+        html = '<div class="chart"></div>'
+        assert fix_aggrid_theme_classes(html, ThemeMode.DARK) is html
+
 
 class TestFixPlotlyTemplate:
     """Tests for fix_plotly_template - ensures Plotly templates always match window theme."""
@@ -126,6 +131,11 @@ class TestFixPlotlyTemplate:
         result = fix_plotly_template(html, ThemeMode.LIGHT)
         assert "plotly_white" in result
 
+    def test_html_without_plotly_is_returned_as_is(self):
+        """Content that never mentions plotly skips the regex pass."""
+        html = "<script>var cfg = {template: 'custom'};</script>"
+        assert fix_plotly_template(html, ThemeMode.DARK) is html
+
 
 class TestThemeCoordinationInBuildHtml:
     """Tests that build_html enforces theme coordination - NO mismatched themes allowed.
@@ -1327,6 +1337,26 @@ class TestNumpyEncoder:
         result = json.dumps({"d": d}, cls=_NumpyEncoder)
         assert "2024-06-15" in result
 
+    def test_typed_arrays_encode_numeric_ndarrays(self):
+        """typed_arrays=True emits Plotly bdata specs for numeric arrays."""
+        import json
+
+        import numpy as np
+
+        from pywry.templates import _NumpyEncoder
+
+        result = json.loads(
+            json.dumps(
+                {"y": np.array([1.5, 2.5]), "s": np.array(["a"])},
+                cls=_NumpyEncoder,
+                typed_arrays=True,
+            )
+        )
+        assert result["y"]["dtype"] == "f8"
+        assert "bdata" in result["y"]
+        assert result["s"] == ["a"]
+        assert json.loads(json.dumps({"y": np.array([1.5])}, cls=_NumpyEncoder)) == {"y": [1.5]}
+
     def test_timedelta_uses_total_seconds(self):
         """timedelta objects use total_seconds()."""
         import datetime
@@ -1393,6 +1423,59 @@ class TestCustomCssOsErrorHandling:
         assert "/* ok */" not in result
 
 
+class TestComponentCache:
+    """Tests for memoized component markup in build_html."""
+
+    def test_library_markup_is_reused(self):
+        """Repeated builds reuse the same wrapped library markup."""
+        config = WindowConfig(enable_plotly=True)
+        assert build_plotly_script(config) is build_plotly_script(config)
+
+    def test_reloaded_asset_gets_new_markup(self):
+        """A different asset string (e.g. after clear_cache) is not served stale."""
+        from unittest.mock import patch
+
+        import pywry.templates as templates_mod
+
+        config = WindowConfig(enable_plotly=True)
+        with patch.object(templates_mod, "get_plotly_js", return_value="/* v1 */"):
+            first = build_plotly_script(config)
+        with patch.object(templates_mod, "get_plotly_js", return_value="/* v2 */"):
+            second = build_plotly_script(config)
+        assert "/* v1 */" in first
+        assert "/* v2 */" in second
+
+    def test_theme_css_file_reread_only_when_changed(self, tmp_path, monkeypatch):
+        """The theme CSS file is read once and again after it changes on disk."""
+        import os
+
+        from pathlib import Path
+
+        css_file = tmp_path / "theme.css"
+        css_file.write_text("/* one */")
+        settings = PyWrySettings(theme=ThemeSettings(css_file=str(css_file)))
+
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            if str(self) == str(css_file):
+                reads.append(self)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+        assert "/* one */" in build_base_styles(settings)
+        assert "/* one */" in build_base_styles(settings)
+        assert len(reads) == 1
+
+        css_file.write_text("/* two, longer */")
+        stat = css_file.stat()
+        os.utime(css_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert "/* two, longer */" in build_base_styles(settings)
+        assert len(reads) == 2
+
+
 class TestBuildPlotlyInitScript:
     """Tests for build_plotly_init_script (lines 208-232)."""
 
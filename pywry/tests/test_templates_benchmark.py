@@ -0,0 +1,99 @@
+"""Benchmarks for ``templates.build_html`` on typical Plotly and grid pages.
+
+Library bundles are replaced with synthetic strings of realistic size
+(Plotly ~4.6 MB, AG Grid ~1.5 MB JS + 200 KB theme CSS) so the numbers do
+not depend on which assets are present in the checkout.  After the first
+build every component is served from the memoized markup cache, leaving a
+single join of the document skeleton.
+
+The median of 50 builds must stay under a budget that defaults to 40 ms
+and can be overridden with the ``PYWRY_BUILD_HTML_BUDGET_MS`` environment
+variable on slow CI runners.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+from unittest.mock import patch
+
+import pytest
+
+import pywry.templates as templates_mod
+
+from pywry.config import PyWrySettings
+from pywry.models import HtmlContent, ThemeMode, WindowConfig
+from pywry.templates import build_html
+
+
+BUILD_BUDGET_MS = float(os.environ.get("PYWRY_BUILD_HTML_BUDGET_MS", "40"))
+
+PLOTLY_JS = "/* plotly */" + "p" * 4_600_000
+AGGRID_JS = "/* ag-grid */" + "g" * 1_500_000
+AGGRID_CSS = "/* ag-theme */" + "c" * 200_000
+
+PAGES = {
+    "plotly": (
+        HtmlContent(
+            html="<div id='chart'></div>",
+            json_data={"x": list(range(500)), "y": [i * 0.5 for i in range(500)]},
+        ),
+        WindowConfig(enable_plotly=True, theme=ThemeMode.DARK),
+    ),
+    "grid": (
+        HtmlContent(
+            html="<div id='grid' class='ag-theme-quartz'></div>",
+            json_data={"rows": [{"id": i, "price": i * 1.5} for i in range(500)]},
+        ),
+        WindowConfig(enable_aggrid=True, theme=ThemeMode.DARK),
+    ),
+    "complete_document": (
+        HtmlContent(
+            html="<!DOCTYPE html><html><head><title>t</title></head>"
+            "<body><div id='chart'></div></body></html>",
+        ),
+        WindowConfig(enable_plotly=True, theme=ThemeMode.LIGHT),
+    ),
+}
+
+
+@pytest.fixture(autouse=True)
+def large_assets():
+    with (
+        patch.object(templates_mod, "get_plotly_js", return_value=PLOTLY_JS),
+        patch.object(templates_mod, "get_aggrid_js", return_value=AGGRID_JS),
+        patch.object(templates_mod, "get_aggrid_css", return_value=AGGRID_CSS),
+    ):
+        yield
+
+
+def _median_build_ms(content: HtmlContent, config: WindowConfig, runs: int = 50) -> float:
+    settings = PyWrySettings()
+    build_html(content, config, "warmup", settings=settings)
+    timings = []
+    for i in range(runs):
+        start = time.perf_counter()
+        build_html(content, config, f"window-{i}", settings=settings)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("page", list(PAGES))
+def test_build_html_within_budget(page: str) -> None:
+    content, config = PAGES[page]
+    median_ms = _median_build_ms(content, config)
+    assert median_ms < BUILD_BUDGET_MS, (
+        f"build_html({page}) took {median_ms:.1f} ms (budget {BUILD_BUDGET_MS:.0f} ms)"
+    )
+
+
+@pytest.mark.parametrize("page", list(PAGES))
+def test_library_appears_once(page: str) -> None:
+    content, config = PAGES[page]
+    html = build_html(content, config, "main", settings=PyWrySettings())
+    library = PLOTLY_JS if config.enable_plotly else AGGRID_JS
+    assert html.count(library[:20]) == 1
+    assert len(html) < len(library) + 1_000_000
@@ -0,0 +1,150 @@
+"""Tests for batched marquee ticker updates in ``pywry.ticker_board``."""
+
+from __future__ import annotations
+
+import time
+
+from typing import Any
+
+import pytest
+
+from pywry.state_mixins import ToolbarStateMixin
+from pywry.ticker_board import SET_ITEMS_EVENT, TickerBoard, format_quote
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def __call__(self, event: str, data: dict[str, Any]) -> None:
+        self.events.append((event, data))
+
+    @property
+    def items(self) -> list[list[dict[str, Any]]]:
+        return [data["items"] for _, data in self.events]
+
+
+class TestFormatQuote:
+    def test_price(self) -> None:
+        assert format_quote("AAPL", 1185.5) == {"text": "AAPL 1,185.50"}
+
+    def test_price_and_change(self) -> None:
+        assert format_quote("AAPL", {"price": 185.5, "change": 0.75}) == {
+            "text": "AAPL 185.50 +0.75",
+            "class_add": "ticker-up",
+            "class_remove": "ticker-down",
+        }
+        down = format_quote("MSFT", {"price": 410, "change": -2})
+        assert down["text"] == "MSFT 410.00 -2.00"
+        assert (down["class_add"], down["class_remove"]) == ("ticker-down", "ticker-up")
+
+    def test_preformatted_strings(self) -> None:
+        quote = format_quote("BTC", {"price": "$67,234", "change": "-3.2%"})
+        assert quote["text"] == "BTC $67,234 -3.2%"
+        assert quote["class_add"] == "ticker-down"
+
+    def test_payload_passthrough(self) -> None:
+        payload = {"html": "<b>AAPL</b>", "styles": {"color": "red"}, "extra": 1}
+        assert format_quote("AAPL", payload) == {
+            "html": "<b>AAPL</b>",
+            "styles": {"color": "red"},
+        }
+
+
+class TestTickerBoard:
+    def test_immediate_mode_batches_one_event(self) -> None:
+        emit = _Recorder()
+        board = TickerBoard(emit, interval=0)
+        board.update({"AAPL": 185.5, "MSFT": 410.0})
+        assert emit.events == [
+            (
+                SET_ITEMS_EVENT,
+                {
+                    "items": [
+                        {"ticker": "AAPL", "text": "AAPL 185.50"},
+                        {"ticker": "MSFT", "text": "MSFT 410.00"},
+                    ]
+                },
+            )
+        ]
+
+    def test_unchanged_values_are_dropped(self) -> None:
+        emit = _Recorder()
+        board = TickerBoard(emit, interval=0)
+        board.update({"AAPL": 185.5})
+        board.update({"AAPL": 185.5})
+        board.update({"AAPL": 186.0, "MSFT": 410.0})
+        assert emit.items == [
+            [{"ticker": "AAPL", "text": "AAPL 185.50"}],
+            [{"ticker": "AAPL", "text": "AAPL 186.00"}, {"ticker": "MSFT", "text": "MSFT 410.00"}],
+        ]
+
+    def test_coalesces_latest_value_per_interval(self) -> None:
+        emit = _Recorder()
+        board = TickerBoard(emit, interval=60)
+        for price in (1.0, 2.0, 3.0):
+            board.update({"AAPL": price, "MSFT": 400 + price})
+        assert emit.events == []
+        assert board.flush() == 2
+        assert emit.items == [
+            [{"ticker": "AAPL", "text": "AAPL 3.00"}, {"ticker": "MSFT", "text": "MSFT 403.00"}]
+        ]
+        board.close()
+
+    def test_per_symbol_throttling(self) -> None:
+        emit = _Recorder()
+        board = TickerBoard(emit, interval=60, min_interval=60)
+        board.update({"AAPL": 1.0})
+        assert board.flush() == 1
+        board.update({"AAPL": 2.0, "MSFT": 400.0})
+        board.update({"AAPL": 3.0})
+        assert board.flush() == 1
+        assert emit.items[-1] == [{"ticker": "MSFT", "text": "MSFT 400.00"}]
+        board.close()
+        assert emit.items[-1] == [{"ticker": "AAPL", "text": "AAPL 3.00"}]
+
+    def test_reset_resends_unchanged_values(self) -> None:
+        emit = _Recorder()
+        board = TickerBoard(emit, interval=0)
+        board.update({"AAPL": 1.0})
+        board.reset()
+        board.update({"AAPL": 1.0})
+        assert len(emit.events) == 2
+
+    def test_background_flush(self) -> None:
+        emit = _Recorder()
+        with TickerBoard(emit, interval=0.01) as board:
+            board.update({"AAPL": 1.0})
+            deadline = time.monotonic() + 5
+            while not emit.events and time.monotonic() < deadline:
+                time.sleep(0.005)
+            assert emit.items == [[{"ticker": "AAPL", "text": "AAPL 1.00"}]]
+        assert board._thread is not None
+        assert not board._thread.is_alive()
+
+    def test_closed_board_rejects_updates(self) -> None:
+        board = TickerBoard(_Recorder(), interval=0)
+        board.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            board.update({"AAPL": 1.0})
+
+    def test_invalid_intervals(self) -> None:
+        with pytest.raises(ValueError, match="non-negative"):
+            TickerBoard(_Recorder(), interval=-1)
+
+    def test_custom_formatter(self) -> None:
+        emit = _Recorder()
+        board = TickerBoard(emit, interval=0, formatter=lambda t, v: {"html": f"<i>{t}={v}</i>"})
+        board.update({"CPU": 45})
+        assert emit.items == [[{"ticker": "CPU", "html": "<i>CPU=45</i>"}]]
+
+    def test_widget_mixin_factory(self) -> None:
+        emit = _Recorder()
+
+        class Widget(ToolbarStateMixin):
+            def emit(self, event_type: str, data: dict[str, Any]) -> None:
+                emit(event_type, data)
+
+        board = Widget().ticker_board(interval=0)
+        board.update({"AAPL": 1.0})
+        assert emit.events[0][0] == SET_ITEMS_EVENT
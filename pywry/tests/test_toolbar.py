@@ -28,6 +28,7 @@ from pywry.toolbar import (
     MultiSelect,
     NumberInput,
     Option,
+    OptionIndex,
     RadioGroup,
     RangeInput,
     SearchInput,
@@ -497,6 +498,211 @@ class TestMultiSelect:
         assert "pywry-dropdown" in html
 
 
+# =============================================================================
+# Server-side Option Source Tests
+# =============================================================================
+
+
+@pytest.fixture
+def ticker_options() -> list[Option]:
+    return [
+        Option(label="Apple Inc.", value="AAPL"),
+        Option(label="Applied Materials", value="AMAT"),
+        Option(label="Microsoft Corporation", value="MSFT"),
+        Option(label="Pineapple Holdings", value="PNPL"),
+        Option(label="Snap Inc.", value="SNAP"),
+        Option(label="Apple", value="APLE"),
+    ]
+
+
+class TestOptionIndex:
+    """Test ranked prefix/trigram search in OptionIndex."""
+
+    def test_empty_query_returns_all_in_order(self, ticker_options: list[Option]) -> None:
+        index = OptionIndex(ticker_options)
+        options, total = index.search("", offset=0, limit=3)
+        assert total == 6
+        assert [opt.value for opt in options] == ["AAPL", "AMAT", "MSFT"]
+
+    def test_ranking_tiers(self, ticker_options: list[Option]) -> None:
+        """Exact, then prefix, then trigram matches with the most shared first."""
+        index = OptionIndex(ticker_options)
+        options, total = index.search("Apple")
+        assert [opt.value for opt in options] == ["APLE", "AAPL", "PNPL", "AMAT"]
+        assert total == 4
+
+    def test_matches_value_and_word_prefix(self, ticker_options: list[Option]) -> None:
+        index = OptionIndex(ticker_options)
+        assert [opt.value for opt in index.search("msft")[0]] == ["MSFT"]
+        assert [opt.value for opt in index.search("mat")[0]] == ["AMAT"]
+        assert [opt.value for opt in index.search("CORP")[0]] == ["MSFT"]
+
+    def test_tolerates_typos(self, ticker_options: list[Option]) -> None:
+        index = OptionIndex(ticker_options)
+        options, _ = index.search("microsfot")
+        assert [opt.value for opt in options] == ["MSFT"]
+
+    def test_short_query_requires_prefix(self, ticker_options: list[Option]) -> None:
+        index = OptionIndex(ticker_options)
+        assert index.search("pl") == ([], 0)
+
+    def test_paging(self) -> None:
+        index = OptionIndex([f"Item {i}" for i in range(120)])
+        page, total = index.search("item", offset=100, limit=50)
+        assert total == 120
+        assert [opt.value for opt in page] == [f"Item {i}" for i in range(100, 120)]
+
+    def test_repeated_query_uses_cache(self, ticker_options: list[Option]) -> None:
+        index = OptionIndex(ticker_options, cache_size=1)
+        index.search("apple")
+        ranked = index._cache["apple"]
+        index.search("apple", offset=1)
+        assert index._cache["apple"] is ranked
+        index.search("snap")
+        assert list(index._cache) == ["snap"]
+
+    def test_get_and_len(self, ticker_options: list[Option]) -> None:
+        index = OptionIndex(ticker_options)
+        assert len(index) == 6
+        assert index.get("SNAP") == ticker_options[4]
+        assert index.get("NOPE") is None
+        assert index.label_for("SNAP") == "Snap Inc."
+        assert index.label_for("NOPE") is None
+
+    def test_keys_built_on_first_search(self, ticker_options: list[Option]) -> None:
+        index = OptionIndex(ticker_options)
+        index.search("")
+        assert index._keys == []
+        assert [opt.value for opt in index.search("snap")[0]] == ["SNAP"]
+        keys = index._keys
+        assert keys
+        index.build()
+        assert index._keys is keys
+
+
+class TestOptionSource:
+    """Test Select/MultiSelect with a server-side option_source."""
+
+    def test_list_source_is_indexed(self, ticker_options: list[Option]) -> None:
+        sel = Select(event="ticker:pick", option_source=ticker_options)
+        assert isinstance(sel.option_source, OptionIndex)
+        assert len(sel.option_source) == 6
+
+    def test_select_renders_virtual_shell(self, ticker_options: list[Option]) -> None:
+        sel = Select(
+            event="ticker:pick",
+            option_source=ticker_options,
+            selected="MSFT",
+            page_size=25,
+        )
+        html = sel.build_html()
+        assert 'data-option-source="server"' in html
+        assert 'data-page-size="25"' in html
+        assert "pywry-option-viewport" in html
+        assert "pywry-search-input" in html
+        assert "pywry-dropdown-option" not in html
+        assert "Microsoft Corporation" in html
+        assert "Snap Inc." not in html
+
+    def test_callable_source_uses_options_for_selected_label(self) -> None:
+        sel = Select(
+            event="ticker:pick",
+            option_source=lambda query, offset, limit: ([], 0),
+            options=[Option(label="Snap Inc.", value="SNAP")],
+            selected="SNAP",
+        )
+        html = sel.build_html()
+        assert "Snap Inc." in html
+        assert "pywry-dropdown-option" not in html
+
+    def test_multiselect_renders_selection_state(self, ticker_options: list[Option]) -> None:
+        ms = MultiSelect(
+            event="ticker:filter",
+            option_source=ticker_options,
+            selected=["SNAP", "GONE"],
+        )
+        html = ms.build_html()
+        assert 'data-option-source="server"' in html
+        assert "&quot;label&quot;: &quot;Snap Inc.&quot;" in html
+        assert "&quot;label&quot;: &quot;GONE&quot;" in html
+        assert 'data-action="all"' not in html
+        assert 'data-action="none"' in html
+        assert "pywry-multiselect-checkbox" not in html
+
+    def test_multiselect_callable_source_label_fallback(self) -> None:
+        def source(query: str, offset: int, limit: int) -> tuple[list[Option], int]:
+            return [], 0
+
+        ms = MultiSelect(
+            event="ticker:filter",
+            option_source=source,
+            options=[Option(label="Snap Inc.", value="SNAP")],
+            selected=["SNAP", "GONE"],
+        )
+        html = ms.build_html()
+        assert ">Snap Inc., GONE<" in html
+        assert "&quot;label&quot;: &quot;GONE&quot;" in html
+
+        source.label_for = {"GONE": "Gone Corp"}.get  # type: ignore[attr-defined]
+        html = ms.build_html()
+        assert ">Snap Inc., Gone Corp<" in html
+        assert "&quot;label&quot;: &quot;Gone Corp&quot;" in html
+
+    def test_option_source_not_serialized(self, ticker_options: list[Option]) -> None:
+        toolbar = Toolbar(items=[Select(event="ticker:pick", option_source=ticker_options)])
+        item = toolbar.to_dict()["items"][0]
+        assert "option_source" not in item
+        assert item["page_size"] == 50
+
+    def test_get_option_source_items(self, ticker_options: list[Option]) -> None:
+        nested = MultiSelect(event="ticker:filter", option_source=ticker_options)
+        top = Select(event="ticker:pick", option_source=ticker_options)
+        toolbar = Toolbar(
+            items=[
+                top,
+                Select(event="theme:pick", options=["Dark"]),
+                Div(children=[nested]),
+            ]
+        )
+        assert toolbar.get_option_source_items() == [top, nested]
+
+    def test_register_handlers_dispatch_pages(self, ticker_options: list[Option]) -> None:
+        from pywry.toolbar import register_option_source_handlers_for_toolbar
+
+        dispatched: list[tuple[str, dict]] = []
+        handlers: dict[str, Callable] = {}
+        first = Select(event="ticker:pick", option_source=ticker_options, page_size=2)
+        second = Select(
+            event="ticker:pick",
+            option_source=lambda query, offset, limit: (["Custom"], 7),
+        )
+        toolbar = Toolbar(items=[first, second])
+
+        registered = register_option_source_handlers_for_toolbar(
+            toolbar, handlers.__setitem__, lambda event, data: dispatched.append((event, data))
+        )
+        assert registered == ["ticker:pick:options"]
+
+        handler = handlers["ticker:pick:options"]
+        handler(
+            {"componentId": first.component_id, "query": "apple", "offset": 1, "limit": 100},
+            "ticker:pick:options",
+            "main",
+        )
+        handler({"componentId": second.component_id, "query": "c"}, "ticker:pick:options", "main")
+        handler({"componentId": "unknown", "query": "c"}, "ticker:pick:options", "main")
+
+        assert len(dispatched) == 2
+        event, data = dispatched[0]
+        assert event == "ticker:pick:options-response"
+        assert data["componentId"] == first.component_id
+        assert (data["query"], data["offset"], data["total"]) == ("apple", 1, 4)
+        assert [opt["value"] for opt in data["options"]] == ["AAPL", "PNPL"]
+        _, data = dispatched[1]
+        assert data["total"] == 7
+        assert data["options"] == [{"label": "Custom", "value": "Custom", "description": ""}]
+
+
 # =============================================================================
 # TextInput Tests
 # =============================================================================
@@ -6183,3 +6389,143 @@ class TestMarqueeUpdatePayloadHtmlContent:
         evt, data = m.update_payload(html_content="<b>bold</b>")
         assert evt == "toolbar:marquee-set-content"
         assert data["html"] == "<b>bold</b>"
+
+
+# =============================================================================
+# Render Cache Tests
+# =============================================================================
+
+
+class TestRenderCache:
+    """Test content-keyed memoization of toolbar and modal HTML."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_render_cache(self) -> None:
+        from pywry import toolbar
+
+        toolbar._RENDER_CACHE.clear()
+
+    @pytest.fixture
+    def button_builds(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Record the labels of buttons rendered without the cache."""
+        builds: list[str] = []
+        original = Button.build_html
+
+        def spy(self: Button) -> str:
+            builds.append(self.label)
+            return original(self)
+
+        monkeypatch.setattr(Button, "build_html", spy)
+        return builds
+
+    def test_unchanged_toolbar_is_not_rebuilt(self, button_builds: list[str]) -> None:
+        toolbar = Toolbar(items=[Button(label="A", event="app:a")])
+        first = toolbar.build_html()
+        assert toolbar.build_html() == first
+        assert button_builds == ["A"]
+
+    def test_only_changed_item_is_rebuilt(self, button_builds: list[str]) -> None:
+        a = Button(label="A", event="app:a")
+        b = Button(label="B", event="app:b")
+        toolbar = Toolbar(items=[a, b])
+        toolbar.build_html()
+        b.label = "B2"
+        html = toolbar.build_html()
+        assert ">B2<" in html
+        assert ">A<" in html
+        assert button_builds == ["A", "B", "B2"]
+
+    def test_nested_div_child_change_invalidates_toolbar(self) -> None:
+        child = Button(label="Inner", event="app:inner")
+        toolbar = Toolbar(items=[Div(content="<p>x</p>", children=[child])])
+        toolbar.build_html()
+        child.disabled = True
+        assert "disabled" in toolbar.build_html()
+
+    def test_in_place_mutation_is_rendered(self) -> None:
+        select = Select(event="app:pick", options=[Option(label="Alpha")])
+        button = Button(label="Export", event="app:export", data={"format": "csv"})
+        toolbar = Toolbar(items=[select, button])
+        first = toolbar.build_html()
+        select.options.append(Option(label="Beta"))
+        html = toolbar.build_html()
+        assert html != first
+        assert ">Beta<" in html
+        button.data.update(format="xlsx")
+        assert "xlsx" in toolbar.build_html()
+
+    def test_added_item_is_rendered(self) -> None:
+        toolbar = Toolbar(items=[Button(label="A", event="app:a")])
+        toolbar.build_html()
+        toolbar.items = [*toolbar.items, Button(label="New", event="app:new")]
+        assert ">New<" in toolbar.build_html()
+
+    def test_model_copy_update_is_rendered(self) -> None:
+        button = Button(label="A", event="app:a")
+        Toolbar(items=[button]).build_html()
+        copy = button.model_copy(update={"label": "Copied"})
+        assert ">Copied<" in Toolbar(items=[copy]).build_html()
+
+    def test_parent_id_is_part_of_the_key(self) -> None:
+        div = Div(content="x")
+        assert 'data-parent-id="one"' in Toolbar(component_id="one", items=[div]).build_html()
+        assert 'data-parent-id="two"' in Toolbar(component_id="two", items=[div]).build_html()
+
+    def test_option_source_is_keyed_by_identity(self) -> None:
+        select = Select(
+            event="app:pick",
+            option_source=OptionIndex([Option(label="Alpha", value="a")]),
+            selected="a",
+        )
+        toolbar = Toolbar(items=[select])
+        assert "Alpha" in toolbar.build_html()
+        select.option_source = OptionIndex([Option(label="Beta", value="a")])
+        assert "Beta" in toolbar.build_html()
+
+    def test_secret_value_is_not_kept_in_cache_keys(self) -> None:
+        from pywry import toolbar as toolbar_module
+
+        secret = SecretInput(event="app:key", value="hunter2")
+        Toolbar(items=[secret]).build_html()
+        assert "hunter2" not in repr(list(toolbar_module._RENDER_CACHE))
+
+    def test_script_file_edit_invalidates(self, tmp_path) -> None:
+        import os
+
+        script_file = tmp_path / "bar.js"
+        script_file.write_text("console.log('v1');", encoding="utf-8")
+        toolbar = Toolbar(items=[Button(label="A", event="app:a")], script=script_file)
+        assert "v1" in toolbar.build_html()
+        script_file.write_text("console.log('v2');", encoding="utf-8")
+        stat = script_file.stat()
+        os.utime(script_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert "v2" in toolbar.build_html()
+
+    def test_script_file_read_is_reused(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from pathlib import Path
+
+        from pywry.toolbar import _resolve_script_content
+
+        script_file = tmp_path / "cached.js"
+        script_file.write_text("console.log('once');", encoding="utf-8")
+        reads: list[Path] = []
+        original = Path.read_text
+
+        def spy(self: Path, *args: object, **kwargs: object) -> str:
+            reads.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", spy)
+        for _ in range(3):
+            assert _resolve_script_content(script_file) == "console.log('once');"
+        assert reads == [script_file]
+
+    def test_modal_is_cached_and_invalidated(self, button_builds: list[str]) -> None:
+        from pywry.modal import Modal
+
+        modal = Modal(title="Settings", items=[Button(label="Save", event="app:save")])
+        first = modal.build_html()
+        assert modal.build_html() == first
+        modal.title = "Preferences"
+        assert "Preferences" in modal.build_html()
+        assert button_builds == ["Save"]
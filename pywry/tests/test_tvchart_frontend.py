@@ -480,6 +480,30 @@ class TestTVChartFrontendStateContracts:
         for field in ("multiplier", "maType", "offset", "source"):
             assert field in body
 
+    # -- Typed-array bar payloads --
+
+    def test_columnar_bars_are_decoded_into_typed_arrays(self, tvchart_defaults_js: str) -> None:
+        body = _fn(tvchart_defaults_js, "_tvDecodeTypedArray")
+        assert "atob(spec.bdata)" in body
+        assert "_TV_TYPED_ARRAY_CTORS[spec.dtype]" in body
+        ctors = tvchart_defaults_js[tvchart_defaults_js.index("var _TV_TYPED_ARRAY_CTORS") :]
+        for code, ctor in (("i4", "Int32Array"), ("f8", "Float64Array")):
+            assert f"{code}: {ctor}" in ctors
+        payload = _fn(tvchart_defaults_js, "_tvDecodePayloadBars")
+        assert "payload.series.forEach" in payload
+        assert "_tvDecodeColumnar(s.volume)" in payload
+
+    def test_create_update_and_data_response_decode_payload(self, tvchart_defaults_js: str) -> None:
+        assert "_tvDecodePayloadBars(payload)" in _create_body(tvchart_defaults_js)
+        update = _extract_braced(
+            tvchart_defaults_js,
+            tvchart_defaults_js.index("window.PYWRY_TVCHART_UPDATE = function"),
+        )
+        assert "_tvDecodePayloadBars(payload)" in update
+        assert "_tvDecodePayloadBars(data)" in _handler(
+            tvchart_defaults_js, "tvchart:data-response"
+        )
+
 
 # =============================================================================
 # Indicator catalogue + compute + recompute
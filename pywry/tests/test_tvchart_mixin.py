@@ -152,6 +152,17 @@ class TestUpdateSeries:
         assert "volume" in payload
         assert len(payload["volume"]) == 2
 
+    def test_typed_arrays_emit_columnar_bars(self, m: _MockEmitter) -> None:
+        df = pd.DataFrame(
+            {"time": [1700000000, 1700086400], "close": [103.0, 104.5], "volume": [1000, 2000]}
+        )
+        m.update_series(df, typed_arrays=True)
+        _, payload = m._emitted[0]
+        assert payload["bars"]["length"] == 2
+        assert payload["bars"]["columns"]["time"]["dtype"] == "i4"
+        assert payload["bars"]["columns"]["value"]["dtype"] == "f8"
+        assert payload["volume"]["length"] == 2
+
     def test_chart_and_series_id_propagation(self, m: _MockEmitter) -> None:
         m.update_series([], chart_id="c42", series_id="overlay")
         _, payload = m._emitted[0]
@@ -0,0 +1,138 @@
+"""Payload-size and parse-time benchmark for typed-array tvchart bars.
+
+Every bundled ``examples/SPY_*.csv`` file is normalized twice, with
+plain bar lists and with ``typed_arrays=True``, and the bars+volume
+payload is serialized as the frontend receives it.  The typed payload
+must be at least ``PYWRY_TYPED_BARS_MIN_SIZE_RATIO`` (default 2.0) times
+smaller.
+
+When Node.js is available, ``JSON.parse`` of the plain payload is timed
+against ``JSON.parse`` plus ``_tvDecodePayloadBars`` (from
+``tvchart/01-globals.js``) of the typed one, best of
+``PYWRY_TYPED_BARS_RUNS`` (default 20) runs.  The decoded bars must equal
+the plain ones and the typed path must take at most
+``PYWRY_TYPED_BARS_MAX_TIME_RATIO`` (default 0.8) of the plain time on
+the largest file.  Run with ``-s`` to see the numbers.  The untimed
+check decodes each file once and compares it with the plain bars.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+
+from pathlib import Path
+
+import pytest
+
+import pywry
+
+from pywry.tvchart import normalize_ohlcv
+
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+
+MIN_SIZE_RATIO = float(os.environ.get("PYWRY_TYPED_BARS_MIN_SIZE_RATIO", "2.0"))
+MAX_TIME_RATIO = float(os.environ.get("PYWRY_TYPED_BARS_MAX_TIME_RATIO", "0.8"))
+RUNS = int(os.environ.get("PYWRY_TYPED_BARS_RUNS", "20"))
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+SPY_FILES = sorted(EXAMPLES.glob("SPY_*.csv"))
+GLOBALS_JS = Path(pywry.__file__).parent / "frontend" / "src" / "tvchart" / "01-globals.js"
+
+pytestmark = pytest.mark.skipif(not SPY_FILES, reason="SPY example data not found")
+
+# Only the decode helpers are needed; the rest of 01-globals.js touches the DOM
+_NODE_BENCH = """
+const fs = require("fs");
+const src = fs.readFileSync(process.argv[1], "utf8");
+const start = src.indexOf("var _TV_TYPED_ARRAY_CTORS");
+eval(src.slice(start));
+const plain = fs.readFileSync(process.argv[2], "utf8");
+const typed = fs.readFileSync(process.argv[3], "utf8");
+const runs = Number(process.argv[4]);
+function best(fn) {
+    let min = Infinity;
+    for (let i = 0; i < runs; i++) {
+        const t0 = process.hrtime.bigint();
+        fn();
+        min = Math.min(min, Number(process.hrtime.bigint() - t0) / 1e6);
+    }
+    return min;
+}
+const plainMs = best(() => JSON.parse(plain));
+const typedMs = best(() => _tvDecodePayloadBars(JSON.parse(typed)));
+const expected = JSON.parse(plain);
+const decoded = _tvDecodePayloadBars(JSON.parse(typed));
+console.log(JSON.stringify({
+    plain_ms: plainMs,
+    typed_ms: typedMs,
+    equal: JSON.stringify(decoded) === JSON.stringify(expected),
+}));
+"""
+
+
+def _payloads(path: Path) -> tuple[str, str]:
+    """Return the plain and typed bars+volume JSON for one CSV file."""
+    frame = pd.read_csv(path)
+    encoded = []
+    for typed_arrays in (False, True):
+        series = normalize_ohlcv(frame, max_bars=len(frame), typed_arrays=typed_arrays).series[0]
+        payload = {"bars": series.bars_payload(), "volume": series.volume_payload()}
+        encoded.append(json.dumps(payload, separators=(",", ":")))
+    return encoded[0], encoded[1]
+
+
+@pytest.mark.parametrize("path", SPY_FILES, ids=lambda path: path.stem)
+def test_typed_payload_is_smaller(path: Path) -> None:
+    plain, typed = _payloads(path)
+    ratio = len(plain) / len(typed)
+    print(f"\n{path.stem}: plain {len(plain) / 1e6:.2f} MB, typed {len(typed) / 1e6:.2f} MB")
+    assert ratio >= MIN_SIZE_RATIO, f"{path.stem}: only {ratio:.2f}x smaller"
+
+
+def _node_results(tmp_path: Path, runs: int) -> dict[str, tuple[int, dict]]:
+    """Run the Node.js harness on every file; map stem to (plain size, result)."""
+    timings = {}
+    for path in SPY_FILES:
+        plain, typed = _payloads(path)
+        (tmp_path / "plain.json").write_text(plain, encoding="utf-8")
+        (tmp_path / "typed.json").write_text(typed, encoding="utf-8")
+        result = subprocess.run(
+            [  # noqa: S607
+                "node",
+                "-e",
+                _NODE_BENCH,
+                str(GLOBALS_JS),
+                str(tmp_path / "plain.json"),
+                str(tmp_path / "typed.json"),
+                str(runs),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=True,
+        )
+        timings[path.stem] = (len(plain), json.loads(result.stdout))
+    return timings
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not available")
+def test_typed_payload_decodes_to_plain_bars(tmp_path: Path) -> None:
+    for stem, (_, result) in _node_results(tmp_path, runs=1).items():
+        assert result["equal"], f"{stem}: decoded bars differ from the plain ones"
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not available")
+def test_typed_payload_parses_faster(tmp_path: Path) -> None:
+    timings = _node_results(tmp_path, RUNS)
+    for stem, (_, timing) in timings.items():
+        print(f"\n{stem}: plain {timing['plain_ms']:.1f} ms, typed {timing['typed_ms']:.1f} ms")
+        assert timing["equal"], f"{stem}: decoded bars differ from the plain ones"
+
+    _, largest = max(timings.values(), key=lambda item: item[0])
+    assert largest["typed_ms"] <= largest["plain_ms"] * MAX_TIME_RATIO, largest
@@ -0,0 +1,117 @@
+"""Tests for the binary typed-array encoders in ``pywry.utils.typed_arrays``."""
+
+from __future__ import annotations
+
+import base64
+
+import numpy as np
+import pytest
+
+from pywry.utils.typed_arrays import encode_records, to_typed_array
+
+
+def _decode(spec: dict[str, str]) -> np.ndarray:
+    array = np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<" + spec["dtype"])
+    if "shape" in spec:
+        array = array.reshape([int(dim) for dim in spec["shape"].split(",")])
+    return array
+
+
+class TestToTypedArray:
+    @pytest.mark.parametrize(
+        ("dtype", "code"),
+        [
+            ("int8", "i1"),
+            ("uint8", "u1"),
+            ("int16", "i2"),
+            ("uint16", "u2"),
+            ("int32", "i4"),
+            ("uint32", "u4"),
+            ("float32", "f4"),
+            ("float64", "f8"),
+        ],
+    )
+    def test_dtype_codes(self, dtype: str, code: str) -> None:
+        values = np.array([0, 1, 2], dtype=dtype)
+        spec = to_typed_array(values)
+        assert spec is not None
+        assert spec["dtype"] == code
+        assert _decode(spec).tolist() == values.tolist()
+
+    def test_int64_is_narrowed(self) -> None:
+        spec = to_typed_array(np.array([1, 300, -5], dtype="int64"))
+        assert spec is not None
+        assert spec["dtype"] == "i2"
+        assert _decode(spec).tolist() == [1, 300, -5]
+
+    def test_large_int64_falls_back_to_float64(self) -> None:
+        spec = to_typed_array(np.array([2**40, 1], dtype="int64"))
+        assert spec is not None
+        assert spec["dtype"] == "f8"
+        assert _decode(spec).tolist() == [2**40, 1]
+
+    def test_unsafe_int64_is_not_encoded(self) -> None:
+        assert to_typed_array(np.array([2**60], dtype="int64")) is None
+
+    def test_big_endian_input(self) -> None:
+        spec = to_typed_array(np.array([1.5, -2.0], dtype=">f8"))
+        assert spec is not None
+        assert _decode(spec).tolist() == [1.5, -2.0]
+
+    def test_two_dimensional_shape(self) -> None:
+        values = np.arange(6, dtype="float64").reshape(2, 3)
+        spec = to_typed_array(values)
+        assert spec is not None
+        assert spec["shape"] == "2, 3"
+        assert _decode(spec).tolist() == values.tolist()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [1, 2, 3],
+            np.array([], dtype="float64"),
+            np.array(["a", "b"]),
+            np.array([True, False]),
+            np.array(["2024-01-01"], dtype="datetime64[D]"),
+        ],
+    )
+    def test_unsupported_values_return_none(self, value: object) -> None:
+        assert to_typed_array(value) is None
+
+
+class TestEncodeRecords:
+    def test_integer_and_float_columns(self) -> None:
+        block = encode_records(
+            [
+                {"time": 1700000000, "close": 1.25, "volume": 10},
+                {"time": 1700000060, "close": 2.5, "volume": 20},
+            ]
+        )
+        assert block is not None
+        assert block["length"] == 2
+        columns = block["columns"]
+        assert columns["time"]["dtype"] == "i4"
+        assert columns["volume"]["dtype"] == "i4"
+        assert columns["close"]["dtype"] == "f8"
+        assert _decode(columns["close"]).tolist() == [1.25, 2.5]
+        assert _decode(columns["time"]).tolist() == [1700000000, 1700000060]
+
+    def test_integers_beyond_int32_stay_float(self) -> None:
+        block = encode_records([{"time": 1700000000000}])
+        assert block is not None
+        assert block["columns"]["time"]["dtype"] == "f8"
+
+    @pytest.mark.parametrize(
+        "records",
+        [
+            [],
+            [{"a": 1}, {"b": 2}],
+            [{"a": 1, "color": "red"}],
+            [{"a": None}],
+            [{"a": 1}, {"a": None}],
+            [{"a": "1.5"}],
+            [{"a": True}],
+        ],
+    )
+    def test_heterogeneous_or_non_numeric_records(self, records: list[dict]) -> None:
+        assert encode_records(records) is None
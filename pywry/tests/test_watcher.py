@@ -2,9 +2,8 @@
 
 Tests cover:
 - WatchedFile dataclass
-- WindowDebouncer dataclass
-- FileWatcher class with mocked Observer and Timer
-- Debounce functionality
+- FileWatcher class with mocked Observer
+- Shared debounce scheduler and batched callbacks
 - Global watcher functions
 - _WatchHandler event forwarding
 - All branches required for 100% coverage
@@ -14,7 +13,6 @@ All tests use mocks for file system and threading operations where appropriate.
 
 from __future__ import annotations
 
-import threading
 import time
 
 from pathlib import Path
@@ -25,7 +23,6 @@ import pytest
 from pywry.watcher import (
     FileWatcher,
     WatchedFile,
-    WindowDebouncer,
     _WatchHandler,
     get_file_watcher,
     stop_file_watcher,
@@ -92,35 +89,10 @@ class TestWatchedFile:
         )
         assert watched.last_triggered == 12345.0
 
-
-# =============================================================================
-# WindowDebouncer Tests
-# =============================================================================
-
-
-class TestWindowDebouncer:
-    """Test WindowDebouncer dataclass."""
-
-    def test_default_values(self) -> None:
-        """Test default values."""
-        debouncer = WindowDebouncer()
-        assert debouncer.pending_paths == set()
-        assert debouncer.timer is None
-        assert isinstance(debouncer.lock, type(threading.Lock()))
-
-    def test_pending_paths(self) -> None:
-        """Test adding pending paths."""
-        debouncer = WindowDebouncer()
-        debouncer.pending_paths.add(Path("/test/file1.txt"))
-        debouncer.pending_paths.add(Path("/test/file2.txt"))
-        assert len(debouncer.pending_paths) == 2
-
-    def test_lock_is_usable(self) -> None:
-        """Test that the lock is usable as a context manager."""
-        debouncer = WindowDebouncer()
-        with debouncer.lock:
-            debouncer.pending_paths.add(Path("/test/file.txt"))
-        assert Path("/test/file.txt") in debouncer.pending_paths
+    def test_batched_defaults_false(self) -> None:
+        """Watches are per-file unless registered as batched."""
+        watched = WatchedFile(path=Path("/test/file.txt"), callback=MagicMock(), label="w")
+        assert watched.batched is False
 
 
 # =============================================================================
@@ -282,22 +254,17 @@ class TestFileWatcherWatch:
         """Test unwatching a label that was never used is a no-op."""
         watcher.unwatch_label("nonexistent_window")
 
-    def test_unwatch_label_cancels_pending_timer(self, css_file: Path) -> None:
-        """unwatch_label cancels a pending debouncer timer and clears state."""
-        watcher = FileWatcher(debounce_ms=10000)  # long so timer doesn't fire
-        watcher.watch(css_file, MagicMock(), "winT")
+    def test_unwatch_label_drops_pending_callbacks(self, css_file: Path) -> None:
+        """A label unwatched during the debounce interval is not called back."""
+        callback = MagicMock()
+        watcher = FileWatcher(debounce_ms=50)
+        watcher.watch(css_file, callback, "winT")
 
-        # Trigger a change to create a debouncer with an active timer
         watcher._on_file_change(css_file.resolve())
-
-        assert "winT" in watcher._debouncers
-        debouncer = watcher._debouncers["winT"]
-        assert debouncer.timer is not None
-
         watcher.unwatch_label("winT")
 
-        # Debouncer was removed
-        assert "winT" not in watcher._debouncers
+        time.sleep(0.2)
+        callback.assert_not_called()
 
 
 # =============================================================================
@@ -365,21 +332,25 @@ class TestFileWatcherStartStop:
         watcher.stop()
         mock_observer_class.assert_not_called()
 
-    def test_stop_cancels_pending_timers(self, mocked_observer, css_file: Path) -> None:
-        """stop() cancels pending debouncer timers and clears them."""
+    def test_stop_discards_pending_changes(self, mocked_observer, css_file: Path) -> None:
+        """stop() drops pending changes and ends the scheduler thread."""
         _, mock_observer = mocked_observer
         watcher = FileWatcher(debounce_ms=10000)
         watcher.watch(css_file, MagicMock(), "win")
         watcher.start()
 
-        # Trigger change so debouncer timer is set
+        # Trigger change so the scheduler holds a pending path
         watcher._on_file_change(css_file.resolve())
-        debouncer = watcher._debouncers["win"]
-        assert debouncer.timer is not None
+        scheduler = watcher._scheduler
+        assert scheduler is not None
+        assert css_file.resolve() in watcher._pending
 
         watcher.stop()
 
-        assert watcher._debouncers == {}
+        assert watcher._pending == {}
+        assert watcher._scheduler is None
+        scheduler.join(timeout=1.0)
+        assert not scheduler.is_alive()
         mock_observer.stop.assert_called_once()
         assert watcher._running is False
 
@@ -476,7 +447,8 @@ class TestFileChangeCallbacks:
         watcher._watches[css_file.resolve()] = []
 
         watcher._on_file_change(css_file.resolve())
-        assert "w1" not in watcher._debouncers
+        assert watcher._pending == {}
+        assert watcher._scheduler is None
 
     def test_debounce_batches_rapid_changes(self, css_file: Path) -> None:
         """Rapid changes within the debounce window are coalesced into one callback."""
@@ -503,6 +475,47 @@ class TestFileChangeCallbacks:
 
         bad_callback.assert_called_once()
 
+    def test_one_scheduler_for_all_labels(self, tmp_path: Path) -> None:
+        """Changes for many files and windows share one scheduler thread and flush."""
+        files = [tmp_path / f"f{i}.css" for i in range(3)]
+        callback = MagicMock()
+        watcher = FileWatcher(debounce_ms=50)
+        for f in files:
+            f.write_text("a {}")
+            for label in ("w1", "w2"):
+                watcher.watch(f, callback, label)
+
+        watcher._on_file_change(files[0].resolve())
+        scheduler = watcher._scheduler
+        for f in files[1:]:
+            watcher._on_file_change(f.resolve())
+        assert watcher._scheduler is scheduler
+
+        time.sleep(0.3)
+        assert callback.call_count == 6
+        assert {c.args for c in callback.call_args_list} == {
+            (f.resolve(), label) for f in files for label in ("w1", "w2")
+        }
+        watcher._stop_scheduler()
+
+    def test_batched_callback_receives_one_flush(self, tmp_path: Path) -> None:
+        """A batched callback gets every changed path and its labels in one call."""
+        a, b = tmp_path / "a.css", tmp_path / "b.js"
+        a.write_text("a {}")
+        b.write_text("1;")
+        callback = MagicMock()
+        watcher = FileWatcher(debounce_ms=20)
+        watcher.watch(a, callback, "w1", batched=True)
+        watcher.watch(a, callback, "w2", batched=True)
+        watcher.watch(b, callback, "w1", batched=True)
+
+        watcher._on_file_change(a.resolve())
+        watcher._on_file_change(b.resolve())
+        time.sleep(0.2)
+
+        callback.assert_called_once_with({a.resolve(): ["w1", "w2"], b.resolve(): ["w1"]})
+        watcher._stop_scheduler()
+
 
 # =============================================================================
 # _WatchHandler Tests
@@ -44,8 +44,10 @@ from pywry.window_dispatch import (
     PROPERTY_GETTERS,
     PROPERTY_METHODS,
     SIZE_POSITION_METHODS,
+    STATE_EVENT_PROPERTIES,
     STATE_METHODS,
     VISIBILITY_METHODS,
+    WATCHED_PROPERTIES,
     WEBVIEW_METHODS,
     _call_appearance_method,
     _call_behavior_method,
@@ -67,6 +69,7 @@ from pywry.window_dispatch import (
     _set_theme,
     _set_title_bar_style,
     call_window_method,
+    get_window_properties,
     get_window_property,
 )
 
@@ -715,6 +718,22 @@ class TestGetWindowProperty:
             get_window_property(window, "monitor_from_point")
 
 
+class TestGetWindowProperties:
+    def test_collects_values_and_errors(self) -> None:
+        window = MagicMock()
+        window.title.return_value = "Main"
+        window.is_focused.return_value = True
+        values, errors = get_window_properties(window, ["title", "is_focused", "bogus"])
+        assert values == {"title": "Main", "is_focused": True}
+        assert errors == {"bogus": "Unknown property: bogus"}
+
+    def test_watched_properties_cover_state_events(self) -> None:
+        for props in STATE_EVENT_PROPERTIES.values():
+            assert set(props) <= set(WATCHED_PROPERTIES)
+            assert set(props) <= set(PROPERTY_GETTERS)
+        assert len(WATCHED_PROPERTIES) == len(set(WATCHED_PROPERTIES))
+
+
 class TestSerializeMonitor:
     """Test monitor serialization helper."""
 